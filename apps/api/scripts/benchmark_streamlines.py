@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+API_SRC = Path(__file__).resolve().parents[1] / "src"
+REPO_ROOT = Path(__file__).resolve().parents[3]
+PIPELINE_SRC = REPO_ROOT / "services" / "data-pipeline" / "src"
+CONFIG_SRC = REPO_ROOT / "packages" / "config" / "src"
+SHARED_SRC = REPO_ROOT / "packages" / "shared" / "src"
+
+for path in (SHARED_SRC, CONFIG_SRC, PIPELINE_SRC, API_SRC):
+    sys.path.insert(0, str(path))
+
+from routers.vector import (  # noqa: E402
+    _integrate_streamline,
+    _integrate_streamlines,
+)
+
+
+def _synthetic_wind(resolution: float) -> tuple[np.ndarray, ...]:
+    lat = np.arange(-90.0, 90.0 + resolution / 2, resolution, dtype=np.float64)
+    lon = np.arange(0.0, 360.0, resolution, dtype=np.float64)
+    lat2d, lon2d = np.meshgrid(np.deg2rad(lat), np.deg2rad(lon), indexing="ij")
+    u = 20.0 * np.cos(lat2d) ** 2 + 6.0 * np.sin(3.0 * lon2d) * np.cos(2.0 * lat2d)
+    v = 8.0 * np.sin(2.0 * lon2d) * np.cos(lat2d)
+    return lat, lon, u, v
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Compare scalar and batched RK4 streamline integration."
+    )
+    parser.add_argument(
+        "--resolution", type=float, default=0.25, help="Grid step in degrees"
+    )
+    parser.add_argument("--seeds", type=int, default=20, help="Seeds per axis")
+    parser.add_argument("--max-steps", type=int, default=200)
+    parser.add_argument("--step-km", type=float, default=25.0)
+    parser.add_argument("--min-speed", type=float, default=0.5)
+    args = parser.parse_args()
+
+    lat, lon, u, v = _synthetic_wind(float(args.resolution))
+    bbox = (60.0, -60.0, 200.0, 60.0)
+    seed_lat, seed_lon = np.meshgrid(
+        np.linspace(-55.0, 55.0, int(args.seeds)),
+        np.linspace(65.0, 195.0, int(args.seeds)),
+        indexing="ij",
+    )
+    params = {
+        "bbox": bbox,
+        "lat_coord": lat,
+        "lon_coord": lon,
+        "u_grid": u,
+        "v_grid": v,
+        "step_km": float(args.step_km),
+        "max_steps": int(args.max_steps),
+        "min_speed": float(args.min_speed),
+    }
+
+    started = time.perf_counter()
+    scalar = [
+        _integrate_streamline(seed_lat=float(a), seed_lon=float(b), **params)
+        for a, b in zip(seed_lat.ravel(), seed_lon.ravel(), strict=True)
+    ]
+    scalar_seconds = time.perf_counter() - started
+
+    started = time.perf_counter()
+    batch = _integrate_streamlines(seed_lat=seed_lat, seed_lon=seed_lon, **params)
+    batch_seconds = time.perf_counter() - started
+
+    summary = {
+        "grid": [int(lat.size), int(lon.size)],
+        "seeds": int(seed_lat.size),
+        "max_steps": int(args.max_steps),
+        "points": sum(len(line_lat) for line_lat, _line_lon in batch),
+        "identical": batch == scalar,
+        "scalar_seconds": round(scalar_seconds, 4),
+        "batch_seconds": round(batch_seconds, 4),
+        "speedup": round(scalar_seconds / max(batch_seconds, 1e-9), 2),
+    }
+    print(json.dumps(summary, ensure_ascii=False, indent=2, sort_keys=True))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,160 @@
+from __future__ import annotations
+
+import logging
+import os
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Callable, Generic, Hashable, Iterator, TypeVar
+
+logger = logging.getLogger("api.error")
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+@dataclass(frozen=True)
+class ByteLRUStats:
+    hits: int
+    misses: int
+    evictions: int
+    entries: int
+    current_bytes: int
+    max_bytes: int
+
+
+class ByteBoundedLRU(Generic[K, V]):
+    """Thread-safe LRU bounded by the total byte size of its values.
+
+    `sizeof` returns the byte size charged for a value. Subclasses may prepare
+    a value before it is stored (`_prepare`, e.g. to make arrays read-only).
+    Loads for the same key are collapsed so concurrent callers compute a value
+    once.
+
+    Every `get`/`get_or_load` call counts exactly one hit or one miss; `peek`
+    and `put` leave the counters alone.
+    """
+
+    def __init__(self, *, max_bytes: int, sizeof: Callable[[V], int]) -> None:
+        self._max_bytes = max(0, int(max_bytes))
+        self._sizeof = sizeof
+        self._entries: OrderedDict[K, tuple[V, int]] = OrderedDict()
+        self._current_bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._lock = threading.Lock()
+        self._flight_locks: dict[Hashable, tuple[threading.Lock, int]] = {}
+
+    @property
+    def max_bytes(self) -> int:
+        return self._max_bytes
+
+    def _prepare(self, value: V) -> V:
+        return value
+
+    def _lookup_locked(self, key: K) -> V | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        self._entries.move_to_end(key)
+        return entry[0]
+
+    def get(self, key: K) -> V | None:
+        with self._lock:
+            value = self._lookup_locked(key)
+            if value is None:
+                self._misses += 1
+            else:
+                self._hits += 1
+            return value
+
+    def peek(self, key: K) -> V | None:
+        """Return the cached value without touching recency or counters."""
+        with self._lock:
+            entry = self._entries.get(key)
+            return None if entry is None else entry[0]
+
+    def put(self, key: K, value: V) -> V:
+        prepared = self._prepare(value)
+        size = self._sizeof(prepared)
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._current_bytes -= previous[1]
+
+            if size > self._max_bytes:
+                return prepared
+
+            self._entries[key] = (prepared, size)
+            self._current_bytes += size
+            while self._current_bytes > self._max_bytes and self._entries:
+                _evicted_key, (_value, evicted_size) = self._entries.popitem(last=False)
+                self._current_bytes -= evicted_size
+                self._evictions += 1
+        return prepared
+
+    @contextmanager
+    def _single_flight(self, flight_key: Hashable) -> Iterator[None]:
+        """Serialize callers sharing `flight_key` for the duration of the block."""
+        with self._lock:
+            lock, waiters = self._flight_locks.get(flight_key, (threading.Lock(), 0))
+            self._flight_locks[flight_key] = (lock, waiters + 1)
+        try:
+            with lock:
+                yield
+        finally:
+            with self._lock:
+                _lock, waiters = self._flight_locks[flight_key]
+                if waiters <= 1:
+                    del self._flight_locks[flight_key]
+                else:
+                    self._flight_locks[flight_key] = (lock, waiters - 1)
+
+    def get_or_load(self, key: K, loader: Callable[[], V]) -> V:
+        with self._lock:
+            value = self._lookup_locked(key)
+            if value is not None:
+                self._hits += 1
+                return value
+
+        with self._single_flight(key):
+            with self._lock:
+                value = self._lookup_locked(key)
+                if value is not None:
+                    self._hits += 1
+                    return value
+                self._misses += 1
+            return self.put(key, loader())
+
+    def stats(self) -> ByteLRUStats:
+        with self._lock:
+            return ByteLRUStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                entries=len(self._entries),
+                current_bytes=self._current_bytes,
+                max_bytes=self._max_bytes,
+            )
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._current_bytes = 0
+            self._hits = 0
+            self._misses = 0
+            self._evictions = 0
+
+
+def configured_max_bytes(env: str, default: int, *, event: str) -> int:
+    """Read a byte budget from `env`; invalid values log `event` and fall back."""
+    raw = os.environ.get(env, "").strip()
+    if raw == "":
+        return default
+    try:
+        return max(0, int(raw))
+    except ValueError:
+        logger.warning(event, extra={"env": env, "value": raw})
+        return default
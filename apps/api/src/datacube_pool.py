@@ -0,0 +1,259 @@
+from __future__ import annotations
+
+import logging
+import os
+import threading
+from collections import OrderedDict
+from contextlib import AbstractContextManager, contextmanager
+from dataclasses import dataclass, field
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Final, Hashable, Iterator
+
+import numpy as np
+import xarray as xr
+
+from datacube.storage import open_datacube
+from grid_cache import datacube_slice_key
+
+logger = logging.getLogger("api.error")
+
+DATACUBE_HANDLE_POOL_SIZE_ENV: Final[str] = "DIGITAL_EARTH_DATACUBE_HANDLE_POOL_SIZE"
+DEFAULT_DATACUBE_HANDLE_POOL_SIZE: Final[int] = 32
+
+
+def _read_only(values: np.ndarray) -> np.ndarray:
+    values.setflags(write=False)
+    return values
+
+
+@dataclass(frozen=True)
+class DataCubeCoords:
+    """Decoded coordinate arrays of a DataCube plus time/level index maps.
+
+    `times` is `datetime64[s]`; `times`/`levels` are None when the cube has no
+    such coordinate. The lookups map a coordinate value to its first index.
+    """
+
+    times: np.ndarray | None
+    levels: np.ndarray | None
+    level_attrs: dict[str, Any] = field(default_factory=dict)
+    time_lookup: dict[np.datetime64, int] = field(default_factory=dict)
+    level_lookup: dict[float, int] = field(default_factory=dict)
+
+    @classmethod
+    def from_dataset(cls, ds: xr.Dataset) -> "DataCubeCoords":
+        times: np.ndarray | None = None
+        time_lookup: dict[np.datetime64, int] = {}
+        if "time" in ds.coords:
+            times = _read_only(np.asarray(ds["time"].values).astype("datetime64[s]"))
+            for index, value in enumerate(times):
+                time_lookup.setdefault(value, index)
+
+        levels: np.ndarray | None = None
+        level_attrs: dict[str, Any] = {}
+        level_lookup: dict[float, int] = {}
+        if "level" in ds.coords:
+            levels = _read_only(np.array(ds["level"].values))
+            level_attrs = dict(ds["level"].attrs)
+            if np.issubdtype(levels.dtype, np.number):
+                for index, value in enumerate(levels.astype(np.float64)):
+                    level_lookup.setdefault(float(value), index)
+
+        return cls(
+            times=times,
+            levels=levels,
+            level_attrs=level_attrs,
+            time_lookup=time_lookup,
+            level_lookup=level_lookup,
+        )
+
+
+@dataclass(frozen=True)
+class DataCubePoolStats:
+    hits: int
+    misses: int
+    evictions: int
+    open_handles: int
+    max_handles: int
+
+
+@dataclass
+class _PooledCube:
+    key: tuple[Hashable, ...]
+    ds: xr.Dataset
+    coords: DataCubeCoords
+    refs: int = 0
+    evicted: bool = False
+
+
+def _close_quietly(ds: xr.Dataset) -> None:
+    try:
+        ds.close()
+    except Exception as exc:  # noqa: BLE001
+        logger.warning("datacube_pool_close_failed", extra={"error": str(exc)})
+
+
+class DataCubeHandlePool:
+    """Per-process LRU of open read-only DataCube datasets.
+
+    Handles are keyed like `datacube_slice_key` (path plus the file's or Zarr
+    metadata's mtime and size), so a rewritten cube is reopened and the stale
+    handle retired. At most `max_handles` datasets stay open;
+    an evicted handle that a request is still reading is closed when that
+    request releases it. Reads on a shared dataset go through xarray's backend
+    lock, so one handle can serve several threads.
+    """
+
+    def __init__(self, *, max_handles: int) -> None:
+        self._max_handles = max(0, int(max_handles))
+        self._entries: OrderedDict[tuple[Hashable, ...], _PooledCube] = OrderedDict()
+        self._by_dataset: dict[int, _PooledCube] = {}
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._lock = threading.Lock()
+
+    @property
+    def max_handles(self) -> int:
+        return self._max_handles
+
+    def _retire_locked(self, entry: _PooledCube) -> xr.Dataset | None:
+        """Drop `entry` from the pool; returns its dataset if it can close now."""
+        self._entries.pop(entry.key, None)
+        entry.evicted = True
+        if entry.refs > 0:
+            return None
+        self._by_dataset.pop(id(entry.ds), None)
+        return entry.ds
+
+    def _checkout(self, cube_path: Path) -> _PooledCube:
+        key = datacube_slice_key(cube_path)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                entry.refs += 1
+                self._hits += 1
+                return entry
+            self._misses += 1
+
+        ds = open_datacube(cube_path, cache=False)
+        try:
+            coords = DataCubeCoords.from_dataset(ds)
+        except Exception:
+            _close_quietly(ds)
+            raise
+
+        to_close: list[xr.Dataset] = []
+        with self._lock:
+            existing = self._entries.get(key)
+            if existing is not None:
+                # Another request opened the same cube meanwhile; share theirs.
+                self._entries.move_to_end(key)
+                existing.refs += 1
+                to_close.append(ds)
+                entry = existing
+            else:
+                entry = _PooledCube(key=key, ds=ds, coords=coords, refs=1)
+                self._by_dataset[id(ds)] = entry
+                stale_entries = [
+                    stale for stale in self._entries.values() if stale.key[0] == key[0]
+                ]
+                for stale in stale_entries:
+                    closable = self._retire_locked(stale)
+                    if closable is not None:
+                        to_close.append(closable)
+                if self._max_handles > 0:
+                    self._entries[key] = entry
+                else:
+                    entry.evicted = True
+                while len(self._entries) > self._max_handles:
+                    _key, oldest = next(iter(self._entries.items()))
+                    closable = self._retire_locked(oldest)
+                    self._evictions += 1
+                    if closable is not None:
+                        to_close.append(closable)
+        for stale_ds in to_close:
+            _close_quietly(stale_ds)
+        return entry
+
+    def _release(self, entry: _PooledCube) -> None:
+        with self._lock:
+            entry.refs -= 1
+            if not entry.evicted or entry.refs > 0:
+                return
+            self._by_dataset.pop(id(entry.ds), None)
+        _close_quietly(entry.ds)
+
+    @contextmanager
+    def acquire(self, cube_path: Path) -> Iterator[xr.Dataset]:
+        """Borrow an open dataset for `cube_path`; callers must not close it."""
+        entry = self._checkout(Path(cube_path))
+        try:
+            yield entry.ds
+        finally:
+            self._release(entry)
+
+    def coords_for(self, ds: xr.Dataset) -> DataCubeCoords | None:
+        with self._lock:
+            entry = self._by_dataset.get(id(ds))
+        if entry is None or entry.ds is not ds:
+            return None
+        return entry.coords
+
+    def stats(self) -> DataCubePoolStats:
+        with self._lock:
+            return DataCubePoolStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                open_handles=len(self._by_dataset),
+                max_handles=self._max_handles,
+            )
+
+    def close(self) -> None:
+        """Close every idle handle; handles still in use close on release."""
+        to_close: list[xr.Dataset] = []
+        with self._lock:
+            for entry in list(self._entries.values()):
+                closable = self._retire_locked(entry)
+                if closable is not None:
+                    to_close.append(closable)
+            self._hits = 0
+            self._misses = 0
+            self._evictions = 0
+        for ds in to_close:
+            _close_quietly(ds)
+
+
+def _configured_pool_size() -> int:
+    raw = os.environ.get(DATACUBE_HANDLE_POOL_SIZE_ENV, "").strip()
+    if raw == "":
+        return DEFAULT_DATACUBE_HANDLE_POOL_SIZE
+    try:
+        return max(0, int(raw))
+    except ValueError:
+        logger.warning(
+            "datacube_pool_invalid_size",
+            extra={"env": DATACUBE_HANDLE_POOL_SIZE_ENV, "value": raw},
+        )
+        return DEFAULT_DATACUBE_HANDLE_POOL_SIZE
+
+
+@lru_cache(maxsize=1)
+def get_datacube_handle_pool() -> DataCubeHandlePool:
+    return DataCubeHandlePool(max_handles=_configured_pool_size())
+
+
+def open_pooled_datacube(cube_path: Path) -> AbstractContextManager[xr.Dataset]:
+    """Context manager yielding a pooled, read-only dataset for `cube_path`."""
+    return get_datacube_handle_pool().acquire(cube_path)
+
+
+def datacube_coords(ds: xr.Dataset) -> DataCubeCoords:
+    """Cached coordinates for a pooled dataset; decoded afresh for any other."""
+    coords = get_datacube_handle_pool().coords_for(ds)
+    if coords is None:
+        coords = DataCubeCoords.from_dataset(ds)
+    return coords
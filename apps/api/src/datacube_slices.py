@@ -0,0 +1,167 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+import xarray as xr
+
+from grid_cache import DecodedGrid, datacube_slice_key, get_datacube_grid_cache
+
+# Coarsest mip level served from a slice (2**6 = 64x64 cells per block).
+MAX_MIP_LEVEL = 6
+
+
+def normalize_grid_axis(
+    coord: np.ndarray, values: np.ndarray, *, axis: int
+) -> tuple[np.ndarray, np.ndarray]:
+    coord_f = np.asarray(coord, dtype=np.float64)
+    if coord_f.size < 2:
+        return coord_f, np.asarray(values, dtype=np.float64)
+    if float(coord_f[0]) <= float(coord_f[-1]):
+        return coord_f, np.asarray(values, dtype=np.float64)
+    return coord_f[::-1], np.flip(np.asarray(values, dtype=np.float64), axis=axis)
+
+
+@dataclass(frozen=True)
+class DataCubeSlice:
+    """A decoded (lat, lon) slice of one DataCube variable.
+
+    Both axes are ascending and `values` is a read-only float32 array shared
+    with the grid cache. `lat_flipped`/`lon_flipped` record which axes the cube
+    stores descending, so `in_file_order()` can recover the original layout as
+    a view.
+    """
+
+    lat: np.ndarray
+    lon: np.ndarray
+    values: np.ndarray
+    lat_flipped: bool = False
+    lon_flipped: bool = False
+
+    def in_file_order(self) -> "DataCubeSlice":
+        lat_step = -1 if self.lat_flipped else 1
+        lon_step = -1 if self.lon_flipped else 1
+        return DataCubeSlice(
+            lat=self.lat[::lat_step],
+            lon=self.lon[::lon_step],
+            values=self.values[::lat_step, ::lon_step],
+        )
+
+
+def _decode_slice(
+    ds: xr.Dataset, *, var: str, time_index: int, level_index: int
+) -> DecodedGrid:
+    da = ds[var].isel(time=int(time_index), level=int(level_index))
+    da = da.transpose("lat", "lon")
+    lat_raw = np.asarray(da["lat"].values, dtype=np.float64)
+    lon_raw = np.asarray(da["lon"].values, dtype=np.float64)
+
+    lat, values = normalize_grid_axis(lat_raw, np.asarray(da.values), axis=0)
+    lon, values = normalize_grid_axis(lon_raw, values, axis=1)
+    flipped = np.array(
+        [
+            lat_raw.size >= 2 and lat_raw[0] > lat_raw[-1],
+            lon_raw.size >= 2 and lon_raw[0] > lon_raw[-1],
+        ],
+        dtype=bool,
+    )
+    return (
+        np.ascontiguousarray(lat),
+        np.ascontiguousarray(lon),
+        np.ascontiguousarray(values, dtype=np.float32),
+        flipped,
+    )
+
+
+def downsample_axis(coord: np.ndarray, factor: int) -> np.ndarray:
+    """Mean coordinate of each `factor`-wide block; the last block may be short."""
+    coord_f = np.asarray(coord, dtype=np.float64)
+    if factor <= 1 or coord_f.size == 0:
+        return coord_f
+    starts = np.arange(0, coord_f.size, int(factor))
+    counts = np.diff(np.append(starts, coord_f.size))
+    return np.add.reduceat(coord_f, starts) / counts
+
+
+def downsample_grid(values: np.ndarray, factor: int) -> np.ndarray:
+    """Area-average `factor` x `factor` blocks, ignoring non-finite cells.
+
+    Edge blocks that run past the grid average the cells they do cover; a
+    block with no finite cell stays NaN.
+    """
+    grid = np.asarray(values, dtype=np.float64)
+    if factor <= 1:
+        return grid
+    rows = -(-grid.shape[0] // factor)
+    cols = -(-grid.shape[1] // factor)
+    padded = np.full((rows * factor, cols * factor), np.nan, dtype=np.float64)
+    padded[: grid.shape[0], : grid.shape[1]] = grid
+
+    blocks = padded.reshape(rows, factor, cols, factor)
+    finite = np.isfinite(blocks)
+    total = np.where(finite, blocks, 0.0).sum(axis=(1, 3))
+    count = finite.sum(axis=(1, 3))
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return np.where(count > 0, total / count, np.nan)
+
+
+def _downsample_slice(grid: DataCubeSlice, *, level: int) -> DecodedGrid:
+    factor = 2 ** int(level)
+    return (
+        np.ascontiguousarray(downsample_axis(grid.lat, factor)),
+        np.ascontiguousarray(downsample_axis(grid.lon, factor)),
+        np.ascontiguousarray(downsample_grid(grid.values, factor), dtype=np.float32),
+        np.array([grid.lat_flipped, grid.lon_flipped], dtype=bool),
+    )
+
+
+def load_datacube_slice(
+    ds: xr.Dataset,
+    cube_path: Path,
+    *,
+    var: str,
+    time_index: int,
+    level_index: int,
+    mip_level: int = 0,
+) -> DataCubeSlice:
+    """Return `var` at (time_index, level_index), decoding it at most once.
+
+    `ds` must be the open dataset for `cube_path` and `var` a resolved data
+    variable with time/level/lat/lon dims. Slices are kept in this process'
+    DataCube grid cache keyed by the cube's identity (path, mtime, size), so
+    vector, streamline and sample requests share one decode per slice.
+
+    `mip_level > 0` returns the slice area-averaged over 2**mip_level cell
+    blocks, built from the native slice and cached alongside it.
+    """
+    level = int(mip_level)
+    if level < 0 or level > MAX_MIP_LEVEL:
+        raise ValueError(f"mip_level must be between 0 and {MAX_MIP_LEVEL}")
+
+    parts: tuple[object, ...] = (var, int(time_index), int(level_index))
+    if level == 0:
+        key = datacube_slice_key(cube_path, *parts)
+
+        def _load() -> DecodedGrid:
+            return _decode_slice(
+                ds, var=var, time_index=time_index, level_index=level_index
+            )
+
+    else:
+        key = datacube_slice_key(cube_path, *parts, f"mip{level}")
+
+        def _load() -> DecodedGrid:
+            native = load_datacube_slice(
+                ds, cube_path, var=var, time_index=time_index, level_index=level_index
+            )
+            return _downsample_slice(native, level=level)
+
+    lat, lon, values, flipped = get_datacube_grid_cache().get_or_load(key, _load)
+    return DataCubeSlice(
+        lat=lat,
+        lon=lon,
+        values=values,
+        lat_flipped=bool(flipped[0]),
+        lon_flipped=bool(flipped[1]),
+    )
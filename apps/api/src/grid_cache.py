@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+from functools import lru_cache
+from pathlib import Path
+from stat import S_ISDIR
+from typing import Final, Hashable
+
+import numpy as np
+
+from byte_lru import ByteBoundedLRU, ByteLRUStats, configured_max_bytes
+
+GRID_CACHE_MAX_BYTES_ENV: Final[str] = "DIGITAL_EARTH_GRID_CACHE_MAX_BYTES"
+DEFAULT_GRID_CACHE_MAX_BYTES: Final[int] = 256 * 1024 * 1024
+DATACUBE_GRID_CACHE_MAX_BYTES_ENV: Final[str] = (
+    "DIGITAL_EARTH_DATACUBE_GRID_CACHE_MAX_BYTES"
+)
+DEFAULT_DATACUBE_GRID_CACHE_MAX_BYTES: Final[int] = 256 * 1024 * 1024
+
+DecodedGrid = tuple[np.ndarray, ...]
+
+# Metadata files rewritten whenever a Zarr store is written (consolidated v2
+# metadata, group/array attributes, v3 metadata).
+_ZARR_STAMP_FILES: Final[tuple[str, ...]] = (
+    ".zmetadata",
+    ".zattrs",
+    ".zgroup",
+    "zarr.json",
+)
+
+
+GridCacheStats = ByteLRUStats
+
+
+def _grid_nbytes(grid: DecodedGrid) -> int:
+    return int(sum(int(np.asarray(arr).nbytes) for arr in grid))
+
+
+def _freeze(grid: DecodedGrid) -> DecodedGrid:
+    frozen: list[np.ndarray] = []
+    for arr in grid:
+        value = np.asarray(arr)
+        value.setflags(write=False)
+        frozen.append(value)
+    return tuple(frozen)
+
+
+class DecodedGridCache(ByteBoundedLRU[Hashable, DecodedGrid]):
+    """Thread-safe LRU of decoded NumPy grids bounded by total array bytes.
+
+    Loads for the same key are collapsed so that concurrent requests for one
+    file only decode it once; the other callers wait and reuse the result.
+    Stored arrays are made read-only.
+    """
+
+    def __init__(self, *, max_bytes: int) -> None:
+        super().__init__(max_bytes=max_bytes, sizeof=_grid_nbytes)
+
+    def _prepare(self, value: DecodedGrid) -> DecodedGrid:
+        return _freeze(value)
+
+
+def _configured_max_bytes(env: str, default: int) -> int:
+    return configured_max_bytes(env, default, event="grid_cache_invalid_max_bytes")
+
+
+def _cube_stamp(cube_path: Path) -> tuple[int, int]:
+    stat = cube_path.stat()
+    if not S_ISDIR(stat.st_mode):
+        return stat.st_mtime_ns, stat.st_size
+
+    mtime_ns, size = stat.st_mtime_ns, 0
+    for name in _ZARR_STAMP_FILES:
+        try:
+            meta = (cube_path / name).stat()
+        except FileNotFoundError:
+            continue
+        mtime_ns = max(mtime_ns, meta.st_mtime_ns)
+        size += meta.st_size
+    return mtime_ns, size
+
+
+def datacube_slice_key(cube_path: Path, *parts: Hashable) -> tuple[Hashable, ...]:
+    """Key for a decoded DataCube slice that changes when the cube is rewritten.
+
+    `parts` identify the slice inside the cube (variable, time, level). NetCDF
+    files are stamped by their own mtime and size. A Zarr directory's mtime
+    does not change when chunks are rewritten in place, so Zarr stores are
+    stamped by their metadata files, which every write of a store rewrites.
+    """
+    mtime_ns, size = _cube_stamp(Path(cube_path))
+    return (str(cube_path), mtime_ns, size, *parts)
+
+
+@lru_cache(maxsize=1)
+def get_cldas_grid_cache() -> DecodedGridCache:
+    return DecodedGridCache(
+        max_bytes=_configured_max_bytes(
+            GRID_CACHE_MAX_BYTES_ENV, DEFAULT_GRID_CACHE_MAX_BYTES
+        )
+    )
+
+
+@lru_cache(maxsize=1)
+def get_datacube_grid_cache() -> DecodedGridCache:
+    """Decoded ECMWF DataCube slices shared by the vector and sample routers."""
+    return DecodedGridCache(
+        max_bytes=_configured_max_bytes(
+            DATACUBE_GRID_CACHE_MAX_BYTES_ENV, DEFAULT_DATACUBE_GRID_CACHE_MAX_BYTES
+        )
+    )
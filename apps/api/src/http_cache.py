@@ -12,3 +12,58 @@ def if_none_match_matches(header: str | None, etag: str) -> bool:
         return True
 
     return any(item.strip() == etag for item in text.split(","))
+
+
+def if_range_matches(header: str | None, etag: str) -> bool:
+    """Return True when a Range request may be honoured for `etag`.
+
+    Only strong entity-tag validators are supported; an HTTP-date or weak tag
+    makes the server fall back to sending the full representation.
+    """
+    if header is None:
+        return True
+    text = header.strip()
+    if text == "":
+        return True
+    if text.startswith("W/"):
+        return False
+    return text == etag
+
+
+def parse_byte_range(header: str | None, size: int) -> tuple[int, int] | None:
+    """Parse a single `bytes=` range into an inclusive (start, end) pair.
+
+    Returns None when the header is absent, malformed or asks for several
+    ranges (the full body is served instead). Raises ValueError when the range
+    cannot be satisfied for a representation of `size` bytes.
+    """
+    if header is None:
+        return None
+    unit, sep, spec = header.strip().partition("=")
+    if sep != "=" or unit.strip().lower() != "bytes":
+        return None
+    spec = spec.strip()
+    if spec == "" or "," in spec:
+        return None
+
+    first, dash, last = spec.partition("-")
+    first = first.strip()
+    last = last.strip()
+    if dash != "-" or not (first.isdigit() or first == ""):
+        return None
+    if not (last.isdigit() or last == "") or (first == "" and last == ""):
+        return None
+
+    if first == "":
+        suffix = int(last)
+        if suffix == 0 or size <= 0:
+            raise ValueError("Range not satisfiable")
+        return max(0, size - suffix), size - 1
+
+    start = int(first)
+    end = size - 1 if last == "" else min(int(last), size - 1)
+    if last != "" and int(last) < start:
+        return None
+    if start >= size:
+        raise ValueError("Range not satisfiable")
+    return start, end
@@ -4,6 +4,7 @@ from fastapi import APIRouter, FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from config import get_settings
+from datacube_pool import get_datacube_handle_pool
 from editor_permissions import (
     EditorPermissionsMiddleware,
     get_editor_permissions_config,
@@ -14,6 +15,7 @@ from observability import (
     register_exception_handlers,
 )
 from rate_limit import RateLimitMiddleware, create_redis_client
+from render_pool import get_render_executor
 from routers.attribution import router as attribution_router
 from routers.analytics import router as analytics_router
 from routers.catalog import router as catalog_router
@@ -58,6 +60,14 @@ def create_app() -> FastAPI:
     async def _close_redis_client() -> None:
         await redis_client.close()
 
+    @app.on_event("shutdown")
+    def _shutdown_render_executor() -> None:
+        get_render_executor().shutdown()
+
+    @app.on_event("shutdown")
+    def _close_datacube_handles() -> None:
+        get_datacube_handle_pool().close()
+
     if settings.api.cors_origins:
         app.add_middleware(
             CORSMiddleware,
@@ -0,0 +1,206 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import multiprocessing
+import os
+import threading
+from asyncio import to_thread
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Callable, Final, Optional, TypeVar
+
+from fastapi import HTTPException
+
+logger = logging.getLogger("api.error")
+
+T = TypeVar("T")
+
+RENDER_WORKERS_ENV: Final[str] = "DIGITAL_EARTH_RENDER_WORKERS"
+RENDER_MAX_PENDING_ENV: Final[str] = "DIGITAL_EARTH_RENDER_MAX_PENDING"
+DEFAULT_RENDER_WORKERS: Final[int] = 0
+DEFAULT_RENDER_MAX_PENDING: Final[int] = 64
+
+# Modules imported once per worker so the first render does not pay for them.
+_WARM_MODULES: Final[tuple[str, ...]] = (
+    "numpy",
+    "xarray",
+    "PIL.Image",
+    "grid_cache",
+    "tiling.cldas_tiles",
+)
+
+
+@dataclass(frozen=True)
+class RenderExecutorStats:
+    workers: int
+    max_pending: int
+    pending: int
+    rejected: int
+
+
+class _WorkerHTTPError(Exception):
+    """Picklable stand-in for an HTTPException raised inside a worker."""
+
+    def __init__(self, status_code: int, detail: Any) -> None:
+        super().__init__(status_code, detail)
+        self.status_code = status_code
+        self.detail = detail
+
+
+def _warm_worker() -> None:
+    import importlib
+
+    for name in _WARM_MODULES:
+        try:
+            importlib.import_module(name)
+        except Exception:  # noqa: BLE001
+            continue
+
+
+def _call_in_worker(
+    fn: Callable[..., T], args: tuple[Any, ...], kwargs: dict[str, Any]
+) -> T:
+    try:
+        return fn(*args, **kwargs)
+    except HTTPException as exc:
+        raise _WorkerHTTPError(exc.status_code, exc.detail) from None
+
+
+class RenderExecutor:
+    """Runs CPU-bound render/compute jobs with a bounded backlog.
+
+    With `workers > 0` jobs go to a pool of long-lived worker processes, so
+    NumPy/PIL work does not hold the API process' GIL and per-process caches
+    (e.g. decoded grids) stay resident between jobs. With `workers == 0` jobs
+    run on a thread in this process. Either way at most `max_pending` jobs may
+    be queued or running; further submissions fail fast with a 503.
+
+    Jobs submitted to the process pool must be picklable module-level callables.
+    """
+
+    def __init__(self, *, workers: int, max_pending: int) -> None:
+        self._workers = max(0, int(workers))
+        self._max_pending = max(1, int(max_pending))
+        self._pending = 0
+        self._rejected = 0
+        self._lock = threading.Lock()
+        self._pool: Optional[ProcessPoolExecutor] = None
+
+    @property
+    def workers(self) -> int:
+        return self._workers
+
+    def _acquire(self) -> None:
+        with self._lock:
+            if self._pending >= self._max_pending:
+                self._rejected += 1
+                rejected = True
+            else:
+                self._pending += 1
+                rejected = False
+        if rejected:
+            logger.warning(
+                "render_queue_full",
+                extra={"max_pending": self._max_pending, "workers": self._workers},
+            )
+            raise HTTPException(status_code=503, detail="Render queue is full")
+
+    def _release(self) -> None:
+        with self._lock:
+            self._pending -= 1
+
+    def _ensure_pool(self) -> Optional[ProcessPoolExecutor]:
+        if self._workers == 0:
+            return None
+        with self._lock:
+            if self._pool is None:
+                self._pool = ProcessPoolExecutor(
+                    max_workers=self._workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                    initializer=_warm_worker,
+                )
+            return self._pool
+
+    def _discard_pool(self, pool: ProcessPoolExecutor) -> None:
+        with self._lock:
+            if self._pool is pool:
+                self._pool = None
+        pool.shutdown(wait=False, cancel_futures=True)
+
+    def call(self, fn: Callable[..., T], /, *args: Any, **kwargs: Any) -> T:
+        """Run `fn` and block until it finishes; for use from worker threads."""
+        self._acquire()
+        try:
+            pool = self._ensure_pool()
+            if pool is None:
+                return fn(*args, **kwargs)
+            try:
+                return pool.submit(_call_in_worker, fn, args, kwargs).result()
+            except BrokenProcessPool:
+                self._discard_pool(pool)
+                raise
+            except _WorkerHTTPError as exc:
+                raise HTTPException(
+                    status_code=exc.status_code, detail=exc.detail
+                ) from exc
+        finally:
+            self._release()
+
+    async def run(self, fn: Callable[..., T], /, *args: Any, **kwargs: Any) -> T:
+        """Run `fn` without blocking the event loop."""
+        self._acquire()
+        try:
+            pool = self._ensure_pool()
+            if pool is None:
+                return await to_thread(fn, *args, **kwargs)
+            try:
+                return await asyncio.wrap_future(
+                    pool.submit(_call_in_worker, fn, args, kwargs)
+                )
+            except BrokenProcessPool:
+                self._discard_pool(pool)
+                raise
+            except _WorkerHTTPError as exc:
+                raise HTTPException(
+                    status_code=exc.status_code, detail=exc.detail
+                ) from exc
+        finally:
+            self._release()
+
+    def stats(self) -> RenderExecutorStats:
+        with self._lock:
+            return RenderExecutorStats(
+                workers=self._workers,
+                max_pending=self._max_pending,
+                pending=self._pending,
+                rejected=self._rejected,
+            )
+
+    def shutdown(self) -> None:
+        with self._lock:
+            pool = self._pool
+            self._pool = None
+        if pool is not None:
+            pool.shutdown(wait=False, cancel_futures=True)
+
+
+def _configured_int(env: str, default: int) -> int:
+    raw = os.environ.get(env, "").strip()
+    if raw == "":
+        return default
+    try:
+        return max(0, int(raw))
+    except ValueError:
+        logger.warning("render_pool_invalid_config", extra={"env": env, "value": raw})
+        return default
+
+
+@lru_cache(maxsize=1)
+def get_render_executor() -> RenderExecutor:
+    return RenderExecutor(
+        workers=_configured_int(RENDER_WORKERS_ENV, DEFAULT_RENDER_WORKERS),
+        max_pending=_configured_int(RENDER_MAX_PENDING_ENV, DEFAULT_RENDER_MAX_PENDING),
+    )
@@ -4,9 +4,10 @@ import hashlib
 import json
 import logging
 from asyncio import to_thread
+from dataclasses import dataclass, replace
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Literal
+from typing import Any, Callable, Literal, Optional
 
 import numpy as np
 import xarray as xr
@@ -20,7 +21,8 @@ from sqlalchemy.orm import Session
 from catalog_cache import RedisLike, get_or_compute_cached_bytes
 import db
 from data_source import DataNotFoundError, DataSourceError
-from datacube.storage import open_datacube
+from datacube_pool import datacube_coords, open_pooled_datacube
+from datacube_slices import DataCubeSlice, load_datacube_slice
 from local_data_service import get_data_source
 from models import EcmwfAsset, EcmwfRun, EcmwfTime
 
@@ -35,6 +37,9 @@ CACHE_LOCK_TTL_MS = 30_000
 CACHE_WAIT_TIMEOUT_MS = 200
 CACHE_COOLDOWN_TTL_SECONDS: tuple[int, int] = (5, 30)
 
+MAX_BATCH_POINTS = 5_000
+MAX_BATCH_VARS = 16
+
 SampleQC = Literal["ok", "missing"]
 
 
@@ -46,6 +51,69 @@ class SampleResponse(BaseModel):
     qc: SampleQC = Field(default="missing")
 
 
+class SampleBatchRequest(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+
+    run: str = Field(..., min_length=1, description="ECMWF run time")
+    valid_time: str = Field(..., min_length=1, description="Valid time")
+    level: str = Field(..., min_length=1, description="Pressure level (hPa) or sfc")
+    vars: list[str] = Field(
+        ..., min_length=1, max_length=MAX_BATCH_VARS, description="Variable names"
+    )
+    lon: list[float] = Field(..., min_length=1, max_length=MAX_BATCH_POINTS)
+    lat: list[float] = Field(..., min_length=1, max_length=MAX_BATCH_POINTS)
+
+
+class SampleBatchColumn(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+
+    var: str
+    unit: str = ""
+    values: list[float | None] = Field(
+        default_factory=list,
+        description="One value per requested point; null where missing",
+    )
+
+
+class SampleBatchResponse(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+
+    count: int = 0
+    columns: list[SampleBatchColumn] = Field(default_factory=list)
+
+
+class SampleProfileColumn(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+
+    var: str
+    unit: str = ""
+    values: list[float | None] = Field(
+        default_factory=list,
+        description="One value per entry of `levels`; null where missing",
+    )
+
+
+class SampleProfileResponse(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+
+    valid_time: str
+    levels: list[str] = Field(default_factory=list)
+    columns: list[SampleProfileColumn] = Field(default_factory=list)
+
+
+class SampleSeriesResponse(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+
+    var: str
+    unit: str = ""
+    times: list[str] = Field(default_factory=list)
+    levels: list[str] = Field(default_factory=list)
+    values: list[list[float | None]] = Field(
+        default_factory=list,
+        description="values[time][level]; null where missing",
+    )
+
+
 def _parse_time(value: str, *, label: str) -> datetime:
     raw = (value or "").strip()
     if raw == "":
@@ -118,22 +186,25 @@ def _resolve_surface_level_index(levels: np.ndarray, attrs: dict[str, Any]) -> i
 def _resolve_level_index(
     ds: xr.Dataset, *, level_key: str, numeric: float | None
 ) -> int:
-    if "level" not in ds.coords:
+    coords = datacube_coords(ds)
+    levels = coords.levels
+    if levels is None:
         raise HTTPException(status_code=500, detail="DataCube missing level coordinate")
-
-    levels = np.asarray(ds["level"].values)
     if levels.size == 0:
         raise HTTPException(
             status_code=500, detail="DataCube level coordinate is empty"
         )
 
     if level_key == "sfc":
-        return _resolve_surface_level_index(levels, dict(ds["level"].attrs))
+        return _resolve_surface_level_index(levels, coords.level_attrs)
 
     if numeric is None or not np.isfinite(numeric):
         raise HTTPException(status_code=400, detail="level must be a finite number")
 
     numeric_f = float(numeric)
+    exact = coords.level_lookup.get(numeric_f)
+    if exact is not None:
+        return exact
     matches = np.where(
         np.isclose(levels.astype(np.float64, copy=False), numeric_f, atol=1e-3)
     )[0]
@@ -143,18 +214,18 @@ def _resolve_level_index(
 
 
 def _resolve_time_index(ds: xr.Dataset, *, valid_time: datetime) -> int:
-    if "time" not in ds.coords:
+    coords = datacube_coords(ds)
+    if coords.times is None:
         raise HTTPException(status_code=500, detail="DataCube missing time coordinate")
-    values = np.asarray(ds["time"].values)
-    if values.size == 0:
+    if coords.times.size == 0:
         raise HTTPException(status_code=500, detail="DataCube time coordinate is empty")
 
     dt = valid_time.astimezone(timezone.utc)
     target = np.datetime64(dt.strftime("%Y-%m-%dT%H:%M:%S"))
-    matches = np.where(values.astype("datetime64[s]") == target)[0]
-    if matches.size == 0:
+    index = coords.time_lookup.get(target)
+    if index is None:
         raise HTTPException(status_code=404, detail="valid_time not found in DataCube")
-    return int(matches[0])
+    return index
 
 
 def _resolve_variable_name(ds: xr.Dataset, requested: str) -> str:
@@ -214,12 +285,11 @@ def _interp_1d(coord: np.ndarray, query: float) -> tuple[list[int], float, bool]
     return [int(order[left]), int(order[right])], frac, valid
 
 
-def _bilinear_point_sample(da: xr.DataArray, *, lat: float, lon: float) -> float | None:
-    if set(da.dims) != {"lat", "lon"}:
-        raise HTTPException(status_code=500, detail="DataCube variable is not lat/lon")
-
-    lat_coord = np.asarray(da["lat"].values)
-    lon_coord = np.asarray(da["lon"].values)
+def _bilinear_point_sample(
+    grid: DataCubeSlice, *, lat: float, lon: float
+) -> float | None:
+    lat_coord = grid.lat
+    lon_coord = grid.lon
     lon_q = _normalize_query_lon(lon, lon_coord)
 
     lat_idx, lat_f, lat_ok = _interp_1d(lat_coord, float(lat))
@@ -229,7 +299,7 @@ def _bilinear_point_sample(da: xr.DataArray, *, lat: float, lon: float) -> float
         return None
 
     # Advanced indexing keeps the index order we pass in.
-    corners = da.isel(lat=lat_idx, lon=lon_idx).transpose("lat", "lon").values
+    corners = grid.values[np.ix_(lat_idx, lon_idx)]
     corner_values = np.asarray(corners, dtype=np.float64)
     if corner_values.shape != (2, 2):
         raise HTTPException(status_code=500, detail="Failed to load 2x2 neighborhood")
@@ -256,6 +326,146 @@ def _bilinear_point_sample(da: xr.DataArray, *, lat: float, lon: float) -> float
     return float(out)
 
 
+@dataclass(frozen=True)
+class _PointWeights:
+    """Bilinear neighbours and weights of many points on one lat/lon grid.
+
+    Index arrays have shape (2, n): the lower and upper neighbour per point.
+    Computed once, the weights apply to any array whose last two axes are that
+    grid, e.g. every time step or level of a variable.
+    """
+
+    lat_index: np.ndarray
+    lon_index: np.ndarray
+    lat_frac: np.ndarray
+    lon_frac: np.ndarray
+    valid: np.ndarray
+
+    def apply(self, values: np.ndarray) -> np.ndarray:
+        grid = np.asarray(values)
+
+        def _corner(i: int, j: int) -> np.ndarray:
+            corner = grid[..., self.lat_index[i], self.lon_index[j]]
+            return corner.astype(np.float64, copy=False)
+
+        wy = self.lat_frac
+        wx = self.lon_frac
+        with np.errstate(invalid="ignore"):
+            out = (
+                (1.0 - wy) * (1.0 - wx) * _corner(0, 0)
+                + (1.0 - wy) * wx * _corner(0, 1)
+                + wy * (1.0 - wx) * _corner(1, 0)
+                + wy * wx * _corner(1, 1)
+            )
+        # Any non-finite corner poisons the sum, as in `_bilinear_point_sample`.
+        return np.where(self.valid & np.isfinite(out), out, np.nan)
+
+
+def _axis_weights(
+    coord: np.ndarray, query: np.ndarray
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    coord_f = np.asarray(coord, dtype=np.float64)
+    if coord_f.ndim != 1 or coord_f.size == 0:
+        raise HTTPException(status_code=500, detail="DataCube has invalid coordinates")
+
+    count = int(coord_f.size)
+    right = np.searchsorted(coord_f, query, side="right")
+    left = np.clip(right - 1, 0, count - 1)
+    right = np.clip(right, 0, count - 1)
+    valid = (query >= coord_f[0]) & (query <= coord_f[-1])
+
+    denom = coord_f[right] - coord_f[left]
+    with np.errstate(invalid="ignore", divide="ignore"):
+        frac = np.where(denom == 0.0, 0.0, (query - coord_f[left]) / denom)
+    return np.stack([left, right]), np.clip(frac, 0.0, 1.0), valid
+
+
+def _point_weights(
+    lat_coord: np.ndarray,
+    lon_coord: np.ndarray,
+    *,
+    lat: np.ndarray,
+    lon: np.ndarray,
+) -> _PointWeights:
+    """Weights for (lat, lon) points on ascending `lat_coord`/`lon_coord`."""
+    lon_coord_f = np.asarray(lon_coord, dtype=np.float64)
+    lon_q = np.asarray(lon, dtype=np.float64)
+    if lon_coord_f.size:
+        # Same convention as `_normalize_query_lon`.
+        lon_min = float(np.nanmin(lon_coord_f))
+        lon_max = float(np.nanmax(lon_coord_f))
+        if lon_min >= 0.0 and lon_max > 180.0:
+            lon_q = lon_q % 360.0
+        else:
+            lon_q = ((lon_q + 180.0) % 360.0) - 180.0
+
+    lat_index, lat_frac, lat_ok = _axis_weights(
+        lat_coord, np.asarray(lat, dtype=np.float64)
+    )
+    lon_index, lon_frac, lon_ok = _axis_weights(lon_coord_f, lon_q)
+    return _PointWeights(
+        lat_index=lat_index,
+        lon_index=lon_index,
+        lat_frac=lat_frac,
+        lon_frac=lon_frac,
+        valid=lat_ok & lon_ok,
+    )
+
+
+def _query_run_assets(
+    *,
+    run_time: datetime,
+    variable: str,
+    valid_time: datetime | None = None,
+    level: str | None = None,
+) -> list[tuple[datetime, str, str]]:
+    """Latest (valid_time, level, path) per time/level of `variable` in a run.
+
+    `valid_time`/`level` narrow the lookup; left as None they match every
+    forecast hour or level in the catalog.
+    """
+    stmt = (
+        select(EcmwfTime.valid_time, EcmwfAsset.level, EcmwfAsset.path)
+        .join(EcmwfRun, EcmwfAsset.run_id == EcmwfRun.id)
+        .join(EcmwfTime, EcmwfAsset.time_id == EcmwfTime.id)
+        .where(
+            EcmwfRun.run_time == run_time,
+            func.lower(EcmwfAsset.variable) == variable.lower(),
+        )
+        .order_by(EcmwfTime.valid_time, EcmwfAsset.level, desc(EcmwfAsset.version))
+    )
+    if valid_time is not None:
+        stmt = stmt.where(EcmwfTime.valid_time == valid_time)
+    if level is not None:
+        stmt = stmt.where(func.lower(EcmwfAsset.level) == level.lower())
+
+    try:
+        with Session(db.get_engine()) as session:
+            rows = session.execute(stmt).all()
+    except SQLAlchemyError as exc:
+        logger.error("sample_db_error", extra={"error": str(exc)})
+        raise HTTPException(
+            status_code=503, detail="Catalog database unavailable"
+        ) from exc
+
+    assets: list[tuple[datetime, str, str]] = []
+    seen: set[tuple[str, str]] = set()
+    for asset_time, asset_level, path in rows:
+        if not isinstance(path, str) or path.strip() == "":
+            continue
+        if asset_time.tzinfo is None:
+            asset_time = asset_time.replace(tzinfo=timezone.utc)
+        key = (_time_key(asset_time), str(asset_level).lower())
+        if key in seen:
+            continue
+        seen.add(key)
+        assets.append((asset_time, str(asset_level), path))
+
+    if not assets:
+        raise HTTPException(status_code=404, detail="DataCube asset not found")
+    return assets
+
+
 def _query_asset_path(
     *, run_time: datetime, valid_time: datetime, variable: str, level: str
 ) -> str:
@@ -309,6 +519,15 @@ def _resolve_asset_path(path_value: str) -> Path:
         raise HTTPException(status_code=500, detail="Internal Server Error") from exc
 
 
+def _check_sample_dims(da: xr.DataArray) -> None:
+    if "time" not in da.dims or "level" not in da.dims:
+        raise HTTPException(
+            status_code=500, detail="DataCube variable missing time/level dims"
+        )
+    if set(da.dims) != {"time", "level", "lat", "lon"}:
+        raise HTTPException(status_code=500, detail="DataCube variable is not lat/lon")
+
+
 def _sample_from_datacube(
     cube_path: Path,
     *,
@@ -319,8 +538,7 @@ def _sample_from_datacube(
     lon: float,
     lat: float,
 ) -> SampleResponse:
-    ds = open_datacube(cube_path)
-    try:
+    with open_pooled_datacube(cube_path) as ds:
         resolved_var = _resolve_variable_name(ds, var)
         da = ds[resolved_var]
         unit = str(da.attrs.get("units") or "")
@@ -330,27 +548,385 @@ def _sample_from_datacube(
             ds, level_key=level_key, numeric=level_numeric
         )
 
-        if "time" not in da.dims or "level" not in da.dims:
-            raise HTTPException(
-                status_code=500, detail="DataCube variable missing time/level dims"
-            )
-
-        slice_da = da.isel(time=int(time_index), level=int(level_index))
-        slice_da = slice_da.transpose("lat", "lon")
-
-        sampled = _bilinear_point_sample(slice_da, lat=float(lat), lon=float(lon))
+        _check_sample_dims(da)
+        grid = load_datacube_slice(
+            ds,
+            cube_path,
+            var=resolved_var,
+            time_index=time_index,
+            level_index=level_index,
+        )
+        sampled = _bilinear_point_sample(grid, lat=float(lat), lon=float(lon))
         if sampled is None:
             return SampleResponse(value=None, unit=unit, qc="missing")
 
         return SampleResponse(value=float(sampled), unit=unit, qc="ok")
-    finally:
-        ds.close()
+
+
+_PointWindow = tuple[slice, slice, _PointWeights]
+
+
+def _point_window(
+    ds: xr.Dataset | xr.DataArray, *, lat: float, lon: float
+) -> _PointWindow:
+    """Locate the 2x2 neighbourhood of (lat, lon) in the cube's own axis order.
+
+    Returns the lat/lon slices to read and weights relative to that window,
+    so a caller can pull just the column under the point across any number
+    of variables, times and levels.
+    """
+    lat_raw = np.asarray(ds["lat"].values, dtype=np.float64)
+    lon_raw = np.asarray(ds["lon"].values, dtype=np.float64)
+    lat_flipped = lat_raw.size >= 2 and lat_raw[0] > lat_raw[-1]
+    lon_flipped = lon_raw.size >= 2 and lon_raw[0] > lon_raw[-1]
+
+    weights = _point_weights(
+        lat_raw[::-1] if lat_flipped else lat_raw,
+        lon_raw[::-1] if lon_flipped else lon_raw,
+        lat=np.array([float(lat)]),
+        lon=np.array([float(lon)]),
+    )
+    lat_index = (
+        lat_raw.size - 1 - weights.lat_index if lat_flipped else weights.lat_index
+    )
+    lon_index = (
+        lon_raw.size - 1 - weights.lon_index if lon_flipped else weights.lon_index
+    )
+    lat_start = int(lat_index.min())
+    lon_start = int(lon_index.min())
+    return (
+        slice(lat_start, int(lat_index.max()) + 1),
+        slice(lon_start, int(lon_index.max()) + 1),
+        replace(
+            weights, lat_index=lat_index - lat_start, lon_index=lon_index - lon_start
+        ),
+    )
+
+
+def _sample_point_block(
+    da: xr.DataArray, window: _PointWindow, *, times: slice, levels: slice
+) -> np.ndarray:
+    """Sample one point over a time x level block; returns shape (time, level)."""
+    lat_window, lon_window, weights = window
+    block = da.isel(time=times, level=levels, lat=lat_window, lon=lon_window)
+    values = block.transpose("time", "level", "lat", "lon").values
+    return weights.apply(values)[..., 0]
+
+
+def _sample_batch_from_datacube(
+    cube_path: Path,
+    *,
+    variables: list[str],
+    valid_time: datetime,
+    level_key: str,
+    level_numeric: float | None,
+    lon: np.ndarray,
+    lat: np.ndarray,
+) -> list[SampleBatchColumn]:
+    """Sample every point for each of `variables`, all stored in `cube_path`.
+
+    The cube is opened once; each variable's slice comes from the DataCube
+    grid cache and is sampled with one vectorized gather. Weights are shared
+    between variables on the same grid.
+    """
+    with open_pooled_datacube(cube_path) as ds:
+        time_index = _resolve_time_index(ds, valid_time=valid_time)
+        level_index = _resolve_level_index(
+            ds, level_key=level_key, numeric=level_numeric
+        )
+
+        columns: list[SampleBatchColumn] = []
+        weights: dict[tuple[bytes, bytes], _PointWeights] = {}
+        for var in variables:
+            resolved_var = _resolve_variable_name(ds, var)
+            da = ds[resolved_var]
+            _check_sample_dims(da)
+            grid = load_datacube_slice(
+                ds,
+                cube_path,
+                var=resolved_var,
+                time_index=time_index,
+                level_index=level_index,
+            )
+            grid_key = (grid.lat.tobytes(), grid.lon.tobytes())
+            point_weights = weights.get(grid_key)
+            if point_weights is None:
+                point_weights = _point_weights(grid.lat, grid.lon, lat=lat, lon=lon)
+                weights[grid_key] = point_weights
+
+            sampled = point_weights.apply(grid.values)
+            columns.append(
+                SampleBatchColumn(
+                    var=var,
+                    unit=str(da.attrs.get("units") or ""),
+                    values=[
+                        None if np.isnan(value) else value for value in sampled.tolist()
+                    ],
+                )
+            )
+        return columns
+
+
+def _sort_level_keys(keys: set[str]) -> list[str]:
+    """Surface first, then pressure levels from the ground up (high to low hPa)."""
+
+    def _order(key: str) -> tuple[int, float]:
+        if key == "sfc":
+            return 0, 0.0
+        return 1, -float(key.replace("p", "."))
+
+    return sorted(keys, key=_order)
+
+
+def _sample_series_from_datacubes(
+    assets: list[tuple[datetime, str, str]],
+    *,
+    var: str,
+    lon: float,
+    lat: float,
+) -> SampleSeriesResponse:
+    """Sample `var` at one point for every catalogued (valid_time, level).
+
+    Assets that share a DataCube are read together: the cube is opened once
+    and only the 2x2 column under the point is read across the time/level
+    range those assets need, with one set of bilinear weights for all of it.
+    """
+    by_cube: dict[Path, list[tuple[datetime, str, float | None]]] = {}
+    resolved_paths: dict[str, Path] = {}
+    for valid_time, level, path in assets:
+        try:
+            level_key, level_numeric = _normalize_level(level)
+        except ValueError:
+            continue
+        cube_path = resolved_paths.get(path)
+        if cube_path is None:
+            cube_path = _resolve_asset_path(path)
+            resolved_paths[path] = cube_path
+        by_cube.setdefault(cube_path, []).append((valid_time, level_key, level_numeric))
+
+    sampled: dict[tuple[str, str], float] = {}
+    unit = ""
+    for cube_path, entries in by_cube.items():
+        with open_pooled_datacube(cube_path) as ds:
+            resolved_var = _resolve_variable_name(ds, var)
+            da = ds[resolved_var]
+            _check_sample_dims(da)
+            unit = unit or str(da.attrs.get("units") or "")
+
+            indexed: list[tuple[str, str, int, int]] = []
+            for valid_time, level_key, level_numeric in entries:
+                try:
+                    time_index = _resolve_time_index(ds, valid_time=valid_time)
+                    level_index = _resolve_level_index(
+                        ds, level_key=level_key, numeric=level_numeric
+                    )
+                except HTTPException as exc:
+                    if exc.status_code != 404:
+                        raise
+                    continue
+                indexed.append(
+                    (_time_key(valid_time), level_key, time_index, level_index)
+                )
+            if not indexed:
+                continue
+
+            time_start = min(entry[2] for entry in indexed)
+            level_start = min(entry[3] for entry in indexed)
+            block = _sample_point_block(
+                da,
+                _point_window(ds, lat=lat, lon=lon),
+                times=slice(time_start, max(entry[2] for entry in indexed) + 1),
+                levels=slice(level_start, max(entry[3] for entry in indexed) + 1),
+            )
+            for time_key, level_key, time_index, level_index in indexed:
+                value = block[time_index - time_start, level_index - level_start]
+                if np.isfinite(value):
+                    sampled[(time_key, level_key)] = float(value)
+
+    times = sorted(
+        {_time_key(t) for entries in by_cube.values() for t, _key, _n in entries}
+    )
+    levels = _sort_level_keys(
+        {key for entries in by_cube.values() for _t, key, _n in entries}
+    )
+    return SampleSeriesResponse(
+        var=var,
+        unit=unit,
+        times=times,
+        levels=levels,
+        values=[
+            [sampled.get((time_key, level_key)) for level_key in levels]
+            for time_key in times
+        ],
+    )
+
+
+def _sample_profile_from_datacubes(
+    assets: dict[str, list[tuple[datetime, str, str]]],
+    *,
+    valid_time: datetime,
+    lon: float,
+    lat: float,
+) -> SampleProfileResponse:
+    """Sample every catalogued level of each variable at one point and time.
+
+    `assets` maps each requested variable to its catalog entries. Each cube
+    is opened once; the horizontal window and bilinear weights are computed
+    once per cube and every variable is read with a single slice over the
+    level axis.
+    """
+    by_cube: dict[Path, dict[str, list[tuple[str, float | None]]]] = {}
+    resolved_paths: dict[str, Path] = {}
+    for var, var_assets in assets.items():
+        for _valid_time, level, path in var_assets:
+            try:
+                level_key, level_numeric = _normalize_level(level)
+            except ValueError:
+                continue
+            cube_path = resolved_paths.get(path)
+            if cube_path is None:
+                cube_path = _resolve_asset_path(path)
+                resolved_paths[path] = cube_path
+            by_cube.setdefault(cube_path, {}).setdefault(var, []).append(
+                (level_key, level_numeric)
+            )
+
+    sampled: dict[tuple[str, str], float] = {}
+    units: dict[str, str] = {}
+    for cube_path, var_levels in by_cube.items():
+        with open_pooled_datacube(cube_path) as ds:
+            time_index = _resolve_time_index(ds, valid_time=valid_time)
+            window = _point_window(ds, lat=lat, lon=lon)
+            for var, levels in var_levels.items():
+                resolved_var = _resolve_variable_name(ds, var)
+                da = ds[resolved_var]
+                _check_sample_dims(da)
+                units.setdefault(var, str(da.attrs.get("units") or ""))
+
+                indexed: list[tuple[str, int]] = []
+                for level_key, level_numeric in levels:
+                    try:
+                        level_index = _resolve_level_index(
+                            ds, level_key=level_key, numeric=level_numeric
+                        )
+                    except HTTPException as exc:
+                        if exc.status_code != 404:
+                            raise
+                        continue
+                    indexed.append((level_key, level_index))
+                if not indexed:
+                    continue
+
+                level_start = min(index for _key, index in indexed)
+                level_stop = max(index for _key, index in indexed) + 1
+                column = _sample_point_block(
+                    da,
+                    window,
+                    times=slice(time_index, time_index + 1),
+                    levels=slice(level_start, level_stop),
+                )[0]
+                for level_key, level_index in indexed:
+                    value = column[level_index - level_start]
+                    if np.isfinite(value):
+                        sampled[(var, level_key)] = float(value)
+
+    levels = _sort_level_keys(
+        {
+            level_key
+            for var_levels in by_cube.values()
+            for entries in var_levels.values()
+            for level_key, _numeric in entries
+        }
+    )
+    return SampleProfileResponse(
+        valid_time=_time_key(valid_time),
+        levels=levels,
+        columns=[
+            SampleProfileColumn(
+                var=var,
+                unit=units.get(var, ""),
+                values=[sampled.get((var, level_key)) for level_key in levels],
+            )
+            for var in assets
+        ],
+    )
+
+
+def _parse_var_list(value: str) -> list[str]:
+    names = [part.strip() for part in (value or "").split(",")]
+    if not names or any(name == "" for name in names):
+        raise ValueError("vars must be comma-separated non-empty variable names")
+    if len(names) > MAX_BATCH_VARS:
+        raise ValueError(f"vars must list at most {MAX_BATCH_VARS} variables")
+    return list(dict.fromkeys(names))
+
+
+def _validate_batch_points(lon: list[float], lat: list[float]) -> None:
+    if len(lon) != len(lat):
+        raise ValueError("lon and lat must have the same length")
+    lon_arr = np.asarray(lon, dtype=np.float64)
+    lat_arr = np.asarray(lat, dtype=np.float64)
+    if not (np.all(np.isfinite(lon_arr)) and np.all(np.isfinite(lat_arr))):
+        raise ValueError("lon/lat values must be finite numbers")
+    if np.any(np.abs(lat_arr) > 90.0):
+        raise ValueError("lat values must be within [-90, 90]")
+    if np.any(np.abs(lon_arr) > 360.0):
+        raise ValueError("lon values must be within [-360, 360]")
 
 
 def _cache_identity(payload: dict[str, object]) -> str:
     return json.dumps(payload, separators=(",", ":"), sort_keys=True, ensure_ascii=True)
 
 
+async def _cached_sample_body(
+    redis: RedisLike | None,
+    *,
+    prefix: str,
+    digest: str,
+    compute: Callable[[], bytes],
+) -> bytes:
+    """Serve `compute()` through the Redis fresh/stale cache under `prefix`.
+
+    `compute` runs on a worker thread. Without Redis, or when Redis fails, the
+    body is computed directly.
+    """
+
+    async def _compute() -> bytes:
+        return await to_thread(compute)
+
+    if redis is None:
+        return await _compute()
+    try:
+        result = await get_or_compute_cached_bytes(
+            redis,
+            fresh_key=f"{prefix}:fresh:{digest}",
+            stale_key=f"{prefix}:stale:{digest}",
+            lock_key=f"{prefix}:lock:{digest}",
+            fresh_ttl_seconds=CACHE_FRESH_TTL_SECONDS,
+            stale_ttl_seconds=CACHE_STALE_TTL_SECONDS,
+            lock_ttl_ms=CACHE_LOCK_TTL_MS,
+            wait_timeout_ms=CACHE_WAIT_TIMEOUT_MS,
+            compute=_compute,
+            cooldown_ttl_seconds=CACHE_COOLDOWN_TTL_SECONDS,
+        )
+    except HTTPException:
+        raise
+    except TimeoutError as exc:
+        raise HTTPException(
+            status_code=503, detail="Sample cache warming timed out"
+        ) from exc
+    except Exception as exc:  # noqa: BLE001
+        logger.warning("sample_cache_unavailable", extra={"error": str(exc)})
+        return await _compute()
+    return result.body
+
+
+def _sample_json_response(body: bytes) -> Response:
+    etag = f'"sha256-{hashlib.sha256(body).hexdigest()}"'
+    headers = {"Cache-Control": SHORT_CACHE_CONTROL_HEADER, "ETag": etag}
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
 @router.get("", response_model=SampleResponse)
 async def sample_point(
     request: Request,
@@ -384,56 +960,185 @@ async def sample_point(
 
     redis: RedisLike | None = getattr(request.app.state, "redis_client", None)
 
-    async def _compute() -> bytes:
-        def _sync() -> bytes:
+    def _compute() -> bytes:
+        asset_path = _query_asset_path(
+            run_time=run_dt,
+            valid_time=valid_dt,
+            variable=var_key,
+            level=level_key,
+        )
+        cube_path = _resolve_asset_path(asset_path)
+        response = _sample_from_datacube(
+            cube_path,
+            var=var_key,
+            valid_time=valid_dt,
+            level_key=level_key,
+            level_numeric=level_numeric,
+            lon=float(lon),
+            lat=float(lat),
+        )
+        return response.model_dump_json().encode("utf-8")
+
+    body = await _cached_sample_body(
+        redis, prefix="sample", digest=digest, compute=_compute
+    )
+    return _sample_json_response(body)
+
+
+@router.post("/batch", response_model=SampleBatchResponse)
+async def sample_batch(request: Request, payload: SampleBatchRequest) -> Response:
+    try:
+        run_dt = _parse_time(payload.run, label="run")
+        valid_dt = _parse_time(payload.valid_time, label="valid_time")
+        level_key, level_numeric = _normalize_level(payload.level)
+        var_keys = [(var or "").strip() for var in payload.vars]
+        if any(var == "" for var in var_keys):
+            raise ValueError("var must not be empty")
+        _validate_batch_points(payload.lon, payload.lat)
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+
+    identity_payload = {
+        "run": _time_key(run_dt),
+        "valid_time": _time_key(valid_dt),
+        "level": level_key,
+        "vars": [var.lower() for var in var_keys],
+        "lon": [float(value) for value in payload.lon],
+        "lat": [float(value) for value in payload.lat],
+    }
+    identity = _cache_identity(identity_payload)
+    digest = hashlib.sha256(identity.encode("utf-8")).hexdigest()
+
+    redis: RedisLike | None = getattr(request.app.state, "redis_client", None)
+
+    def _compute() -> bytes:
+        lon = np.asarray(payload.lon, dtype=np.float64)
+        lat = np.asarray(payload.lat, dtype=np.float64)
+
+        # Variables published in the same DataCube share one open.
+        by_cube: dict[Path, list[str]] = {}
+        for var in var_keys:
             asset_path = _query_asset_path(
                 run_time=run_dt,
                 valid_time=valid_dt,
-                variable=var_key,
+                variable=var,
                 level=level_key,
             )
-            cube_path = _resolve_asset_path(asset_path)
-            response = _sample_from_datacube(
+            by_cube.setdefault(_resolve_asset_path(asset_path), []).append(var)
+
+        sampled: dict[str, SampleBatchColumn] = {}
+        for cube_path, variables in by_cube.items():
+            columns = _sample_batch_from_datacube(
                 cube_path,
-                var=var_key,
+                variables=variables,
                 valid_time=valid_dt,
                 level_key=level_key,
                 level_numeric=level_numeric,
-                lon=float(lon),
-                lat=float(lat),
+                lon=lon,
+                lat=lat,
             )
-            return response.model_dump_json().encode("utf-8")
+            sampled.update((column.var, column) for column in columns)
 
-        return await to_thread(_sync)
+        response = SampleBatchResponse(
+            count=int(lon.size), columns=[sampled[var] for var in var_keys]
+        )
+        return response.model_dump_json().encode("utf-8")
 
-    if redis is None:
-        body = await _compute()
-    else:
-        fresh_key = f"sample:fresh:{digest}"
-        stale_key = f"sample:stale:{digest}"
-        lock_key = f"sample:lock:{digest}"
-        try:
-            result = await get_or_compute_cached_bytes(
-                redis,
-                fresh_key=fresh_key,
-                stale_key=stale_key,
-                lock_key=lock_key,
-                fresh_ttl_seconds=CACHE_FRESH_TTL_SECONDS,
-                stale_ttl_seconds=CACHE_STALE_TTL_SECONDS,
-                lock_ttl_ms=CACHE_LOCK_TTL_MS,
-                wait_timeout_ms=CACHE_WAIT_TIMEOUT_MS,
-                compute=_compute,
-                cooldown_ttl_seconds=CACHE_COOLDOWN_TTL_SECONDS,
-            )
-            body = result.body
-        except TimeoutError as exc:
-            raise HTTPException(
-                status_code=503, detail="Sample cache warming timed out"
-            ) from exc
-        except Exception as exc:  # noqa: BLE001
-            logger.warning("sample_cache_unavailable", extra={"error": str(exc)})
-            body = await _compute()
+    body = await _cached_sample_body(
+        redis, prefix="sample:batch", digest=digest, compute=_compute
+    )
+    return _sample_json_response(body)
 
-    etag = f'"sha256-{hashlib.sha256(body).hexdigest()}"'
-    headers = {"Cache-Control": SHORT_CACHE_CONTROL_HEADER, "ETag": etag}
-    return Response(content=body, media_type="application/json", headers=headers)
+
+@router.get("/series", response_model=SampleSeriesResponse)
+async def sample_series(
+    request: Request,
+    run: str = Query(..., min_length=1, description="ECMWF run time"),
+    var: str = Query(..., min_length=1, description="Variable name"),
+    lon: float = Query(..., ge=-360.0, le=360.0),
+    lat: float = Query(..., ge=-90.0, le=90.0),
+    level: Optional[str] = Query(
+        default=None,
+        description="Pressure level (hPa) or sfc; omit for every catalogued level",
+    ),
+) -> Response:
+    try:
+        run_dt = _parse_time(run, label="run")
+        level_key = _normalize_level(level)[0] if level is not None else None
+        var_key = (var or "").strip()
+        if var_key == "":
+            raise ValueError("var must not be empty")
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+
+    identity_payload = {
+        "run": _time_key(run_dt),
+        "var": var_key.lower(),
+        "level": level_key,
+        "lon": float(lon),
+        "lat": float(lat),
+    }
+    identity = _cache_identity(identity_payload)
+    digest = hashlib.sha256(identity.encode("utf-8")).hexdigest()
+
+    redis: RedisLike | None = getattr(request.app.state, "redis_client", None)
+
+    def _compute() -> bytes:
+        assets = _query_run_assets(run_time=run_dt, variable=var_key, level=level_key)
+        response = _sample_series_from_datacubes(
+            assets, var=var_key, lon=float(lon), lat=float(lat)
+        )
+        return response.model_dump_json().encode("utf-8")
+
+    body = await _cached_sample_body(
+        redis, prefix="sample:series", digest=digest, compute=_compute
+    )
+    return _sample_json_response(body)
+
+
+@router.get("/profile", response_model=SampleProfileResponse)
+async def sample_profile(
+    request: Request,
+    run: str = Query(..., min_length=1, description="ECMWF run time"),
+    valid_time: str = Query(..., min_length=1, description="Valid time"),
+    vars: str = Query(
+        ...,
+        min_length=1,
+        description="Comma-separated variable names, e.g. temp,rh,u,v",
+    ),
+    lon: float = Query(..., ge=-360.0, le=360.0),
+    lat: float = Query(..., ge=-90.0, le=90.0),
+) -> Response:
+    try:
+        run_dt = _parse_time(run, label="run")
+        valid_dt = _parse_time(valid_time, label="valid_time")
+        var_keys = _parse_var_list(vars)
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+
+    identity_payload = {
+        "run": _time_key(run_dt),
+        "valid_time": _time_key(valid_dt),
+        "vars": [var.lower() for var in var_keys],
+        "lon": float(lon),
+        "lat": float(lat),
+    }
+    identity = _cache_identity(identity_payload)
+    digest = hashlib.sha256(identity.encode("utf-8")).hexdigest()
+
+    redis: RedisLike | None = getattr(request.app.state, "redis_client", None)
+
+    def _compute() -> bytes:
+        assets = {
+            var: _query_run_assets(run_time=run_dt, variable=var, valid_time=valid_dt)
+            for var in var_keys
+        }
+        response = _sample_profile_from_datacubes(
+            assets, valid_time=valid_dt, lon=float(lon), lat=float(lat)
+        )
+        return response.model_dump_json().encode("utf-8")
+
+    body = await _cached_sample_body(
+        redis, prefix="sample:profile", digest=digest, compute=_compute
+    )
+    return _sample_json_response(body)
@@ -3,22 +3,46 @@ from __future__ import annotations
 import gzip
 import hashlib
 import logging
+import os
 import re
-from dataclasses import dataclass
+import threading
+import time
+from asyncio import to_thread
+from collections import OrderedDict
+from concurrent.futures import Future
+from dataclasses import dataclass, replace
 from datetime import datetime, timezone
 from io import BytesIO
 from pathlib import Path as PathlibPath
-from typing import Any, Optional
+from stat import S_ISREG
+from typing import Any, Callable, Final, Optional
 
+import anyio
 from fastapi import APIRouter, HTTPException, Path, Query, Request
-from fastapi.responses import RedirectResponse, Response
+from fastapi.responses import FileResponse, RedirectResponse, Response
 
+from catalog_cache import RedisLike, get_or_compute_cached_bytes
 from config import get_settings
 from data_source import DataNotFoundError, DataSourceError
-from http_cache import if_none_match_matches
+from grid_cache import DecodedGrid, get_cldas_grid_cache
+from http_cache import if_none_match_matches, if_range_matches, parse_byte_range
 from local.cldas_loader import CldasLocalLoadError, load_cldas_dataset
 from local_data_service import get_data_source
-from tiling.cldas_tiles import CLDASTileGenerator, CldasTilingError
+from render_pool import get_render_executor
+from tile_availability import (
+    availability_key,
+    get_negative_tile_cache,
+    get_tile_availability_cache,
+    split_tile_key,
+)
+from tile_cache import get_cldas_tile_cache
+from tiling.cldas_tiles import (
+    DEFAULT_METATILE_SIZE,
+    CLDASTileGenerator,
+    CldasTilingError,
+)
+from tiling.palette import save_png
+from tiling.precompress import SIDECAR_METADATA_KEY
 
 logger = logging.getLogger("api.error")
 
@@ -30,6 +54,23 @@ router = APIRouter(prefix="/tiles", tags=["tiles"])
 
 SHORT_CACHE_CONTROL_HEADER = "public, max-age=60"
 
+# Rendered tiles are keyed by source file identity, so cached bodies never go
+# stale; the fresh TTL only bounds how long Redis keeps them around.
+CLDAS_TILE_CACHE_FRESH_TTL_SECONDS = 60 * 60
+CLDAS_TILE_CACHE_STALE_TTL_SECONDS = 24 * 60 * 60
+CLDAS_TILE_CACHE_LOCK_TTL_MS = 30_000
+CLDAS_TILE_CACHE_WAIT_TIMEOUT_MS = 200
+CLDAS_TILE_CACHE_COOLDOWN_TTL_SECONDS: tuple[int, int] = (5, 30)
+
+# Tiles are rendered in aligned N×N metatiles; siblings of the requested tile
+# land in the in-process tile cache. Set to 1 to render single tiles.
+CLDAS_METATILE_SIZE_ENV: Final[str] = "DIGITAL_EARTH_CLDAS_METATILE_SIZE"
+
+# In-flight metatile renders keyed by (grid identity, z, x0, y0, size); every
+# request for a tile of the same metatile waits on one render.
+_metatile_flights: dict[tuple[Any, ...], Future[dict[tuple[int, int], bytes]]] = {}
+_metatile_flights_lock = threading.Lock()
+
 _TIME_KEY_RE = re.compile(r"^\d{8}T\d{6}Z$")
 _TIMESTAMP_RE = re.compile(r"^\d{10}$")
 
@@ -64,14 +105,112 @@ def _timestamp_from_time_key(value: str) -> Optional[str]:
     return parsed.strftime("%Y%m%d%H")
 
 
-def _find_cldas_index_item(index: Any, *, timestamp: str, variable: str) -> Any | None:
-    for item in getattr(index, "items", []):
-        if getattr(item, "variable", None) != variable:
-            continue
-        meta = getattr(item, "meta", None)
-        if isinstance(meta, dict) and meta.get("timestamp") == timestamp:
-            return item
-    return None
+def _cldas_metatile_size() -> int:
+    raw = os.environ.get(CLDAS_METATILE_SIZE_ENV, "").strip()
+    if raw == "":
+        return DEFAULT_METATILE_SIZE
+    try:
+        return max(1, int(raw))
+    except ValueError:
+        logger.warning(
+            "cldas_tiles_invalid_metatile_size",
+            extra={"env": CLDAS_METATILE_SIZE_ENV, "value": raw},
+        )
+        return DEFAULT_METATILE_SIZE
+
+
+def _metatile_origin(index: int, *, zoom: int, size: int) -> int:
+    """First tile index of the aligned metatile span holding `index`.
+
+    Mirrors `CLDASTileGenerator.render_metatile`: out-of-range indices render
+    as a single tile.
+    """
+    if 0 <= index < 2**zoom:
+        return (index // size) * size
+    return index
+
+
+def _render_metatile_once(
+    flight_key: tuple[Any, ...],
+    render: Callable[[], dict[tuple[int, int], bytes]],
+) -> dict[tuple[int, int], bytes]:
+    """Run `render` once per in-flight `flight_key` and share its result.
+
+    The returned mapping is shared between callers and must not be mutated.
+    """
+    with _metatile_flights_lock:
+        flight = _metatile_flights.get(flight_key)
+        leader = flight is None
+        if flight is None:
+            flight = Future()
+            _metatile_flights[flight_key] = flight
+    if not leader:
+        return flight.result()
+
+    try:
+        rendered = render()
+    except BaseException as exc:
+        flight.set_exception(exc)
+        raise
+    else:
+        flight.set_result(rendered)
+        return rendered
+    finally:
+        with _metatile_flights_lock:
+            _metatile_flights.pop(flight_key, None)
+
+
+def _encode_png(image: Any) -> bytes:
+    buf = BytesIO()
+    save_png(image, buf)
+    return buf.getvalue()
+
+
+def _load_cldas_grid(source_path: PathlibPath, *, variable: str) -> DecodedGrid:
+    try:
+        dataset = load_cldas_dataset(source_path, engine="h5netcdf")
+    except CldasLocalLoadError as exc:
+        logger.error("cldas_tiles_load_error", extra={"error": str(exc)})
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+    except Exception as exc:  # noqa: BLE001
+        logger.error("cldas_tiles_load_error", extra={"error": str(exc)})
+        raise HTTPException(status_code=500, detail="Internal Server Error") from exc
+
+    try:
+        generator = CLDASTileGenerator(dataset, variable=variable)
+        return generator.extract_grid()
+    except (CldasLocalLoadError, CldasTilingError, ValueError) as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+    finally:
+        dataset.close()
+
+
+def _render_cldas_metatile(
+    source_path: PathlibPath,
+    *,
+    grid_key: tuple[Any, ...],
+    variable: str,
+    zoom: int,
+    x: int,
+    y: int,
+    size: int,
+) -> dict[tuple[int, int], bytes]:
+    """Render and encode the metatile around (x, y).
+
+    Runs on the render executor, possibly in a worker process whose own grid
+    cache keeps the decoded source grid resident between requests.
+    """
+    lat, lon, grid = get_cldas_grid_cache().get_or_load(
+        grid_key,
+        lambda: _load_cldas_grid(source_path, variable=variable),
+    )
+
+    try:
+        generator = CLDASTileGenerator.from_grid(lat, lon, grid, variable=variable)
+        images = generator.render_metatile(zoom=zoom, x=x, y=y, size=size)
+    except (CldasTilingError, ValueError) as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+    return {coords: _encode_png(image) for coords, image in images.items()}
 
 
 @router.get(
@@ -91,7 +230,7 @@ def _find_cldas_index_item(index: Any, *, timestamp: str, variable: str) -> Any
         503: {"description": "Service Unavailable"},
     },
 )
-def get_cldas_tile(
+async def get_cldas_tile(
     request: Request,
     time_key: str,
     var: str,
@@ -108,66 +247,132 @@ def get_cldas_tile(
         raise HTTPException(status_code=400, detail="Invalid var")
 
     ds = get_data_source()
+    negative_cache = get_negative_tile_cache()
+    negative_source = f"cldas:{getattr(getattr(ds, 'paths', None), 'root_dir', '')}"
+    negative_key = f"{variable}/{timestamp}"
+    if negative_cache.contains(negative_source, negative_key):
+        raise HTTPException(status_code=404, detail="Tile not found")
+
     try:
-        index = ds.list_files(kinds={"cldas"})
+        lookup = await to_thread(ds.index_lookup)
     except Exception as exc:  # noqa: BLE001
         logger.error("cldas_tiles_index_error", extra={"error": str(exc)})
         raise _handle_data_source_error(exc) from exc
 
-    item = _find_cldas_index_item(index, timestamp=timestamp, variable=variable)
+    item = lookup.find(kind="cldas", variable=variable, timestamp=timestamp)
     if item is None:
+        negative_cache.add(negative_source, negative_key)
         raise HTTPException(status_code=404, detail="Tile not found")
 
     relative_path = getattr(item, "relative_path", None)
     if not isinstance(relative_path, str) or relative_path.strip() == "":
         raise HTTPException(status_code=500, detail="Internal Server Error")
 
-    etag_payload = (
-        "\n".join(
-            [
-                relative_path,
-                str(getattr(item, "mtime_ns", "")),
-                str(getattr(item, "size", "")),
-                variable,
-                timestamp,
-                f"{z}/{x}/{y}",
-            ]
+    def _tile_digest(tile_x: int, tile_y: int) -> str:
+        etag_payload = (
+            "\n".join(
+                [
+                    relative_path,
+                    str(getattr(item, "mtime_ns", "")),
+                    str(getattr(item, "size", "")),
+                    variable,
+                    timestamp,
+                    f"{z}/{tile_x}/{tile_y}",
+                ]
+            )
+            .encode("utf-8")
+            .strip()
         )
-        .encode("utf-8")
-        .strip()
-    )
-    etag = f'"sha256-{hashlib.sha256(etag_payload).hexdigest()}"'
+        return hashlib.sha256(etag_payload).hexdigest()
+
+    digest = _tile_digest(x, y)
+    etag = f'"sha256-{digest}"'
     headers = {"Cache-Control": SHORT_CACHE_CONTROL_HEADER, "ETag": etag}
     if if_none_match_matches(request.headers.get("if-none-match"), etag):
         return Response(status_code=304, headers=headers)
 
-    try:
-        source_path = ds.open_path(relative_path)
-    except Exception as exc:  # noqa: BLE001
-        logger.error("cldas_tiles_open_error", extra={"error": str(exc)})
-        raise _handle_data_source_error(exc) from exc
-
-    try:
-        dataset = load_cldas_dataset(source_path, engine="h5netcdf")
-    except CldasLocalLoadError as exc:
-        logger.error("cldas_tiles_load_error", extra={"error": str(exc)})
-        raise HTTPException(status_code=400, detail=str(exc)) from exc
-    except Exception as exc:  # noqa: BLE001
-        logger.error("cldas_tiles_load_error", extra={"error": str(exc)})
-        raise HTTPException(status_code=500, detail="Internal Server Error") from exc
+    grid_key = (
+        relative_path,
+        getattr(item, "mtime_ns", None),
+        getattr(item, "size", None),
+        variable,
+    )
+    metatile_size = _cldas_metatile_size()
+    metatile_key = (
+        grid_key,
+        z,
+        _metatile_origin(x, zoom=z, size=metatile_size),
+        _metatile_origin(y, zoom=z, size=metatile_size),
+        metatile_size,
+    )
 
-    try:
+    def _render_metatile_sync() -> dict[tuple[int, int], bytes]:
         try:
-            generator = CLDASTileGenerator(dataset, variable=variable)
-            image = generator.render_tile(zoom=z, x=x, y=y)
-        except (CldasLocalLoadError, CldasTilingError, ValueError) as exc:
-            raise HTTPException(status_code=400, detail=str(exc)) from exc
-
-        buf = BytesIO()
-        image.save(buf, format="PNG", optimize=True)
-        content = buf.getvalue()
-    finally:
-        dataset.close()
+            source_path = ds.open_path(relative_path)
+        except Exception as exc:  # noqa: BLE001
+            logger.error("cldas_tiles_open_error", extra={"error": str(exc)})
+            raise _handle_data_source_error(exc) from exc
+
+        rendered = get_render_executor().call(
+            _render_cldas_metatile,
+            source_path,
+            grid_key=grid_key,
+            variable=variable,
+            zoom=z,
+            x=x,
+            y=y,
+            size=metatile_size,
+        )
+        for (tile_x, tile_y), body in rendered.items():
+            tile_cache.put(_tile_digest(tile_x, tile_y), body)
+        return rendered
+
+    def _render_once() -> bytes:
+        # The miss was already counted by the lookup below. Concurrent
+        # requests for any tile of this metatile share one render.
+        content = tile_cache.peek(digest)
+        if content is None:
+            rendered = _render_metatile_once(metatile_key, _render_metatile_sync)
+            content = rendered[(x, y)]
+        return content
+
+    tile_cache = get_cldas_tile_cache()
+
+    async def _compute() -> bytes:
+        return await to_thread(_render_once)
+
+    content = tile_cache.get(digest)
+    if content is not None:
+        return Response(content=content, media_type="image/png", headers=headers)
+
+    redis: RedisLike | None = getattr(request.app.state, "redis_client", None)
+    if redis is None:
+        content = await _compute()
+    else:
+        try:
+            result = await get_or_compute_cached_bytes(
+                redis,
+                fresh_key=f"tiles:cldas:fresh:{digest}",
+                stale_key=f"tiles:cldas:stale:{digest}",
+                lock_key=f"tiles:cldas:lock:{digest}",
+                fresh_ttl_seconds=CLDAS_TILE_CACHE_FRESH_TTL_SECONDS,
+                stale_ttl_seconds=CLDAS_TILE_CACHE_STALE_TTL_SECONDS,
+                lock_ttl_ms=CLDAS_TILE_CACHE_LOCK_TTL_MS,
+                wait_timeout_ms=CLDAS_TILE_CACHE_WAIT_TIMEOUT_MS,
+                compute=_compute,
+                cooldown_ttl_seconds=CLDAS_TILE_CACHE_COOLDOWN_TTL_SECONDS,
+            )
+            content = result.body
+            tile_cache.put(digest, content)
+        except HTTPException:
+            raise
+        except TimeoutError as exc:
+            raise HTTPException(
+                status_code=503, detail="Tile cache warming timed out"
+            ) from exc
+        except Exception as exc:  # noqa: BLE001
+            logger.warning("tile_cache_unavailable", extra={"error": str(exc)})
+            content = await _compute()
 
     return Response(content=content, media_type="image/png", headers=headers)
 
@@ -178,6 +383,10 @@ def get_cldas_tile(
 
 _DEFAULT_CACHE_CONTROL = "public, max-age=3600"
 _SIGNED_URL_EXPIRES_SECONDS = 900
+# Presigned URLs are reused for a fraction of their lifetime so redirects
+# always hand out a URL with plenty of validity left.
+_SIGNED_URL_CACHE_TTL_SECONDS = 300
+_SIGNED_URL_CACHE_MAX_ENTRIES = 4096
 _GZIP_MIN_BYTES = 1024
 
 
@@ -200,13 +409,11 @@ def _normalize_tile_key(tile_path: str) -> str:
     return key
 
 
-def _accepts_gzip(header: Optional[str]) -> bool:
+def _encoding_qvalues(header: Optional[str]) -> dict[str, float]:
     if not header:
-        return False
-
-    gzip_q: float | None = None
-    star_q: float | None = None
+        return {}
 
+    qvalues: dict[str, float] = {}
     for part in header.split(","):
         token = part.strip()
         if not token:
@@ -233,16 +440,38 @@ def _accepts_gzip(header: Optional[str]) -> bool:
         elif q > 1:
             q = 1.0
 
-        if coding_lower == "gzip":
-            gzip_q = max(gzip_q, q) if gzip_q is not None else q
-        elif coding_lower == "*":
-            star_q = max(star_q, q) if star_q is not None else q
+        previous = qvalues.get(coding_lower)
+        qvalues[coding_lower] = max(previous, q) if previous is not None else q
+    return qvalues
+
+
+def _encoding_q(qvalues: dict[str, float], coding: str) -> float:
+    if coding in qvalues:
+        return qvalues[coding]
+    return qvalues.get("*", 0.0)
+
+
+def _accepts_gzip(header: Optional[str]) -> bool:
+    return _encoding_q(_encoding_qvalues(header), "gzip") > 0
+
+
+# Precompressed sidecars written by the tile pipeline, in server preference
+# order: (content-coding, file suffix).
+_SIDECAR_ENCODINGS: tuple[tuple[str, str], ...] = (
+    ("br", ".br"),
+    ("zstd", ".zst"),
+    ("gzip", ".gz"),
+)
 
-    if gzip_q is not None:
-        return gzip_q > 0
-    if star_q is not None:
-        return star_q > 0
-    return False
+
+def _acceptable_sidecars(header: Optional[str]) -> list[tuple[str, str]]:
+    qvalues = _encoding_qvalues(header)
+    ranked = [
+        (_encoding_q(qvalues, coding), -index, coding, suffix)
+        for index, (coding, suffix) in enumerate(_SIDECAR_ENCODINGS)
+    ]
+    ranked.sort(reverse=True)
+    return [(coding, suffix) for q, _rank, coding, suffix in ranked if q > 0]
 
 
 def _accepts_webp(header: Optional[str]) -> bool:
@@ -293,17 +522,10 @@ def _vary_header(values: set[str]) -> str | None:
 class _TileLocation:
     url: str
     is_signed: bool = False
+    expires_in_seconds: int = _SIGNED_URL_EXPIRES_SECONDS
 
 
-def _build_tile_location(key: str) -> _TileLocation:
-    settings = get_settings()
-    storage = settings.storage
-
-    if storage.tiles_base_url:
-        base = storage.tiles_base_url.rstrip("/")
-        return _TileLocation(url=f"{base}/{key}", is_signed=False)
-
-    endpoint_url = (storage.endpoint_url or "").strip()
+def _storage_credentials(storage: Any) -> tuple[str | None, str | None]:
     access_key = (
         storage.access_key_id.get_secret_value()
         if storage.access_key_id is not None
@@ -314,29 +536,99 @@ def _build_tile_location(key: str) -> _TileLocation:
         if storage.secret_access_key is not None
         else None
     )
+    return access_key, secret_key
+
+
+class _S3ClientPool:
+    """Shares one boto3 S3 client (and its presigned URLs) per settings object.
+
+    boto3 clients are thread-safe once built, but building one costs tens of
+    milliseconds, so it is done once per `get_settings()` generation. The
+    presigned URL cache is dropped together with the client.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._settings: Any = None
+        self._client: Any = None
+        self._signed_urls: OrderedDict[tuple[str, str], tuple[str, float]] = (
+            OrderedDict()
+        )
+
+    def _client_locked(self, settings: Any, *, feature: str) -> Any:
+        if self._client is not None and self._settings is settings:
+            return self._client
 
-    if access_key and secret_key:
         try:
             import boto3  # type: ignore[import-not-found]
         except Exception as exc:  # noqa: BLE001
             raise RuntimeError(
-                "boto3 is required for signed tiles URLs; install with `pip install boto3`"
+                f"boto3 is required for {feature}; install with `pip install boto3`"
             ) from exc
 
+        storage = settings.storage
+        access_key, secret_key = _storage_credentials(storage)
         client = boto3.client(
             "s3",
             aws_access_key_id=access_key,
             aws_secret_access_key=secret_key,
-            endpoint_url=endpoint_url or None,
+            endpoint_url=(storage.endpoint_url or "").strip() or None,
             region_name=storage.region_name,
         )
+        self._settings = settings
+        self._client = client
+        self._signed_urls.clear()
+        return client
+
+    def client(self, settings: Any, *, feature: str) -> Any:
+        with self._lock:
+            return self._client_locked(settings, feature=feature)
+
+    def presigned_get_url(self, settings: Any, *, key: str) -> tuple[str, int]:
+        bucket = settings.storage.tiles_bucket
+        cache_key = (bucket, key)
+        now = time.monotonic()
+        with self._lock:
+            client = self._client_locked(settings, feature="signed tiles URLs")
+            cached = self._signed_urls.get(cache_key)
+            if cached is not None:
+                url, signed_at = cached
+                age = now - signed_at
+                if age < _SIGNED_URL_CACHE_TTL_SECONDS:
+                    self._signed_urls.move_to_end(cache_key)
+                    return url, int(_SIGNED_URL_EXPIRES_SECONDS - age)
+                del self._signed_urls[cache_key]
 
         url = client.generate_presigned_url(
             "get_object",
-            Params={"Bucket": storage.tiles_bucket, "Key": key},
+            Params={"Bucket": bucket, "Key": key},
             ExpiresIn=_SIGNED_URL_EXPIRES_SECONDS,
         )
-        return _TileLocation(url=url, is_signed=True)
+        with self._lock:
+            if self._client is client:
+                self._signed_urls[cache_key] = (url, now)
+                while len(self._signed_urls) > _SIGNED_URL_CACHE_MAX_ENTRIES:
+                    self._signed_urls.popitem(last=False)
+        return url, _SIGNED_URL_EXPIRES_SECONDS
+
+
+_s3_clients = _S3ClientPool()
+
+
+def _build_tile_location(key: str) -> _TileLocation:
+    settings = get_settings()
+    storage = settings.storage
+
+    if storage.tiles_base_url:
+        base = storage.tiles_base_url.rstrip("/")
+        return _TileLocation(url=f"{base}/{key}", is_signed=False)
+
+    endpoint_url = (storage.endpoint_url or "").strip()
+    access_key, secret_key = _storage_credentials(storage)
+
+    if access_key and secret_key:
+        url, expires_in = _s3_clients.presigned_get_url(settings, key=key)
+        return _TileLocation(url=url, is_signed=True, expires_in_seconds=expires_in)
 
     if endpoint_url:
         base = endpoint_url.rstrip("/")
@@ -369,7 +661,15 @@ def _resolve_local_tile_path(*, tiles_dir: PathlibPath, key: str) -> PathlibPath
     return path
 
 
-def _read_local_tile(*, tiles_dir: PathlibPath, key: str) -> tuple[bytes, str, str]:
+@dataclass(frozen=True)
+class _LocalTile:
+    path: PathlibPath
+    stat: os.stat_result
+    etag: str
+    content_type: str
+
+
+def _stat_local_tile(*, tiles_dir: PathlibPath, key: str) -> _LocalTile:
     path = _resolve_local_tile_path(tiles_dir=tiles_dir, key=key)
     try:
         stat = path.stat()
@@ -377,15 +677,106 @@ def _read_local_tile(*, tiles_dir: PathlibPath, key: str) -> tuple[bytes, str, s
         raise HTTPException(status_code=404, detail="Not Found") from exc
     except OSError as exc:
         raise HTTPException(status_code=500, detail="Internal Server Error") from exc
+    if not S_ISREG(stat.st_mode):
+        raise HTTPException(status_code=404, detail="Not Found")
+
+    etag_payload = f"{key}\n{stat.st_mtime_ns}\n{stat.st_size}".encode("utf-8")
+    etag = f'"sha256-{hashlib.sha256(etag_payload).hexdigest()}"'
+    return _LocalTile(
+        path=path, stat=stat, etag=etag, content_type=_guess_media_type(key)
+    )
 
+
+def _stat_negotiated_local_tile(
+    *, tiles_dir: PathlibPath, key: str, negotiated_key: str
+) -> tuple[_LocalTile, str]:
+    try:
+        return _stat_local_tile(tiles_dir=tiles_dir, key=negotiated_key), negotiated_key
+    except HTTPException as exc:
+        if exc.status_code != 404 or negotiated_key == key:
+            raise
+    return _stat_local_tile(tiles_dir=tiles_dir, key=key), key
+
+
+def _read_local_tile_bytes(tile: _LocalTile) -> bytes:
     try:
-        data = path.read_bytes()
+        return tile.path.read_bytes()
     except OSError as exc:
         raise HTTPException(status_code=500, detail="Internal Server Error") from exc
 
-    etag_payload = f"{key}\n{stat.st_mtime_ns}\n{stat.st_size}".encode("utf-8")
-    etag = f'"sha256-{hashlib.sha256(etag_payload).hexdigest()}"'
-    return data, etag, _guess_media_type(key)
+
+class _LocalTileResponse(FileResponse):
+    """File response streamed from disk, optionally limited to one byte range.
+
+    Full bodies use the ASGI `http.response.pathsend` extension when the server
+    offers it so the file is sent without passing through Python; otherwise
+    the file is streamed in chunks instead of being buffered whole.
+    """
+
+    def __init__(
+        self,
+        path: PathlibPath,
+        *,
+        stat_result: os.stat_result,
+        headers: dict[str, str],
+        media_type: str,
+        byte_range: tuple[int, int] | None = None,
+    ) -> None:
+        super().__init__(
+            path,
+            status_code=200 if byte_range is None else 206,
+            headers=headers,
+            media_type=media_type,
+            stat_result=stat_result,
+        )
+        self.byte_range = byte_range
+        if byte_range is not None:
+            start, end = byte_range
+            self.headers["content-length"] = str(end - start + 1)
+            self.headers["content-range"] = f"bytes {start}-{end}/{stat_result.st_size}"
+
+    async def __call__(self, scope: Any, receive: Any, send: Any) -> None:
+        extensions = scope.get("extensions") or {}
+        if self.byte_range is None and "http.response.pathsend" in extensions:
+            await send(
+                {
+                    "type": "http.response.start",
+                    "status": self.status_code,
+                    "headers": self.raw_headers,
+                }
+            )
+            await send({"type": "http.response.pathsend", "path": str(self.path)})
+            return
+
+        if self.byte_range is None:
+            await super().__call__(scope, receive, send)
+            return
+
+        start, end = self.byte_range
+        await send(
+            {
+                "type": "http.response.start",
+                "status": self.status_code,
+                "headers": self.raw_headers,
+            }
+        )
+        remaining = end - start + 1
+        async with await anyio.open_file(self.path, mode="rb") as file:
+            await file.seek(start)
+            while remaining > 0:
+                chunk = await file.read(min(self.chunk_size, remaining))
+                if not chunk:
+                    break
+                remaining -= len(chunk)
+                await send(
+                    {
+                        "type": "http.response.body",
+                        "body": chunk,
+                        "more_body": remaining > 0,
+                    }
+                )
+        if remaining > 0:
+            await send({"type": "http.response.body", "body": b"", "more_body": False})
 
 
 def _s3_error_code(exc: Exception) -> str | None:
@@ -423,37 +814,9 @@ def _is_s3_not_found(exc: Exception) -> bool:
 
 def _fetch_tile_bytes_from_s3(*, key: str) -> tuple[bytes, dict[str, Any]]:
     settings = get_settings()
-    storage = settings.storage
-
-    access_key = (
-        storage.access_key_id.get_secret_value()
-        if storage.access_key_id is not None
-        else None
-    )
-    secret_key = (
-        storage.secret_access_key.get_secret_value()
-        if storage.secret_access_key is not None
-        else None
-    )
-
-    endpoint_url = (storage.endpoint_url or "").strip() or None
+    client = _s3_clients.client(settings, feature="proxy tiles")
 
-    try:
-        import boto3  # type: ignore[import-not-found]
-    except Exception as exc:  # noqa: BLE001
-        raise RuntimeError(
-            "boto3 is required for proxy tiles; install with `pip install boto3`"
-        ) from exc
-
-    client = boto3.client(
-        "s3",
-        aws_access_key_id=access_key,
-        aws_secret_access_key=secret_key,
-        endpoint_url=endpoint_url,
-        region_name=storage.region_name,
-    )
-
-    obj = client.get_object(Bucket=storage.tiles_bucket, Key=key)
+    obj = client.get_object(Bucket=settings.storage.tiles_bucket, Key=key)
     body = obj.get("Body")
     if body is None or not hasattr(body, "read"):
         raise RuntimeError("Unexpected S3 get_object response body")
@@ -465,6 +828,96 @@ def _fetch_tile_bytes_from_s3(*, key: str) -> tuple[bytes, dict[str, Any]]:
     return bytes(data), obj
 
 
+def _head_tile_from_s3(*, key: str) -> dict[str, Any]:
+    settings = get_settings()
+    client = _s3_clients.client(settings, feature="proxy tiles")
+    return client.head_object(Bucket=settings.storage.tiles_bucket, Key=key)
+
+
+def _listed_sidecar_encodings(obj: dict[str, Any]) -> set[str]:
+    """Sidecar encodings the pipeline recorded on an uploaded tile object."""
+    metadata = obj.get("Metadata")
+    if not isinstance(metadata, dict):
+        return set()
+    raw = metadata.get(SIDECAR_METADATA_KEY)
+    if not isinstance(raw, str):
+        return set()
+    return {token.strip().lower() for token in raw.split(",") if token.strip()}
+
+
+def _fetch_tile_sidecar_from_s3(
+    *, key: str, obj: dict[str, Any], accept_encoding: Optional[str]
+) -> tuple[bytes, dict[str, Any], str] | None:
+    # Only sidecars listed on the tile object are fetched, so a tile without
+    # sidecars costs no extra GETs.
+    listed = _listed_sidecar_encodings(obj)
+    for coding, suffix in _acceptable_sidecars(accept_encoding):
+        if coding not in listed:
+            continue
+        try:
+            data, sidecar_obj = _fetch_tile_bytes_from_s3(key=key + suffix)
+        except Exception as exc:  # noqa: BLE001
+            logger.warning("tiles_sidecar_fetch_failed", extra={"error": str(exc)})
+            return None
+        return data, sidecar_obj, coding
+    return None
+
+
+def _has_s3_credentials() -> bool:
+    access_key, secret_key = _storage_credentials(get_settings().storage)
+    return bool(access_key and secret_key)
+
+
+def _tile_store_source(local_dir: PathlibPath | None) -> str:
+    if local_dir is not None:
+        return f"file:{local_dir}"
+    storage = get_settings().storage
+    return f"s3:{storage.endpoint_url or ''}/{storage.tiles_bucket}"
+
+
+def _load_tile_availability(
+    *, prefix: str, local_dir: PathlibPath | None
+) -> bytes | None:
+    key = availability_key(prefix)
+    if local_dir is not None:
+        path = _resolve_local_tile_path(tiles_dir=local_dir, key=key)
+        try:
+            return path.read_bytes()
+        except FileNotFoundError:
+            return None
+
+    try:
+        data, _obj = _fetch_tile_bytes_from_s3(key=key)
+    except Exception as exc:  # noqa: BLE001
+        if _is_s3_not_found(exc):
+            return None
+        raise
+    return data
+
+
+def _is_known_missing_tile(
+    *, source: str, key: str, local_dir: PathlibPath | None
+) -> bool:
+    """Answer from the negative cache or the layer's availability bitmap.
+
+    Returns False whenever the tile may exist, including for layers that ship
+    without an availability bitmap.
+    """
+    if get_negative_tile_cache().contains(source, key):
+        return True
+
+    address = split_tile_key(key)
+    if address is None:
+        return False
+    prefix, z, x, y = address
+    availability = get_tile_availability_cache().get(
+        source,
+        prefix,
+        lambda: _load_tile_availability(prefix=prefix, local_dir=local_dir),
+    )
+    return availability is not None and not availability.contains(z, x, y)
+
+
 @router.get(
     "/{tile_path:path}",
     response_class=Response,
@@ -506,54 +959,96 @@ def get_tile(
     wants_gzip = _accepts_gzip(accept_encoding)
 
     local_dir = _local_tiles_dir()
+    tile_source = _tile_store_source(local_dir)
+    checks_storage = local_dir is not None or not redirect or _has_s3_credentials()
+    if checks_storage and _is_known_missing_tile(
+        source=tile_source, key=key, local_dir=local_dir
+    ):
+        raise HTTPException(status_code=404, detail="Not Found")
+
     if local_dir is not None:
-        key_to_fetch = negotiated_key
         try:
-            data, etag, content_type = _read_local_tile(
-                tiles_dir=local_dir, key=key_to_fetch
+            tile, key_to_fetch = _stat_negotiated_local_tile(
+                tiles_dir=local_dir, key=key, negotiated_key=negotiated_key
             )
         except HTTPException as exc:
-            if exc.status_code == 404 and key_to_fetch != key:
-                data, etag, content_type = _read_local_tile(
-                    tiles_dir=local_dir, key=key
-                )
-                key_to_fetch = key
-            else:
-                raise
+            if exc.status_code == 404:
+                get_negative_tile_cache().add(tile_source, key)
+            raise
 
+        content_encoding: str | None = None
+        if _is_compressible_content_type(tile.content_type):
+            for coding, suffix in _acceptable_sidecars(accept_encoding):
+                try:
+                    sidecar = _stat_local_tile(
+                        tiles_dir=local_dir, key=key_to_fetch + suffix
+                    )
+                except HTTPException as exc:
+                    if exc.status_code == 404:
+                        continue
+                    raise
+                # Ignore sidecars left over from an older version of the tile.
+                if sidecar.stat.st_mtime_ns < tile.stat.st_mtime_ns:
+                    continue
+                tile = replace(sidecar, content_type=tile.content_type)
+                content_encoding = coding
+                vary.add("Accept-Encoding")
+                break
+
+        etag = tile.etag
+        content_type = tile.content_type
         headers: dict[str, str] = {
             "Cache-Control": _DEFAULT_CACHE_CONTROL,
             "ETag": etag,
         }
+        if content_encoding is not None:
+            headers["Content-Encoding"] = content_encoding
 
-        transformed = False
         if (
-            wants_gzip
-            and len(data) >= _GZIP_MIN_BYTES
+            content_encoding is None
+            and wants_gzip
+            and tile.stat.st_size >= _GZIP_MIN_BYTES
             and _is_compressible_content_type(content_type)
         ):
-            data = gzip.compress(data)
+            data = gzip.compress(_read_local_tile_bytes(tile))
             headers["Content-Encoding"] = "gzip"
             vary.add("Accept-Encoding")
-            transformed = True
+            vary_header = _vary_header(vary)
+            if vary_header:
+                headers["Vary"] = vary_header
+            return Response(content=data, media_type=content_type, headers=headers)
 
-        if not transformed and if_none_match_matches(
-            request.headers.get("if-none-match"), etag
-        ):
+        vary_header = _vary_header(vary)
+        if vary_header:
+            headers["Vary"] = vary_header
+
+        if if_none_match_matches(request.headers.get("if-none-match"), etag):
             response_headers: dict[str, str] = {
                 "Cache-Control": headers["Cache-Control"],
                 "ETag": etag,
             }
-            vary_header = _vary_header(vary)
             if vary_header:
                 response_headers["Vary"] = vary_header
             return Response(status_code=304, headers=response_headers)
 
-        vary_header = _vary_header(vary)
-        if vary_header:
-            headers["Vary"] = vary_header
-
-        return Response(content=data, media_type=content_type, headers=headers)
+        headers["Accept-Ranges"] = "bytes"
+        byte_range: tuple[int, int] | None = None
+        if if_range_matches(request.headers.get("if-range"), etag):
+            try:
+                byte_range = parse_byte_range(
+                    request.headers.get("range"), tile.stat.st_size
+                )
+            except ValueError:
+                headers["Content-Range"] = f"bytes */{tile.stat.st_size}"
+                return Response(status_code=416, headers=headers)
+
+        return _LocalTileResponse(
+            tile.path,
+            stat_result=tile.stat,
+            headers=headers,
+            media_type=content_type,
+            byte_range=byte_range,
+        )
 
     if redirect:
         try:
@@ -565,7 +1060,7 @@ def get_tile(
         cache_control = _DEFAULT_CACHE_CONTROL
         if location.is_signed:
             # Use private cache for signed URLs to prevent shared cache replay
-            cache_control = f"private, max-age={_SIGNED_URL_EXPIRES_SECONDS - 1}"
+            cache_control = f"private, max-age={location.expires_in_seconds - 1}"
 
         headers: dict[str, str] = {"Cache-Control": cache_control}
         vary_header = _vary_header(vary)
@@ -576,14 +1071,25 @@ def get_tile(
 
     # Proxy mode: fetch from storage and return bytes (useful for local dev/tests)
     key_to_fetch = negotiated_key
+    # Objects that may have precompressed sidecars are probed with HEAD so a
+    # sidecar hit does not also download the uncompressed body.
+    probe_sidecars = _is_compressible_content_type(_guess_media_type(key)) and bool(
+        _acceptable_sidecars(accept_encoding)
+    )
+
+    def _load(target: str) -> tuple[bytes | None, dict[str, Any]]:
+        if probe_sidecars:
+            return None, _head_tile_from_s3(key=target)
+        return _fetch_tile_bytes_from_s3(key=target)
 
     try:
-        data, obj = _fetch_tile_bytes_from_s3(key=key_to_fetch)
+        data, obj = _load(key_to_fetch)
     except Exception as exc:  # noqa: BLE001
         if _is_s3_not_found(exc) and key_to_fetch != key:
-            data, obj = _fetch_tile_bytes_from_s3(key=key)
+            data, obj = _load(key)
             key_to_fetch = key
         elif _is_s3_not_found(exc):
+            get_negative_tile_cache().add(tile_source, key)
             raise HTTPException(status_code=404, detail="Not Found") from exc
         else:
             logger.error("tiles_proxy_error", extra={"error": str(exc)})
@@ -591,6 +1097,46 @@ def get_tile(
                 status_code=500, detail="Internal Server Error"
             ) from exc
 
+    if probe_sidecars:
+        sidecar = _fetch_tile_sidecar_from_s3(
+            key=key_to_fetch, obj=obj, accept_encoding=accept_encoding
+        )
+        if sidecar is not None:
+            sidecar_data, sidecar_obj, coding = sidecar
+            vary.add("Accept-Encoding")
+            cache_control = sidecar_obj.get("CacheControl")
+            headers = {
+                "Cache-Control": cache_control.strip()
+                if isinstance(cache_control, str) and cache_control.strip()
+                else _DEFAULT_CACHE_CONTROL,
+                "Content-Encoding": coding,
+            }
+            vary_header = _vary_header(vary)
+            if vary_header:
+                headers["Vary"] = vary_header
+            etag = sidecar_obj.get("ETag")
+            if isinstance(etag, str):
+                headers["ETag"] = etag
+                if if_none_match_matches(request.headers.get("if-none-match"), etag):
+                    headers.pop("Content-Encoding")
+                    return Response(status_code=304, headers=headers)
+            return Response(
+                content=sidecar_data,
+                media_type=_guess_media_type(key_to_fetch),
+                headers=headers,
+            )
+
+    if data is None:
+        try:
+            data, obj = _fetch_tile_bytes_from_s3(key=key_to_fetch)
+        except Exception as exc:  # noqa: BLE001
+            if _is_s3_not_found(exc):
+                raise HTTPException(status_code=404, detail="Not Found") from exc
+            logger.error("tiles_proxy_error", extra={"error": str(exc)})
+            raise HTTPException(
+                status_code=500, detail="Internal Server Error"
+            ) from exc
+
     content_type = obj.get("ContentType")
     if not isinstance(content_type, str) or content_type.strip() == "":
         content_type = _guess_media_type(key_to_fetch)
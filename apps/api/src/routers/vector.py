@@ -1,12 +1,15 @@
 from __future__ import annotations
 
+import asyncio
 import hashlib
 import json
 import logging
-import os
-import tempfile
+import math
 import time as time_module
 from asyncio import to_thread
+from collections import deque
+from dataclasses import dataclass
+from functools import partial
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Callable, Literal, Optional
@@ -14,6 +17,7 @@ from typing import Any, Callable, Literal, Optional
 import numpy as np
 import xarray as xr
 from fastapi import APIRouter, HTTPException, Query, Request
+from fastapi import Path as PathParam
 from fastapi.responses import Response
 from pydantic import BaseModel, ConfigDict, Field
 from sqlalchemy import desc, func, select
@@ -23,8 +27,23 @@ from sqlalchemy.orm import Session
 import db
 from catalog_cache import RedisLike, get_or_compute_cached_bytes
 from data_source import DataNotFoundError, DataSourceError
-from datacube.storage import open_datacube
+from datacube_pool import datacube_coords, open_pooled_datacube
+from datacube_slices import (
+    MAX_MIP_LEVEL,
+    DataCubeSlice,
+    downsample_axis,
+    load_datacube_slice,
+)
 from local_data_service import get_data_source
+from render_pool import get_render_executor
+from routers.tiles import get_tile
+from streamline_simplify import coordinate_decimals, simplify_streamlines
+from vector_cache import get_vector_file_cache
+from wind_pack import (
+    WIND_PACK_MEDIA_TYPE,
+    encode_streamline_pack,
+    encode_wind_vector_pack,
+)
 from models import EcmwfAsset, EcmwfRun, EcmwfTime
 
 logger = logging.getLogger("api.error")
@@ -40,11 +59,21 @@ CACHE_COOLDOWN_TTL_SECONDS: tuple[int, int] = (5, 30)
 MAX_VECTOR_POINTS = 10_000
 MAX_STREAMLINE_SEEDS = 4_096
 MAX_STREAMLINE_TOTAL_POINTS = 200_000
-FILE_CACHE_DIR_ENV = "DIGITAL_EARTH_VECTOR_CACHE_DIR"
+MAX_PREWARM_BBOXES = 50
+# Prewarm jobs one call keeps in flight on the render executor; they share
+# the decoded u/v slice through the grid cache.
+PREWARM_WORKERS = 4
+# Layer written by the data pipeline's `tiles.wind_vector_tiles` stage.
+WIND_VECTOR_TILE_LAYER = "ecmwf/wind_vector"
+# Layer written by the data pipeline's `tiles.wind_texture` stage.
+WIND_TEXTURE_LAYER = "ecmwf/wind_texture"
 WindVectorCacheStatus = Literal["fresh", "computed", "stale"]
+WindStreamlineSeeding = Literal["grid", "even"]
+STREAMLINE_TEST_RATIO = 0.5
 
 EARTH_RADIUS_M = 6_371_000.0
 _RAD_TO_DEG = 180.0 / float(np.pi)
+_KM_PER_DEG = EARTH_RADIUS_M / 1000.0 / _RAD_TO_DEG
 
 
 class WindVectorResponse(BaseModel):
@@ -64,6 +93,7 @@ class WindVectorPrewarmRequest(BaseModel):
         description="Bounding boxes to prewarm: minLon,minLat,maxLon,maxLat",
     )
     stride: int = Field(default=1, ge=1, le=256)
+    target_points: Optional[int] = Field(default=None, ge=1, le=MAX_VECTOR_POINTS)
 
 
 class WindVectorPrewarmItem(BaseModel):
@@ -71,6 +101,7 @@ class WindVectorPrewarmItem(BaseModel):
 
     bbox: str
     status: WindVectorCacheStatus
+    duration_ms: float
 
 
 class WindVectorPrewarmResponse(BaseModel):
@@ -164,22 +195,25 @@ def _resolve_surface_level_index(levels: np.ndarray, attrs: dict[str, Any]) -> i
 def _resolve_level_index(
     ds: xr.Dataset, *, level_key: str, numeric: float | None
 ) -> int:
-    if "level" not in ds.coords:
+    coords = datacube_coords(ds)
+    levels = coords.levels
+    if levels is None:
         raise HTTPException(status_code=500, detail="DataCube missing level coordinate")
-
-    levels = np.asarray(ds["level"].values)
     if levels.size == 0:
         raise HTTPException(
             status_code=500, detail="DataCube level coordinate is empty"
         )
 
     if level_key == "sfc":
-        return _resolve_surface_level_index(levels, dict(ds["level"].attrs))
+        return _resolve_surface_level_index(levels, coords.level_attrs)
 
     if numeric is None or not np.isfinite(numeric):
         raise HTTPException(status_code=400, detail="level must be a finite number")
 
     numeric_f = float(numeric)
+    exact = coords.level_lookup.get(numeric_f)
+    if exact is not None:
+        return exact
     matches = np.where(
         np.isclose(levels.astype(np.float64, copy=False), numeric_f, atol=1e-3)
     )[0]
@@ -189,90 +223,44 @@ def _resolve_level_index(
 
 
 def _resolve_time_index(ds: xr.Dataset, *, valid_time: datetime) -> int:
-    if "time" not in ds.coords:
+    coords = datacube_coords(ds)
+    if coords.times is None:
         raise HTTPException(status_code=500, detail="DataCube missing time coordinate")
-    values = np.asarray(ds["time"].values)
-    if values.size == 0:
+    if coords.times.size == 0:
         raise HTTPException(status_code=500, detail="DataCube time coordinate is empty")
 
     dt = valid_time.astimezone(timezone.utc)
     target = np.datetime64(dt.strftime("%Y-%m-%dT%H:%M:%S"))
-    matches = np.where(values.astype("datetime64[s]") == target)[0]
-    if matches.size == 0:
+    index = coords.time_lookup.get(target)
+    if index is None:
         raise HTTPException(status_code=404, detail="valid_time not found in DataCube")
-    return int(matches[0])
-
+    return index
 
-def _cache_identity(payload: dict[str, object]) -> str:
-    return json.dumps(payload, separators=(",", ":"), sort_keys=True, ensure_ascii=True)
 
+def _accepts_wind_pack(header: Optional[str]) -> bool:
+    # Only an explicit media type opts in; */* keeps serving JSON.
+    return WIND_PACK_MEDIA_TYPE in (header or "").lower()
 
-def _vector_file_cache_dir() -> Path:
-    override = os.environ.get(FILE_CACHE_DIR_ENV, "").strip()
-    if override != "":
-        return Path(override)
-    return Path(tempfile.gettempdir()) / "digital-earth" / "vector-cache"
 
-
-def _read_cached_file(path: Path, *, ttl_seconds: int, now: float) -> bytes | None:
-    try:
-        stat = path.stat()
-    except FileNotFoundError:
-        return None
-    except OSError:
-        return None
-
-    if ttl_seconds <= 0:
-        return None
-    if now - float(stat.st_mtime) > float(ttl_seconds):
-        return None
-
-    try:
-        return path.read_bytes()
-    except OSError:
-        return None
-
-
-def _write_cached_file(path: Path, body: bytes) -> None:
-    path.parent.mkdir(parents=True, exist_ok=True)
-    tmp_path = path.with_suffix(path.suffix + ".tmp")
-    tmp_path.write_bytes(body)
-    tmp_path.replace(path)
+def _cache_identity(payload: dict[str, object]) -> str:
+    return json.dumps(payload, separators=(",", ":"), sort_keys=True, ensure_ascii=True)
 
 
 def _get_or_compute_file_cached_bytes(
     *,
-    fresh_path: Path,
-    stale_path: Path,
-    fresh_ttl_seconds: int,
-    stale_ttl_seconds: int,
+    namespace: str,
+    run_key: str,
+    digest: str,
     compute: Callable[[], bytes],
-    now: float | None = None,
 ) -> tuple[bytes, WindVectorCacheStatus]:
-    timestamp = float(now if now is not None else time_module.time())
-    cached = _read_cached_file(fresh_path, ttl_seconds=fresh_ttl_seconds, now=timestamp)
-    if cached is not None:
-        return cached, "fresh"
-
-    stale = _read_cached_file(stale_path, ttl_seconds=stale_ttl_seconds, now=timestamp)
-    try:
-        computed = compute()
-    except Exception as exc:  # noqa: BLE001
-        if stale is not None:
-            logger.warning(
-                "vector_file_cache_compute_failed_serving_stale",
-                extra={"error": str(exc)},
-            )
-            return stale, "stale"
-        raise
-
-    try:
-        _write_cached_file(fresh_path, computed)
-        _write_cached_file(stale_path, computed)
-    except OSError as exc:
-        logger.warning("vector_file_cache_write_failed", extra={"error": str(exc)})
-
-    return computed, "computed"
+    return get_vector_file_cache().get_or_compute(
+        namespace,
+        run_key,
+        digest,
+        fresh_ttl_seconds=CACHE_FRESH_TTL_SECONDS,
+        stale_ttl_seconds=CACHE_STALE_TTL_SECONDS,
+        compute=compute,
+    )
 
 
 def _query_asset_path(*, run_time: datetime, valid_time: datetime, level: str) -> str:
@@ -338,12 +326,16 @@ def _dataset_lon_uses_360(lon_coord: np.ndarray) -> bool:
     return lon_min >= 0.0 and lon_max > 180.0
 
 
-def _normalize_lon(lon: float, lon_coord: np.ndarray) -> float:
-    if _dataset_lon_uses_360(lon_coord):
+def _wrap_lon(lon: float, *, uses_360: bool) -> float:
+    if uses_360:
         return float(lon) % 360.0
     return float(((float(lon) + 180.0) % 360.0) - 180.0)
 
 
+def _normalize_lon(lon: float, lon_coord: np.ndarray) -> float:
+    return _wrap_lon(lon, uses_360=_dataset_lon_uses_360(lon_coord))
+
+
 def _parse_bbox(value: Optional[str]) -> tuple[float, float, float, float] | None:
     if value is None:
         return None
@@ -438,17 +430,6 @@ def _bbox_contains(
     return float(lon_norm) >= float(lon_min) or float(lon_norm) <= float(lon_max)
 
 
-def _normalize_grid_axis(
-    coord: np.ndarray, values: np.ndarray, *, axis: int
-) -> tuple[np.ndarray, np.ndarray]:
-    coord_f = np.asarray(coord, dtype=np.float64)
-    if coord_f.size < 2:
-        return coord_f, np.asarray(values, dtype=np.float64)
-    if float(coord_f[0]) <= float(coord_f[-1]):
-        return coord_f, np.asarray(values, dtype=np.float64)
-    return coord_f[::-1], np.flip(np.asarray(values, dtype=np.float64), axis=axis)
-
-
 def _bilinear_sample_wind(
     *,
     lat: float,
@@ -542,8 +523,11 @@ def _rk4_step(
     step_m: float,
     min_speed: float,
     direction: float,
+    uses_360: bool | None = None,
 ) -> tuple[float, float] | None:
-    lon_norm = _normalize_lon(lon_unwrapped, lon_coord)
+    if uses_360 is None:
+        uses_360 = _dataset_lon_uses_360(lon_coord)
+    lon_norm = _wrap_lon(lon_unwrapped, uses_360=uses_360)
     sampled = _bilinear_sample_wind(
         lat=float(lat),
         lon=float(lon_norm),
@@ -563,7 +547,7 @@ def _rk4_step(
     dt = float(step_m) / speed
 
     def _derivatives(lat_deg: float, lon_deg: float) -> tuple[float, float] | None:
-        lon_eval = _normalize_lon(lon_deg, lon_coord)
+        lon_eval = _wrap_lon(lon_deg, uses_360=uses_360)
         sample = _bilinear_sample_wind(
             lat=lat_deg,
             lon=float(lon_eval),
@@ -617,85 +601,624 @@ def _rk4_step(
     return lat_next, lon_next
 
 
-def _integrate_streamline(
+def _normalize_lon_array(lon: np.ndarray, *, uses_360: bool) -> np.ndarray:
+    if uses_360:
+        return np.mod(lon, 360.0)
+    return np.mod(lon + 180.0, 360.0) - 180.0
+
+
+def _bbox_contains_array(
     *,
-    seed_lat: float,
-    seed_lon: float,
+    lon: np.ndarray,
+    lat: np.ndarray,
     bbox: tuple[float, float, float, float],
+    lon_coord: np.ndarray,
+    uses_360: bool | None = None,
+) -> np.ndarray:
+    """Vectorized `_bbox_contains`; pass `uses_360` to skip rescanning `lon_coord`."""
+    min_lon, min_lat, max_lon, max_lat = bbox
+    inside = (lat >= float(min(min_lat, max_lat))) & (
+        lat <= float(max(min_lat, max_lat))
+    )
+    if abs(float(max_lon) - float(min_lon)) >= 360.0:
+        return inside
+
+    if uses_360 is None:
+        uses_360 = _dataset_lon_uses_360(lon_coord)
+    lon_min = _wrap_lon(min_lon, uses_360=uses_360)
+    lon_max = _wrap_lon(max_lon, uses_360=uses_360)
+    lon_norm = _normalize_lon_array(lon, uses_360=uses_360)
+    if lon_min <= lon_max:
+        return inside & (lon_norm >= lon_min) & (lon_norm <= lon_max)
+    return inside & ((lon_norm >= lon_min) | (lon_norm <= lon_max))
+
+
+def _bilinear_sample_wind_array(
+    *,
+    lat: np.ndarray,
+    lon: np.ndarray,
     lat_coord: np.ndarray,
     lon_coord: np.ndarray,
     u_grid: np.ndarray,
     v_grid: np.ndarray,
-    step_km: float,
-    max_steps: int,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Vectorized `_bilinear_sample_wind`; returns (u, v, valid)."""
+    valid = (
+        (lat >= lat_coord[0])
+        & (lat <= lat_coord[-1])
+        & (lon >= lon_coord[0])
+        & (lon <= lon_coord[-1])
+    )
+
+    # Plain minimum/maximum and `take` keep the per-call overhead low; this
+    # runs a few times per integration step, often on only a few points.
+    i1 = np.minimum(
+        np.maximum(np.searchsorted(lat_coord, lat, side="right"), 1),
+        lat_coord.size - 1,
+    )
+    j1 = np.minimum(
+        np.maximum(np.searchsorted(lon_coord, lon, side="right"), 1),
+        lon_coord.size - 1,
+    )
+    i0 = i1 - 1
+    j0 = j1 - 1
+
+    lat0 = lat_coord.take(i0)
+    lon0 = lon_coord.take(j0)
+    lat_span = lat_coord.take(i1) - lat0
+    lon_span = lon_coord.take(j1) - lon0
+    valid &= (lat_span != 0.0) & (lon_span != 0.0)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        t = (lat - lat0) / lat_span
+        s = (lon - lon0) / lon_span
+        t_rest = 1.0 - t
+        s_rest = 1.0 - s
+
+        # A non-finite corner always leaves u or v non-finite below.
+        u0 = s_rest * u_grid[i0, j0] + s * u_grid[i0, j1]
+        u1 = s_rest * u_grid[i1, j0] + s * u_grid[i1, j1]
+        v0 = s_rest * v_grid[i0, j0] + s * v_grid[i0, j1]
+        v1 = s_rest * v_grid[i1, j0] + s * v_grid[i1, j1]
+        u = t_rest * u0 + t * u1
+        v = t_rest * v0 + t * v1
+
+    valid &= np.isfinite(u) & np.isfinite(v)
+    return u, v, valid
+
+
+def _rk4_step_array(
+    *,
+    lat: np.ndarray,
+    lon_unwrapped: np.ndarray,
+    lon_coord: np.ndarray,
+    lat_coord: np.ndarray,
+    u_grid: np.ndarray,
+    v_grid: np.ndarray,
+    step_m: float,
     min_speed: float,
-) -> tuple[list[float], list[float]]:
-    lat0 = float(seed_lat)
-    lon0 = float(seed_lon)
-    if not _bbox_contains(lon=lon0, lat=lat0, bbox=bbox, lon_coord=lon_coord):
-        return [], []
+    direction: float | np.ndarray,
+    uses_360: bool | None = None,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Advance every point by one `_rk4_step`; returns (lat, lon, valid).
+
+    `direction` is either one sign for all points or one sign per point.
+    Pass `uses_360` to skip rescanning `lon_coord` on every step.
+    """
+    if uses_360 is None:
+        uses_360 = _dataset_lon_uses_360(lon_coord)
+
+    def _sample(
+        lat_deg: np.ndarray, lon_deg: np.ndarray
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        return _bilinear_sample_wind_array(
+            lat=lat_deg,
+            lon=_normalize_lon_array(lon_deg, uses_360=uses_360),
+            lat_coord=lat_coord,
+            lon_coord=lon_coord,
+            u_grid=u_grid,
+            v_grid=v_grid,
+        )
 
-    step_m = float(step_km) * 1000.0
+    u0, v0, valid = _sample(lat, lon_unwrapped)
+    speed = np.hypot(u0, v0)
+    valid &= (speed > 0.0) & (speed >= float(min_speed))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        dt = float(step_m) / speed
+
+    def _derivatives(
+        lat_deg: np.ndarray, lon_deg: np.ndarray
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        u, v, ok = _sample(lat_deg, lon_deg)
+        u = u * direction
+        v = v * direction
+        cos_lat = np.cos(np.deg2rad(lat_deg))
+        ok &= np.abs(cos_lat) >= 1e-6
+        with np.errstate(divide="ignore", invalid="ignore"):
+            dlat_dt = (v / EARTH_RADIUS_M) * _RAD_TO_DEG
+            dlon_dt = (u / (EARTH_RADIUS_M * cos_lat)) * _RAD_TO_DEG
+        ok &= np.isfinite(dlat_dt) & np.isfinite(dlon_dt)
+        return dlat_dt, dlon_dt, ok
+
+    with np.errstate(invalid="ignore", over="ignore"):
+        k1_lat, k1_lon, ok = _derivatives(lat, lon_unwrapped)
+        valid &= ok
+        k2_lat, k2_lon, ok = _derivatives(
+            lat + 0.5 * dt * k1_lat, lon_unwrapped + 0.5 * dt * k1_lon
+        )
+        valid &= ok
+        k3_lat, k3_lon, ok = _derivatives(
+            lat + 0.5 * dt * k2_lat, lon_unwrapped + 0.5 * dt * k2_lon
+        )
+        valid &= ok
+        k4_lat, k4_lon, ok = _derivatives(
+            lat + dt * k3_lat, lon_unwrapped + dt * k3_lon
+        )
+        valid &= ok
 
-    points_backward: list[tuple[float, float]] = []
-    lat_cursor = lat0
-    lon_cursor = lon0
-    for _ in range(int(max_steps)):
-        next_point = _rk4_step(
-            lat=lat_cursor,
-            lon_unwrapped=lon_cursor,
+        lat_next = lat + (dt / 6.0) * (k1_lat + 2.0 * k2_lat + 2.0 * k3_lat + k4_lat)
+        lon_next = lon_unwrapped + (dt / 6.0) * (
+            k1_lon + 2.0 * k2_lon + 2.0 * k3_lon + k4_lon
+        )
+
+    valid &= np.isfinite(lat_next) & np.isfinite(lon_next)
+    return lat_next, lon_next, valid
+
+
+def _trace_streamlines(
+    *,
+    seed_lat: np.ndarray,
+    seed_lon: np.ndarray,
+    active: np.ndarray,
+    bbox: tuple[float, float, float, float],
+    lat_coord: np.ndarray,
+    lon_coord: np.ndarray,
+    u_grid: np.ndarray,
+    v_grid: np.ndarray,
+    step_m: float,
+    max_steps: int,
+    min_speed: float,
+    direction: float,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Trace all active seeds in one direction until each line terminates.
+
+    Returns per-step (lat, lon) arrays of shape (max_steps, seeds) and the
+    number of steps each line took; a line stops for good at its first
+    failed step, so its points are the first `counts[i]` rows.
+    """
+    count = int(seed_lat.size)
+    track_lat = np.empty((int(max_steps), count), dtype=np.float64)
+    track_lon = np.empty((int(max_steps), count), dtype=np.float64)
+    counts = np.zeros(count, dtype=np.int64)
+
+    lat = seed_lat.copy()
+    lon = seed_lon.copy()
+    uses_360 = _dataset_lon_uses_360(lon_coord)
+    live = np.flatnonzero(active)
+    for step in range(int(max_steps)):
+        if live.size == 0:
+            break
+        lat_next, lon_next, ok = _rk4_step_array(
+            lat=lat[live],
+            lon_unwrapped=lon[live],
             lon_coord=lon_coord,
             lat_coord=lat_coord,
             u_grid=u_grid,
             v_grid=v_grid,
             step_m=step_m,
             min_speed=min_speed,
-            direction=-1.0,
+            direction=direction,
+            uses_360=uses_360,
         )
-        if next_point is None:
-            break
-        lat_next, lon_next = next_point
-        if not _bbox_contains(
-            lon=lon_next, lat=lat_next, bbox=bbox, lon_coord=lon_coord
-        ):
-            break
-        points_backward.append((lon_next, lat_next))
-        lat_cursor = lat_next
-        lon_cursor = lon_next
-
-    points_forward: list[tuple[float, float]] = []
-    lat_cursor = lat0
-    lon_cursor = lon0
-    for _ in range(int(max_steps)):
-        next_point = _rk4_step(
-            lat=lat_cursor,
-            lon_unwrapped=lon_cursor,
+        ok &= _bbox_contains_array(
+            lon=lon_next,
+            lat=lat_next,
+            bbox=bbox,
             lon_coord=lon_coord,
+            uses_360=uses_360,
+        )
+        live = live[ok]
+        lat[live] = lat_next[ok]
+        lon[live] = lon_next[ok]
+        track_lat[step, live] = lat_next[ok]
+        track_lon[step, live] = lon_next[ok]
+        counts[live] += 1
+
+    return track_lat, track_lon, counts
+
+
+def _integrate_streamlines(
+    *,
+    seed_lat: np.ndarray,
+    seed_lon: np.ndarray,
+    bbox: tuple[float, float, float, float],
+    lat_coord: np.ndarray,
+    lon_coord: np.ndarray,
+    u_grid: np.ndarray,
+    v_grid: np.ndarray,
+    step_km: float,
+    max_steps: int,
+    min_speed: float,
+) -> list[tuple[list[float], list[float]]]:
+    """Trace a streamline through every seed, advancing all seeds together.
+
+    Each seed is integrated backward and forward with RK4 until it stalls,
+    leaves `bbox` or reaches `max_steps`. Returns one (lat, lon) pair per seed
+    in seed order; seeds that produce fewer than two points get empty lists.
+    """
+    seed_lat = np.asarray(seed_lat, dtype=np.float64).ravel()
+    seed_lon = np.asarray(seed_lon, dtype=np.float64).ravel()
+    inside = _bbox_contains_array(
+        lon=seed_lon, lat=seed_lat, bbox=bbox, lon_coord=lon_coord
+    )
+
+    step_m = float(step_km) * 1000.0
+    traces = [
+        _trace_streamlines(
+            seed_lat=seed_lat,
+            seed_lon=seed_lon,
+            active=inside,
+            bbox=bbox,
             lat_coord=lat_coord,
+            lon_coord=lon_coord,
             u_grid=u_grid,
             v_grid=v_grid,
             step_m=step_m,
+            max_steps=max_steps,
             min_speed=min_speed,
-            direction=1.0,
+            direction=direction,
         )
-        if next_point is None:
-            break
-        lat_next, lon_next = next_point
-        if not _bbox_contains(
-            lon=lon_next, lat=lat_next, bbox=bbox, lon_coord=lon_coord
-        ):
+        for direction in (-1.0, 1.0)
+    ]
+    (back_lat, back_lon, back_counts), (fwd_lat, fwd_lon, fwd_counts) = traces
+
+    lines: list[tuple[list[float], list[float]]] = []
+    for index in range(seed_lat.size):
+        back = int(back_counts[index])
+        fwd = int(fwd_counts[index])
+        if not inside[index] or back + fwd == 0:
+            lines.append(([], []))
+            continue
+        line_lat = np.concatenate(
+            (
+                back_lat[:back, index][::-1],
+                seed_lat[index : index + 1],
+                fwd_lat[:fwd, index],
+            )
+        )
+        line_lon = np.concatenate(
+            (
+                back_lon[:back, index][::-1],
+                seed_lon[index : index + 1],
+                fwd_lon[:fwd, index],
+            )
+        )
+        lines.append((line_lat.tolist(), line_lon.tolist()))
+    return lines
+
+
+def _km_per_deg_lon(lat: float) -> float:
+    return _KM_PER_DEG * max(math.cos(math.radians(float(lat))), 0.05)
+
+
+class _StreamlineOccupancy:
+    """Spatial hash of placed streamline points on a `separation_km` grid.
+
+    Points live on a sinusoidal plane (km) centred on the bbox's middle
+    meridian: longitude is scaled by the cosine of each point's own latitude,
+    so distances stay true across tall bboxes. A distance query only scans
+    the 3x3 block of cells around the query point.
+    """
+
+    def __init__(
+        self, *, bbox: tuple[float, float, float, float], separation_km: float
+    ) -> None:
+        min_lon, min_lat, max_lon, max_lat = bbox
+        lon_span = float(max_lon) - float(min_lon)
+        if lon_span < 0.0:
+            lon_span += 360.0
+        self._center_lon = float(min_lon) + 0.5 * lon_span
+        self._origin_lat = float(min(min_lat, max_lat))
+        self._cell_km = float(separation_km)
+        self._cells: dict[tuple[int, int], list[tuple[float, float, int, int]]] = {}
+
+    def project(self, lat: float, lon: float) -> tuple[float, float]:
+        dlon = (float(lon) - self._center_lon + 180.0) % 360.0 - 180.0
+        x = dlon * _km_per_deg_lon(lat)
+        y = (float(lat) - self._origin_lat) * _KM_PER_DEG
+        return x, y
+
+    def unproject(self, x: float, y: float) -> tuple[float, float]:
+        lat = self._origin_lat + float(y) / _KM_PER_DEG
+        lon = self._center_lon + float(x) / _km_per_deg_lon(lat)
+        return lat, lon
+
+    def _cell(self, x: float, y: float) -> tuple[int, int]:
+        return int(math.floor(y / self._cell_km)), int(math.floor(x / self._cell_km))
+
+    def is_free(
+        self,
+        x: float,
+        y: float,
+        *,
+        radius_km: float,
+        line_id: int = -1,
+        ordinal: int = 0,
+        lag: int = 0,
+    ) -> bool:
+        """True when no point lies closer than `radius_km` to (x, y).
+
+        Points of `line_id` within `lag` samples of `ordinal` are ignored so a
+        line being traced does not collide with its own recent samples.
+        """
+        row, col = self._cell(x, y)
+        limit = float(radius_km) ** 2
+        for cell_row in (row - 1, row, row + 1):
+            for cell_col in (col - 1, col, col + 1):
+                for px, py, owner, index in self._cells.get((cell_row, cell_col), ()):
+                    if owner == line_id and abs(index - ordinal) <= lag:
+                        continue
+                    if (px - x) ** 2 + (py - y) ** 2 < limit:
+                        return False
+        return True
+
+    def add(self, x: float, y: float, *, line_id: int, ordinal: int) -> None:
+        self._cells.setdefault(self._cell(x, y), []).append((x, y, line_id, ordinal))
+
+    def remove_line(self, x: float, y: float, *, line_id: int) -> None:
+        cell = self._cell(x, y)
+        kept = [entry for entry in self._cells.get(cell, ()) if entry[2] != line_id]
+        if kept:
+            self._cells[cell] = kept
+        else:
+            self._cells.pop(cell, None)
+
+
+# A placed streamline sample: (lat, lon, x, y) with x/y on the occupancy plane.
+_StreamlinePoint = tuple[float, float, float, float]
+
+
+def _trace_separated_streamlines(
+    *,
+    seeds: list[_StreamlinePoint],
+    line_ids: list[int],
+    occupancy: _StreamlineOccupancy,
+    test_km: float,
+    bbox: tuple[float, float, float, float],
+    lat_coord: np.ndarray,
+    lon_coord: np.ndarray,
+    u_grid: np.ndarray,
+    v_grid: np.ndarray,
+    step_km: float,
+    max_steps: int,
+    min_speed: float,
+) -> list[list[_StreamlinePoint]]:
+    """Trace one line per seed, stopping each where it nears another line.
+
+    `seeds` must already be registered in `occupancy` under `line_ids`. The
+    backward and forward fronts of every line advance together, one
+    `_rk4_step_array` call per step (a lone front takes the equivalent scalar
+    `_rk4_step`); a front stops at its first point within
+    `test_km` of any placed point, including those of lines traced alongside
+    it. Returns one list per seed ordered backward-to-forward, empty (and the
+    seed unregistered) when the seed does not produce a line.
+    """
+    step_m = float(step_km) * 1000.0
+    lag = int(math.ceil(float(test_km) / float(step_km))) + 1
+
+    # Front 2*i traces line i backward, front 2*i + 1 forward.
+    front_lat = np.repeat([seed[0] for seed in seeds], 2).astype(np.float64)
+    front_lon = np.repeat([seed[1] for seed in seeds], 2).astype(np.float64)
+    front_dir = np.tile([-1.0, 1.0], len(seeds))
+    fronts: list[list[_StreamlinePoint]] = [[] for _ in range(2 * len(seeds))]
+
+    uses_360 = _dataset_lon_uses_360(lon_coord)
+    live = np.arange(2 * len(seeds))
+    for step in range(1, int(max_steps) + 1):
+        if live.size == 0:
             break
-        points_forward.append((lon_next, lat_next))
-        lat_cursor = lat_next
-        lon_cursor = lon_next
+        if live.size == 1:
+            # A lone front is common (the other one left the bbox or hit a
+            # line); numpy's per-call overhead makes the one-point array step
+            # slower than the scalar step, which gives the same result.
+            front = int(live[0])
+            next_point = _rk4_step(
+                lat=float(front_lat[front]),
+                lon_unwrapped=float(front_lon[front]),
+                lon_coord=lon_coord,
+                lat_coord=lat_coord,
+                u_grid=u_grid,
+                v_grid=v_grid,
+                step_m=step_m,
+                min_speed=min_speed,
+                direction=float(front_dir[front]),
+                uses_360=uses_360,
+            )
+            if next_point is None:
+                break
+            lat_next = np.array([next_point[0]])
+            lon_next = np.array([next_point[1]])
+            ok = np.array([True])
+        else:
+            lat_next, lon_next, ok = _rk4_step_array(
+                lat=front_lat[live],
+                lon_unwrapped=front_lon[live],
+                lon_coord=lon_coord,
+                lat_coord=lat_coord,
+                u_grid=u_grid,
+                v_grid=v_grid,
+                step_m=step_m,
+                min_speed=min_speed,
+                direction=front_dir[live],
+                uses_360=uses_360,
+            )
+        ok &= _bbox_contains_array(
+            lon=lon_next,
+            lat=lat_next,
+            bbox=bbox,
+            lon_coord=lon_coord,
+            uses_360=uses_360,
+        )
+        for index in np.flatnonzero(ok).tolist():
+            front = int(live[index])
+            lat = float(lat_next[index])
+            lon = float(lon_next[index])
+            line_id = line_ids[front // 2]
+            ordinal = int(front_dir[front]) * step
+            x, y = occupancy.project(lat, lon)
+            if not occupancy.is_free(
+                x, y, radius_km=test_km, line_id=line_id, ordinal=ordinal, lag=lag
+            ):
+                ok[index] = False
+                continue
+            occupancy.add(x, y, line_id=line_id, ordinal=ordinal)
+            fronts[front].append((lat, lon, x, y))
+        live = live[ok]
+        front_lat[live] = lat_next[ok]
+        front_lon[live] = lon_next[ok]
+
+    lines: list[list[_StreamlinePoint]] = []
+    for index, seed in enumerate(seeds):
+        backward = fronts[2 * index]
+        forward = fronts[2 * index + 1]
+        if not backward and not forward:
+            occupancy.remove_line(seed[2], seed[3], line_id=line_ids[index])
+            lines.append([])
+            continue
+        lines.append(list(reversed(backward)) + [seed] + forward)
+    return lines
+
+
+def _offset_seeds(
+    line: list[_StreamlinePoint], *, separation_km: float
+) -> list[tuple[tuple[float, float], tuple[float, float]]]:
+    """Candidate seeds one separation away on both sides of every sample.
+
+    Returns one (left, right) pair of (x, y) points per sample.
+    """
+    candidates: list[tuple[tuple[float, float], tuple[float, float]]] = []
+    last = len(line) - 1
+    for index, (_lat, _lon, x, y) in enumerate(line):
+        _a_lat, _a_lon, x_prev, y_prev = line[max(index - 1, 0)]
+        _b_lat, _b_lon, x_next, y_next = line[min(index + 1, last)]
+        dx = x_next - x_prev
+        dy = y_next - y_prev
+        length = math.hypot(dx, dy)
+        if length == 0.0:
+            continue
+        nx = -dy / length * float(separation_km)
+        ny = dx / length * float(separation_km)
+        candidates.append(((x + nx, y + ny), (x - nx, y - ny)))
+    return candidates
 
-    combined = list(reversed(points_backward)) + [(lon0, lat0)] + points_forward
-    if len(combined) < 2:
-        return [], []
 
-    out_lon = [float(lon_val) for lon_val, _lat_val in combined]
-    out_lat = [float(lat_val) for _lon_val, lat_val in combined]
-    return out_lat, out_lon
+def _integrate_streamlines_evenly(
+    *,
+    seed_lat: np.ndarray,
+    seed_lon: np.ndarray,
+    bbox: tuple[float, float, float, float],
+    lat_coord: np.ndarray,
+    lon_coord: np.ndarray,
+    u_grid: np.ndarray,
+    v_grid: np.ndarray,
+    step_km: float,
+    max_steps: int,
+    min_speed: float,
+    separation_km: float,
+    max_points: int = MAX_STREAMLINE_TOTAL_POINTS,
+) -> list[tuple[list[float], list[float]]]:
+    """Place evenly-spaced streamlines (Jobard & Lefer, 1997).
+
+    Every new line starts at least `separation_km` from all placed lines and
+    stops once it gets closer than half of that to any of them. New seeds are
+    taken one separation to either side of already-placed lines; the lattice
+    seeds are only consulted when that queue runs dry, which picks up regions
+    the existing lines never reach. Tracing stops after `max_points` points.
+
+    Both seeds offset from a sample are traced at once (see
+    `_trace_separated_streamlines`).
+    """
+    occupancy = _StreamlineOccupancy(bbox=bbox, separation_km=separation_km)
+    test_km = float(separation_km) * STREAMLINE_TEST_RATIO
+    # Offset seeds sit exactly one separation from their parent sample; allow
+    # for rounding so the parent itself does not reject them.
+    seed_clearance_km = float(separation_km) * (1.0 - 1e-6)
+
+    lattice = iter(
+        zip(
+            np.asarray(seed_lat, dtype=np.float64).ravel().tolist(),
+            np.asarray(seed_lon, dtype=np.float64).ravel().tolist(),
+            strict=True,
+        )
+    )
+    queue: deque[list[_StreamlinePoint]] = deque()
+    pending: deque[list[tuple[float, float]]] = deque()
+    lines: list[tuple[list[float], list[float]]] = []
+    total_points = 0
+    next_line_id = 0
+
+    while total_points < int(max_points):
+        if not pending:
+            if queue:
+                pending.extend(
+                    [occupancy.unproject(*left), occupancy.unproject(*right)]
+                    for left, right in _offset_seeds(
+                        queue.popleft(), separation_km=separation_km
+                    )
+                )
+            else:
+                fallback = next(lattice, None)
+                if fallback is None:
+                    break
+                pending.append([fallback])
+
+        # The two seeds offset from one sample lie on opposite sides of their
+        # parent line, so they are traced together; later candidates are
+        # checked against the lines these produce.
+        seeds: list[_StreamlinePoint] = []
+        line_ids: list[int] = []
+        for cand_lat, cand_lon in pending.popleft():
+            if not _bbox_contains(
+                lon=cand_lon, lat=cand_lat, bbox=bbox, lon_coord=lon_coord
+            ):
+                continue
+            x, y = occupancy.project(cand_lat, cand_lon)
+            if not occupancy.is_free(x, y, radius_km=seed_clearance_km):
+                continue
+            occupancy.add(x, y, line_id=next_line_id, ordinal=0)
+            seeds.append((float(cand_lat), float(cand_lon), x, y))
+            line_ids.append(next_line_id)
+            next_line_id += 1
+        if not seeds:
+            continue
+
+        traced = _trace_separated_streamlines(
+            seeds=seeds,
+            line_ids=line_ids,
+            occupancy=occupancy,
+            test_km=test_km,
+            bbox=bbox,
+            lat_coord=lat_coord,
+            lon_coord=lon_coord,
+            u_grid=u_grid,
+            v_grid=v_grid,
+            step_km=step_km,
+            max_steps=max_steps,
+            min_speed=min_speed,
+        )
+        for line in traced:
+            if not line:
+                continue
+            lines.append(
+                (
+                    [point[0] for point in line],
+                    [point[1] for point in line],
+                )
+            )
+            queue.append(line)
+            total_points += len(line)
+
+    return lines
 
 
 def _resolve_wind_components(ds: xr.Dataset) -> tuple[str, str]:
@@ -720,187 +1243,434 @@ def _flatten_values(values: np.ndarray) -> list[float | None]:
     return [float(v) if bool(ok) else None for v, ok in zip(flat, finite, strict=False)]
 
 
-def _wind_vectors_from_datacube(
+@dataclass(frozen=True)
+class _WindSlice:
+    """Decoded u/v slices of one run/time/level, axes ascending."""
+
+    u: DataCubeSlice
+    v: DataCubeSlice
+
+    @property
+    def lat(self) -> np.ndarray:
+        return self.u.lat
+
+    @property
+    def lon(self) -> np.ndarray:
+        return self.u.lon
+
+
+def _load_wind_slice(
     cube_path: Path,
     *,
     valid_time: datetime,
     level_key: str,
     level_numeric: float | None,
-    bbox: tuple[float, float, float, float] | None,
-    stride: int,
-) -> WindVectorResponse:
-    ds = open_datacube(cube_path)
-    try:
+    mip_level: int = 0,
+) -> _WindSlice:
+    with open_pooled_datacube(cube_path) as ds:
         time_index = _resolve_time_index(ds, valid_time=valid_time)
         level_index = _resolve_level_index(
             ds, level_key=level_key, numeric=level_numeric
         )
 
         u_name, v_name = _resolve_wind_components(ds)
-        u_da = ds[u_name]
-        v_da = ds[v_name]
-
-        if "time" not in u_da.dims or "level" not in u_da.dims:
-            raise HTTPException(
-                status_code=500, detail="DataCube wind variable missing time/level dims"
-            )
-        if "time" not in v_da.dims or "level" not in v_da.dims:
-            raise HTTPException(
-                status_code=500, detail="DataCube wind variable missing time/level dims"
-            )
+        for name in (u_name, v_name):
+            if "time" not in ds[name].dims or "level" not in ds[name].dims:
+                raise HTTPException(
+                    status_code=500,
+                    detail="DataCube wind variable missing time/level dims",
+                )
 
-        u_slice = u_da.isel(time=int(time_index), level=int(level_index)).transpose(
-            "lat", "lon"
+        u_slice = load_datacube_slice(
+            ds,
+            cube_path,
+            var=u_name,
+            time_index=time_index,
+            level_index=level_index,
+            mip_level=mip_level,
         )
-        v_slice = v_da.isel(time=int(time_index), level=int(level_index)).transpose(
-            "lat", "lon"
+        v_slice = load_datacube_slice(
+            ds,
+            cube_path,
+            var=v_name,
+            time_index=time_index,
+            level_index=level_index,
+            mip_level=mip_level,
         )
+        return _WindSlice(u=u_slice, v=v_slice)
 
-        lat_coord = np.asarray(u_slice["lat"].values)
-        lon_coord = np.asarray(u_slice["lon"].values)
 
+def _select_mip_level(
+    lat: np.ndarray,
+    lon: np.ndarray,
+    *,
+    bbox: tuple[float, float, float, float] | None,
+    target_points: int,
+) -> int:
+    """Return the finest mip level whose bbox selection fits `target_points`.
+
+    Only the 1D block-averaged axes are computed here, so picking a level never
+    touches the u/v values. Falls back to `MAX_MIP_LEVEL` when even that is
+    too dense.
+    """
+    for level in range(MAX_MIP_LEVEL + 1):
+        lat_coord = downsample_axis(lat, 2**level)
+        lon_coord = downsample_axis(lon, 2**level)
         if bbox is None:
-            lat_indices = np.arange(lat_coord.size, dtype=int)[:: int(stride)]
-            lon_indices = np.arange(lon_coord.size, dtype=int)[:: int(stride)]
+            count = int(lat_coord.size) * int(lon_coord.size)
         else:
             min_lon, min_lat, max_lon, max_lat = bbox
             lat_indices = _select_indices(
-                lat_coord, min_value=min_lat, max_value=max_lat, stride=stride
+                lat_coord, min_value=min_lat, max_value=max_lat, stride=1
             )
             lon_indices = _select_lon_indices(
-                lon_coord, min_lon=min_lon, max_lon=max_lon, stride=stride
+                lon_coord, min_lon=min_lon, max_lon=max_lon, stride=1
             )
+            count = int(lat_indices.size) * int(lon_indices.size)
+        if count <= int(target_points):
+            return level
+    return MAX_MIP_LEVEL
 
-        if lat_indices.size == 0 or lon_indices.size == 0:
-            return WindVectorResponse()
 
-        point_count = int(lat_indices.size) * int(lon_indices.size)
-        if point_count > MAX_VECTOR_POINTS:
-            raise HTTPException(
-                status_code=400, detail="reduce bbox or increase stride"
-            )
+def _wind_vector_grid_for_target(
+    load: Callable[[int], _WindSlice],
+    *,
+    bbox: tuple[float, float, float, float] | None,
+    stride: int,
+    target_points: int | None,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray] | None:
+    """Select the vector grid, on a coarser mip level when `target_points` is set.
+
+    `load(mip_level)` returns the u/v slice at that level; the native slice is
+    always loaded first because its axes decide the level.
+    """
+    wind = load(0)
+    if target_points is not None:
+        mip_level = _select_mip_level(
+            wind.lat, wind.lon, bbox=bbox, target_points=target_points
+        )
+        if mip_level > 0:
+            wind = load(mip_level)
+    return _wind_vector_grid_from_slice(wind, bbox=bbox, stride=stride)
+
 
-        u_sub = u_slice.isel(lat=lat_indices, lon=lon_indices)
-        v_sub = v_slice.isel(lat=lat_indices, lon=lon_indices)
+def _wind_vector_grid_from_slice(
+    wind: _WindSlice,
+    *,
+    bbox: tuple[float, float, float, float] | None,
+    stride: int,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray] | None:
+    """Select the strided u/v subgrid as (lat, lon, u, v); None when empty.
+
+    Indices follow the cube's own axis order so strided sampling and point
+    order match what the file stores.
+    """
+    u_slice = wind.u.in_file_order()
+    v_slice = wind.v.in_file_order()
+    lat_coord = u_slice.lat
+    lon_coord = u_slice.lon
+
+    if bbox is None:
+        lat_indices = np.arange(lat_coord.size, dtype=int)[:: int(stride)]
+        lon_indices = np.arange(lon_coord.size, dtype=int)[:: int(stride)]
+    else:
+        min_lon, min_lat, max_lon, max_lat = bbox
+        lat_indices = _select_indices(
+            lat_coord, min_value=min_lat, max_value=max_lat, stride=stride
+        )
+        lon_indices = _select_lon_indices(
+            lon_coord, min_lon=min_lon, max_lon=max_lon, stride=stride
+        )
 
-        lat_vals = np.asarray(u_sub["lat"].values, dtype=np.float64)
-        lon_vals = np.asarray(u_sub["lon"].values, dtype=np.float64)
+    if lat_indices.size == 0 or lon_indices.size == 0:
+        return None
 
-        lon_grid, lat_grid = np.meshgrid(lon_vals, lat_vals)
+    point_count = int(lat_indices.size) * int(lon_indices.size)
+    if point_count > MAX_VECTOR_POINTS:
+        raise HTTPException(status_code=400, detail="reduce bbox or increase stride")
 
-        return WindVectorResponse(
-            u=_flatten_values(np.asarray(u_sub.values)),
-            v=_flatten_values(np.asarray(v_sub.values)),
-            lat=_flatten_values(np.asarray(lat_grid)),
-            lon=_flatten_values(np.asarray(lon_grid)),
-        )
-    finally:
-        ds.close()
+    rows = np.ix_(lat_indices, lon_indices)
+    return (
+        lat_coord[lat_indices],
+        lon_coord[lon_indices],
+        u_slice.values[rows],
+        v_slice.values[rows],
+    )
 
 
-def _wind_streamlines_from_datacube(
+def _wind_vector_grid_from_datacube(
     cube_path: Path,
     *,
     valid_time: datetime,
     level_key: str,
     level_numeric: float | None,
+    bbox: tuple[float, float, float, float] | None,
+    stride: int,
+    target_points: int | None = None,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray] | None:
+    def _load(mip_level: int) -> _WindSlice:
+        return _load_wind_slice(
+            cube_path,
+            valid_time=valid_time,
+            level_key=level_key,
+            level_numeric=level_numeric,
+            mip_level=mip_level,
+        )
+
+    return _wind_vector_grid_for_target(
+        _load, bbox=bbox, stride=stride, target_points=target_points
+    )
+
+
+def _wind_vector_response(
+    grid: tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray] | None,
+) -> WindVectorResponse:
+    if grid is None:
+        return WindVectorResponse()
+
+    lat_vals, lon_vals, u_values, v_values = grid
+    lon_grid, lat_grid = np.meshgrid(lon_vals, lat_vals)
+    return WindVectorResponse(
+        u=_flatten_values(u_values),
+        v=_flatten_values(v_values),
+        lat=_flatten_values(np.asarray(lat_grid)),
+        lon=_flatten_values(np.asarray(lon_grid)),
+    )
+
+
+def _wind_vectors_from_datacube(
+    cube_path: Path,
+    **kwargs: Any,
+) -> WindVectorResponse:
+    return _wind_vector_response(_wind_vector_grid_from_datacube(cube_path, **kwargs))
+
+
+def _wind_vector_json_from_datacube(cube_path: Path, **kwargs: Any) -> bytes:
+    return (
+        _wind_vectors_from_datacube(cube_path, **kwargs)
+        .model_dump_json()
+        .encode("utf-8")
+    )
+
+
+def _wind_vector_pack_from_datacube(cube_path: Path, **kwargs: Any) -> bytes:
+    grid = _wind_vector_grid_from_datacube(cube_path, **kwargs)
+    if grid is None:
+        empty = np.empty((0, 0), dtype=np.float64)
+        return encode_wind_vector_pack(lat=[], lon=[], u=empty, v=empty)
+
+    lat_vals, lon_vals, u_values, v_values = grid
+    return encode_wind_vector_pack(lat=lat_vals, lon=lon_vals, u=u_values, v=v_values)
+
+
+def _wind_streamline_lines_from_slice(
+    wind: _WindSlice,
+    *,
     bbox: tuple[float, float, float, float],
     stride: int,
     step_km: float,
     max_steps: int,
     min_speed: float,
-) -> WindStreamlinesResponse:
-    ds = open_datacube(cube_path)
-    try:
-        time_index = _resolve_time_index(ds, valid_time=valid_time)
-        level_index = _resolve_level_index(
-            ds, level_key=level_key, numeric=level_numeric
-        )
+    seeding: WindStreamlineSeeding = "grid",
+    separation_km: float | None = None,
+    zoom: int | None = None,
+) -> list[tuple[list[float], list[float]]]:
+    lat_coord = wind.lat
+    lon_coord = wind.lon
 
-        u_name, v_name = _resolve_wind_components(ds)
-        u_da = ds[u_name]
-        v_da = ds[v_name]
+    if lat_coord.size < 2 or lon_coord.size < 2:
+        return []
 
-        if "time" not in u_da.dims or "level" not in u_da.dims:
-            raise HTTPException(
-                status_code=500, detail="DataCube wind variable missing time/level dims"
-            )
-        if "time" not in v_da.dims or "level" not in v_da.dims:
-            raise HTTPException(
-                status_code=500, detail="DataCube wind variable missing time/level dims"
-            )
+    min_lon, min_lat, max_lon, max_lat = bbox
+    lat_indices = _select_indices(
+        lat_coord, min_value=min_lat, max_value=max_lat, stride=stride
+    )
+    lon_indices = _select_lon_indices(
+        lon_coord, min_lon=min_lon, max_lon=max_lon, stride=stride
+    )
+    if lat_indices.size == 0 or lon_indices.size == 0:
+        return []
 
-        u_slice = u_da.isel(time=int(time_index), level=int(level_index)).transpose(
-            "lat", "lon"
-        )
-        v_slice = v_da.isel(time=int(time_index), level=int(level_index)).transpose(
-            "lat", "lon"
+    seed_count = int(lat_indices.size) * int(lon_indices.size)
+    if seed_count > MAX_STREAMLINE_SEEDS:
+        raise HTTPException(status_code=400, detail="reduce bbox or increase stride")
+
+    estimated_points = seed_count * (2 * int(max_steps) + 1)
+    if seeding == "grid" and estimated_points > MAX_STREAMLINE_TOTAL_POINTS:
+        raise HTTPException(status_code=400, detail="reduce bbox or increase stride")
+
+    # float32 grids are sampled with float64 weights, so no full-grid upcast.
+    u_grid = wind.u.values
+    v_grid = wind.v.values
+
+    seed_lat, seed_lon = np.meshgrid(
+        lat_coord[lat_indices], lon_coord[lon_indices], indexing="ij"
+    )
+    integrate_params: dict[str, Any] = {
+        "seed_lat": seed_lat,
+        "seed_lon": seed_lon,
+        "bbox": bbox,
+        "lat_coord": lat_coord,
+        "lon_coord": lon_coord,
+        "u_grid": u_grid,
+        "v_grid": v_grid,
+        "step_km": step_km,
+        "max_steps": max_steps,
+        "min_speed": min_speed,
+    }
+    if seeding == "even":
+        if separation_km is None:
+            spacing_deg = float(np.median(np.abs(np.diff(lat_coord))))
+            separation_km = int(stride) * spacing_deg * _KM_PER_DEG
+        lines = _integrate_streamlines_evenly(
+            separation_km=float(separation_km), **integrate_params
         )
+    else:
+        lines = _integrate_streamlines(**integrate_params)
+    lines = [(line_lat, line_lon) for line_lat, line_lon in lines if line_lat]
+    if zoom is not None:
+        lines = simplify_streamlines(lines, zoom=zoom)
+    return lines
 
-        lat_raw = np.asarray(u_slice["lat"].values)
-        lon_raw = np.asarray(u_slice["lon"].values)
-        u_values = np.asarray(u_slice.values)
-        v_values = np.asarray(v_slice.values)
 
-        lat_coord, u_values = _normalize_grid_axis(lat_raw, u_values, axis=0)
-        _lat_coord_v, v_values = _normalize_grid_axis(lat_raw, v_values, axis=0)
-        lon_coord, u_values = _normalize_grid_axis(lon_raw, u_values, axis=1)
-        _lon_coord_v, v_values = _normalize_grid_axis(lon_raw, v_values, axis=1)
+def _wind_streamline_lines_from_datacube(
+    cube_path: Path,
+    *,
+    valid_time: datetime,
+    level_key: str,
+    level_numeric: float | None,
+    **kwargs: Any,
+) -> list[tuple[list[float], list[float]]]:
+    wind = _load_wind_slice(
+        cube_path,
+        valid_time=valid_time,
+        level_key=level_key,
+        level_numeric=level_numeric,
+    )
+    return _wind_streamline_lines_from_slice(wind, **kwargs)
 
-        if lat_coord.size < 2 or lon_coord.size < 2:
-            return WindStreamlinesResponse()
 
-        min_lon, min_lat, max_lon, max_lat = bbox
-        lat_indices = _select_indices(
-            lat_coord, min_value=min_lat, max_value=max_lat, stride=stride
-        )
-        lon_indices = _select_lon_indices(
-            lon_coord, min_lon=min_lon, max_lon=max_lon, stride=stride
-        )
-        if lat_indices.size == 0 or lon_indices.size == 0:
-            return WindStreamlinesResponse()
+def _wind_streamlines_response(
+    lines: list[tuple[list[float], list[float]]],
+) -> WindStreamlinesResponse:
+    return WindStreamlinesResponse(
+        streamlines=[
+            WindStreamline(lat=line_lat, lon=line_lon) for line_lat, line_lon in lines
+        ]
+    )
 
-        seed_count = int(lat_indices.size) * int(lon_indices.size)
-        if seed_count > MAX_STREAMLINE_SEEDS:
-            raise HTTPException(
-                status_code=400, detail="reduce bbox or increase stride"
-            )
 
-        estimated_points = seed_count * (2 * int(max_steps) + 1)
-        if estimated_points > MAX_STREAMLINE_TOTAL_POINTS:
-            raise HTTPException(
-                status_code=400, detail="reduce bbox or increase stride"
-            )
+def _wind_streamlines_from_datacube(
+    cube_path: Path, **kwargs: Any
+) -> WindStreamlinesResponse:
+    return _wind_streamlines_response(
+        _wind_streamline_lines_from_datacube(cube_path, **kwargs)
+    )
 
-        u_grid = np.asarray(u_values, dtype=np.float64)
-        v_grid = np.asarray(v_values, dtype=np.float64)
-
-        streamlines: list[WindStreamline] = []
-        for lat_idx in lat_indices:
-            seed_lat = float(lat_coord[int(lat_idx)])
-            for lon_idx in lon_indices:
-                seed_lon = float(lon_coord[int(lon_idx)])
-                line_lat, line_lon = _integrate_streamline(
-                    seed_lat=seed_lat,
-                    seed_lon=seed_lon,
-                    bbox=bbox,
-                    lat_coord=lat_coord,
-                    lon_coord=lon_coord,
-                    u_grid=u_grid,
-                    v_grid=v_grid,
-                    step_km=step_km,
-                    max_steps=max_steps,
-                    min_speed=min_speed,
-                )
-                if line_lat and line_lon:
-                    streamlines.append(WindStreamline(lat=line_lat, lon=line_lon))
 
-        return WindStreamlinesResponse(streamlines=streamlines)
-    finally:
-        ds.close()
+def _wind_streamlines_json_from_datacube(cube_path: Path, **kwargs: Any) -> bytes:
+    response = _wind_streamlines_from_datacube(cube_path, **kwargs)
+    return response.model_dump_json().encode("utf-8")
+
+
+def _wind_streamline_pack_from_datacube(cube_path: Path, **kwargs: Any) -> bytes:
+    lines = _wind_streamline_lines_from_datacube(cube_path, **kwargs)
+    zoom = kwargs.get("zoom")
+    if zoom is None:
+        return encode_streamline_pack(lines)
+    # Match the pack's integer step to the rounding already applied.
+    return encode_streamline_pack(lines, scale=10.0 ** -coordinate_decimals(zoom))
+
+
+_WIND_PACK_RESPONSE: dict[int | str, dict[str, Any]] = {
+    200: {
+        "content": {
+            WIND_PACK_MEDIA_TYPE: {"schema": {"type": "string", "format": "binary"}}
+        },
+    },
+}
+
+
+async def _prewarm_cached_bodies(
+    *,
+    redis: RedisLike | None,
+    cache_namespace: str,
+    key_prefix: str,
+    run_key: str,
+    jobs: list[tuple[str, str, Callable[[], bytes]]],
+) -> list[WindVectorPrewarmItem]:
+    """Warm `(bbox, digest, compute)` jobs on the render executor.
+
+    `compute` must be picklable (a module-level function or a `partial` of
+    one) so it can run in a render worker process. At most `PREWARM_WORKERS`
+    jobs are in flight at once. Results keep the order of `jobs`; each carries
+    the wall time spent on its bbox, including any wait for a free slot.
+    """
+    executor = get_render_executor()
+    slots = asyncio.Semaphore(max(1, min(PREWARM_WORKERS, len(jobs))))
+
+    def _sync_file_cache(
+        digest: str, compute: Callable[[], bytes]
+    ) -> WindVectorCacheStatus:
+        _body, file_status = _get_or_compute_file_cached_bytes(
+            namespace=cache_namespace,
+            run_key=run_key,
+            digest=digest,
+            compute=lambda: executor.call(compute),
+        )
+        return file_status
+
+    async def _warm(
+        bbox_value: str, digest: str, compute: Callable[[], bytes]
+    ) -> WindVectorPrewarmItem:
+        started = time_module.perf_counter()
+        async with slots:
+            if redis is None:
+                status = await to_thread(_sync_file_cache, digest, compute)
+            else:
+
+                async def _compute() -> bytes:
+                    return await executor.run(compute)
+
+                try:
+                    cache_result = await get_or_compute_cached_bytes(
+                        redis,
+                        fresh_key=f"{key_prefix}:run={run_key}:fresh:{digest}",
+                        stale_key=f"{key_prefix}:run={run_key}:stale:{digest}",
+                        lock_key=f"{key_prefix}:run={run_key}:lock:{digest}",
+                        fresh_ttl_seconds=CACHE_FRESH_TTL_SECONDS,
+                        stale_ttl_seconds=CACHE_STALE_TTL_SECONDS,
+                        lock_ttl_ms=CACHE_LOCK_TTL_MS,
+                        wait_timeout_ms=CACHE_WAIT_TIMEOUT_MS,
+                        compute=_compute,
+                        cooldown_ttl_seconds=CACHE_COOLDOWN_TTL_SECONDS,
+                    )
+                    status = cache_result.status
+                except HTTPException:
+                    raise
+                except TimeoutError as exc:
+                    raise HTTPException(
+                        status_code=503, detail="Vector cache warming timed out"
+                    ) from exc
+                except Exception as exc:  # noqa: BLE001
+                    logger.warning(
+                        "vector_cache_unavailable", extra={"error": str(exc)}
+                    )
+                    status = await to_thread(_sync_file_cache, digest, compute)
+
+        duration_ms = (time_module.perf_counter() - started) * 1000.0
+        return WindVectorPrewarmItem(
+            bbox=bbox_value, status=status, duration_ms=round(duration_ms, 3)
+        )
+
+    return list(await asyncio.gather(*(_warm(*job) for job in jobs)))
 
 
-@router.get("/ecmwf/{run}/wind/{level}/{time}", response_model=WindVectorResponse)
+@router.get(
+    "/ecmwf/{run}/wind/{level}/{time}",
+    response_model=WindVectorResponse,
+    responses=_WIND_PACK_RESPONSE,
+)
 async def get_ecmwf_wind_vectors(
     request: Request,
     run: str,
@@ -911,6 +1681,15 @@ async def get_ecmwf_wind_vectors(
         description="Bounding box: minLon,minLat,maxLon,maxLat",
     ),
     stride: int = Query(default=1, ge=1, le=256),
+    target_points: Optional[int] = Query(
+        default=None,
+        ge=1,
+        le=MAX_VECTOR_POINTS,
+        description=(
+            "Pick the finest area-averaged mip level (2x, 4x, ...) whose bbox "
+            "selection has at most this many points; replaces stride"
+        ),
+    ),
 ) -> Response:
     try:
         run_dt = _parse_time(run, label="run")
@@ -919,6 +1698,10 @@ async def get_ecmwf_wind_vectors(
         parsed_bbox = _parse_bbox(bbox)
     except ValueError as exc:
         raise HTTPException(status_code=400, detail=str(exc)) from exc
+    if target_points is not None and stride != 1:
+        raise HTTPException(
+            status_code=400, detail="stride and target_points are mutually exclusive"
+        )
 
     run_key = _time_key(run_dt)
     time_key = _time_key(valid_dt)
@@ -929,6 +1712,11 @@ async def get_ecmwf_wind_vectors(
         "bbox": list(parsed_bbox) if parsed_bbox is not None else None,
         "stride": int(stride),
     }
+    if target_points is not None:
+        identity_payload["target_points"] = int(target_points)
+    wants_pack = _accepts_wind_pack(request.headers.get("accept"))
+    if wants_pack:
+        identity_payload["format"] = "pack"
     identity = _cache_identity(identity_payload)
     digest = hashlib.sha256(identity.encode("utf-8")).hexdigest()
 
@@ -939,13 +1727,20 @@ async def get_ecmwf_wind_vectors(
             run_time=run_dt, valid_time=valid_dt, level=level_key
         )
         cube_path = _resolve_asset_path(asset_path)
-        response = _wind_vectors_from_datacube(
-            cube_path,
-            valid_time=valid_dt,
-            level_key=level_key,
-            level_numeric=level_numeric,
-            bbox=parsed_bbox,
-            stride=int(stride),
+        compute_kwargs: dict[str, Any] = {
+            "valid_time": valid_dt,
+            "level_key": level_key,
+            "level_numeric": level_numeric,
+            "bbox": parsed_bbox,
+            "stride": int(stride),
+            "target_points": target_points,
+        }
+        if wants_pack:
+            return get_render_executor().call(
+                _wind_vector_pack_from_datacube, cube_path, **compute_kwargs
+            )
+        response = get_render_executor().call(
+            _wind_vectors_from_datacube, cube_path, **compute_kwargs
         )
         return response.model_dump_json().encode("utf-8")
 
@@ -953,16 +1748,13 @@ async def get_ecmwf_wind_vectors(
         return await to_thread(_compute_sync)
 
     if redis is None:
-        cache_dir = _vector_file_cache_dir() / "ecmwf-wind" / run_key
-        fresh_path = cache_dir / f"{digest}.fresh"
-        stale_path = cache_dir / f"{digest}.stale"
+        cache_namespace = "ecmwf-wind"
 
         def _sync_file_cache() -> bytes:
             body, _status = _get_or_compute_file_cached_bytes(
-                fresh_path=fresh_path,
-                stale_path=stale_path,
-                fresh_ttl_seconds=CACHE_FRESH_TTL_SECONDS,
-                stale_ttl_seconds=CACHE_STALE_TTL_SECONDS,
+                namespace=cache_namespace,
+                run_key=run_key,
+                digest=digest,
                 compute=_compute_sync,
             )
             return body
@@ -986,6 +1778,8 @@ async def get_ecmwf_wind_vectors(
                 cooldown_ttl_seconds=CACHE_COOLDOWN_TTL_SECONDS,
             )
             body = result.body
+        except HTTPException:
+            raise
         except TimeoutError as exc:
             raise HTTPException(
                 status_code=503, detail="Vector cache warming timed out"
@@ -995,8 +1789,13 @@ async def get_ecmwf_wind_vectors(
             body = await _compute()
 
     etag = f'"sha256-{hashlib.sha256(body).hexdigest()}"'
-    headers = {"Cache-Control": SHORT_CACHE_CONTROL_HEADER, "ETag": etag}
-    return Response(content=body, media_type="application/json", headers=headers)
+    headers = {
+        "Cache-Control": SHORT_CACHE_CONTROL_HEADER,
+        "ETag": etag,
+        "Vary": "Accept",
+    }
+    media_type = WIND_PACK_MEDIA_TYPE if wants_pack else "application/json"
+    return Response(content=body, media_type=media_type, headers=headers)
 
 
 @router.post(
@@ -1011,8 +1810,12 @@ async def prewarm_ecmwf_wind_vectors(
 ) -> WindVectorPrewarmResponse:
     if not payload.bboxes:
         raise HTTPException(status_code=400, detail="bboxes must not be empty")
-    if len(payload.bboxes) > 50:
+    if len(payload.bboxes) > MAX_PREWARM_BBOXES:
         raise HTTPException(status_code=400, detail="too many bboxes to prewarm")
+    if payload.target_points is not None and payload.stride != 1:
+        raise HTTPException(
+            status_code=400, detail="stride and target_points are mutually exclusive"
+        )
 
     try:
         run_dt = _parse_time(run, label="run")
@@ -1039,10 +1842,7 @@ async def prewarm_ecmwf_wind_vectors(
     )
     cube_path = _resolve_asset_path(asset_path)
 
-    cache_dir = _vector_file_cache_dir() / "ecmwf-wind" / run_key
-    redis: RedisLike | None = getattr(request.app.state, "redis_client", None)
-    results: list[WindVectorPrewarmItem] = []
-
+    jobs: list[tuple[str, str, Callable[[], bytes]]] = []
     for bbox_value, bbox_tuple in parsed_bboxes:
         identity_payload: dict[str, object] = {
             "run": run_key,
@@ -1051,89 +1851,144 @@ async def prewarm_ecmwf_wind_vectors(
             "bbox": list(bbox_tuple),
             "stride": int(payload.stride),
         }
+        if payload.target_points is not None:
+            identity_payload["target_points"] = int(payload.target_points)
         identity = _cache_identity(identity_payload)
         digest = hashlib.sha256(identity.encode("utf-8")).hexdigest()
 
-        fresh_path = cache_dir / f"{digest}.fresh"
-        stale_path = cache_dir / f"{digest}.stale"
-
-        def _compute_bbox_sync(
-            *, bbox_for_compute: tuple[float, float, float, float] = bbox_tuple
-        ) -> bytes:
-            response = _wind_vectors_from_datacube(
-                cube_path,
-                valid_time=valid_dt,
-                level_key=level_key,
-                level_numeric=level_numeric,
-                bbox=bbox_for_compute,
-                stride=int(payload.stride),
-            )
-            return response.model_dump_json().encode("utf-8")
+        compute = partial(
+            _wind_vector_json_from_datacube,
+            cube_path,
+            valid_time=valid_dt,
+            level_key=level_key,
+            level_numeric=level_numeric,
+            bbox=bbox_tuple,
+            stride=int(payload.stride),
+            target_points=payload.target_points,
+        )
+        jobs.append((bbox_value, digest, compute))
+
+    results = await _prewarm_cached_bodies(
+        redis=getattr(request.app.state, "redis_client", None),
+        cache_namespace="ecmwf-wind",
+        key_prefix="vector:ecmwf:wind",
+        run_key=run_key,
+        jobs=jobs,
+    )
+    return WindVectorPrewarmResponse(results=results)
 
-        if redis is None:
 
-            def _sync_file_cache() -> WindVectorCacheStatus:
-                _body, file_status = _get_or_compute_file_cached_bytes(
-                    fresh_path=fresh_path,
-                    stale_path=stale_path,
-                    fresh_ttl_seconds=CACHE_FRESH_TTL_SECONDS,
-                    stale_ttl_seconds=CACHE_STALE_TTL_SECONDS,
-                    compute=_compute_bbox_sync,
-                )
-                return file_status
+@router.get(
+    "/ecmwf/{run}/wind/{level}/{time}/{z}/{x}/{y}",
+    response_model=WindVectorResponse,
+    responses={
+        302: {"description": "Redirect to object storage"},
+        304: {"description": "Not Modified"},
+        400: {"description": "Bad Request"},
+        404: {"description": "Not Found"},
+    },
+)
+def get_ecmwf_wind_vector_tile(
+    request: Request,
+    run: str,
+    level: str,
+    time: str,
+    z: int = PathParam(..., ge=0, le=22),
+    x: int = PathParam(..., ge=0),
+    y: int = PathParam(..., ge=0),
+    redirect: bool = Query(
+        default=True,
+        description="Return 302 redirect to object storage when possible",
+    ),
+) -> Response:
+    # Nothing is computed here: the address maps onto a static JSON tile that is
+    # served with the same local/S3, sidecar and availability handling as
+    # `/tiles/{tile_path}`.
+    try:
+        run_key = _time_key(_parse_time(run, label="run"))
+        time_key = _time_key(_parse_time(time, label="time"))
+        level_key, _level_numeric = _normalize_level(level)
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
 
-            status = await to_thread(_sync_file_cache)
-            results.append(WindVectorPrewarmItem(bbox=bbox_value, status=status))
-            continue
+    if x >= 2**z or y >= 2**z:
+        raise HTTPException(status_code=404, detail="Not Found")
 
-        fresh_key = f"vector:ecmwf:wind:run={run_key}:fresh:{digest}"
-        stale_key = f"vector:ecmwf:wind:run={run_key}:stale:{digest}"
-        lock_key = f"vector:ecmwf:wind:run={run_key}:lock:{digest}"
+    key = f"{WIND_VECTOR_TILE_LAYER}/{run_key}/{time_key}/{level_key}/{z}/{x}/{y}.json"
+    return get_tile(key, request, redirect=redirect)
 
-        async def _compute_bbox() -> bytes:
-            return await to_thread(_compute_bbox_sync)
 
-        try:
-            cache_result = await get_or_compute_cached_bytes(
-                redis,
-                fresh_key=fresh_key,
-                stale_key=stale_key,
-                lock_key=lock_key,
-                fresh_ttl_seconds=CACHE_FRESH_TTL_SECONDS,
-                stale_ttl_seconds=CACHE_STALE_TTL_SECONDS,
-                lock_ttl_ms=CACHE_LOCK_TTL_MS,
-                wait_timeout_ms=CACHE_WAIT_TIMEOUT_MS,
-                compute=_compute_bbox,
-                cooldown_ttl_seconds=CACHE_COOLDOWN_TTL_SECONDS,
-            )
-            status = cache_result.status
-        except TimeoutError as exc:
-            raise HTTPException(
-                status_code=503, detail="Vector cache warming timed out"
-            ) from exc
-        except Exception as exc:  # noqa: BLE001
-            logger.warning("vector_cache_unavailable", extra={"error": str(exc)})
+def _wind_texture_key(*, run: str, level: str, time: str, suffix: str) -> str:
+    try:
+        run_key = _time_key(_parse_time(run, label="run"))
+        time_key = _time_key(_parse_time(time, label="time"))
+        level_key, _level_numeric = _normalize_level(level)
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+    return f"{WIND_TEXTURE_LAYER}/{run_key}/{time_key}/{level_key}/wind.{suffix}"
 
-            def _sync_file_cache() -> WindVectorCacheStatus:
-                _body, file_status = _get_or_compute_file_cached_bytes(
-                    fresh_path=fresh_path,
-                    stale_path=stale_path,
-                    fresh_ttl_seconds=CACHE_FRESH_TTL_SECONDS,
-                    stale_ttl_seconds=CACHE_STALE_TTL_SECONDS,
-                    compute=_compute_bbox_sync,
-                )
-                return file_status
 
-            status = await to_thread(_sync_file_cache)
+@router.get(
+    "/ecmwf/{run}/wind/{level}/{time}/texture.png",
+    response_class=Response,
+    responses={
+        200: {
+            "description": "RGBA wind texture (R=u, G=v); WebP when accepted",
+            "content": {
+                "image/png": {"schema": {"type": "string", "format": "binary"}},
+                "image/webp": {"schema": {"type": "string", "format": "binary"}},
+            },
+        },
+        302: {"description": "Redirect to object storage"},
+        304: {"description": "Not Modified"},
+        400: {"description": "Bad Request"},
+        404: {"description": "Not Found"},
+    },
+)
+def get_ecmwf_wind_texture(
+    request: Request,
+    run: str,
+    level: str,
+    time: str,
+    redirect: bool = Query(
+        default=True,
+        description="Return 302 redirect to object storage when possible",
+    ),
+) -> Response:
+    # The texture is precomputed by the pipeline; `get_tile` swaps in the WebP
+    # variant when the client accepts it. Decode with `texture.json`.
+    key = _wind_texture_key(run=run, level=level, time=time, suffix="png")
+    return get_tile(key, request, redirect=redirect)
 
-        results.append(WindVectorPrewarmItem(bbox=bbox_value, status=status))
 
-    return WindVectorPrewarmResponse(results=results)
+@router.get(
+    "/ecmwf/{run}/wind/{level}/{time}/texture.json",
+    responses={
+        200: {"description": "Wind texture size, bounds and u/v scale/offset"},
+        302: {"description": "Redirect to object storage"},
+        304: {"description": "Not Modified"},
+        400: {"description": "Bad Request"},
+        404: {"description": "Not Found"},
+    },
+)
+def get_ecmwf_wind_texture_metadata(
+    request: Request,
+    run: str,
+    level: str,
+    time: str,
+    redirect: bool = Query(
+        default=True,
+        description="Return 302 redirect to object storage when possible",
+    ),
+) -> Response:
+    key = _wind_texture_key(run=run, level=level, time=time, suffix="json")
+    return get_tile(key, request, redirect=redirect)
 
 
 @router.get(
     "/ecmwf/{run}/wind/{level}/{time}/streamlines",
     response_model=WindStreamlinesResponse,
+    responses=_WIND_PACK_RESPONSE,
 )
 async def get_ecmwf_wind_streamlines(
     request: Request,
@@ -1148,6 +2003,28 @@ async def get_ecmwf_wind_streamlines(
     step_km: float = Query(default=10.0, gt=0.0, le=500.0),
     max_steps: int = Query(default=200, ge=1, le=2000),
     min_speed: float = Query(default=0.0, ge=0.0, le=500.0),
+    seeding: WindStreamlineSeeding = Query(
+        default="grid",
+        description=(
+            "grid: one seed per strided grid point; even: evenly-spaced lines "
+            "kept separation_km apart"
+        ),
+    ),
+    separation_km: Optional[float] = Query(
+        default=None,
+        gt=0.0,
+        le=5000.0,
+        description="Line spacing for seeding=even (default: stride grid cells)",
+    ),
+    zoom: Optional[int] = Query(
+        default=None,
+        ge=0,
+        le=22,
+        description=(
+            "Map zoom the lines are drawn at: simplify to half a pixel and round "
+            "coordinates to match (default: full RK4 resolution)"
+        ),
+    ),
 ) -> Response:
     try:
         run_dt = _parse_time(run, label="run")
@@ -1172,6 +2049,14 @@ async def get_ecmwf_wind_streamlines(
         "max_steps": int(max_steps),
         "min_speed": float(min_speed),
     }
+    if seeding != "grid":
+        identity_payload["seeding"] = seeding
+        identity_payload["separation_km"] = separation_km
+    if zoom is not None:
+        identity_payload["zoom"] = int(zoom)
+    wants_pack = _accepts_wind_pack(request.headers.get("accept"))
+    if wants_pack:
+        identity_payload["format"] = "pack"
     identity = _cache_identity(identity_payload)
     digest = hashlib.sha256(identity.encode("utf-8")).hexdigest()
 
@@ -1182,16 +2067,25 @@ async def get_ecmwf_wind_streamlines(
             run_time=run_dt, valid_time=valid_dt, level=level_key
         )
         cube_path = _resolve_asset_path(asset_path)
-        response = _wind_streamlines_from_datacube(
-            cube_path,
-            valid_time=valid_dt,
-            level_key=level_key,
-            level_numeric=level_numeric,
-            bbox=parsed_bbox,
-            stride=int(stride),
-            step_km=float(step_km),
-            max_steps=int(max_steps),
-            min_speed=float(min_speed),
+        compute_kwargs: dict[str, Any] = {
+            "valid_time": valid_dt,
+            "level_key": level_key,
+            "level_numeric": level_numeric,
+            "bbox": parsed_bbox,
+            "stride": int(stride),
+            "step_km": float(step_km),
+            "max_steps": int(max_steps),
+            "min_speed": float(min_speed),
+            "seeding": seeding,
+            "separation_km": separation_km,
+            "zoom": zoom,
+        }
+        if wants_pack:
+            return get_render_executor().call(
+                _wind_streamline_pack_from_datacube, cube_path, **compute_kwargs
+            )
+        response = get_render_executor().call(
+            _wind_streamlines_from_datacube, cube_path, **compute_kwargs
         )
         return response.model_dump_json().encode("utf-8")
 
@@ -1199,16 +2093,13 @@ async def get_ecmwf_wind_streamlines(
         return await to_thread(_compute_sync)
 
     if redis is None:
-        cache_dir = _vector_file_cache_dir() / "ecmwf-wind-streamlines" / run_key
-        fresh_path = cache_dir / f"{digest}.fresh"
-        stale_path = cache_dir / f"{digest}.stale"
+        cache_namespace = "ecmwf-wind-streamlines"
 
         def _sync_file_cache() -> bytes:
             body, _status = _get_or_compute_file_cached_bytes(
-                fresh_path=fresh_path,
-                stale_path=stale_path,
-                fresh_ttl_seconds=CACHE_FRESH_TTL_SECONDS,
-                stale_ttl_seconds=CACHE_STALE_TTL_SECONDS,
+                namespace=cache_namespace,
+                run_key=run_key,
+                digest=digest,
                 compute=_compute_sync,
             )
             return body
@@ -1232,6 +2123,8 @@ async def get_ecmwf_wind_streamlines(
                 cooldown_ttl_seconds=CACHE_COOLDOWN_TTL_SECONDS,
             )
             body = result.body
+        except HTTPException:
+            raise
         except TimeoutError as exc:
             raise HTTPException(
                 status_code=503, detail="Vector cache warming timed out"
@@ -1241,8 +2134,13 @@ async def get_ecmwf_wind_streamlines(
             body = await _compute()
 
     etag = f'"sha256-{hashlib.sha256(body).hexdigest()}"'
-    headers = {"Cache-Control": SHORT_CACHE_CONTROL_HEADER, "ETag": etag}
-    return Response(content=body, media_type="application/json", headers=headers)
+    headers = {
+        "Cache-Control": SHORT_CACHE_CONTROL_HEADER,
+        "ETag": etag,
+        "Vary": "Accept",
+    }
+    media_type = WIND_PACK_MEDIA_TYPE if wants_pack else "application/json"
+    return Response(content=body, media_type=media_type, headers=headers)
 
 
 @router.post(
@@ -1258,11 +2156,37 @@ async def prewarm_ecmwf_wind_streamlines(
     step_km: float = Query(default=10.0, gt=0.0, le=500.0),
     max_steps: int = Query(default=200, ge=1, le=2000),
     min_speed: float = Query(default=0.0, ge=0.0, le=500.0),
+    seeding: WindStreamlineSeeding = Query(
+        default="grid",
+        description=(
+            "grid: one seed per strided grid point; even: evenly-spaced lines "
+            "kept separation_km apart"
+        ),
+    ),
+    separation_km: Optional[float] = Query(
+        default=None,
+        gt=0.0,
+        le=5000.0,
+        description="Line spacing for seeding=even (default: stride grid cells)",
+    ),
+    zoom: Optional[int] = Query(
+        default=None,
+        ge=0,
+        le=22,
+        description=(
+            "Map zoom the lines are drawn at: simplify to half a pixel and round "
+            "coordinates to match (default: full RK4 resolution)"
+        ),
+    ),
 ) -> WindVectorPrewarmResponse:
     if not payload.bboxes:
         raise HTTPException(status_code=400, detail="bboxes must not be empty")
-    if len(payload.bboxes) > 50:
+    if len(payload.bboxes) > MAX_PREWARM_BBOXES:
         raise HTTPException(status_code=400, detail="too many bboxes to prewarm")
+    if payload.target_points is not None:
+        raise HTTPException(
+            status_code=400, detail="target_points is not supported for streamlines"
+        )
 
     try:
         run_dt = _parse_time(run, label="run")
@@ -1289,10 +2213,7 @@ async def prewarm_ecmwf_wind_streamlines(
     )
     cube_path = _resolve_asset_path(asset_path)
 
-    cache_dir = _vector_file_cache_dir() / "ecmwf-wind-streamlines" / run_key
-    redis: RedisLike | None = getattr(request.app.state, "redis_client", None)
-    results: list[WindVectorPrewarmItem] = []
-
+    jobs: list[tuple[str, str, Callable[[], bytes]]] = []
     for bbox_value, bbox_tuple in parsed_bboxes:
         identity_payload: dict[str, object] = {
             "run": run_key,
@@ -1304,84 +2225,36 @@ async def prewarm_ecmwf_wind_streamlines(
             "max_steps": int(max_steps),
             "min_speed": float(min_speed),
         }
+        if seeding != "grid":
+            identity_payload["seeding"] = seeding
+            identity_payload["separation_km"] = separation_km
+        if zoom is not None:
+            identity_payload["zoom"] = int(zoom)
         identity = _cache_identity(identity_payload)
         digest = hashlib.sha256(identity.encode("utf-8")).hexdigest()
 
-        fresh_path = cache_dir / f"{digest}.fresh"
-        stale_path = cache_dir / f"{digest}.stale"
-
-        def _compute_bbox_sync(
-            *, bbox_for_compute: tuple[float, float, float, float] = bbox_tuple
-        ) -> bytes:
-            response = _wind_streamlines_from_datacube(
-                cube_path,
-                valid_time=valid_dt,
-                level_key=level_key,
-                level_numeric=level_numeric,
-                bbox=bbox_for_compute,
-                stride=int(payload.stride),
-                step_km=float(step_km),
-                max_steps=int(max_steps),
-                min_speed=float(min_speed),
-            )
-            return response.model_dump_json().encode("utf-8")
-
-        if redis is None:
-
-            def _sync_file_cache() -> WindVectorCacheStatus:
-                _body, file_status = _get_or_compute_file_cached_bytes(
-                    fresh_path=fresh_path,
-                    stale_path=stale_path,
-                    fresh_ttl_seconds=CACHE_FRESH_TTL_SECONDS,
-                    stale_ttl_seconds=CACHE_STALE_TTL_SECONDS,
-                    compute=_compute_bbox_sync,
-                )
-                return file_status
-
-            status = await to_thread(_sync_file_cache)
-            results.append(WindVectorPrewarmItem(bbox=bbox_value, status=status))
-            continue
-
-        fresh_key = f"vector:ecmwf:wind-streamlines:run={run_key}:fresh:{digest}"
-        stale_key = f"vector:ecmwf:wind-streamlines:run={run_key}:stale:{digest}"
-        lock_key = f"vector:ecmwf:wind-streamlines:run={run_key}:lock:{digest}"
-
-        async def _compute_bbox() -> bytes:
-            return await to_thread(_compute_bbox_sync)
-
-        try:
-            cache_result = await get_or_compute_cached_bytes(
-                redis,
-                fresh_key=fresh_key,
-                stale_key=stale_key,
-                lock_key=lock_key,
-                fresh_ttl_seconds=CACHE_FRESH_TTL_SECONDS,
-                stale_ttl_seconds=CACHE_STALE_TTL_SECONDS,
-                lock_ttl_ms=CACHE_LOCK_TTL_MS,
-                wait_timeout_ms=CACHE_WAIT_TIMEOUT_MS,
-                compute=_compute_bbox,
-                cooldown_ttl_seconds=CACHE_COOLDOWN_TTL_SECONDS,
-            )
-            status = cache_result.status
-        except TimeoutError as exc:
-            raise HTTPException(
-                status_code=503, detail="Vector cache warming timed out"
-            ) from exc
-        except Exception as exc:  # noqa: BLE001
-            logger.warning("vector_cache_unavailable", extra={"error": str(exc)})
-
-            def _sync_file_cache() -> WindVectorCacheStatus:
-                _body, file_status = _get_or_compute_file_cached_bytes(
-                    fresh_path=fresh_path,
-                    stale_path=stale_path,
-                    fresh_ttl_seconds=CACHE_FRESH_TTL_SECONDS,
-                    stale_ttl_seconds=CACHE_STALE_TTL_SECONDS,
-                    compute=_compute_bbox_sync,
-                )
-                return file_status
-
-            status = await to_thread(_sync_file_cache)
-
-        results.append(WindVectorPrewarmItem(bbox=bbox_value, status=status))
-
+        compute = partial(
+            _wind_streamlines_json_from_datacube,
+            cube_path,
+            valid_time=valid_dt,
+            level_key=level_key,
+            level_numeric=level_numeric,
+            bbox=bbox_tuple,
+            stride=int(payload.stride),
+            step_km=float(step_km),
+            max_steps=int(max_steps),
+            min_speed=float(min_speed),
+            seeding=seeding,
+            separation_km=separation_km,
+            zoom=zoom,
+        )
+        jobs.append((bbox_value, digest, compute))
+
+    results = await _prewarm_cached_bodies(
+        redis=getattr(request.app.state, "redis_client", None),
+        cache_namespace="ecmwf-wind-streamlines",
+        key_prefix="vector:ecmwf:wind-streamlines",
+        run_key=run_key,
+        jobs=jobs,
+    )
     return WindVectorPrewarmResponse(results=results)
@@ -5,18 +5,21 @@ import logging
 import math
 import os
 import time
-from asyncio import to_thread
+from concurrent.futures import ThreadPoolExecutor, wait
 from dataclasses import dataclass
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
 from typing import Final, Protocol
 
 import numpy as np
+import xarray as xr
 from fastapi import APIRouter, HTTPException, Query, Request
 from fastapi.responses import Response
 
 from config import get_settings
-from datacube.storage import open_datacube
+from datacube_pool import open_pooled_datacube
+from render_pool import get_render_executor
 from volume.cloud_density import DEFAULT_CLOUD_DENSITY_LAYER
 from volume.pack import encode_volume_pack
 
@@ -42,6 +45,9 @@ MAX_CACHEABLE_BYTES: Final[int] = 4 * 1024 * 1024
 
 METERS_PER_DEG_LAT: Final[float] = 111_320.0
 
+# Threads shared by every volume request in a process for per-level reads.
+VOLUME_LEVEL_WORKERS: Final[int] = 4
+
 _TIME_KEY_FORMAT: Final[str] = "%Y%m%dT%H%M%SZ"
 _ISO_Z_FORMAT: Final[str] = "%Y-%m-%dT%H:%M:%SZ"
 
@@ -443,85 +449,28 @@ def _interp2d(
     return out
 
 
-def _read_cloud_density_coords(path: Path) -> tuple[np.ndarray, np.ndarray]:
-    ds = open_datacube(path)
-    try:
-        if "cloud_density" not in ds.data_vars:
-            raise HTTPException(status_code=500, detail="Slice missing cloud_density")
-        da = ds["cloud_density"].squeeze(drop=True)
-        if set(da.dims) != {"lat", "lon"}:
-            raise HTTPException(
-                status_code=500, detail="Slice must have lat/lon dimensions"
-            )
-        lat = np.asarray(da["lat"].values, dtype=np.float64)
-        lon = np.asarray(da["lon"].values, dtype=np.float64)
-    finally:
-        ds.close()
-
-    if not (_monotonic_1d(lat) and _monotonic_1d(lon)):
+def _cloud_density_array(ds: xr.Dataset) -> xr.DataArray:
+    if "cloud_density" not in ds.data_vars:
+        raise HTTPException(status_code=500, detail="Slice missing cloud_density")
+    da = ds["cloud_density"].squeeze(drop=True)
+    if set(da.dims) != {"lat", "lon"}:
         raise HTTPException(
-            status_code=500, detail="Slice coordinates are not monotonic"
+            status_code=500, detail="Slice must have lat/lon dimensions"
         )
-    return lat, lon
+    return da
 
 
-def _read_cloud_density_grid(
-    path: Path,
-    *,
-    lat_bounds: tuple[float, float] | None = None,
-    lon_bounds: tuple[float, float] | None = None,
-) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
-    ds = open_datacube(path)
-    try:
-        if "cloud_density" not in ds.data_vars:
-            raise HTTPException(status_code=500, detail="Slice missing cloud_density")
-        da = ds["cloud_density"].squeeze(drop=True)
-        if set(da.dims) != {"lat", "lon"}:
-            raise HTTPException(
-                status_code=500, detail="Slice must have lat/lon dimensions"
-            )
-
-        if lat_bounds is not None or lon_bounds is not None:
-            lat_full = np.asarray(da["lat"].values, dtype=np.float64)
-            lon_full = np.asarray(da["lon"].values, dtype=np.float64)
-            if not (_monotonic_1d(lat_full) and _monotonic_1d(lon_full)):
-                raise HTTPException(
-                    status_code=500, detail="Slice coordinates are not monotonic"
-                )
-
-            if lat_bounds is not None:
-                lat_min, lat_max = sorted(lat_bounds)
-                lat_isel = _bounding_slice_monotonic(lat_full, lat_min, lat_max)
-                if lat_isel.stop == 0:
-                    da = da.isel(lat=slice(0, 0))
-                else:
-                    start = float(lat_full[int(lat_isel.start)])
-                    end = float(lat_full[int(lat_isel.stop) - 1])
-                    da = da.sel(lat=slice(start, end))
-
-            if lon_bounds is not None:
-                lon_min, lon_max = sorted(lon_bounds)
-                lon_isel = _bounding_slice_monotonic(lon_full, lon_min, lon_max)
-                if lon_isel.stop == 0:
-                    da = da.isel(lon=slice(0, 0))
-                else:
-                    start = float(lon_full[int(lon_isel.start)])
-                    end = float(lon_full[int(lon_isel.stop) - 1])
-                    da = da.sel(lon=slice(start, end))
-
+def _read_cloud_density_coords(path: Path) -> tuple[np.ndarray, np.ndarray]:
+    with open_pooled_datacube(path) as ds:
+        da = _cloud_density_array(ds)
         lat = np.asarray(da["lat"].values, dtype=np.float64)
         lon = np.asarray(da["lon"].values, dtype=np.float64)
-        values = np.asarray(da.values, dtype=np.float32)
-    finally:
-        ds.close()
 
     if not (_monotonic_1d(lat) and _monotonic_1d(lon)):
         raise HTTPException(
             status_code=500, detail="Slice coordinates are not monotonic"
         )
-    if values.ndim != 2 or values.shape != (lat.size, lon.size):
-        raise HTTPException(status_code=500, detail="Slice has invalid data shape")
-    return lat, lon, values
+    return lat, lon
 
 
 def _estimate_grid_size(bbox: BBox, *, res_m: float) -> tuple[int, int]:
@@ -553,6 +502,78 @@ def _target_grid(bbox: BBox, *, res_m: float) -> tuple[np.ndarray, np.ndarray]:
     return target_lat, target_lon
 
 
+@dataclass(frozen=True)
+class _SliceCrop:
+    """Where a bbox falls in the slice grid, shared by every level of a volume.
+
+    `grid_shape` is the full (lat, lon) shape every level must have and
+    `lat_window`/`lon_window` index the bounded window in file order; the
+    orders and slices then turn that window into the ascending `lat`/`lon`.
+    """
+
+    grid_shape: tuple[int, int]
+    lat_window: slice
+    lon_window: slice
+    lat_order: np.ndarray
+    lon_order: np.ndarray
+    lat_slice: slice
+    lon_slice: slice
+    lat: np.ndarray
+    lon: np.ndarray
+
+
+def _slice_crop(
+    lat_full: np.ndarray,
+    lon_full: np.ndarray,
+    *,
+    lat_bounds: tuple[float, float],
+    lon_bounds: tuple[float, float],
+) -> _SliceCrop:
+    lat_window = _bounding_slice_monotonic(lat_full, *sorted(lat_bounds))
+    lon_window = _bounding_slice_monotonic(lon_full, *sorted(lon_bounds))
+
+    lat_sorted, lat_order = _sorted_axis(lat_full[lat_window])
+    lon_sorted, lon_order = _sorted_axis(lon_full[lon_window])
+    lat_slice = _bounding_slice(lat_sorted, *lat_bounds)
+    lon_slice = _bounding_slice(lon_sorted, *lon_bounds)
+    if lat_slice.stop == 0 or lon_slice.stop == 0:
+        raise HTTPException(status_code=404, detail="bbox outside dataset")
+
+    return _SliceCrop(
+        grid_shape=(int(lat_full.size), int(lon_full.size)),
+        lat_window=lat_window,
+        lon_window=lon_window,
+        lat_order=lat_order,
+        lon_order=lon_order,
+        lat_slice=lat_slice,
+        lon_slice=lon_slice,
+        lat=lat_sorted[lat_slice],
+        lon=lon_sorted[lon_slice],
+    )
+
+
+def _read_volume_level(slice_path: Path, *, crop: _SliceCrop) -> np.ndarray:
+    """Read the reference crop's window from one level without decoding coords."""
+    with open_pooled_datacube(slice_path) as ds:
+        da = _cloud_density_array(ds)
+        if (da.sizes["lat"], da.sizes["lon"]) != crop.grid_shape:
+            raise HTTPException(status_code=500, detail="Slice grids do not match")
+        window = da.isel(lat=crop.lat_window, lon=crop.lon_window)
+        values = np.asarray(window.values, dtype=np.float32)
+
+    if values.shape != (crop.lat_order.size, crop.lon_order.size):
+        raise HTTPException(status_code=500, detail="Slice has invalid data shape")
+    values_sorted = values[np.ix_(crop.lat_order, crop.lon_order)]
+    return values_sorted[crop.lat_slice, :][:, crop.lon_slice]
+
+
+@lru_cache(maxsize=1)
+def _level_pool() -> ThreadPoolExecutor:
+    return ThreadPoolExecutor(
+        max_workers=VOLUME_LEVEL_WORKERS, thread_name_prefix="volume-level"
+    )
+
+
 def _compute_volume_payload(
     *,
     bbox: BBox,
@@ -566,60 +587,49 @@ def _compute_volume_payload(
     _time_key, resolved_dt, time_dir = _resolve_time_dir(
         base_dir, layer=DEFAULT_CLOUD_DENSITY_LAYER, valid_time=valid_time
     )
+    slice_paths = [
+        _resolve_slice_path(time_dir, level_key=level_key) for level_key in levels_keys
+    ]
 
-    reference_slice_path = _resolve_slice_path(time_dir, level_key=levels_keys[0])
-    _, reference_lon = _read_cloud_density_coords(reference_slice_path)
+    # Every level is cropped and resampled on the reference level's grid.
+    reference_lat, reference_lon = _read_cloud_density_coords(slice_paths[0])
     lon_w = _normalize_lon(bbox.west, reference_lon)
     lon_e = _normalize_lon(bbox.east, reference_lon)
     if lon_e <= lon_w:
         raise HTTPException(status_code=400, detail="bbox crosses longitude seam")
 
-    slices: list[np.ndarray] = []
-    lon_coord: np.ndarray | None = None
-    lat_coord: np.ndarray | None = None
-    for level_key in levels_keys:
-        slice_path = _resolve_slice_path(time_dir, level_key=level_key)
-        lat, lon, values = _read_cloud_density_grid(
-            slice_path,
-            lat_bounds=(bbox.south, bbox.north),
-            lon_bounds=(lon_w, lon_e),
-        )
-
-        lon_sorted, lon_order = _sorted_axis(lon)
-        lat_sorted, lat_order = _sorted_axis(lat)
-        values_sorted = values[np.ix_(lat_order, lon_order)]
-
-        lat_slice = _bounding_slice(lat_sorted, bbox.south, bbox.north)
-        lon_slice = _bounding_slice(lon_sorted, lon_w, lon_e)
-        if lat_slice.stop == 0 or lon_slice.stop == 0:
-            raise HTTPException(status_code=404, detail="bbox outside dataset")
+    crop = _slice_crop(
+        reference_lat,
+        reference_lon,
+        lat_bounds=(bbox.south, bbox.north),
+        lon_bounds=(lon_w, lon_e),
+    )
+    target_lon_norm = np.linspace(lon_w, lon_e, target_lon.size, dtype=np.float64)
 
-        lat_sub = lat_sorted[lat_slice]
-        lon_sub = lon_sorted[lon_slice]
-        values_sub = values_sorted[lat_slice, :][:, lon_slice]
+    volume = np.empty(
+        (len(slice_paths), target_lat.size, target_lon.size), dtype=np.float32
+    )
 
-        if lat_coord is None:
-            lat_coord = lat_sub
-            lon_coord = lon_sub
-        else:
-            if (
-                lat_coord.shape != lat_sub.shape
-                or lon_coord is None
-                or lon_coord.shape != lon_sub.shape
-            ):
-                raise HTTPException(status_code=500, detail="Slice grids do not match")
-
-        target_lon_norm = np.linspace(lon_w, lon_e, target_lon.size, dtype=np.float64)
-        slice_resampled = _interp2d(
-            lat=lat_sub,
-            lon=lon_sub,
-            values=values_sub,
+    def _fill_level(index: int) -> None:
+        volume[index] = _interp2d(
+            lat=crop.lat,
+            lon=crop.lon,
+            values=_read_volume_level(slice_paths[index], crop=crop),
             target_lat=target_lat,
             target_lon=target_lon_norm,
         )
-        slices.append(slice_resampled)
 
-    volume = np.stack(slices, axis=0).astype(np.float32, copy=False)
+    pool = _level_pool()
+    futures = [pool.submit(_fill_level, index) for index in range(len(slice_paths))]
+    try:
+        for future in futures:
+            future.result()
+    except BaseException:
+        for future in futures:
+            future.cancel()
+        # Levels still running write into `volume`; let them finish first.
+        wait(futures)
+        raise
 
     header = {
         "bbox": bbox.to_header(),
@@ -749,7 +759,7 @@ async def get_volume(
             cache_hit = False
 
     if payload is None:
-        payload = await to_thread(
+        payload = await get_render_executor().run(
             _compute_volume_payload,
             bbox=bbox_parsed,
             levels_keys=levels_keys,
@@ -0,0 +1,184 @@
+from __future__ import annotations
+
+import math
+from typing import Final, Sequence
+
+import numpy as np
+
+# Web-map tile size the zoom-dependent tolerances are expressed against.
+TILE_SIZE_PX: Final[int] = 256
+# Largest deviation from the traced line that simplification may introduce.
+SIMPLIFY_TOLERANCE_PX: Final[float] = 0.5
+# Coordinates are rounded to the coarsest decimal step finer than this.
+QUANTIZE_STEP_PX: Final[float] = 0.1
+MAX_COORDINATE_DECIMALS: Final[int] = 5
+
+Polyline = tuple[Sequence[float], Sequence[float]]
+
+
+def pixel_size_deg(zoom: int) -> float:
+    """Longitude span of one pixel at `zoom` (equator, Web Mercator tiles)."""
+    return 360.0 / (TILE_SIZE_PX * 2 ** int(zoom))
+
+
+def simplify_tolerance_deg(zoom: int) -> float:
+    return SIMPLIFY_TOLERANCE_PX * pixel_size_deg(zoom)
+
+
+def coordinate_decimals(zoom: int) -> int:
+    """Decimal places that keep rounding error below `QUANTIZE_STEP_PX`."""
+    step = QUANTIZE_STEP_PX * pixel_size_deg(zoom)
+    decimals = math.ceil(-math.log10(step))
+    return max(0, min(MAX_COORDINATE_DECIMALS, decimals))
+
+
+def _flatten(
+    lines: Sequence[Polyline],
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    counts = np.fromiter(
+        (len(line_lat) for line_lat, _line_lon in lines),
+        dtype=np.int64,
+        count=len(lines),
+    )
+    total = int(counts.sum())
+    lat = np.fromiter(
+        (value for line_lat, _ in lines for value in line_lat),
+        dtype=np.float64,
+        count=total,
+    )
+    lon = np.fromiter(
+        (value for _, line_lon in lines for value in line_lon),
+        dtype=np.float64,
+        count=total,
+    )
+    return counts, lat, lon
+
+
+def _split(
+    counts: np.ndarray, lat: np.ndarray, lon: np.ndarray
+) -> list[tuple[list[float], list[float]]]:
+    bounds = np.cumsum(counts)[:-1]
+    return [
+        (line_lat.tolist(), line_lon.tolist())
+        for line_lat, line_lon in zip(np.split(lat, bounds), np.split(lon, bounds))
+    ]
+
+
+def _local_x(counts: np.ndarray, lat: np.ndarray, lon: np.ndarray) -> np.ndarray:
+    """Per-line equirectangular x: `(lon - lon0) * cos(lat_ref)` in degrees.
+
+    `lon0` is the line's first longitude and `lat_ref` its mean latitude, so
+    every line is projected around itself with a single scale.
+    """
+    line_id = np.repeat(np.arange(counts.size), counts)
+    starts = (np.cumsum(counts) - counts)[counts > 0]
+    lon0 = np.zeros(counts.size, dtype=np.float64)
+    lon0[counts > 0] = lon[starts]
+
+    finite = np.isfinite(lat)
+    lat_sum = np.bincount(line_id[finite], lat[finite], minlength=counts.size)
+    lat_count = np.bincount(line_id[finite], minlength=counts.size)
+    lat_ref = lat_sum / np.maximum(lat_count, 1)
+    return (lon - lon0[line_id]) * np.cos(np.radians(lat_ref))[line_id]
+
+
+def _douglas_peucker_keep(
+    counts: np.ndarray, x: np.ndarray, y: np.ndarray, *, tolerance: float
+) -> np.ndarray:
+    """Douglas–Peucker over every line at once; returns the kept-point mask.
+
+    Each pass measures all interior points of all open spans against their
+    span's chord in one vectorized step, then splits every span whose farthest
+    point exceeds `tolerance`. The number of passes follows the recursion
+    depth, not the number of lines.
+    """
+    ends = np.cumsum(counts)
+    starts = ends - counts
+    keep = np.zeros(x.size, dtype=bool)
+    present = counts > 0
+    keep[starts[present]] = True
+    keep[ends[present] - 1] = True
+
+    tolerance_sq = float(tolerance) ** 2
+    span_start = starts[counts > 2]
+    span_end = ends[counts > 2] - 1
+    while span_start.size:
+        interior = span_end - span_start - 1
+        offsets = np.cumsum(interior) - interior
+        span_id = np.repeat(np.arange(span_start.size), interior)
+        index = np.repeat(span_start + 1 - offsets, interior) + np.arange(
+            int(interior.sum())
+        )
+
+        ax = x[span_start][span_id]
+        ay = y[span_start][span_id]
+        dx = x[span_end][span_id] - ax
+        dy = y[span_end][span_id] - ay
+        px = x[index] - ax
+        py = y[index] - ay
+        # Distance to the chord segment (not the infinite line), so spans that
+        # loop back onto their start are still split.
+        length_sq = dx * dx + dy * dy
+        with np.errstate(invalid="ignore", divide="ignore"):
+            t = np.where(length_sq > 0.0, (px * dx + py * dy) / length_sq, 0.0)
+        t = np.clip(t, 0.0, 1.0)
+        dist_sq = (px - t * dx) ** 2 + (py - t * dy) ** 2
+        # A non-finite point is always kept rather than compared away.
+        dist_sq = np.where(np.isnan(dist_sq), np.inf, dist_sq)
+
+        span_max = np.maximum.reduceat(dist_sq, offsets)
+        candidates = np.flatnonzero(dist_sq == span_max[span_id])
+        _ids, first = np.unique(span_id[candidates], return_index=True)
+        farthest = index[candidates[first]]
+
+        split = span_max > tolerance_sq
+        pivot = farthest[split]
+        keep[pivot] = True
+        next_start = np.concatenate((span_start[split], pivot))
+        next_end = np.concatenate((pivot, span_end[split]))
+        open_spans = next_end - next_start > 1
+        span_start = next_start[open_spans]
+        span_end = next_end[open_spans]
+    return keep
+
+
+def simplify_streamlines(
+    lines: Sequence[Polyline], *, zoom: int
+) -> list[tuple[list[float], list[float]]]:
+    """Simplify and quantize (lat, lon) polylines for display at `zoom`.
+
+    Points are dropped with Douglas–Peucker at `SIMPLIFY_TOLERANCE_PX` and
+    the survivors rounded to `coordinate_decimals(zoom)`; consecutive points
+    that round onto each other collapse into one. Distances use a local
+    equirectangular projection per line (lon offsets scaled by the cosine of
+    the line's mean latitude), so the tolerance holds in ground terms away
+    from the equator too.
+    """
+    if not lines:
+        return []
+    if any(len(lat) != len(lon) for lat, lon in lines):
+        raise ValueError("each streamline needs as many lat as lon values")
+
+    counts, lat, lon = _flatten(lines)
+    keep = _douglas_peucker_keep(
+        counts, _local_x(counts, lat, lon), lat, tolerance=simplify_tolerance_deg(zoom)
+    )
+
+    decimals = coordinate_decimals(zoom)
+    lat_q = np.round(lat, decimals)
+    lon_q = np.round(lon, decimals)
+    line_id = np.repeat(np.arange(counts.size), counts)
+    repeated = np.zeros(lat.size, dtype=bool)
+    if lat.size > 1:
+        # Compare each kept point with the previous kept point of its line.
+        kept = np.flatnonzero(keep)
+        same = (
+            (lat_q[kept[1:]] == lat_q[kept[:-1]])
+            & (lon_q[kept[1:]] == lon_q[kept[:-1]])
+            & (line_id[kept[1:]] == line_id[kept[:-1]])
+        )
+        repeated[kept[1:][same]] = True
+    keep &= ~repeated
+
+    kept_counts = np.bincount(line_id[keep], minlength=counts.size)
+    return _split(kept_counts, lat_q[keep], lon_q[keep])
@@ -0,0 +1,149 @@
+from __future__ import annotations
+
+import logging
+import re
+import threading
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Callable, Final, Optional
+
+from tiling.availability import AVAILABILITY_FILENAME, TileAvailability
+
+logger = logging.getLogger("api.error")
+
+TILE_AVAILABILITY_TTL_SECONDS: Final[float] = 60.0
+TILE_AVAILABILITY_MAX_ENTRIES: Final[int] = 1024
+NEGATIVE_TILE_CACHE_TTL_SECONDS: Final[float] = 30.0
+NEGATIVE_TILE_CACHE_MAX_ENTRIES: Final[int] = 16384
+
+_TILE_KEY_TAIL_RE: Final[re.Pattern[str]] = re.compile(
+    r"^(?P<prefix>.+)/(?P<z>\d+)/(?P<x>\d+)/(?P<y>\d+)\.[A-Za-z0-9.]+$"
+)
+
+
+def split_tile_key(key: str) -> Optional[tuple[str, int, int, int]]:
+    """Split `<prefix>/<z>/<x>/<y>.<ext>` into its prefix and tile address."""
+    match = _TILE_KEY_TAIL_RE.match(key)
+    if match is None:
+        return None
+    return (
+        match.group("prefix"),
+        int(match.group("z")),
+        int(match.group("x")),
+        int(match.group("y")),
+    )
+
+
+def availability_key(prefix: str) -> str:
+    return f"{prefix}/{AVAILABILITY_FILENAME}"
+
+
+class _TTLCache:
+    def __init__(self, *, ttl_seconds: float, max_entries: int) -> None:
+        self._ttl_seconds = float(ttl_seconds)
+        self._max_entries = max(1, int(max_entries))
+        self._entries: OrderedDict[tuple[str, str], tuple[float, object]] = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
+
+    def lookup(self, key: tuple[str, str]) -> tuple[bool, object]:
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return False, None
+            expires_at, value = entry
+            if expires_at <= now:
+                del self._entries[key]
+                return False, None
+            return True, value
+
+    def store(self, key: tuple[str, str], value: object) -> None:
+        expires_at = time.monotonic() + self._ttl_seconds
+        with self._lock:
+            self._entries[key] = (expires_at, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+class TileAvailabilityCache:
+    """Short-lived per-prefix cache of decoded availability bitmaps.
+
+    `source` identifies the tile store (local directory or bucket) so bitmaps
+    from different stores never mix. A missing or unreadable bitmap is cached
+    as "unknown" for the same TTL, so layers without one cost a single lookup
+    per TTL.
+    """
+
+    def __init__(
+        self,
+        *,
+        ttl_seconds: float = TILE_AVAILABILITY_TTL_SECONDS,
+        max_entries: int = TILE_AVAILABILITY_MAX_ENTRIES,
+    ) -> None:
+        self._cache = _TTLCache(ttl_seconds=ttl_seconds, max_entries=max_entries)
+
+    def get(
+        self,
+        source: str,
+        prefix: str,
+        load: Callable[[], Optional[bytes]],
+    ) -> Optional[TileAvailability]:
+        found, value = self._cache.lookup((source, prefix))
+        if found:
+            return value  # type: ignore[return-value]
+
+        availability: Optional[TileAvailability] = None
+        try:
+            payload = load()
+            if payload is not None:
+                availability = TileAvailability.from_payload(payload)
+        except Exception as exc:  # noqa: BLE001
+            logger.warning(
+                "tile_availability_unavailable",
+                extra={"prefix": prefix, "error": str(exc)},
+            )
+        self._cache.store((source, prefix), availability)
+        return availability
+
+    def clear(self) -> None:
+        self._cache.clear()
+
+
+class NegativeTileCache:
+    """Remembers recent tile misses so repeated 404s skip storage entirely."""
+
+    def __init__(
+        self,
+        *,
+        ttl_seconds: float = NEGATIVE_TILE_CACHE_TTL_SECONDS,
+        max_entries: int = NEGATIVE_TILE_CACHE_MAX_ENTRIES,
+    ) -> None:
+        self._cache = _TTLCache(ttl_seconds=ttl_seconds, max_entries=max_entries)
+
+    def contains(self, source: str, key: str) -> bool:
+        found, _value = self._cache.lookup((source, key))
+        return found
+
+    def add(self, source: str, key: str) -> None:
+        self._cache.store((source, key), None)
+
+    def clear(self) -> None:
+        self._cache.clear()
+
+
+@lru_cache(maxsize=1)
+def get_tile_availability_cache() -> TileAvailabilityCache:
+    return TileAvailabilityCache()
+
+
+@lru_cache(maxsize=1)
+def get_negative_tile_cache() -> NegativeTileCache:
+    return NegativeTileCache()
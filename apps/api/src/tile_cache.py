@@ -0,0 +1,38 @@
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import Callable, Final
+
+from byte_lru import ByteBoundedLRU, ByteLRUStats, configured_max_bytes
+
+TILE_CACHE_MAX_BYTES_ENV: Final[str] = "DIGITAL_EARTH_TILE_CACHE_MAX_BYTES"
+DEFAULT_TILE_CACHE_MAX_BYTES: Final[int] = 64 * 1024 * 1024
+
+TileCacheStats = ByteLRUStats
+
+
+class RenderedTileCache(ByteBoundedLRU[str, bytes]):
+    """Thread-safe LRU of encoded tile bodies bounded by total bytes.
+
+    Keys are expected to identify the rendered output completely (source file
+    identity plus tile address), so entries never need invalidation and only
+    leave the cache through eviction. Concurrent renders of the same key are
+    collapsed into one.
+    """
+
+    def __init__(self, *, max_bytes: int) -> None:
+        super().__init__(max_bytes=max_bytes, sizeof=len)
+
+    def get_or_render(self, key: str, render: Callable[[], bytes]) -> bytes:
+        return self.get_or_load(key, render)
+
+
+@lru_cache(maxsize=1)
+def get_cldas_tile_cache() -> RenderedTileCache:
+    return RenderedTileCache(
+        max_bytes=configured_max_bytes(
+            TILE_CACHE_MAX_BYTES_ENV,
+            DEFAULT_TILE_CACHE_MAX_BYTES,
+            event="tile_cache_invalid_max_bytes",
+        )
+    )
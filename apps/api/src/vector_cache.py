@@ -0,0 +1,371 @@
+from __future__ import annotations
+
+import logging
+import os
+import shutil
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import Callable, Final, Literal
+
+logger = logging.getLogger("api.error")
+
+VECTOR_CACHE_DIR_ENV: Final[str] = "DIGITAL_EARTH_VECTOR_CACHE_DIR"
+VECTOR_CACHE_MAX_BYTES_ENV: Final[str] = "DIGITAL_EARTH_VECTOR_CACHE_MAX_BYTES"
+VECTOR_CACHE_MEMORY_BYTES_ENV: Final[str] = "DIGITAL_EARTH_VECTOR_CACHE_MEMORY_BYTES"
+VECTOR_CACHE_MAX_RUNS_ENV: Final[str] = "DIGITAL_EARTH_VECTOR_CACHE_MAX_RUNS"
+
+DEFAULT_VECTOR_CACHE_MAX_BYTES: Final[int] = 512 * 1024 * 1024
+DEFAULT_VECTOR_CACHE_MEMORY_BYTES: Final[int] = 32 * 1024 * 1024
+DEFAULT_VECTOR_CACHE_MAX_RUNS: Final[int] = 4
+
+_ENTRY_SUFFIX: Final[str] = ".bin"
+# Files from the previous `.fresh`/`.stale` layout and interrupted writes.
+_LEGACY_SUFFIXES: Final[tuple[str, ...]] = (".fresh", ".stale", ".tmp")
+
+VectorCacheStatus = Literal["fresh", "computed", "stale"]
+_EntryKey = tuple[str, str, str]
+
+
+@dataclass(frozen=True)
+class VectorCacheStats:
+    memory_hits: int
+    disk_hits: int
+    misses: int
+    stale_served: int
+    evictions: int
+    entries: int
+    current_bytes: int
+    max_bytes: int
+    memory_entries: int
+    memory_bytes: int
+
+
+@dataclass(frozen=True)
+class _DiskEntry:
+    size: int
+    written_at: float
+
+
+class VectorFileCache:
+    """Byte-bounded LRU disk cache of response bodies with a memory hot tier.
+
+    Bodies are stored once per key at `<root>/<namespace>/<run>/<digest>.bin`
+    and age from their write time: younger than `fresh_ttl_seconds` they are
+    served as-is, younger than `stale_ttl_seconds` they are only served when
+    recomputing fails. Disk usage is kept under `max_bytes` by evicting the
+    least recently used entries, and each namespace keeps at most `max_runs`
+    runs: the oldest run is purged only when a strictly newer one is written,
+    and runs older than the retained window are computed but not cached.
+    Recently used bodies are also held in memory (bounded by `memory_bytes`) so
+    hot keys are served without touching the filesystem.
+
+    The index and the `max_bytes` budget are per process. Directory contents
+    are adopted once on first use; workers sharing one directory each enforce
+    their own budget and do not see each other's writes until they restart.
+    """
+
+    def __init__(
+        self,
+        root: str | Path,
+        *,
+        max_bytes: int,
+        memory_bytes: int = DEFAULT_VECTOR_CACHE_MEMORY_BYTES,
+        max_runs: int = DEFAULT_VECTOR_CACHE_MAX_RUNS,
+    ) -> None:
+        self._root = Path(root)
+        self._max_bytes = max(0, int(max_bytes))
+        self._memory_max_bytes = max(0, int(memory_bytes))
+        self._max_runs = max(1, int(max_runs))
+
+        self._entries: OrderedDict[_EntryKey, _DiskEntry] = OrderedDict()
+        self._current_bytes = 0
+        self._memory: OrderedDict[_EntryKey, tuple[bytes, float]] = OrderedDict()
+        self._memory_bytes = 0
+        self._runs: dict[str, set[str]] = {}
+        self._indexed = False
+
+        self._memory_hits = 0
+        self._disk_hits = 0
+        self._misses = 0
+        self._stale_served = 0
+        self._evictions = 0
+        self._lock = threading.Lock()
+
+    @property
+    def root(self) -> Path:
+        return self._root
+
+    @property
+    def max_bytes(self) -> int:
+        return self._max_bytes
+
+    def _path(self, key: _EntryKey) -> Path:
+        namespace, run, digest = key
+        return self._root / namespace / run / f"{digest}{_ENTRY_SUFFIX}"
+
+    def _ensure_index_locked(self) -> None:
+        """Adopt entries left on disk by a previous process (oldest first)."""
+        if self._indexed:
+            return
+        self._indexed = True
+
+        found: list[tuple[float, _EntryKey, int]] = []
+        for path in self._root.glob("*/*/*"):
+            try:
+                if path.name.endswith(_LEGACY_SUFFIXES):
+                    path.unlink(missing_ok=True)
+                    continue
+                if path.suffix != _ENTRY_SUFFIX or not path.is_file():
+                    continue
+                stat = path.stat()
+            except OSError:
+                continue
+            key = (path.parent.parent.name, path.parent.name, path.stem)
+            found.append((float(stat.st_mtime), key, int(stat.st_size)))
+
+        for written_at, key, size in sorted(found):
+            self._entries[key] = _DiskEntry(size=size, written_at=written_at)
+            self._current_bytes += size
+            self._runs.setdefault(key[0], set()).add(key[1])
+
+    def _drop_locked(self, key: _EntryKey) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._current_bytes -= entry.size
+        cached = self._memory.pop(key, None)
+        if cached is not None:
+            self._memory_bytes -= len(cached[0])
+
+    def _remember_locked(self, key: _EntryKey, body: bytes, written_at: float) -> None:
+        previous = self._memory.pop(key, None)
+        if previous is not None:
+            self._memory_bytes -= len(previous[0])
+        if len(body) > self._memory_max_bytes:
+            return
+        self._memory[key] = (body, written_at)
+        self._memory_bytes += len(body)
+        while self._memory_bytes > self._memory_max_bytes and self._memory:
+            _key, (evicted, _written_at) = self._memory.popitem(last=False)
+            self._memory_bytes -= len(evicted)
+
+    def _evict_locked(self) -> list[Path]:
+        victims: list[Path] = []
+        while self._current_bytes > self._max_bytes and self._entries:
+            key, entry = self._entries.popitem(last=False)
+            self._current_bytes -= entry.size
+            cached = self._memory.pop(key, None)
+            if cached is not None:
+                self._memory_bytes -= len(cached[0])
+            self._evictions += 1
+            victims.append(self._path(key))
+        return victims
+
+    def _purge_locked(self, namespace: str, run: str) -> None:
+        for key in [key for key in self._entries if key[:2] == (namespace, run)]:
+            self._drop_locked(key)
+        for key in [key for key in self._memory if key[:2] == (namespace, run)]:
+            self._drop_locked(key)
+        runs = self._runs.get(namespace)
+        if runs is not None:
+            runs.discard(run)
+
+    def _admit_run_locked(self, namespace: str, run: str) -> list[str] | None:
+        """Retain `run`, returning the runs it ages out (None when too old)."""
+        runs = self._runs.setdefault(namespace, set())
+        if run in runs:
+            return []
+        # Run keys are YYYYMMDDTHHMMSSZ, so lexical order is chronological.
+        newest = sorted(runs)[-self._max_runs :]
+        if len(newest) >= self._max_runs and run < newest[0]:
+            return None
+        runs.add(run)
+        aged_out = sorted(runs)[: max(0, len(runs) - self._max_runs)]
+        for old_run in aged_out:
+            self._purge_locked(namespace, old_run)
+        return aged_out
+
+    def purge_run(self, namespace: str, run: str) -> None:
+        """Drop every entry cached for `run` in `namespace`."""
+        with self._lock:
+            self._ensure_index_locked()
+            self._purge_locked(namespace, run)
+        shutil.rmtree(self._root / namespace / run, ignore_errors=True)
+
+    def _lookup(
+        self, key: _EntryKey, *, max_age: float, now: float
+    ) -> tuple[bytes, bool] | None:
+        """Return (body, from_memory) when an entry younger than `max_age` exists."""
+        with self._lock:
+            self._ensure_index_locked()
+            cached = self._memory.get(key)
+            if cached is not None and now - cached[1] <= max_age:
+                self._memory.move_to_end(key)
+                if key in self._entries:
+                    self._entries.move_to_end(key)
+                return cached[0], True
+            entry = self._entries.get(key)
+            if entry is None or now - entry.written_at > max_age:
+                return None
+
+        try:
+            body = self._path(key).read_bytes()
+        except OSError:
+            with self._lock:
+                if self._entries.get(key) is entry:
+                    self._drop_locked(key)
+            return None
+
+        with self._lock:
+            if self._entries.get(key) is entry:
+                self._entries.move_to_end(key)
+                self._remember_locked(key, body, entry.written_at)
+        return body, False
+
+    def _store(self, key: _EntryKey, body: bytes, *, now: float) -> None:
+        path = self._path(key)
+        with self._lock:
+            self._ensure_index_locked()
+            aged_out = self._admit_run_locked(key[0], key[1])
+        if aged_out is None:
+            return
+        for old_run in aged_out:
+            shutil.rmtree(self._root / key[0] / old_run, ignore_errors=True)
+
+        if len(body) <= self._max_bytes:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_name(
+                f".{path.name}.{os.getpid()}-{threading.get_ident()}.tmp"
+            )
+            try:
+                tmp.write_bytes(body)
+                os.replace(tmp, path)
+            except OSError:
+                tmp.unlink(missing_ok=True)
+                raise
+
+        with self._lock:
+            self._drop_locked(key)
+            if len(body) <= self._max_bytes:
+                self._entries[key] = _DiskEntry(size=len(body), written_at=now)
+                self._current_bytes += len(body)
+            self._remember_locked(key, body, now)
+            victims = self._evict_locked()
+        for victim in victims:
+            victim.unlink(missing_ok=True)
+
+    def get_or_compute(
+        self,
+        namespace: str,
+        run: str,
+        digest: str,
+        *,
+        fresh_ttl_seconds: int,
+        stale_ttl_seconds: int,
+        compute: Callable[[], bytes],
+        now: float | None = None,
+    ) -> tuple[bytes, VectorCacheStatus]:
+        key: _EntryKey = (namespace, run, digest)
+        timestamp = float(now if now is not None else time.time())
+
+        if fresh_ttl_seconds > 0:
+            hit = self._lookup(key, max_age=float(fresh_ttl_seconds), now=timestamp)
+            if hit is not None:
+                body, from_memory = hit
+                with self._lock:
+                    if from_memory:
+                        self._memory_hits += 1
+                    else:
+                        self._disk_hits += 1
+                return body, "fresh"
+
+        with self._lock:
+            self._misses += 1
+        stale = (
+            self._lookup(key, max_age=float(stale_ttl_seconds), now=timestamp)
+            if stale_ttl_seconds > 0
+            else None
+        )
+        try:
+            computed = compute()
+        except Exception as exc:  # noqa: BLE001
+            if stale is not None:
+                logger.warning(
+                    "vector_file_cache_compute_failed_serving_stale",
+                    extra={"error": str(exc)},
+                )
+                with self._lock:
+                    self._stale_served += 1
+                return stale[0], "stale"
+            raise
+
+        try:
+            self._store(key, computed, now=timestamp)
+        except OSError as exc:
+            logger.warning("vector_file_cache_write_failed", extra={"error": str(exc)})
+        return computed, "computed"
+
+    def stats(self) -> VectorCacheStats:
+        with self._lock:
+            return VectorCacheStats(
+                memory_hits=self._memory_hits,
+                disk_hits=self._disk_hits,
+                misses=self._misses,
+                stale_served=self._stale_served,
+                evictions=self._evictions,
+                entries=len(self._entries),
+                current_bytes=self._current_bytes,
+                max_bytes=self._max_bytes,
+                memory_entries=len(self._memory),
+                memory_bytes=self._memory_bytes,
+            )
+
+
+def _configured_int(env: str, default: int, *, minimum: int = 0) -> int:
+    raw = os.environ.get(env, "").strip()
+    if raw == "":
+        return default
+    try:
+        return max(minimum, int(raw))
+    except ValueError:
+        logger.warning("vector_cache_invalid_setting", extra={"env": env, "value": raw})
+        return default
+
+
+def _configured_root() -> Path:
+    override = os.environ.get(VECTOR_CACHE_DIR_ENV, "").strip()
+    if override != "":
+        return Path(override)
+    return Path(tempfile.gettempdir()) / "digital-earth" / "vector-cache"
+
+
+@lru_cache(maxsize=8)
+def _vector_file_cache(
+    root: str, max_bytes: int, memory_bytes: int, max_runs: int
+) -> VectorFileCache:
+    return VectorFileCache(
+        root, max_bytes=max_bytes, memory_bytes=memory_bytes, max_runs=max_runs
+    )
+
+
+def get_vector_file_cache() -> VectorFileCache:
+    """Process-wide cache for the configured directory and limits."""
+    return _vector_file_cache(
+        str(_configured_root()),
+        _configured_int(VECTOR_CACHE_MAX_BYTES_ENV, DEFAULT_VECTOR_CACHE_MAX_BYTES),
+        _configured_int(
+            VECTOR_CACHE_MEMORY_BYTES_ENV, DEFAULT_VECTOR_CACHE_MEMORY_BYTES
+        ),
+        _configured_int(
+            VECTOR_CACHE_MAX_RUNS_ENV, DEFAULT_VECTOR_CACHE_MAX_RUNS, minimum=1
+        ),
+    )
+
+
+def reset_vector_file_cache() -> None:
+    """Forget the process-wide caches so the next call re-reads the environment."""
+    _vector_file_cache.cache_clear()
@@ -0,0 +1,263 @@
+from __future__ import annotations
+
+import json
+import struct
+from typing import Any, Final, Mapping, Sequence
+
+import numpy as np
+import zstandard as zstd
+
+WIND_PACK_MEDIA_TYPE: Final[str] = "application/vnd.digital-earth.wind-pack"
+
+VECTOR_MAGIC: Final[bytes] = b"WNDV"
+STREAMLINE_MAGIC: Final[bytes] = b"WNDS"
+_HEADER_LEN: Final[struct.Struct] = struct.Struct("<I")
+
+MAX_HEADER_BYTES: Final[int] = 1024 * 1024  # 1 MiB
+MAX_BODY_BYTES: Final[int] = 64 * 1024 * 1024  # 64 MiB
+
+# u/v are stored as int16 multiples of `scale` (0.01 m/s covers +-327 m/s);
+# polyline coordinates as int32 multiples of `scale` degrees (1e-5 deg ~ 1 m).
+DEFAULT_VECTOR_SCALE: Final[float] = 0.01
+DEFAULT_STREAMLINE_SCALE: Final[float] = 1e-5
+
+_INT16 = np.iinfo(np.int16)
+_INT32 = np.iinfo(np.int32)
+
+
+def _json_dumps(payload: Mapping[str, Any]) -> bytes:
+    return json.dumps(
+        payload,
+        ensure_ascii=True,
+        separators=(",", ":"),
+        sort_keys=True,
+    ).encode("utf-8")
+
+
+def _pack(
+    magic: bytes, header: Mapping[str, Any], body: bytes, compression_level: int
+) -> bytes:
+    header_bytes = _json_dumps({**header, "compression": "zstd"})
+    if len(header_bytes) > MAX_HEADER_BYTES:
+        raise ValueError("header JSON is too large")
+    compressed = zstd.ZstdCompressor(level=int(compression_level)).compress(body)
+    return magic + _HEADER_LEN.pack(len(header_bytes)) + header_bytes + compressed
+
+
+def _unpack(
+    payload: bytes | bytearray | memoryview, *, magic: bytes
+) -> tuple[dict[str, Any], bytes]:
+    view = memoryview(payload)
+    if view.nbytes < 8:
+        raise ValueError("payload is too small to be a wind pack")
+    if view[:4].tobytes() != magic:
+        raise ValueError("invalid magic; not a wind pack")
+
+    (header_len,) = _HEADER_LEN.unpack(view[4:8])
+    if header_len <= 0 or header_len > MAX_HEADER_BYTES:
+        raise ValueError("invalid header length")
+    header_end = 8 + int(header_len)
+    if header_end > view.nbytes:
+        raise ValueError("payload truncated while reading header")
+
+    try:
+        header = json.loads(view[8:header_end].tobytes().decode("utf-8"))
+    except (UnicodeDecodeError, json.JSONDecodeError) as exc:
+        raise ValueError("invalid header JSON") from exc
+    if not isinstance(header, dict):
+        raise ValueError("header JSON must be an object")
+    if str(header.get("compression", "")).lower() != "zstd":
+        raise ValueError(f"unsupported compression {header.get('compression')!r}")
+
+    try:
+        body = zstd.ZstdDecompressor().decompress(
+            view[header_end:].tobytes(), max_output_size=MAX_BODY_BYTES
+        )
+    except zstd.ZstdError as exc:
+        raise ValueError("zstd decompression failed") from exc
+    return header, body
+
+
+def _axis_header(values: np.ndarray) -> dict[str, Any]:
+    """Describe a 1D axis as start/step when regular, else list its values."""
+    axis = np.asarray(values, dtype=np.float64).ravel()
+    if axis.size >= 2:
+        steps = np.diff(axis)
+        step = float(steps.mean())
+        if step != 0.0 and np.allclose(steps, step, rtol=1e-6, atol=1e-9):
+            return {"start": float(axis[0]), "step": step, "count": int(axis.size)}
+    return {"values": [float(value) for value in axis]}
+
+
+def _axis_values(entry: Mapping[str, Any]) -> np.ndarray:
+    if "values" in entry:
+        return np.asarray(entry["values"], dtype=np.float64)
+    start = float(entry["start"])
+    step = float(entry["step"])
+    return start + step * np.arange(int(entry["count"]), dtype=np.float64)
+
+
+def _quantize(values: np.ndarray, *, scale: float, info: np.iinfo) -> np.ndarray:
+    scaled = np.rint(np.asarray(values, dtype=np.float64) / float(scale))
+    return np.clip(scaled, info.min, info.max)
+
+
+def encode_wind_vector_pack(
+    *,
+    lat: np.ndarray,
+    lon: np.ndarray,
+    u: np.ndarray,
+    v: np.ndarray,
+    scale: float = DEFAULT_VECTOR_SCALE,
+    compression_level: int = 3,
+) -> bytes:
+    """Encode a lat x lon u/v grid as a `WNDV` wind pack.
+
+    Body (zstd): u int16[rows*cols], v int16[rows*cols], then a row-major
+    validity bitmask (packed MSB first). Cells where u or v is not finite are
+    stored as 0 and flagged invalid.
+    """
+    u_arr = np.asarray(u, dtype=np.float64)
+    v_arr = np.asarray(v, dtype=np.float64)
+    shape = (int(np.asarray(lat).size), int(np.asarray(lon).size))
+    if u_arr.shape != shape or v_arr.shape != shape:
+        raise ValueError("u/v must have shape [lat, lon]")
+
+    valid = np.isfinite(u_arr) & np.isfinite(v_arr)
+    u_q = np.where(valid, _quantize(u_arr, scale=scale, info=_INT16), 0)
+    v_q = np.where(valid, _quantize(v_arr, scale=scale, info=_INT16), 0)
+    body = b"".join(
+        (
+            u_q.astype("<i2").tobytes(),
+            v_q.astype("<i2").tobytes(),
+            np.packbits(valid, axis=None).tobytes(),
+        )
+    )
+    header = {
+        "version": 1,
+        "shape": list(shape),
+        "dtype": "int16",
+        "scale": float(scale),
+        "lat": _axis_header(lat),
+        "lon": _axis_header(lon),
+    }
+    return _pack(VECTOR_MAGIC, header, body, compression_level)
+
+
+def decode_wind_vector_pack(
+    payload: bytes | bytearray | memoryview,
+) -> tuple[dict[str, Any], dict[str, np.ndarray]]:
+    """Decode a `WNDV` pack into (header, {lat, lon, u, v, valid}).
+
+    Invalid cells decode as NaN in u/v.
+    """
+    header, body = _unpack(payload, magic=VECTOR_MAGIC)
+    try:
+        rows, cols = (int(value) for value in header["shape"])
+        scale = float(header["scale"])
+        lat = _axis_values(header["lat"])
+        lon = _axis_values(header["lon"])
+    except (KeyError, TypeError, ValueError) as exc:
+        raise ValueError(f"invalid wind pack header: {exc}") from exc
+    if rows < 0 or cols < 0 or lat.size != rows or lon.size != cols:
+        raise ValueError("wind pack axes do not match shape")
+
+    cells = rows * cols
+    mask_bytes = (cells + 7) // 8
+    if len(body) != 4 * cells + mask_bytes:
+        raise ValueError("wind pack body size mismatch")
+
+    u_q = np.frombuffer(body, dtype="<i2", count=cells)
+    v_q = np.frombuffer(body, dtype="<i2", count=cells, offset=2 * cells)
+    valid = np.unpackbits(
+        np.frombuffer(body, dtype=np.uint8, offset=4 * cells), count=cells
+    ).astype(bool)
+
+    u = np.where(valid, u_q * scale, np.nan).reshape(rows, cols)
+    v = np.where(valid, v_q * scale, np.nan).reshape(rows, cols)
+    return header, {
+        "lat": lat,
+        "lon": lon,
+        "u": u,
+        "v": v,
+        "valid": valid.reshape(rows, cols),
+    }
+
+
+def encode_streamline_pack(
+    lines: Sequence[tuple[Sequence[float], Sequence[float]]],
+    *,
+    scale: float = DEFAULT_STREAMLINE_SCALE,
+    compression_level: int = 3,
+) -> bytes:
+    """Encode (lat, lon) polylines as a `WNDS` wind pack.
+
+    Body (zstd): uint32 point counts per line, then lat and lon as int32
+    multiples of `scale` degrees. Within each line the first point is absolute
+    and every following point is a delta from its predecessor.
+    """
+    lat_parts = [
+        np.asarray(line_lat, dtype=np.float64).ravel() for line_lat, _ in lines
+    ]
+    lon_parts = [
+        np.asarray(line_lon, dtype=np.float64).ravel() for _, line_lon in lines
+    ]
+    if any(
+        lat_part.size != lon_part.size
+        for lat_part, lon_part in zip(lat_parts, lon_parts, strict=True)
+    ):
+        raise ValueError("each streamline needs as many lat as lon values")
+    counts = np.array([part.size for part in lat_parts], dtype=np.int64)
+
+    total = int(counts.sum())
+    lat = np.concatenate(lat_parts) if lat_parts else np.empty(0, dtype=np.float64)
+    lon = np.concatenate(lon_parts) if lon_parts else np.empty(0, dtype=np.float64)
+
+    starts = np.cumsum(counts) - counts
+    starts = starts[counts > 0]
+    body_parts = [counts.astype("<u4").tobytes()]
+    for values in (lat, lon):
+        quantized = _quantize(values, scale=scale, info=_INT32).astype(np.int64)
+        deltas = np.diff(quantized, prepend=0)
+        deltas[starts] = quantized[starts]
+        body_parts.append(deltas.astype("<i4").tobytes())
+
+    header = {
+        "version": 1,
+        "count": int(counts.size),
+        "points": total,
+        "dtype": "int32",
+        "scale": float(scale),
+        "encoding": "delta",
+    }
+    return _pack(STREAMLINE_MAGIC, header, b"".join(body_parts), compression_level)
+
+
+def decode_streamline_pack(
+    payload: bytes | bytearray | memoryview,
+) -> tuple[dict[str, Any], list[tuple[np.ndarray, np.ndarray]]]:
+    """Decode a `WNDS` pack into (header, [(lat, lon), ...])."""
+    header, body = _unpack(payload, magic=STREAMLINE_MAGIC)
+    try:
+        count = int(header["count"])
+        total = int(header["points"])
+        scale = float(header["scale"])
+    except (KeyError, TypeError, ValueError) as exc:
+        raise ValueError(f"invalid wind pack header: {exc}") from exc
+    if count < 0 or total < 0 or len(body) != 4 * count + 8 * total:
+        raise ValueError("wind pack body size mismatch")
+
+    counts = np.frombuffer(body, dtype="<u4", count=count).astype(np.int64)
+    if int(counts.sum()) != total:
+        raise ValueError("wind pack point counts do not add up")
+    if count == 0:
+        return header, []
+    offsets = np.cumsum(counts)[:-1]
+
+    columns: list[list[np.ndarray]] = []
+    for index in range(2):
+        deltas = np.frombuffer(
+            body, dtype="<i4", count=total, offset=4 * count + 4 * total * index
+        ).astype(np.int64)
+        columns.append([np.cumsum(part) * scale for part in np.split(deltas, offsets)])
+    return header, list(zip(columns[0], columns[1], strict=True))
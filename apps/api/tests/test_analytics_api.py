@@ -216,3 +216,117 @@ def test_tiles_can_serve_from_local_filesystem(
         headers={"If-None-Match": etag, "Accept-Encoding": "gzip;q=0"},
     )
     assert cached.status_code == 304
+
+
+def test_tiles_local_filesystem_supports_range_requests(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    tiles_root = tmp_path / "Data" / "tiles"
+    target = tiles_root / "layer" / "0" / "0" / "0.pbf"
+    target.parent.mkdir(parents=True, exist_ok=True)
+    payload = bytes(range(256)) * 4
+    target.write_bytes(payload)
+
+    client, _redis = _make_client(
+        monkeypatch,
+        tmp_path,
+        db_url=f"sqlite+pysqlite:///{tmp_path / 'analytics.db'}",
+        tiles_dir=tiles_root,
+    )
+
+    identity = {"Accept-Encoding": "identity"}
+    full = client.get("/api/v1/tiles/layer/0/0/0.pbf", headers=identity)
+    assert full.status_code == 200
+    assert full.content == payload
+    assert full.headers["accept-ranges"] == "bytes"
+    assert full.headers["content-length"] == str(len(payload))
+    assert full.headers["content-type"] == "application/x-protobuf"
+    etag = full.headers["etag"]
+    assert etag.startswith('"sha256-')
+
+    partial = client.get(
+        "/api/v1/tiles/layer/0/0/0.pbf", headers={**identity, "Range": "bytes=10-19"}
+    )
+    assert partial.status_code == 206
+    assert partial.content == payload[10:20]
+    assert partial.headers["content-range"] == f"bytes 10-19/{len(payload)}"
+    assert partial.headers["etag"] == etag
+
+    suffix = client.get(
+        "/api/v1/tiles/layer/0/0/0.pbf",
+        headers={**identity, "Range": "bytes=-4", "If-Range": etag},
+    )
+    assert suffix.status_code == 206
+    assert suffix.content == payload[-4:]
+
+    stale = client.get(
+        "/api/v1/tiles/layer/0/0/0.pbf",
+        headers={**identity, "Range": "bytes=0-3", "If-Range": '"sha256-old"'},
+    )
+    assert stale.status_code == 200
+    assert stale.content == payload
+
+    unsatisfiable = client.get(
+        "/api/v1/tiles/layer/0/0/0.pbf", headers={**identity, "Range": "bytes=5000-"}
+    )
+    assert unsatisfiable.status_code == 416
+    assert unsatisfiable.headers["content-range"] == f"bytes */{len(payload)}"
+
+    traversal = client.get("/api/v1/tiles/layer/%2E%2E/%2E%2E/secret.pbf")
+    assert traversal.status_code in {400, 404}
+
+
+def test_tiles_local_filesystem_serves_precompressed_sidecars(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    import gzip
+    import os
+
+    tiles_root = tmp_path / "Data" / "tiles"
+    target = tiles_root / "layer" / "legend.json"
+    target.parent.mkdir(parents=True, exist_ok=True)
+    body = ("{" + '"k": 1,' * 400 + '"end": 0}').encode("utf-8")
+    target.write_bytes(body)
+    sidecar = target.with_name("legend.json.br")
+    sidecar.write_bytes(b"fake-brotli")
+    target.with_name("legend.json.gz").write_bytes(gzip.compress(body))
+
+    client, _redis = _make_client(
+        monkeypatch,
+        tmp_path,
+        db_url=f"sqlite+pysqlite:///{tmp_path / 'analytics.db'}",
+        tiles_dir=tiles_root,
+    )
+
+    br = client.get(
+        "/api/v1/tiles/layer/legend.json",
+        headers={"Accept-Encoding": "gzip;q=0.5, br"},
+    )
+    assert br.status_code == 200
+    assert br.headers["content-encoding"] == "br"
+    assert br.headers["content-type"].startswith("application/json")
+    assert br.headers["vary"] == "Accept-Encoding"
+    assert br.headers["content-length"] == str(len(b"fake-brotli"))
+
+    cached = client.get(
+        "/api/v1/tiles/layer/legend.json",
+        headers={"Accept-Encoding": "br", "If-None-Match": br.headers["etag"]},
+    )
+    assert cached.status_code == 304
+
+    gz = client.get(
+        "/api/v1/tiles/layer/legend.json", headers={"Accept-Encoding": "gzip"}
+    )
+    assert gz.status_code == 200
+    assert gz.headers["content-encoding"] == "gzip"
+    assert gz.headers["etag"] != br.headers["etag"]
+    assert gz.content == body
+
+    stat = target.stat()
+    os.utime(sidecar, ns=(stat.st_atime_ns, stat.st_mtime_ns - 10_000_000_000))
+    stale = client.get(
+        "/api/v1/tiles/layer/legend.json", headers={"Accept-Encoding": "br"}
+    )
+    assert stale.status_code == 200
+    assert "content-encoding" not in stale.headers
+    assert stale.content == body
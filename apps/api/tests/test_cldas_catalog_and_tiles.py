@@ -99,11 +99,15 @@ def _make_client(
     from config import get_settings
     from digital_earth_config.local_data import get_local_data_paths
     from local_data_service import get_data_source
+    from render_pool import get_render_executor
+    from tile_cache import get_cldas_tile_cache
     import main as main_module
 
     get_settings.cache_clear()
     get_data_source.cache_clear()
     get_local_data_paths.cache_clear()
+    get_cldas_tile_cache.cache_clear()
+    get_render_executor.cache_clear()
 
     redis = FakeRedis(use_real_time=False)
     monkeypatch.setattr(main_module, "create_redis_client", lambda _url: redis)
@@ -307,3 +311,185 @@ def test_tiles_cldas_missing_variable_in_dataset_returns_400(
     assert response.status_code == 400
     payload = response.json()
     assert payload["error_code"] == 40000
+
+
+def test_tiles_cldas_reuses_decoded_grid_across_tiles(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    _write_cldas_file(tmp_path, ts="2025010100")
+    client = _make_client(monkeypatch, tmp_path)
+
+    import routers.tiles as tiles_module
+    from grid_cache import get_cldas_grid_cache
+
+    get_cldas_grid_cache.cache_clear()
+    calls = {"count": 0}
+    original = tiles_module.load_cldas_dataset
+
+    def _counting_load(*args: object, **kwargs: object) -> xr.Dataset:
+        calls["count"] += 1
+        return original(*args, **kwargs)
+
+    monkeypatch.setattr(tiles_module, "load_cldas_dataset", _counting_load)
+
+    first = client.get("/api/v1/tiles/cldas/20250101T000000Z/TMP/0/0/0.png")
+    second = client.get("/api/v1/tiles/cldas/20250101T000000Z/TMP/0/1/0.png")
+    assert first.status_code == 200
+    assert second.status_code == 200
+    assert calls["count"] == 1
+
+    stats = get_cldas_grid_cache().stats()
+    assert stats.misses == 1
+    assert stats.hits == 1
+    assert stats.entries == 1
+
+
+def test_tiles_cldas_serves_rendered_bytes_from_memory_and_redis(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    _write_cldas_file(tmp_path, ts="2025010100")
+    client = _make_client(monkeypatch, tmp_path)
+
+    import routers.tiles as tiles_module
+    from tile_cache import get_cldas_tile_cache
+
+    calls = {"count": 0}
+    original = tiles_module.CLDASTileGenerator.render_metatile
+
+    def _counting_render(self, *args: object, **kwargs: object):  # type: ignore[no-untyped-def]
+        calls["count"] += 1
+        return original(self, *args, **kwargs)
+
+    monkeypatch.setattr(
+        tiles_module.CLDASTileGenerator, "render_metatile", _counting_render
+    )
+
+    url = "/api/v1/tiles/cldas/20250101T000000Z/TMP/0/0/0.png"
+    first = client.get(url)
+    second = client.get(url)
+    assert first.status_code == 200
+    assert second.status_code == 200
+    assert second.content == first.content
+    assert second.headers["etag"] == first.headers["etag"]
+    assert calls["count"] == 1
+    assert get_cldas_tile_cache().stats().hits == 1
+
+    get_cldas_tile_cache().clear()
+    from_redis = client.get(url)
+    assert from_redis.status_code == 200
+    assert from_redis.content == first.content
+    assert calls["count"] == 1
+
+
+def test_tiles_cldas_metatile_render_fills_sibling_tiles(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    _write_cldas_file(tmp_path, ts="2025010100")
+    client = _make_client(monkeypatch, tmp_path)
+
+    import routers.tiles as tiles_module
+    from tile_cache import get_cldas_tile_cache
+
+    calls = {"count": 0}
+    original = tiles_module.CLDASTileGenerator.render_metatile
+
+    def _counting_render(self, *args: object, **kwargs: object):  # type: ignore[no-untyped-def]
+        calls["count"] += 1
+        return original(self, *args, **kwargs)
+
+    monkeypatch.setattr(
+        tiles_module.CLDASTileGenerator, "render_metatile", _counting_render
+    )
+
+    first = client.get("/api/v1/tiles/cldas/20250101T000000Z/TMP/2/2/1.png")
+    assert first.status_code == 200
+    assert get_cldas_tile_cache().stats().entries == 16
+
+    sibling = client.get("/api/v1/tiles/cldas/20250101T000000Z/TMP/2/3/0.png")
+    assert sibling.status_code == 200
+    assert sibling.content.startswith(b"\x89PNG\r\n\x1a\n")
+    assert calls["count"] == 1
+
+    monkeypatch.setenv("DIGITAL_EARTH_CLDAS_METATILE_SIZE", "1")
+    get_cldas_tile_cache().clear()
+    single = client.get("/api/v1/tiles/cldas/20250101T000000Z/TMP/3/5/2.png")
+    assert single.status_code == 200
+    assert get_cldas_tile_cache().stats().entries == 1
+
+
+def test_tiles_cldas_returns_503_when_render_queue_is_full(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    _write_cldas_file(tmp_path, ts="2025010100")
+    monkeypatch.setenv("DIGITAL_EARTH_RENDER_MAX_PENDING", "1")
+    client = _make_client(monkeypatch, tmp_path)
+
+    from render_pool import get_render_executor
+
+    executor = get_render_executor()
+    executor._acquire()
+    try:
+        busy = client.get("/api/v1/tiles/cldas/20250101T000000Z/TMP/0/0/0.png")
+    finally:
+        executor._release()
+    assert busy.status_code == 503
+    assert executor.stats().rejected == 1
+
+    ok = client.get("/api/v1/tiles/cldas/20250101T000000Z/TMP/0/0/0.png")
+    assert ok.status_code == 200
+
+
+def test_tiles_cldas_counts_one_miss_per_rendered_tile(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    _write_cldas_file(tmp_path, ts="2025010100")
+    client = _make_client(monkeypatch, tmp_path)
+
+    from tile_cache import get_cldas_tile_cache
+
+    url = "/api/v1/tiles/cldas/20250101T000000Z/TMP/0/0/0.png"
+    assert client.get(url).status_code == 200
+    assert client.get(url).status_code == 200
+
+    stats = get_cldas_tile_cache().stats()
+    assert (stats.hits, stats.misses) == (1, 1)
+
+
+def test_tiles_cldas_concurrent_metatile_requests_share_one_render() -> None:
+    import threading
+
+    import routers.tiles as tiles_module
+
+    started = threading.Event()
+    release = threading.Event()
+    calls = {"count": 0}
+
+    def _slow_render() -> dict[tuple[int, int], bytes]:
+        calls["count"] += 1
+        started.set()
+        release.wait(timeout=5)
+        return {(2, 0): b"a", (3, 1): b"b"}
+
+    results: list[bytes] = []
+
+    def _worker(tile: tuple[int, int]) -> None:
+        rendered = tiles_module._render_metatile_once(
+            ("grid", 2, 2, 0, 4), _slow_render
+        )
+        results.append(rendered[tile])
+
+    threads = [
+        threading.Thread(target=_worker, args=(tile,))
+        for tile in [(2, 0), (3, 1), (3, 1)]
+    ]
+    threads[0].start()
+    assert started.wait(timeout=5)
+    for thread in threads[1:]:
+        thread.start()
+    release.set()
+    for thread in threads:
+        thread.join(timeout=5)
+
+    assert calls["count"] == 1
+    assert sorted(results) == [b"a", b"b", b"b"]
+    assert tiles_module._metatile_flights == {}
@@ -0,0 +1,141 @@
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import numpy as np
+import pytest
+import xarray as xr
+
+import datacube_pool
+from datacube_pool import DataCubeHandlePool, datacube_coords
+
+
+@pytest.fixture
+def fake_cubes(monkeypatch: pytest.MonkeyPatch) -> dict[str, list[str]]:
+    calls: dict[str, list[str]] = {"opened": [], "closed": []}
+
+    def _open(path: Path, **_kwargs) -> xr.Dataset:
+        name = Path(path).name
+        calls["opened"].append(name)
+        ds = xr.Dataset(
+            coords={
+                "time": np.array(
+                    ["2026-01-01T00:00:00", "2026-01-01T06:00:00"],
+                    dtype="datetime64[s]",
+                ),
+                "level": xr.DataArray(
+                    [850.0, 500.0], dims=["level"], attrs={"units": "hPa"}
+                ),
+            }
+        )
+        ds.set_close(lambda: calls["closed"].append(name))
+        return ds
+
+    monkeypatch.setattr(datacube_pool, "open_datacube", _open)
+    return calls
+
+
+def _touch(path: Path, *, mtime_ns: int = 1_000_000_000) -> Path:
+    path.write_bytes(b"cube")
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+    return path
+
+
+def test_pool_reuses_handles_and_caches_coords(
+    tmp_path: Path, fake_cubes: dict[str, list[str]]
+) -> None:
+    pool = DataCubeHandlePool(max_handles=4)
+    cube = _touch(tmp_path / "a.nc")
+
+    with pool.acquire(cube) as first:
+        coords = pool.coords_for(first)
+    with pool.acquire(cube) as second:
+        assert second is first
+        assert pool.coords_for(second) is coords
+
+    assert fake_cubes["opened"] == ["a.nc"]
+    assert fake_cubes["closed"] == []
+    assert coords is not None
+    assert coords.time_lookup[np.datetime64("2026-01-01T06:00:00")] == 1
+    assert coords.level_lookup[500.0] == 1
+    assert coords.level_attrs == {"units": "hPa"}
+    assert not coords.times.flags.writeable
+
+    stats = pool.stats()
+    assert (stats.hits, stats.misses, stats.open_handles) == (1, 1, 1)
+
+    pool.close()
+    assert fake_cubes["closed"] == ["a.nc"]
+    assert pool.stats().open_handles == 0
+
+
+def test_pool_reopens_rewritten_cube_and_retires_the_old_handle(
+    tmp_path: Path, fake_cubes: dict[str, list[str]]
+) -> None:
+    pool = DataCubeHandlePool(max_handles=4)
+    cube = _touch(tmp_path / "a.nc")
+
+    with pool.acquire(cube) as first:
+        pass
+    _touch(cube, mtime_ns=2_000_000_000)
+    with pool.acquire(cube) as second:
+        assert second is not first
+
+    assert fake_cubes["opened"] == ["a.nc", "a.nc"]
+    assert fake_cubes["closed"] == ["a.nc"]
+    assert pool.stats().open_handles == 1
+
+
+def test_pool_evicts_lru_and_defers_closing_handles_in_use(
+    tmp_path: Path, fake_cubes: dict[str, list[str]]
+) -> None:
+    pool = DataCubeHandlePool(max_handles=2)
+    a, b, c = (_touch(tmp_path / f"{name}.nc") for name in "abc")
+
+    with pool.acquire(a):
+        with pool.acquire(b):
+            pass
+        with pool.acquire(c):
+            # `a` is least recently used but still being read.
+            assert fake_cubes["closed"] == []
+        assert pool.stats().open_handles == 3
+    assert fake_cubes["closed"] == ["a.nc"]
+
+    with pool.acquire(b):
+        pass
+    stats = pool.stats()
+    assert stats.evictions == 1
+    assert stats.open_handles == 2
+    assert fake_cubes["opened"] == ["a.nc", "b.nc", "c.nc"]
+
+
+def test_pool_without_capacity_closes_after_each_use(
+    tmp_path: Path, fake_cubes: dict[str, list[str]]
+) -> None:
+    pool = DataCubeHandlePool(max_handles=0)
+    cube = _touch(tmp_path / "a.nc")
+
+    for _ in range(2):
+        with pool.acquire(cube):
+            pass
+
+    assert fake_cubes["opened"] == ["a.nc", "a.nc"]
+    assert fake_cubes["closed"] == ["a.nc", "a.nc"]
+
+
+def test_datacube_coords_decodes_unpooled_datasets() -> None:
+    coords = datacube_coords(xr.Dataset())
+    assert coords.times is None
+    assert coords.levels is None
+
+
+def test_pool_size_follows_environment(monkeypatch: pytest.MonkeyPatch) -> None:
+    datacube_pool.get_datacube_handle_pool.cache_clear()
+    monkeypatch.setenv(datacube_pool.DATACUBE_HANDLE_POOL_SIZE_ENV, "3")
+    assert datacube_pool.get_datacube_handle_pool().max_handles == 3
+
+    datacube_pool.get_datacube_handle_pool.cache_clear()
+    monkeypatch.setenv(datacube_pool.DATACUBE_HANDLE_POOL_SIZE_ENV, "many")
+    assert datacube_pool.get_datacube_handle_pool().max_handles == 32
+    datacube_pool.get_datacube_handle_pool.cache_clear()
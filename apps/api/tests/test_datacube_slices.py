@@ -0,0 +1,130 @@
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import numpy as np
+import pytest
+import xarray as xr
+
+
+def _write_cube(path: Path, *, offset: float = 0.0) -> None:
+    lat = np.array([2.0, 1.0, 0.0], dtype=np.float32)
+    lon = np.array([10.0, 11.0], dtype=np.float32)
+    values = np.arange(6, dtype=np.float64).reshape(1, 1, 3, 2) + offset
+    ds = xr.Dataset(
+        {"u": xr.DataArray(values, dims=["time", "level", "lat", "lon"])},
+        coords={
+            "time": np.array(["2026-01-01T00:00:00"], dtype="datetime64[s]"),
+            "level": np.array([850.0], dtype=np.float32),
+            "lat": lat,
+            "lon": lon,
+        },
+    )
+    path.parent.mkdir(parents=True, exist_ok=True)
+    ds.to_netcdf(path, engine="h5netcdf")
+
+
+@pytest.fixture(autouse=True)
+def _fresh_cache():
+    from grid_cache import get_datacube_grid_cache
+
+    get_datacube_grid_cache.cache_clear()
+    yield
+    get_datacube_grid_cache.cache_clear()
+
+
+def _load(path: Path):
+    from datacube.storage import open_datacube
+    from datacube_slices import load_datacube_slice
+
+    ds = open_datacube(path)
+    try:
+        return load_datacube_slice(ds, path, var="u", time_index=0, level_index=0)
+    finally:
+        ds.close()
+
+
+def test_slice_is_normalized_float32_and_decoded_once(tmp_path: Path) -> None:
+    from grid_cache import get_datacube_grid_cache
+
+    cube_path = tmp_path / "cube.nc"
+    _write_cube(cube_path)
+
+    first = _load(cube_path)
+    second = _load(cube_path)
+
+    assert first.values is second.values
+    assert first.values.dtype == np.float32
+    assert not first.values.flags.writeable
+    assert first.lat.tolist() == [0.0, 1.0, 2.0]
+    assert first.lon.tolist() == [10.0, 11.0]
+    assert (first.lat_flipped, first.lon_flipped) == (True, False)
+    assert first.values.tolist() == [[4.0, 5.0], [2.0, 3.0], [0.0, 1.0]]
+
+    raw = first.in_file_order()
+    assert raw.lat.tolist() == [2.0, 1.0, 0.0]
+    assert raw.values.tolist() == [[0.0, 1.0], [2.0, 3.0], [4.0, 5.0]]
+
+    stats = get_datacube_grid_cache().stats()
+    assert (stats.hits, stats.misses, stats.entries) == (1, 1, 1)
+
+
+def test_rewritten_cube_is_decoded_again(tmp_path: Path) -> None:
+    cube_path = tmp_path / "cube.nc"
+    _write_cube(cube_path)
+    assert _load(cube_path).values[0, 0] == pytest.approx(4.0)
+
+    _write_cube(cube_path, offset=100.0)
+    stat = cube_path.stat()
+    os.utime(cube_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    assert _load(cube_path).values[0, 0] == pytest.approx(104.0)
+
+
+def test_datacube_grid_cache_size_follows_environment(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    from grid_cache import get_datacube_grid_cache
+
+    monkeypatch.setenv("DIGITAL_EARTH_DATACUBE_GRID_CACHE_MAX_BYTES", "4096")
+    assert get_datacube_grid_cache().max_bytes == 4096
+
+    get_datacube_grid_cache.cache_clear()
+    monkeypatch.setenv("DIGITAL_EARTH_DATACUBE_GRID_CACHE_MAX_BYTES", "lots")
+    assert get_datacube_grid_cache().max_bytes == 256 * 1024 * 1024
+
+
+def test_mip_levels_area_average_and_share_the_native_decode(tmp_path: Path) -> None:
+    from datacube.storage import open_datacube
+    from datacube_slices import downsample_grid, load_datacube_slice
+    from grid_cache import get_datacube_grid_cache
+
+    grid = np.array([[1.0, 3.0, 5.0], [np.nan, 2.0, np.nan]])
+    assert downsample_grid(grid, 2).tolist() == [[2.0, 5.0]]
+    assert np.isnan(downsample_grid(np.full((2, 2), np.nan), 2)).all()
+
+    cube_path = tmp_path / "cube.nc"
+    _write_cube(cube_path)
+    ds = open_datacube(cube_path)
+    try:
+        mip = load_datacube_slice(
+            ds, cube_path, var="u", time_index=0, level_index=0, mip_level=1
+        )
+        again = load_datacube_slice(
+            ds, cube_path, var="u", time_index=0, level_index=0, mip_level=1
+        )
+        with pytest.raises(ValueError, match="mip_level"):
+            load_datacube_slice(
+                ds, cube_path, var="u", time_index=0, level_index=0, mip_level=-1
+            )
+    finally:
+        ds.close()
+
+    assert again.values is mip.values
+    assert mip.lat.tolist() == [0.5, 2.0]
+    assert mip.lon.tolist() == [10.5]
+    assert mip.values.tolist() == [[3.5], [0.5]]
+    assert mip.lat_flipped and not mip.lon_flipped
+    # One native decode plus one mip entry, each loaded once.
+    stats = get_datacube_grid_cache().stats()
+    assert (stats.misses, stats.entries) == (2, 2)
@@ -0,0 +1,146 @@
+from __future__ import annotations
+
+import os
+import threading
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from grid_cache import DecodedGridCache, datacube_slice_key
+
+
+def _grid(value: float, *, size: int = 4) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    lat = np.linspace(0.0, 1.0, size, dtype=np.float64)
+    lon = np.linspace(0.0, 1.0, size, dtype=np.float64)
+    grid = np.full((size, size), value, dtype=np.float32)
+    return lat, lon, grid
+
+
+def _grid_bytes(size: int = 4) -> int:
+    return sum(arr.nbytes for arr in _grid(0.0, size=size))
+
+
+def test_grid_cache_counts_hits_and_misses() -> None:
+    cache = DecodedGridCache(max_bytes=10 * _grid_bytes())
+    calls = {"count": 0}
+
+    def _load() -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        calls["count"] += 1
+        return _grid(1.0)
+
+    first = cache.get_or_load(("a.nc", 1, 2, "TMP"), _load)
+    second = cache.get_or_load(("a.nc", 1, 2, "TMP"), _load)
+
+    assert calls["count"] == 1
+    assert first[2] is second[2]
+    stats = cache.stats()
+    assert stats.hits == 1
+    assert stats.misses == 1
+    assert stats.entries == 1
+    assert stats.current_bytes == _grid_bytes()
+
+
+def test_grid_cache_returns_read_only_arrays() -> None:
+    cache = DecodedGridCache(max_bytes=10 * _grid_bytes())
+    _lat, _lon, grid = cache.get_or_load("k", lambda: _grid(1.0))
+    with pytest.raises(ValueError):
+        grid[0, 0] = 5.0
+
+
+def test_grid_cache_evicts_least_recently_used_by_bytes() -> None:
+    cache = DecodedGridCache(max_bytes=2 * _grid_bytes())
+    cache.put("a", _grid(1.0))
+    cache.put("b", _grid(2.0))
+    assert cache.get("a") is not None
+
+    cache.put("c", _grid(3.0))
+
+    assert cache.get("b") is None
+    assert cache.get("a") is not None
+    assert cache.get("c") is not None
+    stats = cache.stats()
+    assert stats.evictions == 1
+    assert stats.entries == 2
+    assert stats.current_bytes <= stats.max_bytes
+
+
+def test_grid_cache_skips_entries_larger_than_budget() -> None:
+    cache = DecodedGridCache(max_bytes=_grid_bytes(size=2))
+    cache.put("small", _grid(1.0, size=2))
+
+    loaded = cache.get_or_load("big", lambda: _grid(2.0, size=8))
+
+    assert float(loaded[2][0, 0]) == 2.0
+    assert cache.get("big") is None
+    assert cache.get("small") is not None
+
+
+def test_grid_cache_does_not_cache_loader_errors() -> None:
+    cache = DecodedGridCache(max_bytes=10 * _grid_bytes())
+
+    def _fail() -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        raise RuntimeError("boom")
+
+    with pytest.raises(RuntimeError):
+        cache.get_or_load("k", _fail)
+
+    loaded = cache.get_or_load("k", lambda: _grid(4.0))
+    assert float(loaded[2][0, 0]) == 4.0
+    assert cache.stats().misses == 2
+
+
+def test_grid_cache_collapses_concurrent_loads() -> None:
+    cache = DecodedGridCache(max_bytes=10 * _grid_bytes())
+    started = threading.Event()
+    release = threading.Event()
+    calls = {"count": 0}
+
+    def _slow_load() -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        calls["count"] += 1
+        started.set()
+        release.wait(timeout=5)
+        return _grid(7.0)
+
+    results: list[tuple[np.ndarray, ...]] = []
+
+    def _worker() -> None:
+        results.append(cache.get_or_load("shared", _slow_load))
+
+    threads = [threading.Thread(target=_worker) for _ in range(4)]
+    threads[0].start()
+    assert started.wait(timeout=5)
+    for thread in threads[1:]:
+        thread.start()
+    release.set()
+    for thread in threads:
+        thread.join(timeout=5)
+
+    assert calls["count"] == 1
+    assert len(results) == 4
+    assert all(float(item[2][0, 0]) == 7.0 for item in results)
+    assert cache.stats().misses == 1
+
+
+def test_datacube_slice_key_stamps_zarr_stores_by_their_metadata(
+    tmp_path: Path,
+) -> None:
+    store = tmp_path / "cube.zarr"
+    (store / "u").mkdir(parents=True)
+    metadata = store / ".zmetadata"
+    metadata.write_text("{}")
+    (store / "u" / "0.0.0").write_bytes(b"old")
+    store_stat = store.stat()
+    before = datacube_slice_key(store, "u", 0)
+
+    # Rewriting chunks in place leaves the store directory's mtime unchanged.
+    (store / "u" / "0.0.0").write_bytes(b"new")
+    metadata.write_text('{"zarr_consolidated_format": 1}')
+    later_ns = store_stat.st_mtime_ns + 1_000_000_000
+    os.utime(metadata, ns=(later_ns, later_ns))
+    os.utime(store, ns=(store_stat.st_atime_ns, store_stat.st_mtime_ns))
+
+    after = datacube_slice_key(store, "u", 0)
+    assert after != before
+    assert after[0] == str(store)
+    assert after[3:] == ("u", 0)
@@ -1,7 +1,32 @@
 from __future__ import annotations
 
-from http_cache import if_none_match_matches
+import pytest
+
+from http_cache import if_none_match_matches, if_range_matches, parse_byte_range
 
 
 def test_if_none_match_matches_returns_false_for_blank_header() -> None:
     assert if_none_match_matches("   ", '"t"') is False
+
+
+def test_parse_byte_range_handles_single_ranges() -> None:
+    assert parse_byte_range(None, 100) is None
+    assert parse_byte_range("bytes=0-9", 100) == (0, 9)
+    assert parse_byte_range("bytes=90-", 100) == (90, 99)
+    assert parse_byte_range("bytes=90-500", 100) == (90, 99)
+    assert parse_byte_range("bytes=-10", 100) == (90, 99)
+    assert parse_byte_range("bytes=0-1,5-6", 100) is None
+    assert parse_byte_range("items=0-1", 100) is None
+    assert parse_byte_range("bytes=9-1", 100) is None
+
+    with pytest.raises(ValueError):
+        parse_byte_range("bytes=100-", 100)
+    with pytest.raises(ValueError):
+        parse_byte_range("bytes=-0", 100)
+
+
+def test_if_range_matches_requires_strong_etag() -> None:
+    assert if_range_matches(None, '"t"') is True
+    assert if_range_matches('"t"', '"t"') is True
+    assert if_range_matches('W/"t"', '"t"') is False
+    assert if_range_matches("Wed, 21 Oct 2015 07:28:00 GMT", '"t"') is False
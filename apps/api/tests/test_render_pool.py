@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+import asyncio
+import os
+import threading
+
+import pytest
+from fastapi import HTTPException
+
+from render_pool import RenderExecutor
+
+
+def _worker_pid(offset: int = 0) -> int:
+    return os.getpid() + offset
+
+
+def _raise_not_found() -> None:
+    raise HTTPException(status_code=404, detail="missing")
+
+
+def test_render_executor_runs_inline_without_workers() -> None:
+    executor = RenderExecutor(workers=0, max_pending=2)
+
+    assert executor.call(_worker_pid) == os.getpid()
+    assert asyncio.run(executor.run(_worker_pid, 1)) == os.getpid() + 1
+
+    stats = executor.stats()
+    assert stats.workers == 0
+    assert stats.pending == 0
+    assert stats.rejected == 0
+
+
+def test_render_executor_rejects_when_queue_is_full() -> None:
+    executor = RenderExecutor(workers=0, max_pending=1)
+    started = threading.Event()
+    release = threading.Event()
+
+    def _block() -> int:
+        started.set()
+        release.wait(timeout=5)
+        return 1
+
+    thread = threading.Thread(target=executor.call, args=(_block,))
+    thread.start()
+    try:
+        assert started.wait(timeout=5)
+        with pytest.raises(HTTPException) as excinfo:
+            executor.call(_worker_pid)
+        assert excinfo.value.status_code == 503
+        with pytest.raises(HTTPException):
+            asyncio.run(executor.run(_worker_pid))
+    finally:
+        release.set()
+        thread.join(timeout=5)
+
+    assert executor.stats().rejected == 2
+    assert executor.stats().pending == 0
+    assert executor.call(_worker_pid) == os.getpid()
+
+
+def test_render_executor_runs_jobs_in_worker_processes() -> None:
+    executor = RenderExecutor(workers=1, max_pending=4)
+    try:
+        worker_pid = executor.call(_worker_pid)
+        assert worker_pid != os.getpid()
+        assert asyncio.run(executor.run(_worker_pid)) == worker_pid
+
+        with pytest.raises(HTTPException) as excinfo:
+            executor.call(_raise_not_found)
+        assert excinfo.value.status_code == 404
+        assert excinfo.value.detail == "missing"
+        assert executor.stats().pending == 0
+    finally:
+        executor.shutdown()
@@ -63,6 +63,18 @@ def _seed_asset(
     level: str,
     path: str,
 ) -> None:
+    _seed_assets(
+        db_url, run_time=run_time, assets=[(valid_time, variable, level, path)]
+    )
+
+
+def _seed_assets(
+    db_url: str,
+    *,
+    run_time: datetime,
+    assets: list[tuple[datetime, str, str, str]],
+) -> None:
+    """Seed one run with (valid_time, variable, level, path) assets."""
     from models import Base, EcmwfAsset, EcmwfRun, EcmwfTime
 
     engine = create_engine(db_url)
@@ -70,17 +82,26 @@ def _seed_asset(
 
     with Session(engine) as session:
         run = EcmwfRun(run_time=run_time, status="complete")
-        time = EcmwfTime(valid_time=valid_time, run=run)
-        asset = EcmwfAsset(
-            variable=variable,
-            level=level,
-            status="complete",
-            version=1,
-            path=path,
-            run=run,
-            time=time,
-        )
-        session.add_all([run, time, asset])
+        times: dict[datetime, EcmwfTime] = {}
+        rows: list[object] = [run]
+        for valid_time, variable, level, path in assets:
+            time = times.get(valid_time)
+            if time is None:
+                time = EcmwfTime(valid_time=valid_time, run=run)
+                times[valid_time] = time
+                rows.append(time)
+            rows.append(
+                EcmwfAsset(
+                    variable=variable,
+                    level=level,
+                    status="complete",
+                    version=1,
+                    path=path,
+                    run=run,
+                    time=time,
+                )
+            )
+        session.add_all(rows)
         session.commit()
 
 
@@ -405,3 +426,288 @@ def test_sample_missing_asset_returns_404(
     assert resp.status_code == 404
     body = resp.json()
     assert body["error_code"] == 40400
+
+
+def test_sample_batch_returns_columns_for_many_points(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    db_url = f"sqlite+pysqlite:///{tmp_path / 'catalog.db'}"
+    client, _redis = _make_client(monkeypatch, tmp_path, db_url=db_url)
+
+    lat = np.array([0.0, 1.0], dtype=np.float64)
+    lon = np.array([0.0, 1.0], dtype=np.float64)
+    grid = (10.0 * lat[:, None] + 100.0 * lon[None, :]).astype(np.float32)
+    temp_path = tmp_path / "Data" / "cubes" / "temp.nc"
+    _write_test_datacube(temp_path, var="temp", values=grid[None, None, :, :])
+    rh = np.full((1, 1, 2, 2), 50.0, dtype=np.float32)
+    rh[0, 0, 0, 0] = np.nan
+    rh_path = tmp_path / "Data" / "cubes" / "rh.nc"
+    _write_test_datacube(rh_path, var="rh", values=rh)
+
+    run_time = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    _seed_assets(
+        db_url,
+        run_time=run_time,
+        assets=[
+            (run_time, "temp", "sfc", str(temp_path.relative_to(tmp_path / "Data"))),
+            (run_time, "rh", "sfc", str(rh_path.relative_to(tmp_path / "Data"))),
+        ],
+    )
+
+    body = {
+        "run": "20260101T000000Z",
+        "valid_time": "2026-01-01T00:00:00Z",
+        "level": "sfc",
+        "vars": ["TEMP", "rh"],
+        # -359.5 wraps onto the grid at 0.5.
+        "lon": [0.75, 0.5, 0.0, -359.5, 1.0],
+        "lat": [0.25, 2.0, 0.0, 0.5, 1.0],
+    }
+    resp = client.post("/api/v1/sample/batch", json=body)
+    assert resp.status_code == 200
+    payload = resp.json()
+    assert payload["count"] == 5
+    temp, rh_column = payload["columns"]
+    assert (temp["var"], temp["unit"]) == ("TEMP", "°C")
+    assert temp["values"][0] == pytest.approx(77.5)
+    assert temp["values"][1] is None
+    assert temp["values"][2] == pytest.approx(0.0)
+    assert temp["values"][3] == pytest.approx(55.0)
+    assert temp["values"][4] == pytest.approx(110.0)
+    assert rh_column["var"] == "rh"
+    # A NaN corner poisons every point whose cell touches it.
+    assert rh_column["values"] == [None, None, None, None, pytest.approx(50.0)]
+
+    # Each point matches the single-point endpoint.
+    single = client.get(
+        "/api/v1/sample",
+        params={
+            "run": "20260101T000000Z",
+            "valid_time": "2026-01-01T00:00:00Z",
+            "level": "sfc",
+            "var": "temp",
+            "lon": 0.75,
+            "lat": 0.25,
+        },
+    )
+    assert single.json()["value"] == pytest.approx(temp["values"][0])
+
+    mismatched = client.post("/api/v1/sample/batch", json={**body, "lat": [0.0, 0.0]})
+    assert mismatched.status_code == 400
+    assert mismatched.json()["message"] == "lon and lat must have the same length"
+
+    too_many = client.post(
+        "/api/v1/sample/batch",
+        json={**body, "lon": [0.0] * 5001, "lat": [0.0] * 5001},
+    )
+    assert too_many.status_code == 400
+    assert too_many.json()["error_code"] == 40000
+
+
+def _write_series_datacube(
+    path: Path, *, var: str, times: list[str], levels: list[float], offset: float
+) -> None:
+    # Linear in every dimension, so bilinear samples are exact.
+    lat = np.array([2.0, 1.0, 0.0], dtype=np.float32)
+    lon = np.array([0.0, 1.0, 2.0], dtype=np.float32)
+    t = np.arange(len(times), dtype=np.float64)[:, None, None, None]
+    lv = np.arange(len(levels), dtype=np.float64)[None, :, None, None]
+    values = (
+        offset
+        + 1000.0 * t
+        + 100.0 * lv
+        + 10.0 * lat[None, None, :, None]
+        + lon[None, None, None, :]
+    )
+    ds = xr.Dataset(
+        {
+            var: xr.DataArray(
+                values.astype(np.float32),
+                dims=["time", "level", "lat", "lon"],
+                attrs={"units": "K"},
+            )
+        },
+        coords={
+            "time": np.array(times, dtype="datetime64[s]"),
+            "level": xr.DataArray(levels, dims=["level"], attrs={"units": "hPa"}),
+            "lat": lat,
+            "lon": lon,
+        },
+    )
+    path.parent.mkdir(parents=True, exist_ok=True)
+    ds.to_netcdf(path, engine="h5netcdf")
+
+
+def _count_datacube_opens(monkeypatch: pytest.MonkeyPatch) -> list[Path]:
+    import datacube_pool
+
+    datacube_pool.get_datacube_handle_pool().close()
+    datacube_pool.get_datacube_handle_pool.cache_clear()
+
+    opened: list[Path] = []
+    real_open = datacube_pool.open_datacube
+
+    def _counting_open(path: Path, **kwargs):
+        opened.append(Path(path))
+        return real_open(path, **kwargs)
+
+    monkeypatch.setattr(datacube_pool, "open_datacube", _counting_open)
+    return opened
+
+
+def test_sample_series_reads_each_cube_once_for_all_hours(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    db_url = f"sqlite+pysqlite:///{tmp_path / 'catalog.db'}"
+    client, _redis = _make_client(monkeypatch, tmp_path, db_url=db_url)
+
+    data_dir = tmp_path / "Data"
+    first = data_dir / "cubes" / "temp-00-12.nc"
+    _write_series_datacube(
+        first,
+        var="temp",
+        times=["2026-01-01T00:00:00", "2026-01-01T06:00:00", "2026-01-01T12:00:00"],
+        levels=[850.0, 500.0],
+        offset=0.0,
+    )
+    second = data_dir / "cubes" / "temp-18.nc"
+    _write_series_datacube(
+        second,
+        var="temp",
+        times=["2026-01-01T18:00:00"],
+        levels=[850.0],
+        offset=5000.0,
+    )
+
+    run_time = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    assets: list[tuple[datetime, str, str, str]] = []
+    for hour in (0, 6, 12):
+        valid_time = datetime(2026, 1, 1, hour, tzinfo=timezone.utc)
+        for level in ("850", "500"):
+            assets.append((valid_time, "temp", level, str(first.relative_to(data_dir))))
+    assets.append(
+        (
+            datetime(2026, 1, 1, 18, tzinfo=timezone.utc),
+            "temp",
+            "850",
+            str(second.relative_to(data_dir)),
+        )
+    )
+    # A catalog row with an unusable level must not add an empty row to `times`.
+    assets.append(
+        (
+            datetime(2026, 1, 1, 21, tzinfo=timezone.utc),
+            "temp",
+            "bogus",
+            str(second.relative_to(data_dir)),
+        )
+    )
+    _seed_assets(db_url, run_time=run_time, assets=assets)
+
+    opened = _count_datacube_opens(monkeypatch)
+
+    params = {"run": "20260101T000000Z", "var": "temp", "lon": 0.5, "lat": 1.5}
+    resp = client.get("/api/v1/sample/series", params=params)
+    assert resp.status_code == 200
+    payload = resp.json()
+    assert payload["unit"] == "K"
+    assert payload["times"] == [
+        "20260101T000000Z",
+        "20260101T060000Z",
+        "20260101T120000Z",
+        "20260101T180000Z",
+    ]
+    assert payload["levels"] == ["850", "500"]
+    assert payload["values"] == [
+        [pytest.approx(15.5), pytest.approx(115.5)],
+        [pytest.approx(1015.5), pytest.approx(1115.5)],
+        [pytest.approx(2015.5), pytest.approx(2115.5)],
+        [pytest.approx(5015.5), None],
+    ]
+    assert sorted(path.name for path in opened) == ["temp-00-12.nc", "temp-18.nc"]
+
+    resp = client.get("/api/v1/sample/series", params={**params, "level": "500hPa"})
+    assert resp.status_code == 200
+    payload = resp.json()
+    assert payload["levels"] == ["500"]
+    assert payload["times"] == [
+        "20260101T000000Z",
+        "20260101T060000Z",
+        "20260101T120000Z",
+    ]
+    assert [row[0] for row in payload["values"]] == pytest.approx(
+        [115.5, 1115.5, 2115.5]
+    )
+    # The open handles are pooled, so the second request reopens nothing.
+    assert len(opened) == 2
+
+    missing = client.get("/api/v1/sample/series", params={**params, "var": "unknown"})
+    assert missing.status_code == 404
+
+
+def test_sample_profile_reads_all_levels_for_several_vars(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    db_url = f"sqlite+pysqlite:///{tmp_path / 'catalog.db'}"
+    client, _redis = _make_client(monkeypatch, tmp_path, db_url=db_url)
+
+    data_dir = tmp_path / "Data"
+    temp_cube = data_dir / "cubes" / "temp.nc"
+    _write_series_datacube(
+        temp_cube,
+        var="temp",
+        times=["2026-01-01T00:00:00", "2026-01-01T06:00:00"],
+        levels=[850.0, 500.0],
+        offset=0.0,
+    )
+    rh_cube = data_dir / "cubes" / "rh.nc"
+    _write_series_datacube(
+        rh_cube,
+        var="rh",
+        times=["2026-01-01T06:00:00"],
+        levels=[1000.0, 850.0, 500.0],
+        offset=300.0,
+    )
+
+    run_time = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    valid_time = datetime(2026, 1, 1, 6, tzinfo=timezone.utc)
+    assets = [
+        (valid_time, "temp", level, str(temp_cube.relative_to(data_dir)))
+        for level in ("850", "500")
+    ] + [
+        (valid_time, "rh", level, str(rh_cube.relative_to(data_dir)))
+        for level in ("1000", "850", "500")
+    ]
+    _seed_assets(db_url, run_time=run_time, assets=assets)
+
+    opened = _count_datacube_opens(monkeypatch)
+
+    params = {
+        "run": "20260101T000000Z",
+        "valid_time": "20260101T060000Z",
+        "vars": "temp,rh",
+        "lon": 0.5,
+        "lat": 1.5,
+    }
+    resp = client.get("/api/v1/sample/profile", params=params)
+    assert resp.status_code == 200
+    payload = resp.json()
+    assert payload["valid_time"] == "20260101T060000Z"
+    assert payload["levels"] == ["1000", "850", "500"]
+    assert [column["var"] for column in payload["columns"]] == ["temp", "rh"]
+    assert payload["columns"][0]["unit"] == "K"
+    assert payload["columns"][0]["values"] == [
+        None,
+        pytest.approx(1015.5),
+        pytest.approx(1115.5),
+    ]
+    assert payload["columns"][1]["values"] == pytest.approx([315.5, 415.5, 515.5])
+    assert sorted(path.name for path in opened) == ["rh.nc", "temp.nc"]
+
+    empty = client.get("/api/v1/sample/profile", params={**params, "vars": "temp,"})
+    assert empty.status_code == 400
+
+    missing = client.get(
+        "/api/v1/sample/profile", params={**params, "vars": "temp,unknown"}
+    )
+    assert missing.status_code == 404
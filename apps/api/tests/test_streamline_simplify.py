@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+import math
+
+import numpy as np
+import pytest
+
+
+def _reference_douglas_peucker(
+    x: list[float], y: list[float], tolerance: float
+) -> list[int]:
+    def _distance(i: int, a: int, b: int) -> float:
+        dx, dy = x[b] - x[a], y[b] - y[a]
+        px, py = x[i] - x[a], y[i] - y[a]
+        length_sq = dx * dx + dy * dy
+        t = 0.0 if length_sq == 0.0 else (px * dx + py * dy) / length_sq
+        t = min(1.0, max(0.0, t))
+        return math.hypot(px - t * dx, py - t * dy)
+
+    def _recurse(a: int, b: int) -> list[int]:
+        if b - a < 2:
+            return []
+        far = max(range(a + 1, b), key=lambda i: _distance(i, a, b))
+        if _distance(far, a, b) <= tolerance:
+            return []
+        return _recurse(a, far) + [far] + _recurse(far, b)
+
+    if len(x) < 2:
+        return list(range(len(x)))
+    return [0, *_recurse(0, len(x) - 1), len(x) - 1]
+
+
+def test_zoom_sets_tolerance_and_precision() -> None:
+    from streamline_simplify import (
+        coordinate_decimals,
+        pixel_size_deg,
+        simplify_tolerance_deg,
+    )
+
+    assert pixel_size_deg(0) == pytest.approx(360.0 / 256.0)
+    assert simplify_tolerance_deg(1) == pytest.approx(pixel_size_deg(1) / 2.0)
+    assert [coordinate_decimals(zoom) for zoom in (0, 4, 8, 12, 22)] == [
+        1,
+        3,
+        4,
+        5,
+        5,
+    ]
+
+
+def test_simplify_drops_collinear_points_and_merges_rounded_duplicates() -> None:
+    from streamline_simplify import simplify_streamlines
+
+    straight = ([10.0] * 5, [100.0, 100.1, 100.2, 100.3, 100.4])
+    corner = ([0.0, 0.0, 0.0, 1.0, 2.0], [0.0, 1.0, 2.0, 2.0, 2.0])
+    tiny = ([5.0, 5.0000001, 5.0000002], [7.0, 7.0, 7.0])
+    single = ([1.23456789], [2.3456789])
+
+    lines = simplify_streamlines([straight, corner, tiny, single], zoom=6)
+    assert lines[0] == ([10.0, 10.0], [100.0, 100.4])
+    assert lines[1] == ([0.0, 0.0, 2.0], [0.0, 2.0, 2.0])
+    assert lines[2] == ([5.0], [7.0])
+    assert lines[3] == ([1.235], [2.346])
+
+    assert simplify_streamlines([], zoom=3) == []
+    with pytest.raises(ValueError, match="as many lat as lon"):
+        simplify_streamlines([([1.0, 2.0], [1.0])], zoom=3)
+
+
+def test_vectorized_pass_matches_recursive_douglas_peucker() -> None:
+    from streamline_simplify import _douglas_peucker_keep
+
+    rng = np.random.default_rng(7)
+    lines = [
+        np.cumsum(rng.normal(size=(count, 2)), axis=0)
+        for count in (0, 1, 2, 3, 17, 64, 200)
+    ]
+    counts = np.array([line.shape[0] for line in lines], dtype=np.int64)
+    x = np.concatenate([line[:, 0] for line in lines])
+    y = np.concatenate([line[:, 1] for line in lines])
+
+    keep = _douglas_peucker_keep(counts, x, y, tolerance=1.5)
+
+    offset = 0
+    for line, count in zip(lines, counts):
+        expected = _reference_douglas_peucker(
+            line[:, 0].tolist(), line[:, 1].tolist(), 1.5
+        )
+        assert np.flatnonzero(keep[offset : offset + count]).tolist() == expected
+        offset += int(count)
+
+
+def test_simplify_measures_curved_high_latitude_lines_in_ground_terms() -> None:
+    from streamline_simplify import simplify_streamlines, simplify_tolerance_deg
+
+    tolerance = simplify_tolerance_deg(6)
+    lat = np.linspace(50.0, 70.0, 41)
+    meridian = (lat.tolist(), [100.0] * lat.size)
+
+    # A northward arc whose bulge is east-west, centred near 60.5°N where one
+    # degree of longitude spans cos(60.5°) ≈ 0.49 degrees on the ground.
+    arc_lat = np.linspace(60.0, 61.0, 21)
+    bulge = np.sin(np.linspace(0.0, np.pi, arc_lat.size))
+    scale = math.cos(math.radians(60.5))
+    wide = (arc_lat.tolist(), (100.0 + bulge * 2.5 * tolerance / scale).tolist())
+    narrow = (arc_lat.tolist(), (100.0 + bulge * 0.5 * tolerance / scale).tolist())
+
+    lines = simplify_streamlines([meridian, wide, narrow], zoom=6)
+
+    assert lines[0] == ([50.0, 70.0], [100.0, 100.0])
+    assert len(lines[1][0]) > 2
+    assert lines[2][0] == [60.0, 61.0]
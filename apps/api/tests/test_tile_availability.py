@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+import pytest
+
+import tile_availability
+from tile_availability import (
+    NegativeTileCache,
+    TileAvailabilityCache,
+    split_tile_key,
+)
+
+
+def test_split_tile_key_parses_trailing_tile_address() -> None:
+    assert split_tile_key("cldas/tmp/20260101T000000Z/3/5/2.png") == (
+        "cldas/tmp/20260101T000000Z",
+        3,
+        5,
+        2,
+    )
+    assert split_tile_key("layer/t/0/0/0.json.gz") == ("layer/t", 0, 0, 0)
+    assert split_tile_key("layer/legend.json") is None
+    assert split_tile_key("3/5/2.png") is None
+
+
+def test_negative_tile_cache_expires_entries(monkeypatch: pytest.MonkeyPatch) -> None:
+    now = {"value": 100.0}
+    monkeypatch.setattr(tile_availability.time, "monotonic", lambda: now["value"])
+
+    cache = NegativeTileCache(ttl_seconds=30, max_entries=2)
+    cache.add("file:/a", "k1")
+    assert cache.contains("file:/a", "k1")
+    assert not cache.contains("file:/b", "k1")
+
+    cache.add("file:/a", "k2")
+    cache.add("file:/a", "k3")
+    assert not cache.contains("file:/a", "k1")
+
+    now["value"] = 131.0
+    assert not cache.contains("file:/a", "k3")
+
+
+def test_availability_cache_remembers_missing_and_invalid_bitmaps() -> None:
+    cache = TileAvailabilityCache(ttl_seconds=60)
+    calls = {"count": 0}
+
+    def _load() -> bytes | None:
+        calls["count"] += 1
+        return b"{not json"
+
+    assert cache.get("file:/a", "layer/t", _load) is None
+    assert cache.get("file:/a", "layer/t", _load) is None
+    assert calls["count"] == 1
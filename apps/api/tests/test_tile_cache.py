@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+import threading
+
+from tile_cache import RenderedTileCache
+
+
+def test_tile_cache_evicts_least_recently_used_by_bytes() -> None:
+    cache = RenderedTileCache(max_bytes=8)
+    cache.put("a", b"aaaa")
+    cache.put("b", b"bbbb")
+    assert cache.get("a") == b"aaaa"
+
+    cache.put("c", b"cccc")
+
+    assert cache.get("b") is None
+    assert cache.get("a") == b"aaaa"
+    assert cache.get("c") == b"cccc"
+    stats = cache.stats()
+    assert stats.evictions == 1
+    assert stats.current_bytes == 8
+
+
+def test_tile_cache_skips_bodies_larger_than_budget() -> None:
+    cache = RenderedTileCache(max_bytes=4)
+    body = cache.get_or_render("big", lambda: b"0123456789")
+    assert body == b"0123456789"
+    assert cache.get("big") is None
+    assert cache.stats().entries == 0
+
+
+def test_tile_cache_collapses_concurrent_renders() -> None:
+    cache = RenderedTileCache(max_bytes=1024)
+    started = threading.Event()
+    release = threading.Event()
+    calls = {"count": 0}
+
+    def _slow_render() -> bytes:
+        calls["count"] += 1
+        started.set()
+        release.wait(timeout=5)
+        return b"png"
+
+    results: list[bytes] = []
+
+    def _worker() -> None:
+        results.append(cache.get_or_render("tile", _slow_render))
+
+    threads = [threading.Thread(target=_worker) for _ in range(4)]
+    threads[0].start()
+    assert started.wait(timeout=5)
+    for thread in threads[1:]:
+        thread.start()
+    release.set()
+    for thread in threads:
+        thread.join(timeout=5)
+
+    assert calls["count"] == 1
+    assert results == [b"png"] * 4
+    assert cache.stats().misses == 1
+
+
+def test_tile_cache_counts_each_lookup_once() -> None:
+    cache = RenderedTileCache(max_bytes=1024)
+
+    assert cache.get_or_render("tile", lambda: b"png") == b"png"
+    assert cache.peek("tile") == b"png"
+    assert cache.get("tile") == b"png"
+    assert cache.get("other") is None
+
+    stats = cache.stats()
+    assert (stats.hits, stats.misses) == (1, 2)
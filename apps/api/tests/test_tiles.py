@@ -53,8 +53,14 @@ def _make_client(
 
     from config import get_settings
     from main import create_app
+    from tile_availability import (
+        get_negative_tile_cache,
+        get_tile_availability_cache,
+    )
 
     get_settings.cache_clear()
+    get_negative_tile_cache.cache_clear()
+    get_tile_availability_cache.cache_clear()
     return TestClient(create_app())
 
 
@@ -66,6 +72,18 @@ class FakeBody:
         return self._data
 
 
+class HeadFromGetClient:
+    """Answers head_object with the get_object response minus its body."""
+
+    def get_object(self, *, Bucket: str, Key: str) -> dict[str, Any]:
+        raise NotImplementedError
+
+    def head_object(self, *, Bucket: str, Key: str) -> dict[str, Any]:
+        obj = dict(self.get_object(Bucket=Bucket, Key=Key))
+        obj.pop("Body", None)
+        return obj
+
+
 class FakeClientError(RuntimeError):
     def __init__(self, *, status_code: int, code: str) -> None:
         super().__init__(code)
@@ -178,6 +196,136 @@ def test_tiles_redirects_to_signed_url_when_credentials_present(
     assert response.headers["cache-control"] == "private, max-age=899"
 
 
+def test_tiles_reuses_s3_client_and_presigned_urls(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    created: list[object] = []
+    signed: list[str] = []
+
+    class SignedClient:
+        def generate_presigned_url(
+            self, operation: str, *, Params: dict[str, str], ExpiresIn: int
+        ) -> str:
+            signed.append(Params["Key"])
+            return f"https://signed.example/{Params['Key']}?n={len(signed)}"
+
+    def _factory(*args: object, **kwargs: object) -> SignedClient:
+        client = SignedClient()
+        created.append(client)
+        return client
+
+    _install_fake_boto3(monkeypatch, client_factory=_factory)
+    monkeypatch.setenv("DIGITAL_EARTH_STORAGE_ACCESS_KEY_ID", "a")
+    monkeypatch.setenv("DIGITAL_EARTH_STORAGE_SECRET_ACCESS_KEY", "b")
+
+    import routers.tiles as tiles_module
+
+    now = {"value": 1000.0}
+    monkeypatch.setattr(tiles_module.time, "monotonic", lambda: now["value"])
+
+    client = _make_client(
+        monkeypatch,
+        tmp_path,
+        config_overrides={"storage": {"endpoint_url": "https://s3.example"}},
+    )
+
+    first = client.get("/api/v1/tiles/a/b/c.png", follow_redirects=False)
+    now["value"] += 100.0
+    second = client.get("/api/v1/tiles/a/b/c.png", follow_redirects=False)
+    other = client.get("/api/v1/tiles/a/b/d.png", follow_redirects=False)
+
+    assert first.headers["location"] == second.headers["location"]
+    assert first.headers["cache-control"] == "private, max-age=899"
+    assert second.headers["cache-control"] == "private, max-age=799"
+    assert other.headers["location"].startswith("https://signed.example/a/b/d.png")
+    assert len(created) == 1
+    assert signed == ["a/b/c.png", "a/b/d.png"]
+
+    now["value"] += tiles_module._SIGNED_URL_CACHE_TTL_SECONDS
+    refreshed = client.get("/api/v1/tiles/a/b/c.png", follow_redirects=False)
+    assert refreshed.headers["location"] != first.headers["location"]
+    assert refreshed.headers["cache-control"] == "private, max-age=899"
+    assert len(created) == 1
+
+
+def test_tiles_proxy_prefers_precompressed_sidecar(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    requested: list[tuple[str, str]] = []
+
+    class ProxyClient:
+        def head_object(self, *, Bucket: str, Key: str) -> dict[str, Any]:
+            requested.append(("HEAD", Key))
+            if Key == "a/legend.json":
+                return {
+                    "ContentType": "application/json",
+                    "Metadata": {"sidecar-encodings": "gzip,zstd"},
+                    "ETag": '"plain"',
+                }
+            raise FakeClientError(status_code=404, code="404")
+
+        def get_object(self, *, Bucket: str, Key: str) -> dict[str, Any]:
+            requested.append(("GET", Key))
+            if Key == "a/legend.json.gz":
+                return {
+                    "Body": FakeBody(gzip.compress(b"{}")),
+                    "ContentType": "application/json",
+                    "ContentEncoding": "gzip",
+                    "ETag": '"gz"',
+                }
+            raise FakeClientError(status_code=404, code="NoSuchKey")
+
+    _install_fake_boto3(
+        monkeypatch, client_factory=lambda *args, **kwargs: ProxyClient()
+    )
+    client = _make_client(monkeypatch, tmp_path, config_overrides=None)
+
+    response = client.get(
+        "/api/v1/tiles/a/legend.json?redirect=false",
+        headers={"Accept-Encoding": "br, gzip"},
+    )
+    assert response.status_code == 200
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.headers["vary"] == "Accept-Encoding"
+    assert response.headers["etag"] == '"gz"'
+    assert response.json() == {}
+    assert requested == [("HEAD", "a/legend.json"), ("GET", "a/legend.json.gz")]
+
+
+def test_tiles_proxy_does_not_probe_for_unlisted_sidecars(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    requested: list[tuple[str, str]] = []
+
+    class ProxyClient:
+        def head_object(self, *, Bucket: str, Key: str) -> dict[str, Any]:
+            requested.append(("HEAD", Key))
+            return {"ContentType": "application/json", "ETag": '"plain"'}
+
+        def get_object(self, *, Bucket: str, Key: str) -> dict[str, Any]:
+            requested.append(("GET", Key))
+            if Key == "a/legend.json":
+                return {
+                    "Body": FakeBody(b"{}"),
+                    "ContentType": "application/json",
+                    "ETag": '"plain"',
+                }
+            raise FakeClientError(status_code=404, code="NoSuchKey")
+
+    _install_fake_boto3(
+        monkeypatch, client_factory=lambda *args, **kwargs: ProxyClient()
+    )
+    client = _make_client(monkeypatch, tmp_path, config_overrides=None)
+
+    response = client.get(
+        "/api/v1/tiles/a/legend.json?redirect=false",
+        headers={"Accept-Encoding": "br, zstd, gzip"},
+    )
+    assert response.status_code == 200
+    assert response.json() == {}
+    assert requested == [("HEAD", "a/legend.json"), ("GET", "a/legend.json")]
+
+
 def test_tiles_proxy_returns_bytes_with_etag_and_supports_304(
     monkeypatch: pytest.MonkeyPatch, tmp_path: Path
 ) -> None:
@@ -216,7 +364,7 @@ def test_tiles_proxy_gzips_vector_tiles_when_accepted(
 ) -> None:
     payload = b"a" * 2048
 
-    class ProxyClient:
+    class ProxyClient(HeadFromGetClient):
         def get_object(self, *, Bucket: str, Key: str) -> dict[str, Any]:
             assert Bucket == "tiles"
             assert Key == "vector/0/0/0.pbf"
@@ -424,6 +572,50 @@ def test_tiles_proxy_returns_404_when_object_missing(
     assert payload["message"] == "Not Found"
 
 
+def test_tiles_proxy_short_circuits_tiles_missing_from_availability(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    from tiling.availability import write_availability
+
+    tree = tmp_path / "tree"
+    (tree / "2" / "1").mkdir(parents=True)
+    (tree / "2" / "1" / "1.png").write_bytes(b"png")
+    (tree / "2" / "1" / "2.png").write_bytes(b"png")
+    availability = write_availability(tree).read_bytes()
+
+    requested: list[str] = []
+
+    class ProxyClient:
+        def get_object(self, *, Bucket: str, Key: str) -> dict[str, Any]:
+            requested.append(Key)
+            if Key == "layer/t0/availability.json":
+                return {
+                    "Body": FakeBody(availability),
+                    "ContentType": "application/json",
+                }
+            if Key == "layer/t0/2/1/1.png":
+                return {"Body": FakeBody(b"png"), "ContentType": "image/png"}
+            raise FakeClientError(status_code=404, code="NoSuchKey")
+
+    _install_fake_boto3(
+        monkeypatch, client_factory=lambda *args, **kwargs: ProxyClient()
+    )
+    client = _make_client(monkeypatch, tmp_path, config_overrides=None)
+
+    def _status(tile: str) -> int:
+        return client.get(f"/api/v1/tiles/layer/t0/{tile}?redirect=false").status_code
+
+    assert _status("2/1/1.png") == 200
+    assert _status("2/3/0.png") == 404
+    assert _status("9/0/0.png") == 404
+    assert requested == ["layer/t0/availability.json", "layer/t0/2/1/1.png"]
+
+    # Listed in the bitmap but missing from storage: remembered after one miss.
+    assert _status("2/1/2.png") == 404
+    assert _status("2/1/2.png") == 404
+    assert requested.count("layer/t0/2/1/2.png") == 1
+
+
 def test_tiles_proxy_returns_500_when_storage_body_invalid(
     monkeypatch: pytest.MonkeyPatch, tmp_path: Path
 ) -> None:
@@ -505,7 +697,7 @@ def test_tiles_proxy_can_return_304_for_gzipped_object_when_client_accepts_gzip(
     raw = b"hello" * 300
     encoded = gzip.compress(raw)
 
-    class ProxyClient:
+    class ProxyClient(HeadFromGetClient):
         def get_object(self, *, Bucket: str, Key: str) -> dict[str, Any]:
             return {
                 "Body": FakeBody(encoded),
@@ -37,7 +37,10 @@ def _write_local_data_config(path: Path) -> None:
     )
 
 
-def _base_config(*, data_source: str = "local") -> dict:
+def _base_config(*, data_source: str = "local", tiles_dir: str | None = None) -> dict:
+    storage: dict[str, object] = {"tiles_bucket": "tiles", "raw_bucket": "raw"}
+    if tiles_dir is not None:
+        storage["tiles_dir"] = tiles_dir
     return {
         "api": {
             "host": "0.0.0.0",
@@ -50,7 +53,7 @@ def _base_config(*, data_source: str = "local") -> dict:
         "web": {"api_base_url": "http://localhost:8000"},
         "database": {"host": "localhost", "port": 5432, "name": "digital_earth"},
         "redis": {"host": "localhost", "port": 6379},
-        "storage": {"tiles_bucket": "tiles", "raw_bucket": "raw"},
+        "storage": storage,
     }
 
 
@@ -85,12 +88,23 @@ def _seed_asset(
 
 
 def _make_client(
-    monkeypatch: pytest.MonkeyPatch, tmp_path: Path, *, db_url: str
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+    *,
+    db_url: str,
+    tiles_dir: Path | None = None,
 ) -> tuple[TestClient, FakeRedis]:
     monkeypatch.chdir(tmp_path)
 
     config_dir = tmp_path / "config"
-    _write_config(config_dir, "dev", _base_config(data_source="local"))
+    _write_config(
+        config_dir,
+        "dev",
+        _base_config(
+            data_source="local",
+            tiles_dir=str(tiles_dir) if tiles_dir is not None else None,
+        ),
+    )
     _write_local_data_config(config_dir / "local-data.yaml")
 
     monkeypatch.setenv("DIGITAL_EARTH_ENV", "dev")
@@ -257,19 +271,18 @@ def test_vector_helpers_cover_edge_cases() -> None:
 
 
 def test_streamlines_helpers_cover_edge_cases() -> None:
+    from datacube_slices import normalize_grid_axis
     from routers import vector as vector_router
 
     # normalize axis: no-op vs reversed coordinate
     values = np.arange(6, dtype=np.float32).reshape(3, 2)
     coord = np.array([0.0, 1.0, 2.0], dtype=np.float32)
-    norm_coord, norm_values = vector_router._normalize_grid_axis(coord, values, axis=0)
+    norm_coord, norm_values = normalize_grid_axis(coord, values, axis=0)
     assert norm_coord.tolist() == [0.0, 1.0, 2.0]
     assert norm_values.tolist() == values.astype(np.float64).tolist()
 
     desc_coord = np.array([2.0, 1.0, 0.0], dtype=np.float32)
-    flipped_coord, flipped_values = vector_router._normalize_grid_axis(
-        desc_coord, values, axis=0
-    )
+    flipped_coord, flipped_values = normalize_grid_axis(desc_coord, values, axis=0)
     assert flipped_coord.tolist() == [0.0, 1.0, 2.0]
     assert flipped_values.tolist() == values[::-1].astype(np.float64).tolist()
 
@@ -367,9 +380,9 @@ def test_streamlines_helpers_cover_edge_cases() -> None:
 
     # streamline integration: seed outside bbox returns empty polyline
     bbox = (0.0, 0.0, 1.0, 1.0)
-    empty_lat, empty_lon = vector_router._integrate_streamline(
-        seed_lat=2.0,
-        seed_lon=2.0,
+    [(empty_lat, empty_lon)] = vector_router._integrate_streamlines(
+        seed_lat=np.array([2.0]),
+        seed_lon=np.array([2.0]),
         bbox=bbox,
         lat_coord=lat_coord2,
         lon_coord=lon_coord2,
@@ -429,9 +442,9 @@ def test_streamlines_helpers_cover_wrap_bbox_and_short_lines() -> None:
     u_zero = np.zeros((2, 2), dtype=np.float64)
     v_zero = np.zeros((2, 2), dtype=np.float64)
     bbox = (0.0, 0.0, 1.0, 1.0)
-    line_lat, line_lon = vector_router._integrate_streamline(
-        seed_lat=0.5,
-        seed_lon=0.5,
+    [(line_lat, line_lon)] = vector_router._integrate_streamlines(
+        seed_lat=np.array([0.5]),
+        seed_lon=np.array([0.5]),
         bbox=bbox,
         lat_coord=lat_coord2,
         lon_coord=lon_coord2,
@@ -445,12 +458,216 @@ def test_streamlines_helpers_cover_wrap_bbox_and_short_lines() -> None:
     assert line_lon == []
 
 
+def _reference_streamline(
+    *,
+    seed_lat: float,
+    seed_lon: float,
+    bbox: tuple[float, float, float, float],
+    lat_coord: np.ndarray,
+    lon_coord: np.ndarray,
+    u_grid: np.ndarray,
+    v_grid: np.ndarray,
+    step_km: float,
+    max_steps: int,
+    min_speed: float,
+) -> tuple[list[float], list[float]]:
+    """Scalar RK4 reference that the batched integrators are checked against."""
+    from routers import vector as vector_router
+
+    lat0 = float(seed_lat)
+    lon0 = float(seed_lon)
+    if not vector_router._bbox_contains(
+        lon=lon0, lat=lat0, bbox=bbox, lon_coord=lon_coord
+    ):
+        return [], []
+
+    step_m = float(step_km) * 1000.0
+
+    points_backward: list[tuple[float, float]] = []
+    lat_cursor = lat0
+    lon_cursor = lon0
+    for _ in range(int(max_steps)):
+        next_point = vector_router._rk4_step(
+            lat=lat_cursor,
+            lon_unwrapped=lon_cursor,
+            lon_coord=lon_coord,
+            lat_coord=lat_coord,
+            u_grid=u_grid,
+            v_grid=v_grid,
+            step_m=step_m,
+            min_speed=min_speed,
+            direction=-1.0,
+        )
+        if next_point is None:
+            break
+        lat_next, lon_next = next_point
+        if not vector_router._bbox_contains(
+            lon=lon_next, lat=lat_next, bbox=bbox, lon_coord=lon_coord
+        ):
+            break
+        points_backward.append((lon_next, lat_next))
+        lat_cursor = lat_next
+        lon_cursor = lon_next
+
+    points_forward: list[tuple[float, float]] = []
+    lat_cursor = lat0
+    lon_cursor = lon0
+    for _ in range(int(max_steps)):
+        next_point = vector_router._rk4_step(
+            lat=lat_cursor,
+            lon_unwrapped=lon_cursor,
+            lon_coord=lon_coord,
+            lat_coord=lat_coord,
+            u_grid=u_grid,
+            v_grid=v_grid,
+            step_m=step_m,
+            min_speed=min_speed,
+            direction=1.0,
+        )
+        if next_point is None:
+            break
+        lat_next, lon_next = next_point
+        if not vector_router._bbox_contains(
+            lon=lon_next, lat=lat_next, bbox=bbox, lon_coord=lon_coord
+        ):
+            break
+        points_forward.append((lon_next, lat_next))
+        lat_cursor = lat_next
+        lon_cursor = lon_next
+
+    combined = list(reversed(points_backward)) + [(lon0, lat0)] + points_forward
+    if len(combined) < 2:
+        return [], []
+
+    out_lon = [float(lon_val) for lon_val, _lat_val in combined]
+    out_lat = [float(lat_val) for _lon_val, lat_val in combined]
+    return out_lat, out_lon
+
+
+@pytest.mark.parametrize(
+    ("lon_coord", "bbox"),
+    [
+        (np.linspace(0.0, 359.0, 360), (350.0, -60.0, 40.0, 60.0)),
+        (np.linspace(-180.0, 179.0, 360), (-30.0, -80.0, 30.0, 80.0)),
+    ],
+)
+def test_batch_streamlines_match_scalar_integrator(
+    lon_coord: np.ndarray, bbox: tuple[float, float, float, float]
+) -> None:
+    from routers import vector as vector_router
+
+    rng = np.random.default_rng(7)
+    lat_coord = np.linspace(-90.0, 90.0, 181)
+    lat2d, lon2d = np.meshgrid(
+        np.deg2rad(lat_coord), np.deg2rad(lon_coord), indexing="ij"
+    )
+    u_grid = 15.0 * np.cos(lat2d) + 3.0 * np.sin(2.0 * lon2d)
+    v_grid = 8.0 * np.sin(3.0 * lon2d) * np.cos(lat2d)
+    u_grid[rng.random(u_grid.shape) < 0.01] = np.nan
+    v_grid[np.abs(u_grid) < 0.5] = 0.0
+
+    seed_lat = rng.uniform(-70.0, 70.0, size=60)
+    seed_lon = rng.uniform(-360.0, 360.0, size=60)
+    params = {
+        "bbox": bbox,
+        "lat_coord": lat_coord,
+        "lon_coord": lon_coord,
+        "u_grid": u_grid,
+        "v_grid": v_grid,
+        "step_km": 40.0,
+        "max_steps": 30,
+        "min_speed": 1.0,
+    }
+
+    batch = vector_router._integrate_streamlines(
+        seed_lat=seed_lat, seed_lon=seed_lon, **params
+    )
+    scalar = [
+        _reference_streamline(seed_lat=float(lat), seed_lon=float(lon), **params)
+        for lat, lon in zip(seed_lat, seed_lon, strict=True)
+    ]
+    assert batch == scalar
+    assert sum(1 for line_lat, _line_lon in scalar if line_lat) >= 5
+
+
+def test_even_streamlines_keep_lines_apart() -> None:
+    from routers import vector as vector_router
+
+    lat_coord = np.linspace(-90.0, 90.0, 181)
+    lon_coord = np.linspace(0.0, 359.0, 360)
+    lat2d, lon2d = np.meshgrid(
+        np.deg2rad(lat_coord), np.deg2rad(lon_coord), indexing="ij"
+    )
+    u_grid = 15.0 * np.cos(lat2d) + 3.0 * np.sin(2.0 * lon2d)
+    v_grid = 8.0 * np.sin(3.0 * lon2d) * np.cos(lat2d)
+    bbox = (100.0, -30.0, 160.0, 30.0)
+    seed_lat, seed_lon = np.meshgrid(
+        lat_coord[60:121:5], lon_coord[100:161:5], indexing="ij"
+    )
+    params = {
+        "seed_lat": seed_lat,
+        "seed_lon": seed_lon,
+        "bbox": bbox,
+        "lat_coord": lat_coord,
+        "lon_coord": lon_coord,
+        "u_grid": u_grid,
+        "v_grid": v_grid,
+        "step_km": 40.0,
+        "max_steps": 150,
+        "min_speed": 0.5,
+    }
+
+    grid_lines = vector_router._integrate_streamlines(**params)
+    even_lines = vector_router._integrate_streamlines_evenly(
+        separation_km=400.0, **params
+    )
+    assert 5 <= len(even_lines) < seed_lat.size
+    assert sum(len(line_lat) for line_lat, _ in even_lines) < sum(
+        len(line_lat) for line_lat, _ in grid_lines
+    )
+
+    occupancy = vector_router._StreamlineOccupancy(bbox=bbox, separation_km=400.0)
+    points = np.array(
+        [
+            (index, *occupancy.project(lat, lon))
+            for index, (line_lat, line_lon) in enumerate(even_lines)
+            for lat, lon in zip(line_lat, line_lon, strict=True)
+        ]
+    )
+    distance = np.hypot(
+        points[:, 1][:, None] - points[:, 1][None, :],
+        points[:, 2][:, None] - points[:, 2][None, :],
+    )
+    other_line = points[:, 0][:, None] != points[:, 0][None, :]
+    assert distance[other_line].min() >= 400.0 * vector_router.STREAMLINE_TEST_RATIO
+
+    capped = vector_router._integrate_streamlines_evenly(
+        separation_km=400.0, max_points=50, **params
+    )
+    assert sum(len(line_lat) for line_lat, _ in capped) < 50 + 2 * 150 + 1
+
+
+def test_streamline_occupancy_scales_longitude_by_each_latitude() -> None:
+    from routers import vector as vector_router
+
+    occupancy = vector_router._StreamlineOccupancy(
+        bbox=(170.0, 0.0, -170.0, 80.0), separation_km=100.0
+    )
+    for lat in (5.0, 70.0):
+        x0, y0 = occupancy.project(lat, 179.5)
+        x1, y1 = occupancy.project(lat, -179.5)
+        assert y1 == pytest.approx(y0)
+        assert x1 - x0 == pytest.approx(111.195 * np.cos(np.deg2rad(lat)), rel=1e-3)
+        assert occupancy.unproject(x1, y1) == pytest.approx((lat, 180.5))
+
+
 def test_streamlines_helpers_cover_degenerate_grids() -> None:
+    from datacube_slices import normalize_grid_axis
     from routers import vector as vector_router
 
     coord = np.array([0.0], dtype=np.float32)
     values = np.array([[1.0]], dtype=np.float32)
-    norm_coord, norm_values = vector_router._normalize_grid_axis(coord, values, axis=0)
+    norm_coord, norm_values = normalize_grid_axis(coord, values, axis=0)
     assert norm_coord.tolist() == [0.0]
     assert norm_values.tolist() == [[1.0]]
 
@@ -774,6 +991,7 @@ def test_vector_prewarm_endpoint_warms_cache(
     assert prewarm.status_code == 200
     payload = prewarm.json()
     assert payload["results"][0]["status"] == "computed"
+    assert payload["results"][0]["duration_ms"] >= 0.0
 
     from routers import vector as vector_router
 
@@ -802,6 +1020,79 @@ def test_vector_prewarm_requires_editor_permission(
     assert prewarm.status_code == 403
 
 
+def test_prewarm_decodes_wind_slice_once_for_many_bboxes(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    db_url = f"sqlite+pysqlite:///{tmp_path / 'catalog.db'}"
+    monkeypatch.setenv("ENABLE_EDITOR", "true")
+    client, _redis = _make_client(monkeypatch, tmp_path, db_url=db_url)
+
+    cube_path = tmp_path / "Data" / "cubes" / "wind-850.nc"
+    lat = np.linspace(0.0, 4.0, 5, dtype=np.float32)
+    lon = np.linspace(0.0, 4.0, 5, dtype=np.float32)
+    level = xr.DataArray([850.0], dims=["level"], attrs={"units": "hPa"})
+    _write_wind_datacube(
+        cube_path,
+        u_name="u",
+        v_name="v",
+        u_values=np.full((1, 1, 5, 5), 10.0, dtype=np.float32),
+        v_values=np.zeros((1, 1, 5, 5), dtype=np.float32),
+        lat=lat,
+        lon=lon,
+        level=level,
+    )
+    _seed_asset(
+        db_url,
+        run_time=datetime(2026, 1, 1, tzinfo=timezone.utc),
+        valid_time=datetime(2026, 1, 1, tzinfo=timezone.utc),
+        variable="wind",
+        level="850",
+        path=str(cube_path.relative_to(tmp_path / "Data")),
+    )
+
+    from grid_cache import get_datacube_grid_cache
+    from routers import vector as vector_router
+
+    get_datacube_grid_cache().clear()
+    loads: list[Path] = []
+    original_load = vector_router._load_wind_slice
+
+    def _counting_load(path: Path, **kwargs: object) -> object:
+        loads.append(path)
+        return original_load(path, **kwargs)
+
+    monkeypatch.setattr(vector_router, "_load_wind_slice", _counting_load)
+
+    bboxes = ["0,0,1,1", "1,1,3,3", "2,0,4,2", "0,2,2,4", "3,3,4,4"]
+    base = "/api/v1/vector/ecmwf/20260101T000000Z/wind/850/20260101T000000Z"
+    prewarm = client.post(f"{base}/prewarm", json={"bboxes": bboxes, "stride": 1})
+    assert prewarm.status_code == 200
+    results = prewarm.json()["results"]
+    assert [item["bbox"] for item in results] == bboxes
+    assert {item["status"] for item in results} == {"computed"}
+    assert all(item["duration_ms"] >= 0.0 for item in results)
+
+    streamlines = client.post(
+        f"{base}/streamlines/prewarm",
+        params={"step_km": 10.0, "max_steps": 10},
+        json={"bboxes": bboxes, "stride": 1},
+    )
+    assert streamlines.status_code == 200
+    assert [item["bbox"] for item in streamlines.json()["results"]] == bboxes
+    # Every bbox reads the slice, but u and v are decoded only once.
+    assert len(loads) == 2 * len(bboxes)
+    assert get_datacube_grid_cache().stats().misses == 2
+
+    # Fully cached prewarms never open the DataCube.
+    again = client.post(f"{base}/prewarm", json={"bboxes": bboxes, "stride": 1})
+    assert {item["status"] for item in again.json()["results"]} == {"fresh"}
+    assert len(loads) == 2 * len(bboxes)
+
+    resp = client.get(base, params={"bbox": "1,1,3,3", "stride": 1})
+    assert resp.status_code == 200
+    assert resp.json()["u"] == [10.0] * 9
+
+
 def test_vector_supports_surface_wind_10m_component_names(
     monkeypatch: pytest.MonkeyPatch, tmp_path: Path
 ) -> None:
@@ -940,6 +1231,64 @@ def test_vector_guard_rejects_excessive_points(
     assert resp.json()["message"] == "reduce bbox or increase stride"
 
 
+def test_vector_target_points_selects_area_averaged_mip_level(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    db_url = f"sqlite+pysqlite:///{tmp_path / 'catalog.db'}"
+    client, _redis = _make_client(monkeypatch, tmp_path, db_url=db_url)
+
+    cube_path = tmp_path / "Data" / "cubes" / "wind-850.nc"
+    lat = np.linspace(0.0, 100.0, 101, dtype=np.float32)
+    lon = np.linspace(0.0, 100.0, 101, dtype=np.float32)
+    level = xr.DataArray([850.0], dims=["level"], attrs={"units": "hPa"})
+
+    lon_grid = np.broadcast_to(lon, (lat.size, lon.size))
+    u_values = lon_grid.reshape(1, 1, lat.size, lon.size).astype(np.float32)
+    v_values = np.ones((1, 1, lat.size, lon.size), dtype=np.float32)
+    v_values[0, 0, 0, 0] = np.nan
+    _write_wind_datacube(
+        cube_path,
+        u_name="u",
+        v_name="v",
+        u_values=u_values,
+        v_values=v_values,
+        lat=lat,
+        lon=lon,
+        level=level,
+    )
+
+    run_time = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    rel_path = str(cube_path.relative_to(tmp_path / "Data"))
+    _seed_asset(
+        db_url,
+        run_time=run_time,
+        valid_time=run_time,
+        variable="wind",
+        level="850",
+        path=rel_path,
+    )
+
+    url = "/api/v1/vector/ecmwf/20260101T000000Z/wind/850/20260101T000000Z"
+    resp = client.get(url, params={"target_points": 51 * 51})
+    assert resp.status_code == 200
+    payload = resp.json()
+    # 101 cells per axis average into 51 blocks of 2 (the last one is short).
+    assert len(payload["u"]) == 51 * 51
+    assert payload["lat"][0] == pytest.approx(0.5)
+    assert payload["lon"][:2] == pytest.approx([0.5, 2.5])
+    assert payload["lon"][50] == pytest.approx(100.0)
+    assert payload["u"][:2] == pytest.approx([0.5, 2.5])
+    assert payload["v"][0] == pytest.approx(1.0)
+
+    resp = client.get(url, params={"target_points": 30, "bbox": "0,0,20,20"})
+    assert resp.status_code == 200
+    assert len(resp.json()["u"]) <= 30
+
+    resp = client.get(url, params={"target_points": 100, "stride": 2})
+    assert resp.status_code == 400
+    assert resp.json()["message"] == "stride and target_points are mutually exclusive"
+
+
 def test_vector_invalid_bbox_returns_400(
     monkeypatch: pytest.MonkeyPatch, tmp_path: Path
 ) -> None:
@@ -1124,6 +1473,135 @@ def test_streamlines_endpoint_returns_polylines_in_bbox(
         assert all(-1e-6 <= value <= 2.0 + 1e-6 for value in line["lat"])
         assert all(-1e-6 <= value <= 2.0 + 1e-6 for value in line["lon"])
 
+    resp = client.get(
+        "/api/v1/vector/ecmwf/20260101T000000Z/wind/850/20260101T000000Z/streamlines",
+        params={
+            "bbox": "0,0,2,2",
+            "stride": 1,
+            "step_km": 10.0,
+            "max_steps": 25,
+            "zoom": 8,
+        },
+    )
+    assert resp.status_code == 200
+    simplified = resp.json()["streamlines"]
+    assert len(simplified) == 9
+    # Uniform eastward wind traces straight lines: only the endpoints remain,
+    # rounded to the zoom's coordinate precision.
+    for line, full in zip(simplified, payload["streamlines"]):
+        assert len(line["lat"]) == 2
+        assert line["lon"] == pytest.approx([full["lon"][0], full["lon"][-1]], abs=5e-5)
+        assert all(value == round(value, 4) for value in line["lat"] + line["lon"])
+
+
+def test_vectors_and_streamlines_share_decoded_wind_slices(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    db_url = f"sqlite+pysqlite:///{tmp_path / 'catalog.db'}"
+    client, _redis = _make_client(monkeypatch, tmp_path, db_url=db_url)
+
+    cube_path = tmp_path / "Data" / "cubes" / "wind-850.nc"
+    lat = np.array([2.0, 1.0, 0.0], dtype=np.float32)
+    lon = np.array([0.0, 1.0, 2.0], dtype=np.float32)
+    level = xr.DataArray([850.0], dims=["level"], attrs={"units": "hPa"})
+    u_values = np.arange(9, dtype=np.float32).reshape(1, 1, 3, 3)
+    _write_wind_datacube(
+        cube_path,
+        u_name="u",
+        v_name="v",
+        u_values=u_values,
+        v_values=np.zeros((1, 1, 3, 3), dtype=np.float32),
+        lat=lat,
+        lon=lon,
+        level=level,
+    )
+    _seed_asset(
+        db_url,
+        run_time=datetime(2026, 1, 1, tzinfo=timezone.utc),
+        valid_time=datetime(2026, 1, 1, tzinfo=timezone.utc),
+        variable="wind",
+        level="850",
+        path=str(cube_path.relative_to(tmp_path / "Data")),
+    )
+
+    from grid_cache import get_datacube_grid_cache
+
+    get_datacube_grid_cache.cache_clear()
+    base = "/api/v1/vector/ecmwf/20260101T000000Z/wind/850/20260101T000000Z"
+
+    vectors = client.get(base, params={"bbox": "0,0,2,2", "stride": 2})
+    assert vectors.status_code == 200
+    payload = vectors.json()
+    # Points keep the cube's own (descending) latitude order.
+    assert payload["lat"] == [2.0, 2.0, 0.0, 0.0]
+    assert payload["u"] == [0.0, 2.0, 6.0, 8.0]
+
+    streamlines = client.get(
+        f"{base}/streamlines",
+        params={"bbox": "0,0,2,2", "stride": 1, "step_km": 10.0, "max_steps": 5},
+    )
+    assert streamlines.status_code == 200
+
+    stats = get_datacube_grid_cache().stats()
+    assert (stats.misses, stats.hits, stats.entries) == (2, 2, 2)
+
+
+def test_streamlines_even_seeding_thins_lines(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    db_url = f"sqlite+pysqlite:///{tmp_path / 'catalog.db'}"
+    client, _redis = _make_client(monkeypatch, tmp_path, db_url=db_url)
+
+    cube_path = tmp_path / "Data" / "cubes" / "wind-850.nc"
+    lat = np.arange(0.0, 5.5, 0.5, dtype=np.float32)
+    lon = np.arange(0.0, 5.5, 0.5, dtype=np.float32)
+    level = xr.DataArray([850.0], dims=["level"], attrs={"units": "hPa"})
+    u_values = np.full((1, 1, lat.size, lon.size), 10.0, dtype=np.float32)
+    v_values = np.zeros((1, 1, lat.size, lon.size), dtype=np.float32)
+    _write_wind_datacube(
+        cube_path,
+        u_name="u",
+        v_name="v",
+        u_values=u_values,
+        v_values=v_values,
+        lat=lat,
+        lon=lon,
+        level=level,
+    )
+
+    run_time = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    _seed_asset(
+        db_url,
+        run_time=run_time,
+        valid_time=run_time,
+        variable="wind",
+        level="850",
+        path=str(cube_path.relative_to(tmp_path / "Data")),
+    )
+
+    url = "/api/v1/vector/ecmwf/20260101T000000Z/wind/850/20260101T000000Z/streamlines"
+    params = {"bbox": "0,0,5,5", "step_km": 10.0, "max_steps": 100}
+    grid = client.get(url, params=params)
+    even = client.get(url, params={**params, "seeding": "even", "separation_km": 111.0})
+    assert grid.status_code == 200
+    assert even.status_code == 200
+    assert grid.json() != even.json()
+
+    grid_lines = grid.json()["streamlines"]
+    even_lines = even.json()["streamlines"]
+    assert len(grid_lines) == lat.size * lon.size
+    assert len(even_lines) == 6
+    # Uniform eastward flow: every even line spans the bbox on its own row.
+    rows = sorted(round(line["lat"][0], 3) for line in even_lines)
+    assert all(b - a >= 0.99 for a, b in zip(rows, rows[1:]))
+    for line in even_lines:
+        assert max(line["lat"]) - min(line["lat"]) < 1e-6
+        assert line["lon"][0] <= 0.1
+        assert line["lon"][-1] >= 4.9
+
+    invalid = client.get(url, params={**params, "seeding": "random"})
+    assert invalid.status_code == 400
+
 
 def test_streamlines_cache_hit_skips_db_query(
     monkeypatch: pytest.MonkeyPatch, tmp_path: Path
@@ -1305,3 +1783,182 @@ def test_streamlines_works_without_redis_and_with_absolute_asset_path(
     second = client.get(url, params=params)
     assert second.status_code == 200
     assert second.json() == first.json()
+
+
+def test_vector_and_streamlines_negotiate_wind_pack(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    db_url = f"sqlite+pysqlite:///{tmp_path / 'catalog.db'}"
+    client, _redis = _make_client(monkeypatch, tmp_path, db_url=db_url)
+
+    cube_path = tmp_path / "Data" / "cubes" / "wind-850.nc"
+    lat = np.array([0.0, 1.0, 2.0], dtype=np.float32)
+    lon = np.array([0.0, 1.0, 2.0], dtype=np.float32)
+    level = xr.DataArray([850.0], dims=["level"], attrs={"units": "hPa"})
+
+    u_grid = np.full((lat.size, lon.size), 10.0, dtype=np.float32)
+    v_grid = np.zeros((lat.size, lon.size), dtype=np.float32)
+    v_grid[1, 1] = np.nan
+    _write_wind_datacube(
+        cube_path,
+        u_name="u",
+        v_name="v",
+        u_values=u_grid[None, None, :, :],
+        v_values=v_grid[None, None, :, :],
+        lat=lat,
+        lon=lon,
+        level=level,
+    )
+    _seed_asset(
+        db_url,
+        run_time=datetime(2026, 1, 1, tzinfo=timezone.utc),
+        valid_time=datetime(2026, 1, 1, tzinfo=timezone.utc),
+        variable="wind",
+        level="850",
+        path=str(cube_path.relative_to(tmp_path / "Data")),
+    )
+
+    from wind_pack import (
+        WIND_PACK_MEDIA_TYPE,
+        decode_streamline_pack,
+        decode_wind_vector_pack,
+    )
+
+    url = "/api/v1/vector/ecmwf/20260101T000000Z/wind/850/20260101T000000Z"
+    params = {"bbox": "0,0,2,2", "stride": 1}
+
+    as_json = client.get(url, params=params)
+    assert as_json.status_code == 200
+    assert as_json.headers["content-type"].startswith("application/json")
+    assert as_json.headers["vary"] == "Accept"
+
+    packed = client.get(url, params=params, headers={"Accept": WIND_PACK_MEDIA_TYPE})
+    assert packed.status_code == 200
+    assert packed.headers["content-type"] == WIND_PACK_MEDIA_TYPE
+    assert packed.headers["etag"] != as_json.headers["etag"]
+
+    header, decoded = decode_wind_vector_pack(packed.content)
+    assert header["shape"] == [3, 3]
+    assert header["lat"] == {"start": 0.0, "step": 1.0, "count": 3}
+    assert not decoded["valid"][1, 1]
+    np.testing.assert_allclose(decoded["u"][decoded["valid"]], 10.0)
+    assert as_json.json()["v"][4] is None
+
+    streamline_params = {**params, "step_km": 10.0, "max_steps": 25}
+    lines_json = client.get(f"{url}/streamlines", params=streamline_params).json()
+    lines_packed = client.get(
+        f"{url}/streamlines",
+        params=streamline_params,
+        headers={"Accept": WIND_PACK_MEDIA_TYPE},
+    )
+    assert lines_packed.status_code == 200
+    assert lines_packed.headers["content-type"] == WIND_PACK_MEDIA_TYPE
+
+    _header, lines = decode_streamline_pack(lines_packed.content)
+    assert len(lines) == len(lines_json["streamlines"])
+    for (line_lat, line_lon), expected in zip(
+        lines, lines_json["streamlines"], strict=True
+    ):
+        np.testing.assert_allclose(line_lat, expected["lat"], atol=1e-5)
+        np.testing.assert_allclose(line_lon, expected["lon"], atol=1e-5)
+
+
+def test_vector_tile_endpoint_serves_precomputed_tiles(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    tiles_dir = tmp_path / "tiles"
+    tiles_root = (
+        tiles_dir
+        / "ecmwf"
+        / "wind_vector"
+        / "20260101T000000Z"
+        / "20260101T060000Z"
+        / "850"
+    )
+    tile = {"u": [1.5], "v": [-2.0], "lat": [45.0], "lon": [-90.0]}
+    (tiles_root / "0" / "0").mkdir(parents=True)
+    (tiles_root / "0" / "0" / "0.json").write_text(json.dumps(tile), encoding="utf-8")
+
+    db_url = f"sqlite+pysqlite:///{tmp_path / 'catalog.db'}"
+    client, _redis = _make_client(
+        monkeypatch, tmp_path, db_url=db_url, tiles_dir=tiles_dir
+    )
+
+    from routers import vector as vector_router
+
+    def _boom(*_args: object, **_kwargs: object) -> object:
+        raise AssertionError("vector tiles must not touch the catalog")
+
+    monkeypatch.setattr(vector_router, "_query_asset_path", _boom)
+
+    base = "/api/v1/vector/ecmwf/2026-01-01T00:00:00Z/wind/850hPa/20260101T060000Z"
+    resp = client.get(f"{base}/0/0/0")
+    assert resp.status_code == 200
+    assert resp.headers["content-type"].startswith("application/json")
+    assert "etag" in resp.headers
+    assert resp.json() == tile
+
+    cached = client.get(
+        f"{base}/0/0/0", headers={"If-None-Match": resp.headers["etag"]}
+    )
+    assert cached.status_code == 304
+
+    assert client.get(f"{base}/0/1/0").status_code == 404
+    assert client.get(f"{base}/1/1/0").status_code == 404
+    invalid = client.get(f"{base}/0/0/-1")
+    assert invalid.status_code == 400
+    assert invalid.json()["error_code"] == 40000
+    assert (
+        client.get(
+            "/api/v1/vector/ecmwf/not-a-time/wind/850/20260101T060000Z/0/0/0"
+        ).status_code
+        == 400
+    )
+
+
+def test_wind_texture_endpoints_serve_precomputed_texture(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    tiles_dir = tmp_path / "tiles"
+    texture_dir = (
+        tiles_dir
+        / "ecmwf"
+        / "wind_texture"
+        / "20260101T000000Z"
+        / "20260101T060000Z"
+        / "850"
+    )
+    texture_dir.mkdir(parents=True)
+    (texture_dir / "wind.png").write_bytes(b"\x89PNG\r\n\x1a\nfake")
+    (texture_dir / "wind.webp").write_bytes(b"RIFF\x00\x00\x00\x00WEBPfake")
+    metadata = {"width": 2, "height": 2, "uOffset": -1.0, "uScale": 0.01}
+    (texture_dir / "wind.json").write_text(json.dumps(metadata), encoding="utf-8")
+
+    db_url = f"sqlite+pysqlite:///{tmp_path / 'catalog.db'}"
+    client, _redis = _make_client(
+        monkeypatch, tmp_path, db_url=db_url, tiles_dir=tiles_dir
+    )
+
+    base = "/api/v1/vector/ecmwf/2026-01-01T00:00:00Z/wind/850hPa/20260101T060000Z"
+    png = client.get(f"{base}/texture.png")
+    assert png.status_code == 200
+    assert png.headers["content-type"].startswith("image/png")
+    assert png.content.startswith(b"\x89PNG")
+
+    webp = client.get(f"{base}/texture.png", headers={"Accept": "image/webp,image/*"})
+    assert webp.status_code == 200
+    assert webp.headers["content-type"].startswith("image/webp")
+    assert webp.content.startswith(b"RIFF")
+
+    meta = client.get(f"{base}/texture.json")
+    assert meta.status_code == 200
+    assert meta.json() == metadata
+
+    missing = "/api/v1/vector/ecmwf/2026-01-01T00:00:00Z/wind/500/20260101T060000Z"
+    assert client.get(f"{missing}/texture.png").status_code == 404
+    assert (
+        client.get(
+            "/api/v1/vector/ecmwf/not-a-time/wind/850/20260101T060000Z/texture.json"
+        ).status_code
+        == 400
+    )
@@ -0,0 +1,185 @@
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import pytest
+
+from vector_cache import (
+    VectorFileCache,
+    get_vector_file_cache,
+    reset_vector_file_cache,
+)
+
+
+def _compute(body: bytes, calls: list[bytes]):
+    def _inner() -> bytes:
+        calls.append(body)
+        return body
+
+    return _inner
+
+
+def _boom() -> bytes:
+    raise RuntimeError("compute failed")
+
+
+def test_vector_cache_serves_fresh_from_memory_then_disk(tmp_path: Path) -> None:
+    cache = VectorFileCache(tmp_path, max_bytes=1024, memory_bytes=1024)
+    calls: list[bytes] = []
+
+    body, status = cache.get_or_compute(
+        "ecmwf-wind",
+        "20260101T000000Z",
+        "abc",
+        fresh_ttl_seconds=60,
+        stale_ttl_seconds=3600,
+        compute=_compute(b"payload", calls),
+        now=1000.0,
+    )
+    assert (body, status) == (b"payload", "computed")
+    path = tmp_path / "ecmwf-wind" / "20260101T000000Z" / "abc.bin"
+    assert path.read_bytes() == b"payload"
+    assert not list(path.parent.glob("*.tmp"))
+
+    body, status = cache.get_or_compute(
+        "ecmwf-wind",
+        "20260101T000000Z",
+        "abc",
+        fresh_ttl_seconds=60,
+        stale_ttl_seconds=3600,
+        compute=_boom,
+        now=1030.0,
+    )
+    assert (body, status) == (b"payload", "fresh")
+    assert cache.stats().memory_hits == 1
+
+    # A new process adopts the on-disk entry and serves it from disk.
+    os.utime(path, (1000.0, 1000.0))
+    restarted = VectorFileCache(tmp_path, max_bytes=1024, memory_bytes=1024)
+    body, status = restarted.get_or_compute(
+        "ecmwf-wind",
+        "20260101T000000Z",
+        "abc",
+        fresh_ttl_seconds=60,
+        stale_ttl_seconds=3600,
+        compute=_boom,
+        now=1030.0,
+    )
+    assert (body, status) == (b"payload", "fresh")
+    stats = restarted.stats()
+    assert (stats.disk_hits, stats.entries, stats.current_bytes) == (1, 1, 7)
+    assert calls == [b"payload"]
+
+
+def test_vector_cache_serves_stale_only_when_compute_fails(tmp_path: Path) -> None:
+    cache = VectorFileCache(tmp_path, max_bytes=1024)
+    kwargs = {"fresh_ttl_seconds": 60, "stale_ttl_seconds": 3600}
+    cache.get_or_compute("ns", "run", "k", compute=lambda: b"old", now=0.0, **kwargs)
+
+    body, status = cache.get_or_compute(
+        "ns", "run", "k", compute=_boom, now=120.0, **kwargs
+    )
+    assert (body, status) == (b"old", "stale")
+
+    body, status = cache.get_or_compute(
+        "ns", "run", "k", compute=lambda: b"new", now=121.0, **kwargs
+    )
+    assert (body, status) == (b"new", "computed")
+
+    with pytest.raises(RuntimeError, match="compute failed"):
+        cache.get_or_compute("ns", "run", "k", compute=_boom, now=5000.0, **kwargs)
+
+
+def test_vector_cache_evicts_least_recently_used_within_budget(
+    tmp_path: Path,
+) -> None:
+    cache = VectorFileCache(tmp_path, max_bytes=8, memory_bytes=0)
+    kwargs = {"fresh_ttl_seconds": 60, "stale_ttl_seconds": 60}
+    cache.get_or_compute("ns", "run", "a", compute=lambda: b"aaaa", now=0.0, **kwargs)
+    cache.get_or_compute("ns", "run", "b", compute=lambda: b"bbbb", now=0.0, **kwargs)
+    # Touch "a" so "b" becomes the eviction candidate.
+    cache.get_or_compute("ns", "run", "a", compute=_boom, now=1.0, **kwargs)
+    cache.get_or_compute("ns", "run", "c", compute=lambda: b"cccc", now=2.0, **kwargs)
+
+    run_dir = tmp_path / "ns" / "run"
+    assert sorted(path.name for path in run_dir.iterdir()) == ["a.bin", "c.bin"]
+    stats = cache.stats()
+    assert (stats.evictions, stats.entries, stats.current_bytes) == (1, 2, 8)
+
+    body, status = cache.get_or_compute(
+        "ns", "run", "big", compute=lambda: b"0123456789", now=3.0, **kwargs
+    )
+    assert (body, status) == (b"0123456789", "computed")
+    assert not (run_dir / "big.bin").exists()
+
+
+def test_vector_cache_purges_aged_out_runs(tmp_path: Path) -> None:
+    cache = VectorFileCache(tmp_path, max_bytes=1024, max_runs=2)
+    kwargs = {"fresh_ttl_seconds": 60, "stale_ttl_seconds": 60, "now": 0.0}
+    for run in ("20260101T000000Z", "20260101T120000Z", "20260102T000000Z"):
+        cache.get_or_compute("ns", run, "k", compute=lambda: b"x", **kwargs)
+
+    assert sorted(path.name for path in (tmp_path / "ns").iterdir()) == [
+        "20260101T120000Z",
+        "20260102T000000Z",
+    ]
+    assert cache.stats().entries == 2
+
+    cache.purge_run("ns", "20260102T000000Z")
+    assert not (tmp_path / "ns" / "20260102T000000Z").exists()
+    assert cache.stats().entries == 1
+
+
+def test_vector_cache_does_not_cache_runs_older_than_the_window(
+    tmp_path: Path,
+) -> None:
+    cache = VectorFileCache(tmp_path, max_bytes=1024, max_runs=1)
+    kwargs = {"fresh_ttl_seconds": 60, "stale_ttl_seconds": 60, "now": 0.0}
+    calls: list[bytes] = []
+    for run in ("20260102T000000Z", "20260101T000000Z") * 2:
+        body, _status = cache.get_or_compute(
+            "ns", run, "k", compute=_compute(run.encode(), calls), **kwargs
+        )
+        assert body == run.encode()
+
+    assert calls == [b"20260102T000000Z", b"20260101T000000Z", b"20260101T000000Z"]
+    assert [path.name for path in (tmp_path / "ns").iterdir()] == ["20260102T000000Z"]
+    stats = cache.stats()
+    assert (stats.misses, stats.memory_hits, stats.entries) == (3, 1, 1)
+
+
+def test_vector_cache_cleans_legacy_files_on_startup(tmp_path: Path) -> None:
+    run_dir = tmp_path / "ecmwf-wind" / "20260101T000000Z"
+    run_dir.mkdir(parents=True)
+    for name in ("abc.fresh", "abc.stale", "abc.fresh.tmp"):
+        (run_dir / name).write_bytes(b"legacy")
+
+    cache = VectorFileCache(tmp_path, max_bytes=1024)
+    cache.get_or_compute(
+        "ecmwf-wind",
+        "20260101T000000Z",
+        "abc",
+        fresh_ttl_seconds=60,
+        stale_ttl_seconds=60,
+        compute=lambda: b"body",
+    )
+    assert sorted(path.name for path in run_dir.iterdir()) == ["abc.bin"]
+
+
+def test_get_vector_file_cache_follows_environment(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    reset_vector_file_cache()
+    monkeypatch.setenv("DIGITAL_EARTH_VECTOR_CACHE_DIR", str(tmp_path / "one"))
+    monkeypatch.setenv("DIGITAL_EARTH_VECTOR_CACHE_MAX_BYTES", "2048")
+    first = get_vector_file_cache()
+    assert first is get_vector_file_cache()
+    assert first.root == tmp_path / "one"
+    assert first.max_bytes == 2048
+
+    monkeypatch.setenv("DIGITAL_EARTH_VECTOR_CACHE_DIR", str(tmp_path / "two"))
+    monkeypatch.setenv("DIGITAL_EARTH_VECTOR_CACHE_MAX_BYTES", "not-a-number")
+    second = get_vector_file_cache()
+    assert second.root == tmp_path / "two"
+    assert second.max_bytes == 512 * 1024 * 1024
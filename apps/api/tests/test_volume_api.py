@@ -199,6 +199,56 @@ def test_volume_returns_volume_pack_for_cloud_density_slices(
     assert np.allclose(array[1], values_500)
 
 
+def test_volume_reads_levels_concurrently_in_request_order(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    base_dir = tmp_path / "volume-data"
+    valid_time = "2026-01-01T00:00:00"
+    time_dir = base_dir / DEFAULT_CLOUD_DENSITY_LAYER / "20260101T000000Z"
+    lat = [0.0, 0.1, 0.2]
+    lon = [0.0, 0.1, 0.2]
+    base = np.arange(9, dtype=np.float32).reshape((3, 3))
+    levels = [200, 300, 500, 700, 850, 925]
+    for offset, level in enumerate(levels):
+        _write_cloud_density_slice(
+            time_dir / f"{level}.nc",
+            valid_time=valid_time,
+            level=level,
+            lat=lat,
+            lon=lon,
+            values=base + 100.0 * offset,
+        )
+    _write_cloud_density_slice(
+        time_dir / "1000.nc",
+        valid_time=valid_time,
+        level=1000,
+        lat=[0.0, 0.05, 0.1, 0.15, 0.2],
+        lon=lon,
+        values=np.zeros((5, 3), dtype=np.float32),
+    )
+
+    client = _make_client(monkeypatch, tmp_path, volume_data_dir=base_dir)
+    params = {
+        "bbox": "0,0,0.2,0.2,0,12000",
+        "levels": ",".join(str(level) for level in reversed(levels)),
+        "res": "11132",
+        "valid_time": "2026-01-01T00:00:00Z",
+    }
+    response = client.get("/api/v1/volume", params=params)
+    assert response.status_code == 200
+
+    header, array = decode_volume_pack(response.content)
+    assert header["levels"] == list(reversed(levels))
+    assert array.shape == (len(levels), 3, 3)
+    for index, offset in enumerate(reversed(range(len(levels)))):
+        assert np.allclose(array[index], base + 100.0 * offset)
+
+    mismatched = client.get(
+        "/api/v1/volume", params={**params, "levels": "300,1000,500"}
+    )
+    assert mismatched.status_code == 500
+
+
 def test_volume_caches_volume_pack_payload_in_redis(
     monkeypatch: pytest.MonkeyPatch, tmp_path: Path
 ) -> None:
@@ -247,7 +297,7 @@ def test_volume_caches_volume_pack_payload_in_redis(
     def _unexpected(*args: object, **kwargs: object) -> object:
         raise AssertionError("expected cache hit")
 
-    monkeypatch.setattr(volume_routes, "_read_cloud_density_grid", _unexpected)
+    monkeypatch.setattr(volume_routes, "_read_volume_level", _unexpected)
     cached = client.get("/api/v1/volume", params=params)
     assert cached.status_code == 200
     assert cached.content == response.content
@@ -288,7 +338,7 @@ def test_volume_cache_key_is_canonicalized(
     def _unexpected(*args: object, **kwargs: object) -> object:
         raise AssertionError("expected cache hit for canonicalized params")
 
-    monkeypatch.setattr(volume_routes, "_read_cloud_density_grid", _unexpected)
+    monkeypatch.setattr(volume_routes, "_read_volume_level", _unexpected)
     canonical = {
         "bbox": "0,0,0.2,0.2,0,12000",
         "levels": "300",
@@ -767,9 +817,24 @@ def test_read_cloud_density_coords_raises_when_coords_non_monotonic(
     assert excinfo.value.detail == "Slice coordinates are not monotonic"
 
 
-def test_read_cloud_density_grid_subsets_using_lat_lon_bounds(tmp_path: Path) -> None:
+def _crop_for(
+    lat: list[float],
+    lon: list[float],
+    *,
+    lat_bounds: tuple[float, float],
+    lon_bounds: tuple[float, float],
+) -> volume_routes._SliceCrop:
+    return volume_routes._slice_crop(
+        np.asarray(lat, dtype=np.float64),
+        np.asarray(lon, dtype=np.float64),
+        lat_bounds=lat_bounds,
+        lon_bounds=lon_bounds,
+    )
+
+
+def test_read_volume_level_subsets_using_lat_lon_bounds(tmp_path: Path) -> None:
     path = tmp_path / "subset.nc"
-    lat = [0.0, 1.0, 2.0, 3.0, 4.0]
+    lat = [4.0, 3.0, 2.0, 1.0, 0.0]
     lon = [10.0, 11.0, 12.0, 13.0, 14.0]
     values = np.arange(len(lat) * len(lon), dtype=np.float32).reshape(
         (len(lat), len(lon))
@@ -783,15 +848,14 @@ def test_read_cloud_density_grid_subsets_using_lat_lon_bounds(tmp_path: Path) ->
         values=values,
     )
 
-    out_lat, out_lon, out_values = volume_routes._read_cloud_density_grid(
-        path, lat_bounds=(2.8, 1.2), lon_bounds=(12.8, 11.2)
-    )
-    assert np.array_equal(out_lat, np.array([1.0, 2.0, 3.0]))
-    assert np.array_equal(out_lon, np.array([11.0, 12.0, 13.0]))
-    assert np.array_equal(out_values, values[1:4, 1:4])
+    crop = _crop_for(lat, lon, lat_bounds=(1.2, 2.8), lon_bounds=(11.2, 12.8))
+    out_values = volume_routes._read_volume_level(path, crop=crop)
+    assert np.array_equal(crop.lat, np.array([1.0, 2.0, 3.0]))
+    assert np.array_equal(crop.lon, np.array([11.0, 12.0, 13.0]))
+    assert np.array_equal(out_values, values[3:0:-1, 1:4])
 
 
-def test_read_cloud_density_grid_raises_when_missing_cloud_density_var(
+def test_read_volume_level_raises_when_missing_cloud_density_var(
     tmp_path: Path,
 ) -> None:
     path = tmp_path / "grid-missing-var.nc"
@@ -801,13 +865,14 @@ def test_read_cloud_density_grid_raises_when_missing_cloud_density_var(
     )
     ds.to_netcdf(path, engine="h5netcdf")
 
+    crop = _crop_for([0.0, 1.0], [0.0, 1.0], lat_bounds=(0, 1), lon_bounds=(0, 1))
     with pytest.raises(HTTPException) as excinfo:
-        volume_routes._read_cloud_density_grid(path)
+        volume_routes._read_volume_level(path, crop=crop)
     assert excinfo.value.status_code == 500
     assert excinfo.value.detail == "Slice missing cloud_density"
 
 
-def test_read_cloud_density_grid_raises_when_dims_not_lat_lon(tmp_path: Path) -> None:
+def test_read_volume_level_raises_when_dims_not_lat_lon(tmp_path: Path) -> None:
     path = tmp_path / "grid-wrong-dims.nc"
     ds = xr.Dataset(
         {
@@ -824,57 +889,34 @@ def test_read_cloud_density_grid_raises_when_dims_not_lat_lon(tmp_path: Path) ->
     )
     ds.to_netcdf(path, engine="h5netcdf")
 
+    crop = _crop_for([0.0, 1.0], [0.0, 1.0], lat_bounds=(0, 1), lon_bounds=(0, 1))
     with pytest.raises(HTTPException) as excinfo:
-        volume_routes._read_cloud_density_grid(path)
+        volume_routes._read_volume_level(path, crop=crop)
     assert excinfo.value.status_code == 500
     assert excinfo.value.detail == "Slice must have lat/lon dimensions"
 
 
-def test_read_cloud_density_grid_raises_when_non_monotonic_and_bounds_used(
+def test_read_volume_level_raises_when_grid_differs_from_reference(
     tmp_path: Path,
 ) -> None:
-    path = tmp_path / "grid-non-monotonic-bounds.nc"
-    lat = [0.0, 0.2, 0.1]
-    lon = [0.0, 0.1, 0.2]
-    values = np.ones((len(lat), len(lon)), dtype=np.float32)
+    path = tmp_path / "grid-other-shape.nc"
     _write_cloud_density_slice(
         path,
         valid_time="2026-01-01T00:00:00",
         level=300,
-        lat=lat,
-        lon=lon,
-        values=values,
+        lat=[0.0, 1.0, 2.0],
+        lon=[0.0, 1.0],
+        values=np.zeros((3, 2), dtype=np.float32),
     )
 
+    crop = _crop_for([0.0, 1.0], [0.0, 1.0], lat_bounds=(0, 1), lon_bounds=(0, 1))
     with pytest.raises(HTTPException) as excinfo:
-        volume_routes._read_cloud_density_grid(path, lat_bounds=(0.0, 1.0))
+        volume_routes._read_volume_level(path, crop=crop)
     assert excinfo.value.status_code == 500
-    assert excinfo.value.detail == "Slice coordinates are not monotonic"
+    assert excinfo.value.detail == "Slice grids do not match"
 
 
-def test_read_cloud_density_grid_raises_when_non_monotonic_without_bounds(
-    tmp_path: Path,
-) -> None:
-    path = tmp_path / "grid-non-monotonic.nc"
-    lat = [0.0, 0.2, 0.1]
-    lon = [0.0, 0.1, 0.2]
-    values = np.ones((len(lat), len(lon)), dtype=np.float32)
-    _write_cloud_density_slice(
-        path,
-        valid_time="2026-01-01T00:00:00",
-        level=300,
-        lat=lat,
-        lon=lon,
-        values=values,
-    )
-
-    with pytest.raises(HTTPException) as excinfo:
-        volume_routes._read_cloud_density_grid(path)
-    assert excinfo.value.status_code == 500
-    assert excinfo.value.detail == "Slice coordinates are not monotonic"
-
-
-def test_read_cloud_density_grid_raises_when_data_shape_is_invalid(
+def test_read_volume_level_raises_when_data_shape_is_invalid(
     tmp_path: Path,
 ) -> None:
     path = tmp_path / "grid-invalid-shape.nc"
@@ -884,46 +926,24 @@ def test_read_cloud_density_grid_raises_when_data_shape_is_invalid(
     )
     ds.to_netcdf(path, engine="h5netcdf")
 
+    crop = _crop_for(
+        [0.0, 1.0, 2.0], [10.0, 11.0], lat_bounds=(0, 2), lon_bounds=(10, 11)
+    )
     with pytest.raises(HTTPException) as excinfo:
-        volume_routes._read_cloud_density_grid(path)
+        volume_routes._read_volume_level(path, crop=crop)
     assert excinfo.value.status_code == 500
     assert excinfo.value.detail == "Slice has invalid data shape"
 
 
-def test_read_cloud_density_grid_returns_empty_lat_selection_for_empty_coord(
-    tmp_path: Path,
-) -> None:
-    path = tmp_path / "grid-empty-lat.nc"
-    ds = xr.Dataset(
-        {"cloud_density": (("lat", "lon"), np.empty((0, 2), dtype=np.float32))},
-        coords={"lat": np.array([], dtype=np.float64), "lon": [0.0, 1.0]},
-    )
-    ds.to_netcdf(path, engine="h5netcdf")
-
-    out_lat, out_lon, out_values = volume_routes._read_cloud_density_grid(
-        path, lat_bounds=(0.0, 1.0)
-    )
-    assert out_lat.size == 0
-    assert np.array_equal(out_lon, np.array([0.0, 1.0]))
-    assert out_values.shape == (0, 2)
-
-
-def test_read_cloud_density_grid_returns_empty_lon_selection_for_empty_coord(
-    tmp_path: Path,
-) -> None:
-    path = tmp_path / "grid-empty-lon.nc"
-    ds = xr.Dataset(
-        {"cloud_density": (("lat", "lon"), np.empty((2, 0), dtype=np.float32))},
-        coords={"lat": [0.0, 1.0], "lon": np.array([], dtype=np.float64)},
-    )
-    ds.to_netcdf(path, engine="h5netcdf")
-
-    out_lat, out_lon, out_values = volume_routes._read_cloud_density_grid(
-        path, lon_bounds=(0.0, 1.0)
-    )
-    assert np.array_equal(out_lat, np.array([0.0, 1.0]))
-    assert out_lon.size == 0
-    assert out_values.shape == (2, 0)
+@pytest.mark.parametrize(
+    ("lat", "lon"),
+    [([], [0.0, 1.0]), ([0.0, 1.0], [])],
+)
+def test_slice_crop_rejects_empty_selection(lat: list[float], lon: list[float]) -> None:
+    with pytest.raises(HTTPException) as excinfo:
+        _crop_for(lat, lon, lat_bounds=(0.0, 1.0), lon_bounds=(0.0, 1.0))
+    assert excinfo.value.status_code == 404
+    assert excinfo.value.detail == "bbox outside dataset"
 
 
 @pytest.mark.parametrize(
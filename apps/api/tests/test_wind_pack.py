@@ -0,0 +1,162 @@
+from __future__ import annotations
+
+import struct
+
+import numpy as np
+import pytest
+
+
+def test_vector_pack_roundtrip_quantizes_and_masks_invalid_cells() -> None:
+    from wind_pack import decode_wind_vector_pack, encode_wind_vector_pack
+
+    lat = np.array([10.0, 10.5, 11.0], dtype=np.float64)
+    lon = np.array([100.0, 100.25, 100.5, 100.75], dtype=np.float64)
+    u = np.arange(12, dtype=np.float64).reshape(3, 4) * 1.234
+    v = -u
+    u[1, 2] = np.nan
+    v[2, 0] = np.inf
+
+    payload = encode_wind_vector_pack(lat=lat, lon=lon, u=u, v=v)
+    assert payload[:4] == b"WNDV"
+
+    header, decoded = decode_wind_vector_pack(payload)
+    assert header["shape"] == [3, 4]
+    assert header["dtype"] == "int16"
+    assert header["compression"] == "zstd"
+    assert header["lat"] == {"start": 10.0, "step": 0.5, "count": 3}
+    assert header["lon"] == {"start": 100.0, "step": 0.25, "count": 4}
+
+    np.testing.assert_allclose(decoded["lat"], lat)
+    np.testing.assert_allclose(decoded["lon"], lon)
+
+    expected_valid = np.isfinite(u) & np.isfinite(v)
+    np.testing.assert_array_equal(decoded["valid"], expected_valid)
+    assert np.isnan(decoded["u"][1, 2]) and np.isnan(decoded["v"][1, 2])
+    assert np.isnan(decoded["u"][2, 0]) and np.isnan(decoded["v"][2, 0])
+    np.testing.assert_allclose(
+        decoded["u"][expected_valid], u[expected_valid], atol=0.005
+    )
+    np.testing.assert_allclose(
+        decoded["v"][expected_valid], v[expected_valid], atol=0.005
+    )
+
+
+def test_vector_pack_lists_irregular_axes_and_clips_out_of_range() -> None:
+    from wind_pack import decode_wind_vector_pack, encode_wind_vector_pack
+
+    lat = np.array([0.0, 1.0, 3.0], dtype=np.float64)
+    lon = np.array([5.0], dtype=np.float64)
+    u = np.array([[1000.0], [-1000.0], [1.0]], dtype=np.float64)
+    v = np.zeros((3, 1), dtype=np.float64)
+
+    header, decoded = decode_wind_vector_pack(
+        encode_wind_vector_pack(lat=lat, lon=lon, u=u, v=v)
+    )
+    assert header["lat"] == {"values": [0.0, 1.0, 3.0]}
+    assert header["lon"] == {"values": [5.0]}
+    np.testing.assert_allclose(decoded["lat"], lat)
+    assert decoded["u"][0, 0] == pytest.approx(327.67)
+    assert decoded["u"][1, 0] == pytest.approx(-327.68)
+    assert decoded["u"][2, 0] == pytest.approx(1.0)
+
+
+def test_vector_pack_handles_empty_grid_and_rejects_bad_shapes() -> None:
+    from wind_pack import decode_wind_vector_pack, encode_wind_vector_pack
+
+    empty = np.empty((0, 0), dtype=np.float64)
+    header, decoded = decode_wind_vector_pack(
+        encode_wind_vector_pack(lat=[], lon=[], u=empty, v=empty)
+    )
+    assert header["shape"] == [0, 0]
+    assert decoded["u"].shape == (0, 0)
+
+    with pytest.raises(ValueError, match="shape"):
+        encode_wind_vector_pack(
+            lat=np.zeros(2), lon=np.zeros(3), u=np.zeros((3, 2)), v=np.zeros((3, 2))
+        )
+
+
+def test_vector_pack_is_much_smaller_than_json() -> None:
+    import json
+
+    from wind_pack import encode_wind_vector_pack
+
+    lat = np.linspace(-60.0, 60.0, 121)
+    lon = np.linspace(60.0, 180.0, 241)
+    rng = np.random.default_rng(0)
+    u = rng.normal(0.0, 8.0, size=(lat.size, lon.size))
+    v = rng.normal(0.0, 8.0, size=(lat.size, lon.size))
+
+    lon_grid, lat_grid = np.meshgrid(lon, lat)
+    as_json = json.dumps(
+        {
+            "u": u.ravel().tolist(),
+            "v": v.ravel().tolist(),
+            "lat": lat_grid.ravel().tolist(),
+            "lon": lon_grid.ravel().tolist(),
+        }
+    ).encode("utf-8")
+    packed = encode_wind_vector_pack(lat=lat, lon=lon, u=u, v=v)
+    assert len(packed) * 10 < len(as_json)
+
+
+def test_streamline_pack_roundtrip_delta_encodes_lines() -> None:
+    from wind_pack import decode_streamline_pack, encode_streamline_pack
+
+    lines = [
+        ([10.0, 10.1, 10.25], [100.0, 100.2, 100.45]),
+        ([-5.5, -5.4], [179.9, 180.0]),
+        ([0.000004], [0.0]),
+    ]
+    payload = encode_streamline_pack(lines)
+    assert payload[:4] == b"WNDS"
+
+    header, decoded = decode_streamline_pack(payload)
+    assert header["count"] == 3
+    assert header["points"] == 6
+    assert header["encoding"] == "delta"
+    assert len(decoded) == 3
+    for (lat, lon), (decoded_lat, decoded_lon) in zip(lines, decoded, strict=True):
+        np.testing.assert_allclose(decoded_lat, lat, atol=1e-5)
+        np.testing.assert_allclose(decoded_lon, lon, atol=1e-5)
+
+
+def test_streamline_pack_handles_empty_and_rejects_ragged_lines() -> None:
+    from wind_pack import decode_streamline_pack, encode_streamline_pack
+
+    header, decoded = decode_streamline_pack(encode_streamline_pack([]))
+    assert header["count"] == 0
+    assert decoded == []
+
+    with pytest.raises(ValueError, match="as many lat as lon"):
+        encode_streamline_pack([([1.0, 2.0], [3.0])])
+
+
+def test_decoders_reject_corrupt_payloads() -> None:
+    from wind_pack import (
+        decode_streamline_pack,
+        decode_wind_vector_pack,
+        encode_streamline_pack,
+        encode_wind_vector_pack,
+    )
+
+    vector_payload = encode_wind_vector_pack(
+        lat=[0.0], lon=[0.0], u=np.zeros((1, 1)), v=np.zeros((1, 1))
+    )
+    streamline_payload = encode_streamline_pack([([0.0, 1.0], [0.0, 1.0])])
+
+    with pytest.raises(ValueError, match="too small"):
+        decode_wind_vector_pack(b"WND")
+    with pytest.raises(ValueError, match="magic"):
+        decode_wind_vector_pack(streamline_payload)
+    with pytest.raises(ValueError, match="magic"):
+        decode_streamline_pack(vector_payload)
+    with pytest.raises(ValueError, match="header length"):
+        decode_wind_vector_pack(b"WNDV" + struct.pack("<I", 0))
+    with pytest.raises(ValueError, match="truncated"):
+        decode_wind_vector_pack(b"WNDV" + struct.pack("<I", 64) + b"{}")
+    with pytest.raises(ValueError, match="header JSON"):
+        decode_wind_vector_pack(b"WNDV" + struct.pack("<I", 2) + b"[]")
+    (header_len,) = struct.unpack("<I", vector_payload[4:8])
+    with pytest.raises(ValueError, match="zstd"):
+        decode_wind_vector_pack(vector_payload[: 8 + header_len] + b"not zstd")
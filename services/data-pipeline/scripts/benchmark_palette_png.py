@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import time
+from io import BytesIO
+from pathlib import Path
+
+import numpy as np
+from PIL import Image
+
+PIPELINE_SRC = Path(__file__).resolve().parents[1] / "src"
+REPO_ROOT = Path(__file__).resolve().parents[3]
+CONFIG_SRC = REPO_ROOT / "packages" / "config" / "src"
+SHARED_SRC = REPO_ROOT / "packages" / "shared" / "src"
+
+sys.path.insert(0, str(SHARED_SRC))
+sys.path.insert(0, str(CONFIG_SRC))
+sys.path.insert(0, str(PIPELINE_SRC))
+
+from tiling.cldas_tiles import CLDASTileGenerator  # noqa: E402
+from tiling.palette import save_png  # noqa: E402
+
+
+def _synthetic_grid(rows: int, cols: int) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    lat = np.linspace(-90.0, 90.0, rows, dtype=np.float64)
+    lon = np.linspace(-180.0, 180.0, cols, dtype=np.float64)
+    lat2d, lon2d = np.meshgrid(np.deg2rad(lat), np.deg2rad(lon), indexing="ij")
+    grid = 10.0 + 25.0 * np.cos(lat2d) + 5.0 * np.sin(3.0 * lon2d) * np.cos(2.0 * lat2d)
+    grid[(lat2d > 1.2) & (lon2d < 0.0)] = np.nan
+    return lat, lon, grid.astype(np.float32)
+
+
+def _encode_all(images: list[Image.Image], *, optimize_rgba: bool) -> tuple[int, float]:
+    total = 0
+    started = time.perf_counter()
+    for image in images:
+        buf = BytesIO()
+        if optimize_rgba:
+            image.save(buf, format="PNG", optimize=True)
+        else:
+            save_png(image, buf)
+        total += len(buf.getvalue())
+    return total, time.perf_counter() - started
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Compare RGBA and 8-bit paletted PNG tile size and encode time."
+    )
+    parser.add_argument("--zoom", type=int, default=3, help="Zoom level to render")
+    parser.add_argument("--tile-size", type=int, default=256, help="Tile size in px")
+    parser.add_argument("--grid-rows", type=int, default=721)
+    parser.add_argument("--grid-cols", type=int, default=1441)
+    args = parser.parse_args()
+
+    lat, lon, grid = _synthetic_grid(args.grid_rows, args.grid_cols)
+    generator = CLDASTileGenerator.from_grid(lat, lon, grid, variable="TMP")
+    lut = generator.palette_lut()
+
+    rgba_images: list[Image.Image] = []
+    palette_images: list[Image.Image] = []
+    for x in range(2 ** (args.zoom + 1)):
+        for y in range(2**args.zoom):
+            pixels = generator._render_tile_array(
+                zoom=args.zoom,
+                x=x,
+                y=y,
+                tile_size=args.tile_size,
+                lat=lat,
+                lon=lon,
+                grid=grid,
+            )
+            rgba_images.append(Image.fromarray(pixels))
+            indices = generator._render_tile_array(
+                zoom=args.zoom,
+                x=x,
+                y=y,
+                tile_size=args.tile_size,
+                lat=lat,
+                lon=lon,
+                grid=grid,
+                palette=lut,
+            )
+            palette_images.append(lut.image(indices))
+
+    rgba_bytes, rgba_seconds = _encode_all(rgba_images, optimize_rgba=True)
+    palette_bytes, palette_seconds = _encode_all(palette_images, optimize_rgba=False)
+
+    summary = {
+        "tiles": len(rgba_images),
+        "tile_size": args.tile_size,
+        "rgba": {"bytes": rgba_bytes, "encode_seconds": round(rgba_seconds, 4)},
+        "palette": {
+            "bytes": palette_bytes,
+            "encode_seconds": round(palette_seconds, 4),
+            "levels": lut.levels,
+        },
+        "size_ratio": round(palette_bytes / max(1, rgba_bytes), 4),
+        "encode_speedup": round(rgba_seconds / max(palette_seconds, 1e-9), 2),
+    }
+    print(json.dumps(summary, ensure_ascii=False, indent=2, sort_keys=True))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
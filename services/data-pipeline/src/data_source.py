@@ -6,7 +6,7 @@ from typing import Optional
 
 from digital_earth_config.local_data import LocalDataPaths, get_local_data_paths
 
-from local.cache import get_local_file_index
+from local.cache import DEFAULT_CACHE_PATH, LocalFileIndexMemo
 from local.cldas_loader import (
     CldasGridSummary,
     load_cldas_dataset,
@@ -14,6 +14,7 @@ from local.cldas_loader import (
 )
 from local.ecmwf_loader import read_ecmwf_grib_bytes
 from local.indexer import LocalDataKind, LocalFileIndex, LocalFileIndexItem
+from local.lookup import LocalFileIndexLookup
 from local.town_forecast import TownForecastFile, parse_town_forecast_file
 
 
@@ -26,6 +27,8 @@ class DataNotFoundError(FileNotFoundError, DataSourceError):
 
 
 class DataSource(ABC):
+    _index_lookup: Optional[LocalFileIndexLookup] = None
+
     @abstractmethod
     def list_files(
         self,
@@ -38,11 +41,20 @@ class DataSource(ABC):
     def open_path(self, relative_path: str) -> Path:
         raise NotImplementedError
 
+    def _lookup_for(self, index: LocalFileIndex) -> LocalFileIndexLookup:
+        lookup = self._index_lookup
+        if lookup is None or lookup.index is not index:
+            lookup = LocalFileIndexLookup(index)
+            self._index_lookup = lookup
+        return lookup
+
+    def index_lookup(self) -> LocalFileIndexLookup:
+        return self._lookup_for(self.list_files())
+
     def get_index_item(self, relative_path: str) -> LocalFileIndexItem:
-        index = self.list_files()
-        for item in index.items:
-            if item.relative_path == relative_path:
-                return item
+        item = self.index_lookup().get(relative_path)
+        if item is not None:
+            return item
         raise DataNotFoundError(f"Local data file not found in index: {relative_path}")
 
     def read_bytes(self, relative_path: str) -> bytes:
@@ -76,7 +88,9 @@ class LocalDataSource(DataSource):
         cache_path: Optional[Path] = None,
     ) -> None:
         self._paths = paths or get_local_data_paths()
-        self._cache_path = cache_path
+        self._index_memo = LocalFileIndexMemo(
+            self._paths, cache_path=cache_path or DEFAULT_CACHE_PATH
+        )
 
     @property
     def paths(self) -> LocalDataPaths:
@@ -87,14 +101,10 @@ class LocalDataSource(DataSource):
         *,
         kinds: Optional[set[LocalDataKind]] = None,
     ) -> LocalFileIndex:
-        index = get_local_file_index(
-            self._paths,
-            cache_path=self._cache_path or Path(".cache/local-data-index.json"),
-        )
+        index = self._index_memo.get()
         if kinds is None:
             return index
-        items = [item for item in index.items if item.kind in kinds]
-        return index.model_copy(update={"items": items})
+        return self._lookup_for(index).filtered(kinds)
 
     def open_path(self, relative_path: str) -> Path:
         if relative_path.strip() == "":
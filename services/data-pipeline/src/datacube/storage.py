@@ -157,19 +157,27 @@ def open_datacube(
     *,
     format: Optional[DataCubeFormat] = None,
     engine: Optional[str] = None,
+    cache: bool = True,
 ) -> xr.Dataset:
+    """Open a DataCube lazily.
+
+    Pass `cache=False` for long-lived handles so that reading a variable does
+    not keep its decoded values in memory on the dataset.
+    """
     p = Path(path)
     fmt = format or _infer_format(p)
 
     if fmt == "zarr":
         try:
-            return xr.open_zarr(p, consolidated=True)
+            return xr.open_zarr(p, consolidated=True, cache=cache)
         except Exception as exc:  # noqa: BLE001
             raise DataCubeStorageError(f"Failed to open Zarr DataCube: {p}") from exc
 
     if fmt == "netcdf":
         try:
-            return xr.open_dataset(p, engine=engine or "h5netcdf", decode_cf=True)
+            return xr.open_dataset(
+                p, engine=engine or "h5netcdf", decode_cf=True, cache=cache
+            )
         except Exception as exc:  # noqa: BLE001
             raise DataCubeStorageError(f"Failed to open NetCDF DataCube: {p}") from exc
 
@@ -2,12 +2,14 @@ from __future__ import annotations
 
 from .cache import get_local_file_index
 from .indexer import LocalFileIndex, LocalFileIndexItem
+from .lookup import LocalFileIndexLookup
 from .scanner import DiscoveredFile, discover_local_files
 
 __all__ = [
     "DiscoveredFile",
     "LocalFileIndex",
     "LocalFileIndexItem",
+    "LocalFileIndexLookup",
     "discover_local_files",
     "get_local_file_index",
 ]
@@ -93,3 +93,40 @@ def get_local_file_index(
     index = build_local_file_index(discovered, root_dir=paths.root_dir)
     save_local_file_index(cache_path, index)
     return index
+
+
+def index_cache_stamp(path: Path) -> Optional[tuple[int, int]]:
+    """(mtime_ns, size) of the index cache file, or None if it is missing."""
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return int(stat.st_mtime_ns), int(stat.st_size)
+
+
+class LocalFileIndexMemo:
+    """Keeps the parsed index in memory between lookups.
+
+    `get_local_file_index` re-reads the cache file and stats every indexed
+    file; the memo only repeats that when the cache file itself changes (by
+    mtime/size) or the index outlives `index_cache_ttl_seconds`.
+    """
+
+    def __init__(self, paths: LocalDataPaths, *, cache_path: Path) -> None:
+        self._paths = paths
+        self._cache_path = cache_path
+        self._memo: Optional[tuple[tuple[int, int], LocalFileIndex]] = None
+
+    def get(self) -> LocalFileIndex:
+        memo = self._memo
+        if memo is not None:
+            stamp, index = memo
+            if stamp == index_cache_stamp(self._cache_path) and _is_cache_fresh(
+                index, ttl_seconds=self._paths.index_cache_ttl_seconds
+            ):
+                return index
+
+        index = get_local_file_index(self._paths, cache_path=self._cache_path)
+        stamp = index_cache_stamp(self._cache_path)
+        self._memo = None if stamp is None else (stamp, index)
+        return index
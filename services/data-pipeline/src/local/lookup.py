@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+from bisect import bisect_left, bisect_right
+from typing import Iterable, Optional
+
+from .indexer import LocalDataKind, LocalFileIndex, LocalFileIndexItem
+
+LookupKey = tuple[str, Optional[str], Optional[str]]
+
+
+def item_timestamp(item: LocalFileIndexItem) -> Optional[str]:
+    raw = item.meta.get("timestamp") if isinstance(item.meta, dict) else None
+    if isinstance(raw, str) and raw.strip():
+        return raw
+    return item.time
+
+
+class LocalFileIndexLookup:
+    """Hashed secondary indexes over a `LocalFileIndex` snapshot.
+
+    Built once per index snapshot so request handlers can resolve items in
+    O(1) instead of scanning every indexed file. When several items share a
+    key, the first one in index order wins (matching the previous linear
+    scans).
+    """
+
+    def __init__(self, index: LocalFileIndex) -> None:
+        self._index = index
+        self._by_relative_path: dict[str, LocalFileIndexItem] = {}
+        self._by_key: dict[LookupKey, LocalFileIndexItem] = {}
+        times: dict[tuple[str, Optional[str]], set[str]] = {}
+
+        for item in index.items:
+            self._by_relative_path.setdefault(item.relative_path, item)
+            timestamp = item_timestamp(item)
+            self._by_key.setdefault((item.kind, item.variable, timestamp), item)
+            if timestamp is not None:
+                times.setdefault((item.kind, item.variable), set()).add(timestamp)
+                times.setdefault((item.kind, None), set()).add(timestamp)
+
+        self._sorted_times = {key: sorted(values) for key, values in times.items()}
+        self._filtered: dict[frozenset[str], LocalFileIndex] = {}
+
+    @property
+    def index(self) -> LocalFileIndex:
+        return self._index
+
+    def get(self, relative_path: str) -> Optional[LocalFileIndexItem]:
+        return self._by_relative_path.get(relative_path)
+
+    def find(
+        self, *, kind: LocalDataKind, variable: Optional[str], timestamp: str
+    ) -> Optional[LocalFileIndexItem]:
+        return self._by_key.get((kind, variable, timestamp))
+
+    def times(
+        self,
+        *,
+        kind: LocalDataKind,
+        variable: Optional[str] = None,
+        start: Optional[str] = None,
+        end: Optional[str] = None,
+    ) -> list[str]:
+        values = self._sorted_times.get((kind, variable), [])
+        lo = 0 if start is None else bisect_left(values, start)
+        hi = len(values) if end is None else bisect_right(values, end)
+        return values[lo:hi]
+
+    def filtered(self, kinds: Iterable[LocalDataKind]) -> LocalFileIndex:
+        key = frozenset(kinds)
+        cached = self._filtered.get(key)
+        if cached is not None:
+            return cached
+
+        items = [item for item in self._index.items if item.kind in key]
+        view = self._index.model_copy(update={"items": items})
+        self._filtered[key] = view
+        return view
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import argparse
 import json
+import time
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Final, Iterable, Sequence
@@ -12,6 +13,12 @@ import xarray as xr
 from datacube.core import DataCube
 from datacube.decoder import decode_grib
 from tiles.wind_speed_tiles import DEFAULT_WIND_SPEED_OPACITY, WindSpeedTileGenerator
+from tiles.wind_texture import WindTextureError, WindTextureGenerator
+from tiles.wind_vector_tiles import (
+    DEFAULT_WIND_VECTOR_POINTS_PER_TILE,
+    WindVectorTileGenerator,
+    WindVectorTilingError,
+)
 from tiling.bias_tiles import (
     DEFAULT_BIAS_FORECAST_VARIABLE,
     DEFAULT_BIAS_LAYER,
@@ -23,6 +30,7 @@ from tiling.precip_amount_tiles import (
     PrecipAmountTileGenerator,
     PrecipAmountTilingError,
 )
+from tiling.precompress import precompress_directory
 from tiling.tcc_tiles import TccTileGenerator, TccTilingError
 from tiling.temperature_tiles import TemperatureTileGenerator, TemperatureTilingError
 
@@ -111,6 +119,10 @@ def generate_ecmwf_raster_tiles(
     precipitation: bool = True,
     wind_speed: bool = False,
     wind_speed_opacity: float = DEFAULT_WIND_SPEED_OPACITY,
+    wind_vectors: bool = False,
+    wind_vector_points: int = DEFAULT_WIND_VECTOR_POINTS_PER_TILE,
+    wind_texture: bool = False,
+    run_time: object | None = None,
     min_zoom: int | None = None,
     max_zoom: int | None = None,
     tile_size: int | None = None,
@@ -223,6 +235,53 @@ def generate_ecmwf_raster_tiles(
                 )
             )
 
+    if wind_vectors:
+        if run_time is None:
+            raise ValueError("run_time is required for wind vector tiles")
+        generator = WindVectorTileGenerator(cube, points_per_tile=wind_vector_points)
+        try:
+            results.append(
+                generator.generate(
+                    output_dir,
+                    run_time=run_time,
+                    valid_time=resolved_valid_time,
+                    level=level,
+                    min_zoom=min_zoom,
+                    max_zoom=max_zoom,
+                )
+            )
+        except WindVectorTilingError as exc:
+            skipped.append(
+                SkippedTileGenerationResult(
+                    layer=generator.layer,
+                    variable=generator.variable,
+                    error=str(exc),
+                )
+            )
+
+    if wind_texture:
+        if run_time is None:
+            raise ValueError("run_time is required for wind textures")
+        generator = WindTextureGenerator(cube)
+        try:
+            results.append(
+                generator.generate(
+                    output_dir,
+                    run_time=run_time,
+                    valid_time=resolved_valid_time,
+                    level=level,
+                    formats=resolved_formats,
+                )
+            )
+        except WindTextureError as exc:
+            skipped.append(
+                SkippedTileGenerationResult(
+                    layer=generator.layer,
+                    variable=generator.variable,
+                    error=str(exc),
+                )
+            )
+
     if not results and not skipped:
         raise ValueError("No tile layers selected")
     return [*results, *skipped]
@@ -232,7 +291,8 @@ def _build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(
         prog="python -m tiles",
         description=(
-            "Generate ECMWF raster tiles (temperature/cloud/precipitation, optional wind speed) "
+            "Generate ECMWF raster tiles (temperature/cloud/precipitation, optional wind speed), "
+            "optional wind vector tiles and wind textures "
             "and optional observation-vs-forecast bias tiles."
         ),
     )
@@ -291,6 +351,36 @@ def _build_parser() -> argparse.ArgumentParser:
         default=DEFAULT_WIND_SPEED_OPACITY,
         help="Wind speed tile opacity in [0, 1] (default: 0.35)",
     )
+    parser.add_argument(
+        "--wind-vectors",
+        action=argparse.BooleanOptionalAction,
+        default=False,
+        help="Generate u/v wind vector JSON tiles served by the vector API (default: disabled)",
+    )
+    parser.add_argument(
+        "--wind-vector-points",
+        type=int,
+        default=DEFAULT_WIND_VECTOR_POINTS_PER_TILE,
+        help=f"Wind vector samples per tile edge (default: {DEFAULT_WIND_VECTOR_POINTS_PER_TILE})",
+    )
+    parser.add_argument(
+        "--wind-texture",
+        action=argparse.BooleanOptionalAction,
+        default=False,
+        help="Generate a u/v wind texture (RG channels + JSON metadata) for client-side particles (default: disabled)",
+    )
+    parser.add_argument(
+        "--run-time",
+        default=None,
+        help="ECMWF run time (ISO8601 or YYYYMMDDTHHMMSSZ); required with --wind-vectors/--wind-texture",
+    )
+
+    parser.add_argument(
+        "--precompress",
+        action=argparse.BooleanOptionalAction,
+        default=True,
+        help="Write .gz/.br/.zst sidecars for compressible outputs such as legend.json (default: enabled)",
+    )
 
     parser.add_argument(
         "--bias",
@@ -341,6 +431,10 @@ def main(argv: Iterable[str] | None = None) -> int:
     parser = _build_parser()
     args = parser.parse_args(list(argv) if argv is not None else None)
 
+    # Only files written from here on are precompressed. Floored to the second
+    # so filesystems with coarse mtimes still count this run's files.
+    run_started_ns = time.time_ns() // 1_000_000_000 * 1_000_000_000
+
     cube = _load_datacube(Path(args.datacube))
     try:
         formats = _parse_formats(tuple(args.formats)) or DEFAULT_TILE_FORMATS
@@ -356,6 +450,8 @@ def main(argv: Iterable[str] | None = None) -> int:
                 bool(args.cloud),
                 bool(args.precipitation),
                 bool(args.wind_speed),
+                bool(args.wind_vectors),
+                bool(args.wind_texture),
             )
         )
         if wants_ecmwf_layers:
@@ -370,6 +466,10 @@ def main(argv: Iterable[str] | None = None) -> int:
                     precipitation=bool(args.precipitation),
                     wind_speed=bool(args.wind_speed),
                     wind_speed_opacity=float(args.wind_speed_opacity),
+                    wind_vectors=bool(args.wind_vectors),
+                    wind_vector_points=int(args.wind_vector_points),
+                    wind_texture=bool(args.wind_texture),
+                    run_time=args.run_time,
                     min_zoom=int(args.min_zoom) if args.min_zoom is not None else None,
                     max_zoom=int(args.max_zoom) if args.max_zoom is not None else None,
                     tile_size=int(args.tile_size)
@@ -422,6 +522,11 @@ def main(argv: Iterable[str] | None = None) -> int:
 
         if not results:
             raise ValueError("No tile layers selected")
+
+        if bool(args.precompress):
+            precompress_directory(
+                Path(args.output_dir), modified_since_ns=run_started_ns
+            )
     finally:
         cube.dataset.close()
 
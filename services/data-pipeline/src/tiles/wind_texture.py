@@ -0,0 +1,283 @@
+from __future__ import annotations
+
+import json
+import math
+import os
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Final, Sequence
+
+import numpy as np
+import xarray as xr
+from PIL import Image
+
+from datacube.core import DataCube
+from tiles.wind_vector_tiles import WindVectorTilingError, _extract_wind_grids
+from tiling.temperature_tiles import (
+    _ensure_relative_to_base,
+    _normalize_time_key,
+    _parse_time,
+    _resolve_level_index,
+    _resolve_time_index,
+    _validate_layer,
+    _validate_level_key,
+    _validate_time_key,
+)
+
+
+DEFAULT_WIND_TEXTURE_LAYER: Final[str] = "ecmwf/wind_texture"
+WIND_TEXTURE_BASENAME: Final[str] = "wind"
+SUPPORTED_WIND_TEXTURE_FORMATS: Final[tuple[str, ...]] = ("png", "webp")
+MAX_WIND_TEXTURE_SIZE: Final[int] = 4096
+
+
+class WindTextureError(WindVectorTilingError):
+    pass
+
+
+@dataclass(frozen=True)
+class WindTextureGenerationResult:
+    layer: str
+    variable: str
+    run: str
+    time: str
+    level: str
+    output_dir: Path
+    width: int
+    height: int
+    formats: tuple[str, ...]
+
+
+def _validate_size(value: int | None, *, label: str) -> int | None:
+    if value is None:
+        return None
+    size = int(value)
+    if size < 2 or size > MAX_WIND_TEXTURE_SIZE:
+        raise ValueError(f"{label} must be between 2 and {MAX_WIND_TEXTURE_SIZE}")
+    return size
+
+
+def _normalize_formats(formats: Sequence[str]) -> tuple[str, ...]:
+    normalized: list[str] = []
+    for fmt in formats:
+        value = str(fmt).strip().lower()
+        if value not in SUPPORTED_WIND_TEXTURE_FORMATS:
+            raise ValueError(f"Unsupported wind texture format: {fmt!r}")
+        if value not in normalized:
+            normalized.append(value)
+    if not normalized:
+        raise ValueError("At least one wind texture format must be specified")
+    return tuple(normalized)
+
+
+def _channel_range(values: np.ndarray, valid: np.ndarray) -> tuple[float, float]:
+    if not valid.any():
+        return 0.0, 0.0
+    # Round outwards to 0.01 m/s so the metadata stays short and exact.
+    vmin = math.floor(float(np.min(values[valid])) * 100.0) / 100.0
+    vmax = math.ceil(float(np.max(values[valid])) * 100.0) / 100.0
+    return vmin, vmax
+
+
+def _encode_channel(
+    values: np.ndarray, valid: np.ndarray, *, vmin: float, vmax: float
+) -> np.ndarray:
+    span = vmax - vmin
+    if span <= 0.0:
+        return np.zeros(values.shape, dtype=np.uint8)
+    scaled = np.where(valid, (values - vmin) / span * 255.0, 0.0)
+    return np.clip(np.rint(scaled), 0, 255).astype(np.uint8)
+
+
+def wind_texture_rgba(
+    u: np.ndarray, v: np.ndarray
+) -> tuple[np.ndarray, dict[str, float]]:
+    """Pack u/v into an RGBA texture: R=u, G=v, B=0, A=255 (0 where missing).
+
+    Returns the pixels and the per-channel ranges; a channel decodes as
+    `offset + byte * scale` with `offset = min` and `scale = (max - min) / 255`.
+    """
+    u_f = np.asarray(u, dtype=np.float64)
+    v_f = np.asarray(v, dtype=np.float64)
+    if u_f.shape != v_f.shape or u_f.ndim != 2:
+        raise ValueError("u and v must be 2D grids of the same shape")
+
+    valid = np.isfinite(u_f) & np.isfinite(v_f)
+    u_min, u_max = _channel_range(u_f, valid)
+    v_min, v_max = _channel_range(v_f, valid)
+
+    rgba = np.zeros((*u_f.shape, 4), dtype=np.uint8)
+    rgba[..., 0] = _encode_channel(u_f, valid, vmin=u_min, vmax=u_max)
+    rgba[..., 1] = _encode_channel(v_f, valid, vmin=v_min, vmax=v_max)
+    rgba[..., 3] = np.where(valid, 255, 0).astype(np.uint8)
+    ranges = {"uMin": u_min, "uMax": u_max, "vMin": v_min, "vMax": v_max}
+    return rgba, ranges
+
+
+def _interp_axis(
+    grid: np.ndarray, coord: np.ndarray, query: np.ndarray, *, axis: int
+) -> np.ndarray:
+    """Linearly resample `grid` along `axis`; queries on grid points copy them.
+
+    Unlike `tiling.cldas_tiles._bilinear_sample` both ends of `coord` are
+    inclusive, and a sample exactly on a grid line never mixes in its (possibly
+    missing) neighbour.
+    """
+    pos = np.interp(query, coord, np.arange(coord.size, dtype=np.float64))
+    snapped = np.rint(pos)
+    pos = np.where(np.abs(pos - snapped) < 1e-9, snapped, pos)
+    i0 = np.clip(np.floor(pos).astype(np.int64), 0, coord.size - 1)
+    i1 = np.minimum(i0 + 1, coord.size - 1)
+
+    shape = [1] * grid.ndim
+    shape[axis] = -1
+    weight = (pos - i0).reshape(shape)
+    lower = np.take(grid, i0, axis=axis)
+    upper = np.take(grid, i1, axis=axis)
+    with np.errstate(invalid="ignore"):
+        blended = (1.0 - weight) * lower + weight * upper
+    return np.where(weight == 0.0, lower, blended)
+
+
+def _write_atomic(target: Path, data: bytes) -> None:
+    tmp = target.with_name(f".{target.name}.tmp-{os.getpid()}")
+    tmp.write_bytes(data)
+    os.replace(tmp, target)
+
+
+def _save_texture(img: Image.Image, target: Path) -> None:
+    tmp = target.with_name(f".{target.name}.tmp-{os.getpid()}")
+    if target.suffix == ".webp":
+        # `exact` keeps RGB under transparent pixels, which carry data here.
+        img.save(tmp, format="WEBP", lossless=True, exact=True, method=6)
+    else:
+        img.save(tmp, format="PNG", optimize=True)
+    os.replace(tmp, target)
+
+
+class WindTextureGenerator:
+    """Encode one u/v slice as a wind texture for client-side particle animation.
+
+    The texture covers the dataset's lon/lat extent on a regular grid (rows run
+    north to south) and is written as `wind.png`/`wind.webp` next to a
+    `wind.json` that carries the size, bounds and per-channel scale/offset, in
+    the layout popularised by WebGL wind-layer renderers.
+    """
+
+    def __init__(
+        self,
+        cube: DataCube,
+        *,
+        layer: str = DEFAULT_WIND_TEXTURE_LAYER,
+        width: int | None = None,
+        height: int | None = None,
+    ) -> None:
+        self._cube = cube
+        self._layer = _validate_layer(layer)
+        self._width = _validate_size(width, label="width")
+        self._height = _validate_size(height, label="height")
+
+    @classmethod
+    def from_dataset(
+        cls,
+        ds: xr.Dataset,
+        *,
+        layer: str = DEFAULT_WIND_TEXTURE_LAYER,
+        width: int | None = None,
+        height: int | None = None,
+    ) -> "WindTextureGenerator":
+        return cls(DataCube.from_dataset(ds), layer=layer, width=width, height=height)
+
+    @property
+    def layer(self) -> str:
+        return self._layer
+
+    @property
+    def variable(self) -> str:
+        return "u,v"
+
+    def render(
+        self, *, time_index: int, level_index: int
+    ) -> tuple[np.ndarray, dict[str, Any], str]:
+        """Return the RGBA pixels, texture metadata and resolved `u,v` names."""
+        try:
+            lat, lon, u_grid, v_grid, variable = _extract_wind_grids(
+                self._cube.dataset, time_index=time_index, level_index=level_index
+            )
+        except WindVectorTilingError as exc:
+            raise WindTextureError(str(exc)) from exc
+        if lat.size < 2 or lon.size < 2:
+            raise WindTextureError("wind grid needs at least 2x2 points")
+
+        west, east = float(lon[0]), float(lon[-1])
+        south, north = float(lat[0]), float(lat[-1])
+        width = self._width or int(lon.size)
+        height = self._height or int(lat.size)
+
+        lon_q = np.linspace(west, east, width)
+        lat_q = np.linspace(north, south, height)
+        u = _interp_axis(_interp_axis(u_grid, lat, lat_q, axis=0), lon, lon_q, axis=1)
+        v = _interp_axis(_interp_axis(v_grid, lat, lat_q, axis=0), lon, lon_q, axis=1)
+
+        rgba, ranges = wind_texture_rgba(u, v)
+        metadata: dict[str, Any] = {
+            "width": width,
+            "height": height,
+            "bbox": [west, south, east, north],
+            **ranges,
+            "uOffset": ranges["uMin"],
+            "uScale": (ranges["uMax"] - ranges["uMin"]) / 255.0,
+            "vOffset": ranges["vMin"],
+            "vScale": (ranges["vMax"] - ranges["vMin"]) / 255.0,
+            "units": "m/s",
+        }
+        return rgba, metadata, variable
+
+    def generate(
+        self,
+        output_dir: str | Path,
+        *,
+        run_time: object,
+        valid_time: object,
+        level: object,
+        formats: Sequence[str] = SUPPORTED_WIND_TEXTURE_FORMATS,
+    ) -> WindTextureGenerationResult:
+        ds = self._cube.dataset
+        run_key = _validate_time_key(_normalize_time_key(_parse_time(run_time)))
+        time_index, time_key = _resolve_time_index(ds, valid_time)
+        level_index, level_key = _resolve_level_index(ds, level)
+        level_key = _validate_level_key(level_key)
+        resolved_formats = _normalize_formats(formats)
+
+        rgba, metadata, variable = self.render(
+            time_index=time_index, level_index=level_index
+        )
+        metadata = {"run": run_key, "time": time_key, "level": level_key, **metadata}
+
+        base = Path(output_dir).resolve()
+        layer_dir = (base / self._layer).resolve()
+        _ensure_relative_to_base(base_dir=base, path=layer_dir, label="layer")
+
+        texture_dir = (layer_dir / run_key / time_key / level_key).resolve()
+        _ensure_relative_to_base(base_dir=base, path=texture_dir, label="time_key")
+        texture_dir.mkdir(parents=True, exist_ok=True)
+
+        img = Image.fromarray(rgba)
+        for fmt in resolved_formats:
+            _save_texture(img, texture_dir / f"{WIND_TEXTURE_BASENAME}.{fmt}")
+        _write_atomic(
+            texture_dir / f"{WIND_TEXTURE_BASENAME}.json",
+            json.dumps(metadata, separators=(",", ":")).encode("utf-8"),
+        )
+
+        return WindTextureGenerationResult(
+            layer=self._layer,
+            variable=variable,
+            run=run_key,
+            time=time_key,
+            level=level_key,
+            output_dir=layer_dir,
+            width=int(metadata["width"]),
+            height=int(metadata["height"]),
+            formats=resolved_formats,
+        )
@@ -0,0 +1,293 @@
+from __future__ import annotations
+
+import json
+import os
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Final
+
+import numpy as np
+import xarray as xr
+
+from datacube.core import DataCube
+from tiling.cldas_tiles import (
+    _bilinear_sample,
+    _ensure_ascending_axis,
+    _normalize_longitudes,
+)
+from tiling.availability import write_availability
+from tiling.config import get_tiling_config
+from tiling.epsg4326 import lat_to_tile_y, lon_to_tile_x, tile_bounds
+from tiling.temperature_tiles import (
+    TemperatureTileGenerator,
+    TemperatureTilingError,
+    _ensure_relative_to_base,
+    _normalize_time_key,
+    _parse_time,
+    _resolve_level_index,
+    _resolve_time_index,
+    _validate_layer,
+    _validate_level_key,
+    _validate_time_key,
+)
+
+
+DEFAULT_WIND_VECTOR_LAYER: Final[str] = "ecmwf/wind_vector"
+DEFAULT_WIND_VECTOR_POINTS_PER_TILE: Final[int] = 16
+MAX_WIND_VECTOR_POINTS_PER_TILE: Final[int] = 64
+
+# Same candidates (and order) as the API's on-demand vector endpoint.
+WIND_COMPONENT_CANDIDATES: Final[tuple[tuple[str, str], ...]] = (
+    ("u", "v"),
+    ("eastward_wind_10m", "northward_wind_10m"),
+    ("10u", "10v"),
+    ("u10", "v10"),
+)
+
+
+class WindVectorTilingError(TemperatureTilingError):
+    pass
+
+
+def _resolve_wind_components(ds: xr.Dataset) -> tuple[str, str]:
+    available = {name.lower(): name for name in ds.data_vars}
+    for u_name, v_name in WIND_COMPONENT_CANDIDATES:
+        resolved_u = available.get(u_name.lower())
+        resolved_v = available.get(v_name.lower())
+        if resolved_u is not None and resolved_v is not None:
+            return resolved_u, resolved_v
+    names = ", ".join(sorted(ds.data_vars))
+    raise WindVectorTilingError(f"Wind components not found; available=[{names}]")
+
+
+def _validate_points_per_tile(value: int) -> int:
+    points = int(value)
+    if points < 1 or points > MAX_WIND_VECTOR_POINTS_PER_TILE:
+        raise ValueError(
+            f"points_per_tile must be between 1 and {MAX_WIND_VECTOR_POINTS_PER_TILE}"
+        )
+    return points
+
+
+def _extract_wind_grids(
+    ds: xr.Dataset, *, time_index: int, level_index: int
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, str]:
+    """Return ascending (lat, lon), u/v float32 grids and the `u,v` names."""
+    u_name, v_name = _resolve_wind_components(ds)
+
+    grids: list[np.ndarray] = []
+    lat = np.asarray(ds["lat"].values)
+    lon = np.asarray(ds["lon"].values)
+    for name in (u_name, v_name):
+        da = ds[name]
+        if "time" not in da.dims or "level" not in da.dims:
+            raise WindVectorTilingError(
+                f"{name} variable missing required dims: time/level"
+            )
+        slice_da = da.isel(time=int(time_index), level=int(level_index))
+        if set(slice_da.dims) != {"lat", "lon"}:
+            raise WindVectorTilingError(
+                f"Expected data dims {{'lat','lon'}}, got {list(slice_da.dims)}"
+            )
+        grid = np.asarray(slice_da.transpose("lat", "lon").values).astype(
+            np.float32, copy=False
+        )
+        if lat.size != grid.shape[0] or lon.size != grid.shape[1]:
+            raise WindVectorTilingError(
+                "lat/lon coordinates do not match wind grid shape"
+            )
+        grids.append(grid)
+
+    stacked = np.stack(grids, axis=-1)
+    lat_sorted, stacked = _ensure_ascending_axis(lat, stacked, axis=0)
+    lon_sorted, stacked = _ensure_ascending_axis(lon, stacked, axis=1)
+    lon_sorted, stacked = _normalize_longitudes(lon_sorted, stacked)
+    return (
+        lat_sorted.astype(np.float64, copy=False),
+        lon_sorted.astype(np.float64, copy=False),
+        stacked[..., 0],
+        stacked[..., 1],
+        f"{u_name},{v_name}",
+    )
+
+
+def _write_tile(target: Path, payload: dict[str, list[float]]) -> None:
+    data = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+    tmp = target.with_name(f".{target.name}.tmp-{os.getpid()}")
+    tmp.write_bytes(data)
+    os.replace(tmp, target)
+
+
+@dataclass(frozen=True)
+class WindVectorTileGenerationResult:
+    layer: str
+    variable: str
+    run: str
+    time: str
+    level: str
+    output_dir: Path
+    min_zoom: int
+    max_zoom: int
+    points_per_tile: int
+    tiles_written: int
+
+
+class WindVectorTileGenerator:
+    """Write a z/x/y pyramid of decimated u/v vector tiles.
+
+    Each tile samples u/v bilinearly on a `points_per_tile` square lattice of
+    cell centres and stores the finite samples as `{y}.json` in the same
+    shape as the on-demand vector endpoint (`u`, `v`, `lat`, `lon` lists).
+    Tiles without a single finite sample are not written, so the layer's
+    `availability.json` doubles as its coverage map.
+    """
+
+    def __init__(
+        self,
+        cube: DataCube,
+        *,
+        layer: str = DEFAULT_WIND_VECTOR_LAYER,
+        points_per_tile: int = DEFAULT_WIND_VECTOR_POINTS_PER_TILE,
+    ) -> None:
+        self._cube = cube
+        self._layer = _validate_layer(layer)
+        self._points_per_tile = _validate_points_per_tile(points_per_tile)
+
+    @classmethod
+    def from_dataset(
+        cls,
+        ds: xr.Dataset,
+        *,
+        layer: str = DEFAULT_WIND_VECTOR_LAYER,
+        points_per_tile: int = DEFAULT_WIND_VECTOR_POINTS_PER_TILE,
+    ) -> "WindVectorTileGenerator":
+        return cls(
+            DataCube.from_dataset(ds), layer=layer, points_per_tile=points_per_tile
+        )
+
+    @property
+    def layer(self) -> str:
+        return self._layer
+
+    @property
+    def variable(self) -> str:
+        return "u,v"
+
+    @property
+    def points_per_tile(self) -> int:
+        return self._points_per_tile
+
+    def render_tile(
+        self,
+        *,
+        zoom: int,
+        x: int,
+        y: int,
+        lat: np.ndarray,
+        lon: np.ndarray,
+        u_grid: np.ndarray,
+        v_grid: np.ndarray,
+    ) -> dict[str, list[float]]:
+        bounds = tile_bounds(zoom, x, y)
+        steps = (np.arange(self._points_per_tile, dtype=np.float64) + 0.5) / float(
+            self._points_per_tile
+        )
+        lon_q = bounds.west + steps * (bounds.east - bounds.west)
+        lat_q = bounds.north - steps * (bounds.north - bounds.south)
+
+        u = _bilinear_sample(lat, lon, u_grid, lat_query=lat_q, lon_query=lon_q)
+        v = _bilinear_sample(lat, lon, v_grid, lat_query=lat_q, lon_query=lon_q)
+        valid = np.isfinite(u) & np.isfinite(v)
+
+        lon_grid, lat_grid = np.meshgrid(lon_q, lat_q)
+        return {
+            "u": np.round(u[valid].astype(np.float64), 2).tolist(),
+            "v": np.round(v[valid].astype(np.float64), 2).tolist(),
+            "lat": np.round(lat_grid[valid], 5).tolist(),
+            "lon": np.round(lon_grid[valid], 5).tolist(),
+        }
+
+    def generate(
+        self,
+        output_dir: str | Path,
+        *,
+        run_time: object,
+        valid_time: object,
+        level: object,
+        min_zoom: int | None = None,
+        max_zoom: int | None = None,
+    ) -> WindVectorTileGenerationResult:
+        ds = self._cube.dataset
+        run_key = _validate_time_key(_normalize_time_key(_parse_time(run_time)))
+        time_index, time_key = _resolve_time_index(ds, valid_time)
+        level_index, level_key = _resolve_level_index(ds, level)
+        level_key = _validate_level_key(level_key)
+
+        config = get_tiling_config()
+        TemperatureTileGenerator._validate_config(config)
+
+        if min_zoom is None and max_zoom is None:
+            resolved_min_zoom = int(config.global_.min_zoom)
+            resolved_max_zoom = int(config.global_.max_zoom)
+        else:
+            resolved_min_zoom = int(max_zoom if min_zoom is None else min_zoom)
+            resolved_max_zoom = int(min_zoom if max_zoom is None else max_zoom)
+        TemperatureTileGenerator._validate_zoom_range(
+            min_zoom=resolved_min_zoom, max_zoom=resolved_max_zoom, config=config
+        )
+
+        lat, lon, u_grid, v_grid, variable = _extract_wind_grids(
+            ds, time_index=time_index, level_index=level_index
+        )
+        lat_min = float(np.nanmin(lat))
+        lat_max = float(np.nanmax(lat))
+        lon_min = float(np.nanmin(lon))
+        lon_max = float(np.nanmax(lon))
+
+        base = Path(output_dir).resolve()
+        layer_dir = (base / self._layer).resolve()
+        _ensure_relative_to_base(base_dir=base, path=layer_dir, label="layer")
+
+        tiles_root = (layer_dir / run_key / time_key / level_key).resolve()
+        _ensure_relative_to_base(base_dir=base, path=tiles_root, label="time_key")
+        tiles_root.mkdir(parents=True, exist_ok=True)
+
+        tiles_written = 0
+        for zoom in range(resolved_min_zoom, resolved_max_zoom + 1):
+            x0 = lon_to_tile_x(lon_min, zoom)
+            x1 = lon_to_tile_x(lon_max, zoom)
+            y0 = lat_to_tile_y(lat_max, zoom)
+            y1 = lat_to_tile_y(lat_min, zoom)
+
+            for x in range(x0, x1 + 1):
+                x_dir = tiles_root / str(zoom) / str(x)
+                for y in range(y0, y1 + 1):
+                    payload = self.render_tile(
+                        zoom=zoom,
+                        x=x,
+                        y=y,
+                        lat=lat,
+                        lon=lon,
+                        u_grid=u_grid,
+                        v_grid=v_grid,
+                    )
+                    if not payload["u"]:
+                        continue
+                    x_dir.mkdir(parents=True, exist_ok=True)
+                    _write_tile(x_dir / f"{y}.json", payload)
+                    tiles_written += 1
+
+        write_availability(tiles_root)
+
+        return WindVectorTileGenerationResult(
+            layer=self._layer,
+            variable=variable,
+            run=run_key,
+            time=time_key,
+            level=level_key,
+            output_dir=layer_dir,
+            min_zoom=resolved_min_zoom,
+            max_zoom=resolved_max_zoom,
+            points_per_tile=self._points_per_tile,
+            tiles_written=tiles_written,
+        )
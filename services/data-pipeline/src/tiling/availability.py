@@ -0,0 +1,138 @@
+from __future__ import annotations
+
+import base64
+import json
+import os
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Final, Mapping
+
+import numpy as np
+
+AVAILABILITY_FILENAME: Final[str] = "availability.json"
+AVAILABILITY_SCHEMA_VERSION: Final[int] = 1
+
+
+@dataclass(frozen=True)
+class _ZoomBitmap:
+    x: int
+    y: int
+    cols: int
+    rows: int
+    bits: bytes
+
+    def contains(self, x: int, y: int) -> bool:
+        col = x - self.x
+        row = y - self.y
+        if not (0 <= col < self.cols and 0 <= row < self.rows):
+            return False
+        index = row * self.cols + col
+        return bool(self.bits[index >> 3] & (0x80 >> (index & 7)))
+
+
+class TileAvailability:
+    """Decoded `availability.json`: answers whether a z/x/y tile was generated."""
+
+    def __init__(self, zooms: Mapping[int, _ZoomBitmap]) -> None:
+        self._zooms = dict(zooms)
+
+    @property
+    def zooms(self) -> list[int]:
+        return sorted(self._zooms)
+
+    def contains(self, zoom: int, x: int, y: int) -> bool:
+        bitmap = self._zooms.get(int(zoom))
+        return bitmap is not None and bitmap.contains(int(x), int(y))
+
+    @classmethod
+    def from_payload(
+        cls, payload: bytes | str | Mapping[str, Any]
+    ) -> "TileAvailability":
+        try:
+            data = payload if isinstance(payload, Mapping) else json.loads(payload)
+            if data.get("schema_version") != AVAILABILITY_SCHEMA_VERSION:
+                raise ValueError("unsupported availability schema_version")
+
+            zooms: dict[int, _ZoomBitmap] = {}
+            for zoom_raw, entry in dict(data["zooms"]).items():
+                bitmap = _ZoomBitmap(
+                    x=int(entry["x"]),
+                    y=int(entry["y"]),
+                    cols=int(entry["cols"]),
+                    rows=int(entry["rows"]),
+                    bits=base64.b64decode(entry["bitmap"], validate=True),
+                )
+                if bitmap.cols <= 0 or bitmap.rows <= 0:
+                    raise ValueError("availability bitmap must not be empty")
+                if len(bitmap.bits) * 8 < bitmap.cols * bitmap.rows:
+                    raise ValueError("availability bitmap is truncated")
+                zooms[int(zoom_raw)] = bitmap
+        except (KeyError, TypeError, AttributeError, ValueError) as exc:
+            raise ValueError(f"Invalid tile availability payload: {exc}") from exc
+        return cls(zooms)
+
+
+def _scan_tiles(tiles_root: Path) -> dict[int, set[tuple[int, int]]]:
+    tiles: dict[int, set[tuple[int, int]]] = {}
+    for zoom_dir in tiles_root.iterdir():
+        if not zoom_dir.is_dir() or not zoom_dir.name.isdigit():
+            continue
+        coords: set[tuple[int, int]] = set()
+        for x_dir in zoom_dir.iterdir():
+            if not x_dir.is_dir() or not x_dir.name.isdigit():
+                continue
+            for tile in x_dir.iterdir():
+                y_raw = tile.name.split(".", 1)[0]
+                if "." in tile.name and y_raw.isdigit() and tile.is_file():
+                    coords.add((int(x_dir.name), int(y_raw)))
+        if coords:
+            tiles[int(zoom_dir.name)] = coords
+    return tiles
+
+
+def _encode_zoom(coords: set[tuple[int, int]]) -> dict[str, Any]:
+    xs = np.fromiter((x for x, _ in coords), dtype=np.int64, count=len(coords))
+    ys = np.fromiter((y for _, y in coords), dtype=np.int64, count=len(coords))
+    x0, y0 = int(xs.min()), int(ys.min())
+    cols = int(xs.max()) - x0 + 1
+    rows = int(ys.max()) - y0 + 1
+
+    bits = np.zeros((rows, cols), dtype=bool)
+    bits[ys - y0, xs - x0] = True
+    return {
+        "x": x0,
+        "y": y0,
+        "cols": cols,
+        "rows": rows,
+        "bitmap": base64.b64encode(np.packbits(bits, axis=None).tobytes()).decode(
+            "ascii"
+        ),
+    }
+
+
+def build_availability(tiles_root: str | Path) -> dict[str, Any]:
+    """Describe which z/x/y tiles exist below `tiles_root`.
+
+    Each zoom stores the bounding box of its tiles plus a row-major bitmap
+    (packed MSB first, base64) over that box. A tile counts as available when
+    it exists in any format.
+    """
+    root = Path(tiles_root)
+    zooms = {
+        str(zoom): _encode_zoom(coords)
+        for zoom, coords in sorted(_scan_tiles(root).items())
+    }
+    return {"schema_version": AVAILABILITY_SCHEMA_VERSION, "zooms": zooms}
+
+
+def write_availability(tiles_root: str | Path) -> Path:
+    root = Path(tiles_root)
+    payload = json.dumps(
+        build_availability(root), separators=(",", ":"), sort_keys=True
+    ).encode("utf-8")
+
+    target = root / AVAILABILITY_FILENAME
+    tmp = target.with_name(f".{target.name}.tmp-{os.getpid()}")
+    tmp.write_bytes(payload)
+    os.replace(tmp, target)
+    return target
@@ -14,7 +14,9 @@ from PIL import Image
 from legend import load_legend, normalize_legend_for_clients
 from digital_earth_config import Settings
 from local.cldas_loader import load_cldas_dataset
+from tiling.availability import write_availability
 from tiling.config import TilingConfig, get_tiling_config
+from tiling.palette import PaletteLUT, legend_value_range, save_png
 from tiling.storage import S3UploadConfig, upload_directory_to_s3
 from tiling.epsg4326 import TileBounds, lat_to_tile_y, lon_to_tile_x, tile_bounds
 
@@ -26,6 +28,11 @@ class CldasTilingError(RuntimeError):
 _TMP_BLUE: Final[tuple[int, int, int]] = (0x3B, 0x82, 0xF6)
 _TMP_WHITE: Final[tuple[int, int, int]] = (0xFF, 0xFF, 0xFF)
 _TMP_RED: Final[tuple[int, int, int]] = (0xEF, 0x44, 0x44)
+# Temperature ramp range in °C: blue at the minimum, white at 0, red at the max.
+_TMP_MIN_C: Final[float] = -20.0
+_TMP_MAX_C: Final[float] = 40.0
+
+DEFAULT_METATILE_SIZE: Final[int] = 4
 
 _LAYER_SEGMENT_RE: Final[re.Pattern[str]] = re.compile(r"^[A-Za-z0-9_]+$")
 _TIME_KEY_RE: Final[re.Pattern[str]] = re.compile(r"^[A-Za-z0-9TZ-]+$")
@@ -160,7 +167,7 @@ def _bilinear_sample(
 def temperature_rgba(values: np.ndarray) -> np.ndarray:
     values_f = values.astype(np.float32, copy=False)
     mask = np.isfinite(values_f)
-    clipped = np.clip(values_f, -20.0, 40.0)
+    clipped = np.clip(values_f, _TMP_MIN_C, _TMP_MAX_C)
 
     rgb = np.zeros((*values_f.shape, 3), dtype=np.float32)
     alpha = np.zeros(values_f.shape, dtype=np.uint8)
@@ -168,9 +175,9 @@ def temperature_rgba(values: np.ndarray) -> np.ndarray:
     below = clipped <= 0.0
     above = ~below
 
-    t1 = (clipped + 20.0) / 20.0
+    t1 = (clipped - _TMP_MIN_C) / -_TMP_MIN_C
     t1 = np.clip(t1, 0.0, 1.0)
-    t2 = clipped / 40.0
+    t2 = clipped / _TMP_MAX_C
     t2 = np.clip(t2, 0.0, 1.0)
 
     blue = np.array(_TMP_BLUE, dtype=np.float32)
@@ -267,6 +274,30 @@ def gradient_rgba_from_legend(
     return rgba
 
 
+def _slice_metatile(
+    pixels: np.ndarray,
+    *,
+    x: int,
+    y: int,
+    cols: int,
+    rows: int,
+    tile_size: int,
+    palette: Optional[PaletteLUT] = None,
+) -> dict[tuple[int, int], Image.Image]:
+    tiles: dict[tuple[int, int], Image.Image] = {}
+    for dy in range(rows):
+        top = dy * tile_size
+        for dx in range(cols):
+            left = dx * tile_size
+            tile = np.ascontiguousarray(
+                pixels[top : top + tile_size, left : left + tile_size]
+            )
+            tiles[(x + dx, y + dy)] = (
+                Image.fromarray(tile) if palette is None else palette.image(tile)
+            )
+    return tiles
+
+
 @dataclass(frozen=True)
 class TileGenerationResult:
     layer: str
@@ -292,6 +323,8 @@ class CLDASTileGenerator:
         self._time_index = int(time_index)
         self._layer = _validate_layer(layer)
         self._legend: Optional[dict[str, Any]] = None
+        self._palette: Optional[PaletteLUT] = None
+        self._grid: Optional[tuple[np.ndarray, np.ndarray, np.ndarray]] = None
         if self._variable.strip() == "":
             raise ValueError("variable must not be empty")
 
@@ -308,6 +341,33 @@ class CLDASTileGenerator:
         ds = load_cldas_dataset(source_path, engine=engine)
         return cls(ds, variable=variable, time_index=time_index, layer=layer)
 
+    @classmethod
+    def from_grid(
+        cls,
+        lat: np.ndarray,
+        lon: np.ndarray,
+        grid: np.ndarray,
+        *,
+        variable: str = "TMP",
+        layer: str = "cldas/tmp",
+    ) -> "CLDASTileGenerator":
+        """Build a generator around a grid previously returned by `extract_grid`.
+
+        The arrays must already be normalized (ascending lat/lon, [-180, 180)
+        longitudes), which lets callers keep decoded grids around and render
+        tiles without reopening the source NetCDF.
+        """
+
+        generator = cls(xr.Dataset(), variable=variable, layer=layer)
+        if grid.ndim != 2 or grid.shape != (lat.size, lon.size):
+            raise CldasTilingError("lat/lon coordinates do not match data grid shape")
+        generator._grid = (
+            np.asarray(lat, dtype=np.float64),
+            np.asarray(lon, dtype=np.float64),
+            grid,
+        )
+        return generator
+
     @property
     def variable(self) -> str:
         return self._variable
@@ -328,6 +388,22 @@ class CLDASTileGenerator:
         legend = self._load_legend()
         return gradient_rgba_from_legend(values, legend=legend)
 
+    def palette_lut(self) -> PaletteLUT:
+        if self._palette is None:
+            if self._layer == "cldas/tmp":
+                vmin, vmax = _TMP_MIN_C, _TMP_MAX_C
+            else:
+                vmin, vmax = legend_value_range(self._load_legend())
+            self._palette = PaletteLUT.from_colorizer(
+                self._colorize, vmin=vmin, vmax=vmax
+            )
+        return self._palette
+
+    def _palette_for(self, config: TilingConfig) -> Optional[PaletteLUT]:
+        if self._layer in config.palette_layers:
+            return self.palette_lut()
+        return None
+
     def _extract_grid(self) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
         if self._variable not in self._ds.data_vars:
             raise CldasTilingError(
@@ -365,33 +441,81 @@ class CLDASTileGenerator:
             grid,
         )
 
-    def _render_tile_array(
+    def extract_grid(self) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        if self._grid is None:
+            self._grid = self._extract_grid()
+        return self._grid
+
+    def _render_block_array(
         self,
         *,
         zoom: int,
         x: int,
         y: int,
+        cols: int,
+        rows: int,
         tile_size: int,
         lat: np.ndarray,
         lon: np.ndarray,
         grid: np.ndarray,
+        palette: Optional[PaletteLUT] = None,
     ) -> np.ndarray:
+        """Render a `cols`×`rows` block of tiles starting at (x, y) in one pass.
+
+        Returns RGBA pixels, or palette indices when `palette` is given.
+        """
         if tile_size <= 0:
             raise ValueError("tile_size must be > 0")
+        if cols <= 0 or rows <= 0:
+            raise ValueError("metatile cols/rows must be > 0")
 
-        bounds: TileBounds = tile_bounds(zoom, x, y)
-
-        cols = (np.arange(tile_size, dtype=np.float64) + 0.5) / tile_size
-        rows = (np.arange(tile_size, dtype=np.float64) + 0.5) / tile_size
+        frac = (np.arange(tile_size, dtype=np.float64) + 0.5) / tile_size
 
-        lon_px = bounds.west + cols * (bounds.east - bounds.west)
-        lat_px = bounds.north - rows * (bounds.north - bounds.south)
+        lon_parts: list[np.ndarray] = []
+        for dx in range(cols):
+            bounds: TileBounds = tile_bounds(zoom, x + dx, y)
+            lon_parts.append(bounds.west + frac * (bounds.east - bounds.west))
+        lat_parts: list[np.ndarray] = []
+        for dy in range(rows):
+            bounds = tile_bounds(zoom, x, y + dy)
+            lat_parts.append(bounds.north - frac * (bounds.north - bounds.south))
 
         sampled = _bilinear_sample(
-            lat, lon, grid, lat_query=lat_px.astype(np.float64), lon_query=lon_px
+            lat,
+            lon,
+            grid,
+            lat_query=np.concatenate(lat_parts),
+            lon_query=np.concatenate(lon_parts),
         )
+        if palette is not None:
+            return palette.indices(sampled)
         return self._colorize(sampled)
 
+    def _render_tile_array(
+        self,
+        *,
+        zoom: int,
+        x: int,
+        y: int,
+        tile_size: int,
+        lat: np.ndarray,
+        lon: np.ndarray,
+        grid: np.ndarray,
+        palette: Optional[PaletteLUT] = None,
+    ) -> np.ndarray:
+        return self._render_block_array(
+            zoom=zoom,
+            x=x,
+            y=y,
+            cols=1,
+            rows=1,
+            tile_size=tile_size,
+            lat=lat,
+            lon=lon,
+            grid=grid,
+            palette=palette,
+        )
+
     @staticmethod
     def _validate_config(config: TilingConfig) -> None:
         if config.crs != "EPSG:4326":
@@ -435,10 +559,11 @@ class CLDASTileGenerator:
         config = get_tiling_config()
         self._validate_config(config)
 
-        lat, lon, grid = self._extract_grid()
+        lat, lon, grid = self.extract_grid()
         resolved_tile_size = int(config.tile_size if tile_size is None else tile_size)
         self._validate_zoom_range(min_zoom=int(zoom), max_zoom=int(zoom), config=config)
-        rgba = self._render_tile_array(
+        palette = self._palette_for(config)
+        pixels = self._render_tile_array(
             zoom=zoom,
             x=x,
             y=y,
@@ -446,8 +571,69 @@ class CLDASTileGenerator:
             lat=lat,
             lon=lon,
             grid=grid,
+            palette=palette,
+        )
+        if palette is not None:
+            return palette.image(pixels)
+        return Image.fromarray(pixels)
+
+    def render_metatile(
+        self,
+        *,
+        zoom: int,
+        x: int,
+        y: int,
+        size: int = DEFAULT_METATILE_SIZE,
+        tile_size: int | None = None,
+    ) -> dict[tuple[int, int], Image.Image]:
+        """Render the aligned `size`×`size` metatile containing tile (x, y).
+
+        Returns every tile of the metatile keyed by (x, y). The block is clipped
+        to the tile matrix of the zoom level; out-of-range coordinates render as
+        a single tile, matching `render_tile`.
+        """
+        if size <= 0:
+            raise ValueError("metatile size must be > 0")
+
+        config = get_tiling_config()
+        self._validate_config(config)
+
+        lat, lon, grid = self.extract_grid()
+        resolved_tile_size = int(config.tile_size if tile_size is None else tile_size)
+        self._validate_zoom_range(min_zoom=int(zoom), max_zoom=int(zoom), config=config)
+
+        count = 2 ** int(zoom)
+
+        def _span(index: int) -> tuple[int, int]:
+            if 0 <= index < count:
+                start = (index // size) * size
+                return start, min(size, count - start)
+            return index, 1
+
+        x0, cols = _span(int(x))
+        y0, rows = _span(int(y))
+        palette = self._palette_for(config)
+        pixels = self._render_block_array(
+            zoom=zoom,
+            x=x0,
+            y=y0,
+            cols=cols,
+            rows=rows,
+            tile_size=resolved_tile_size,
+            lat=lat,
+            lon=lon,
+            grid=grid,
+            palette=palette,
+        )
+        return _slice_metatile(
+            pixels,
+            x=x0,
+            y=y0,
+            cols=cols,
+            rows=rows,
+            tile_size=resolved_tile_size,
+            palette=palette,
         )
-        return Image.fromarray(rgba)
 
     def write_legend(self, output_dir: str | Path) -> Path:
         base = Path(output_dir).resolve()
@@ -472,6 +658,7 @@ class CLDASTileGenerator:
         max_zoom: int | None = None,
         tile_size: int | None = None,
         time_key: Optional[str] = None,
+        metatile_size: int = DEFAULT_METATILE_SIZE,
     ) -> TileGenerationResult:
         config = get_tiling_config()
         self._validate_config(config)
@@ -486,12 +673,14 @@ class CLDASTileGenerator:
             resolved_max_zoom = int(min_zoom if max_zoom is None else max_zoom)
 
         resolved_tile_size = int(config.tile_size if tile_size is None else tile_size)
+        if metatile_size <= 0:
+            raise ValueError("metatile_size must be > 0")
 
         self._validate_zoom_range(
             min_zoom=resolved_min_zoom, max_zoom=resolved_max_zoom, config=config
         )
 
-        lat, lon, grid = self._extract_grid()
+        lat, lon, grid = self.extract_grid()
         lat_min = float(np.nanmin(lat))
         lat_max = float(np.nanmax(lat))
         lon_min = float(np.nanmin(lon))
@@ -515,6 +704,7 @@ class CLDASTileGenerator:
 
         self.write_legend(base)
 
+        palette = self._palette_for(config)
         tiles_written = 0
         for zoom in range(resolved_min_zoom, resolved_max_zoom + 1):
             x0 = lon_to_tile_x(lon_min, zoom)
@@ -523,22 +713,39 @@ class CLDASTileGenerator:
             y1 = lat_to_tile_y(lat_min, zoom)
 
             for x in range(x0, x1 + 1):
-                x_dir = tiles_root / str(zoom) / str(x)
-                x_dir.mkdir(parents=True, exist_ok=True)
-                for y in range(y0, y1 + 1):
-                    rgba = self._render_tile_array(
+                (tiles_root / str(zoom) / str(x)).mkdir(parents=True, exist_ok=True)
+
+            for block_x in range(x0, x1 + 1, metatile_size):
+                cols = min(metatile_size, x1 + 1 - block_x)
+                for block_y in range(y0, y1 + 1, metatile_size):
+                    rows = min(metatile_size, y1 + 1 - block_y)
+                    pixels = self._render_block_array(
                         zoom=zoom,
-                        x=x,
-                        y=y,
+                        x=block_x,
+                        y=block_y,
+                        cols=cols,
+                        rows=rows,
                         tile_size=resolved_tile_size,
                         lat=lat,
                         lon=lon,
                         grid=grid,
+                        palette=palette,
+                    )
+                    tiles = _slice_metatile(
+                        pixels,
+                        x=block_x,
+                        y=block_y,
+                        cols=cols,
+                        rows=rows,
+                        tile_size=resolved_tile_size,
+                        palette=palette,
                     )
-                    img = Image.fromarray(rgba)
-                    target = x_dir / f"{y}.png"
-                    img.save(target, format="PNG", optimize=True)
-                    tiles_written += 1
+                    for (x, y), img in tiles.items():
+                        target = tiles_root / str(zoom) / str(x) / f"{y}.png"
+                        save_png(img, target)
+                        tiles_written += 1
+
+        write_availability(tiles_root)
 
         return TileGenerationResult(
             layer=self._layer,
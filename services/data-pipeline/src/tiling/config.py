@@ -36,6 +36,10 @@ class TilingConfig(BaseModel):
     global_: ZoomRange = Field(alias="global")
     event: ZoomRange
     tile_size: int = Field(default=256, gt=0)
+    # CLDAS layers (e.g. "cldas/tmp") whose PNG tiles are written as 8-bit
+    # paletted images built from the legend instead of 32-bit RGBA. Only the
+    # CLDAS renderer supports palettes, so other layers are rejected.
+    palette_layers: list[str] = Field(default_factory=list)
 
     @model_validator(mode="after")
     def _validate_tiling(self) -> "TilingConfig":
@@ -51,6 +55,15 @@ class TilingConfig(BaseModel):
                 "global zoom range must end before event zoom range starts"
             )
 
+        unsupported = [
+            layer for layer in self.palette_layers if not layer.startswith("cldas/")
+        ]
+        if unsupported:
+            raise ValueError(
+                "palette_layers only supports CLDAS layers (cldas/...); "
+                f"got {unsupported}"
+            )
+
         return self
 
 
@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from pathlib import Path
+from typing import IO, Any, Callable, Final
+
+import numpy as np
+from PIL import Image
+
+# Index 0 is reserved for no-data pixels and marked fully transparent in tRNS.
+TRANSPARENT_INDEX: Final[int] = 0
+DEFAULT_PALETTE_LEVELS: Final[int] = 255
+PALETTE_PNG_COMPRESS_LEVEL: Final[int] = 6
+
+
+@dataclass(frozen=True)
+class PaletteLUT:
+    """Quantized lookup table mapping scalar values to 8-bit palette indices.
+
+    The value range is split into `levels` evenly spaced bins whose colors are
+    taken from the layer colorizer at the bin centers, so a paletted tile
+    differs from the RGBA rendering by at most half a bin of value.
+    """
+
+    vmin: float
+    vmax: float
+    palette: np.ndarray  # (levels + 1, 4) uint8, row 0 transparent
+
+    @property
+    def levels(self) -> int:
+        return int(self.palette.shape[0]) - 1
+
+    @classmethod
+    def from_colorizer(
+        cls,
+        colorize: Callable[[np.ndarray], np.ndarray],
+        *,
+        vmin: float,
+        vmax: float,
+        levels: int = DEFAULT_PALETTE_LEVELS,
+    ) -> "PaletteLUT":
+        if not 2 <= int(levels) <= 255:
+            raise ValueError("palette levels must be within [2, 255]")
+        if not (np.isfinite(vmin) and np.isfinite(vmax)) or vmax <= vmin:
+            raise ValueError("palette value range must be finite and increasing")
+
+        centers = np.linspace(float(vmin), float(vmax), int(levels), dtype=np.float32)
+        colors = np.asarray(colorize(centers), dtype=np.uint8).reshape(int(levels), 4)
+
+        palette = np.zeros((int(levels) + 1, 4), dtype=np.uint8)
+        palette[1:] = colors
+        palette.setflags(write=False)
+        return cls(vmin=float(vmin), vmax=float(vmax), palette=palette)
+
+    def indices(self, values: np.ndarray) -> np.ndarray:
+        values_f = np.asarray(values, dtype=np.float32)
+        mask = np.isfinite(values_f)
+        scale = (self.levels - 1) / (self.vmax - self.vmin)
+        scaled = (np.where(mask, values_f, self.vmin) - self.vmin) * scale
+        bins = np.clip(np.rint(scaled), 0, self.levels - 1).astype(np.uint8)
+        return np.where(mask, bins + 1, TRANSPARENT_INDEX).astype(np.uint8)
+
+    def image(self, indices: np.ndarray) -> Image.Image:
+        img = Image.fromarray(np.ascontiguousarray(indices, dtype=np.uint8), mode="P")
+        img.putpalette(self.palette[:, :3].tobytes(), rawmode="RGB")
+        alpha = self.palette[:, 3]
+        if np.all(alpha[1:] == 255):
+            img.info["transparency"] = TRANSPARENT_INDEX
+        else:
+            img.info["transparency"] = alpha.tobytes()
+        return img
+
+
+def legend_value_range(legend: dict[str, Any]) -> tuple[float, float]:
+    stops = legend.get("stops")
+    if stops is None:
+        stops = legend.get("colorStops")
+    if not isinstance(stops, list) or len(stops) < 2:
+        raise ValueError(
+            "legend.stops (or legend.colorStops) must be a list with at least 2 stops"
+        )
+    values = [
+        float(stop["value"])
+        for stop in stops
+        if isinstance(stop, dict) and isinstance(stop.get("value"), (int, float))
+    ]
+    if len(values) < 2:
+        raise ValueError("legend stop value must be a finite number")
+    return min(values), max(values)
+
+
+def save_png(img: Image.Image, fp: str | Path | IO[bytes]) -> None:
+    """Save a tile PNG, using the fast zlib path for paletted images."""
+    if img.mode == "P":
+        img.save(fp, format="PNG", compress_level=PALETTE_PNG_COMPRESS_LEVEL)
+        return
+    img.save(fp, format="PNG", optimize=True)
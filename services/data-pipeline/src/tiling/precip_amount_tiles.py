@@ -20,6 +20,7 @@ from tiling.cldas_tiles import (
     _normalize_longitudes,
     gradient_rgba_from_legend,
 )
+from tiling.availability import write_availability
 from tiling.config import TilingConfig, get_tiling_config
 from tiling.epsg4326 import TileBounds, lat_to_tile_y, lon_to_tile_x, tile_bounds
 
@@ -636,6 +637,8 @@ class PrecipAmountTileGenerator:
                         _save_tile_image(img, target)
                         tiles_written += 1
 
+        write_availability(tiles_root)
+
         return PrecipAmountTileGenerationResult(
             layer=self._layer,
             variable=self._variable,
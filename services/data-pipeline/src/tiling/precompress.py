@@ -0,0 +1,185 @@
+from __future__ import annotations
+
+import gzip
+import os
+from pathlib import Path
+from typing import Callable, Final, Iterable, Optional
+
+PRECOMPRESS_MIN_BYTES: Final[int] = 1024
+PRECOMPRESSIBLE_SUFFIXES: Final[frozenset[str]] = frozenset(
+    {".json", ".geojson", ".pbf", ".mvt", ".txt", ".csv"}
+)
+
+# Sidecar suffix -> HTTP content-coding token.
+SIDECAR_ENCODINGS: Final[dict[str, str]] = {".br": "br", ".zst": "zstd", ".gz": "gzip"}
+
+# S3 object metadata on an uploaded file listing the sidecar encodings stored
+# next to it (comma-separated content-coding tokens), so readers never probe.
+SIDECAR_METADATA_KEY: Final[str] = "sidecar-encodings"
+
+
+class PrecompressError(RuntimeError):
+    pass
+
+
+def _gzip_encoder() -> Callable[[bytes], bytes]:
+    return lambda data: gzip.compress(data, compresslevel=9, mtime=0)
+
+
+def _brotli_encoder() -> Optional[Callable[[bytes], bytes]]:
+    try:
+        import brotli  # type: ignore[import-not-found]
+    except Exception:  # noqa: BLE001
+        return None
+    return lambda data: brotli.compress(data, quality=11)
+
+
+def _zstd_encoder() -> Optional[Callable[[bytes], bytes]]:
+    try:
+        import zstandard  # type: ignore[import-not-found]
+    except Exception:  # noqa: BLE001
+        return None
+    compressor = zstandard.ZstdCompressor(level=19)
+    return compressor.compress
+
+
+def _resolve_encoders(
+    encodings: Optional[Iterable[str]],
+) -> dict[str, Callable[[bytes], bytes]]:
+    requested = (
+        ["gzip", "br", "zstd"]
+        if encodings is None
+        else [str(item).strip().lower() for item in encodings]
+    )
+    factories: dict[str, Callable[[], Optional[Callable[[bytes], bytes]]]] = {
+        "gzip": _gzip_encoder,
+        "br": _brotli_encoder,
+        "zstd": _zstd_encoder,
+    }
+
+    resolved: dict[str, Callable[[bytes], bytes]] = {}
+    for encoding in requested:
+        factory = factories.get(encoding)
+        if factory is None:
+            raise PrecompressError(f"Unsupported sidecar encoding: {encoding!r}")
+        encoder = factory()
+        if encoder is None:
+            # Optional codecs (brotli/zstandard) are skipped when not installed,
+            # unless the caller asked for them explicitly.
+            if encodings is not None:
+                raise PrecompressError(
+                    f"{encoding} sidecars require an optional compression package"
+                )
+            continue
+        resolved[encoding] = encoder
+    return resolved
+
+
+def is_precompressible(path: Path) -> bool:
+    return path.suffix.lower() in PRECOMPRESSIBLE_SUFFIXES
+
+
+def sidecar_path(path: Path, encoding: str) -> Path:
+    for suffix, token in SIDECAR_ENCODINGS.items():
+        if token == encoding:
+            return path.with_name(path.name + suffix)
+    raise PrecompressError(f"Unsupported sidecar encoding: {encoding!r}")
+
+
+def sidecar_encoding(path: Path) -> Optional[str]:
+    return SIDECAR_ENCODINGS.get(path.suffix.lower())
+
+
+def available_sidecar_encodings(path: Path) -> list[str]:
+    """Content-codings of the up-to-date sidecars next to `path`.
+
+    Sidecars older than `path` were written for a previous version of the file
+    and are not listed.
+    """
+    try:
+        source_mtime_ns = path.stat().st_mtime_ns
+    except FileNotFoundError:
+        return []
+
+    encodings: list[str] = []
+    for suffix, encoding in SIDECAR_ENCODINGS.items():
+        try:
+            sidecar_stat = path.with_name(path.name + suffix).stat()
+        except FileNotFoundError:
+            continue
+        if sidecar_stat.st_mtime_ns >= source_mtime_ns:
+            encodings.append(encoding)
+    return encodings
+
+
+def _write_atomic(target: Path, data: bytes) -> None:
+    tmp = target.with_name(f".{target.name}.tmp-{os.getpid()}")
+    tmp.write_bytes(data)
+    os.replace(tmp, target)
+
+
+def _write_sidecars(
+    source: Path,
+    *,
+    encoders: dict[str, Callable[[bytes], bytes]],
+    min_bytes: int,
+) -> list[Path]:
+    data = source.read_bytes()
+
+    written: list[Path] = []
+    for encoding, encoder in encoders.items():
+        target = sidecar_path(source, encoding)
+        compressed = encoder(data) if len(data) >= min_bytes else None
+        if compressed is None or len(compressed) >= len(data):
+            target.unlink(missing_ok=True)
+            continue
+        _write_atomic(target, compressed)
+        written.append(target)
+    return written
+
+
+def write_precompressed_sidecars(
+    path: str | Path,
+    *,
+    encodings: Optional[Iterable[str]] = None,
+    min_bytes: int = PRECOMPRESS_MIN_BYTES,
+) -> list[Path]:
+    """Write `<file>.gz`/`.br`/`.zst` next to a compressible tile file.
+
+    Sidecars are only kept when they are smaller than the source; stale
+    sidecars of a file that no longer qualifies are removed.
+    """
+    return _write_sidecars(
+        Path(path), encoders=_resolve_encoders(encodings), min_bytes=min_bytes
+    )
+
+
+def precompress_directory(
+    root: str | Path,
+    *,
+    encodings: Optional[Iterable[str]] = None,
+    min_bytes: int = PRECOMPRESS_MIN_BYTES,
+    modified_since_ns: Optional[int] = None,
+) -> int:
+    """Emit sidecars for every compressible file below `root`.
+
+    With `modified_since_ns`, only files modified at or after that time are
+    compressed, so a run can limit itself to the files it just wrote. Returns
+    the number of sidecar files written.
+    """
+    base = Path(root)
+    if not base.is_dir():
+        raise PrecompressError(f"Tile directory not found: {base}")
+
+    encoders = _resolve_encoders(encodings)
+    written = 0
+    for path in sorted(base.rglob("*")):
+        if not path.is_file() or not is_precompressible(path):
+            continue
+        if (
+            modified_since_ns is not None
+            and path.stat().st_mtime_ns < modified_since_ns
+        ):
+            continue
+        written += len(_write_sidecars(path, encoders=encoders, min_bytes=min_bytes))
+    return written
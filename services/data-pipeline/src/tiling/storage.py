@@ -3,7 +3,14 @@ from __future__ import annotations
 import os
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional
+from typing import Any, Optional
+
+from tiling.precompress import (
+    SIDECAR_METADATA_KEY,
+    available_sidecar_encodings,
+    is_precompressible,
+    sidecar_encoding,
+)
 
 
 class TileStorageError(RuntimeError):
@@ -23,6 +30,8 @@ def guess_content_type(path: Path) -> str:
         return "image/webp"
     if suffix == ".json":
         return "application/json"
+    if suffix in {".pbf", ".mvt"}:
+        return "application/x-protobuf"
     return "application/octet-stream"
 
 
@@ -79,7 +88,20 @@ def upload_directory_to_s3(
             continue
         rel = path.relative_to(root)
         key = build_s3_key(config.prefix, rel)
-        extra_args: dict[str, str] = {"ContentType": guess_content_type(path)}
+        encoding = sidecar_encoding(path)
+        if encoding is not None:
+            # Precompressed sidecars keep the media type of the file they encode.
+            extra_args: dict[str, Any] = {
+                "ContentType": guess_content_type(path.with_suffix("")),
+                "ContentEncoding": encoding,
+            }
+        else:
+            extra_args = {"ContentType": guess_content_type(path)}
+        if encoding is None and is_precompressible(path):
+            # Record which sidecars exist so readers need not probe for them.
+            extra_args["Metadata"] = {
+                SIDECAR_METADATA_KEY: ",".join(available_sidecar_encodings(path))
+            }
         if config.cache_control:
             extra_args["CacheControl"] = config.cache_control
         client.upload_file(str(path), config.bucket, key, ExtraArgs=extra_args)
@@ -16,6 +16,7 @@ from tiling.cldas_tiles import (
     _ensure_ascending_axis,
     _normalize_longitudes,
 )
+from tiling.availability import write_availability
 from tiling.config import TilingConfig, get_tiling_config
 from tiling.epsg4326 import TileBounds, lat_to_tile_y, lon_to_tile_x, tile_bounds
 
@@ -533,6 +534,8 @@ class TccTileGenerator:
                         _save_tile_image(img, target)
                         tiles_written += 1
 
+        write_availability(tiles_root)
+
         return TccTileGenerationResult(
             layer=self._layer,
             variable=self._variable,
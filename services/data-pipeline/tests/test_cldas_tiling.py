@@ -125,6 +125,84 @@ def test_cldas_tile_generator_render_tile_and_input_validation() -> None:
         generator.render_tile(zoom=0, x=0, y=0, tile_size=0)
 
 
+def test_cldas_tile_generator_from_grid_matches_dataset_render() -> None:
+    from tiling.cldas_tiles import CLDASTileGenerator, CldasTilingError
+
+    ds = _make_global_tmp_dataset(value=10.0, lat_descending=True)
+    generator = CLDASTileGenerator(ds, variable="TMP", layer="cldas/tmp")
+    lat, lon, grid = generator.extract_grid()
+    assert lat[0] < lat[-1]
+
+    expected = np.asarray(generator.render_tile(zoom=0, x=0, y=0, tile_size=4))
+    cached = CLDASTileGenerator.from_grid(lat, lon, grid, variable="TMP")
+    actual = np.asarray(cached.render_tile(zoom=0, x=0, y=0, tile_size=4))
+    np.testing.assert_array_equal(actual, expected)
+
+    with pytest.raises(CldasTilingError):
+        CLDASTileGenerator.from_grid(lat, lon[:-1], grid, variable="TMP")
+
+
+def test_cldas_tile_generator_metatile_matches_single_tile_renders() -> None:
+    from tiling.cldas_tiles import CLDASTileGenerator
+
+    lat = np.linspace(-90.0, 90.0, 37, dtype=np.float64)
+    lon = np.linspace(-180.0, 180.0, 73, dtype=np.float64)
+    grid = (lat[:, None] * 0.3 + lon[None, :] * 0.1).astype(np.float32)
+    generator = CLDASTileGenerator.from_grid(lat, lon, grid, variable="TMP")
+
+    tiles = generator.render_metatile(zoom=2, x=3, y=1, size=2, tile_size=8)
+    assert sorted(tiles) == [(2, 0), (2, 1), (3, 0), (3, 1)]
+    for (x, y), image in tiles.items():
+        expected = np.asarray(generator.render_tile(zoom=2, x=x, y=y, tile_size=8))
+        np.testing.assert_array_equal(np.asarray(image), expected)
+
+    clipped = generator.render_metatile(zoom=0, x=0, y=0, size=4, tile_size=8)
+    assert list(clipped) == [(0, 0)]
+
+    with pytest.raises(ValueError):
+        generator.render_metatile(zoom=0, x=0, y=0, size=0, tile_size=8)
+
+
+def test_cldas_tile_generator_renders_palette_layers(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    import tiling.cldas_tiles as cldas_tiles
+    from tiling.config import get_tiling_config
+
+    lat = np.linspace(-90.0, 90.0, 37, dtype=np.float64)
+    lon = np.linspace(-180.0, 180.0, 73, dtype=np.float64)
+    grid = (lat[:, None] * 0.3 + lon[None, :] * 0.1).astype(np.float32)
+    grid[:, :12] = np.nan
+    generator = cldas_tiles.CLDASTileGenerator.from_grid(lat, lon, grid, variable="TMP")
+    rgba = np.asarray(generator.render_tile(zoom=0, x=0, y=0, tile_size=8))
+
+    config = get_tiling_config().model_copy(update={"palette_layers": ["cldas/tmp"]})
+    monkeypatch.setattr(cldas_tiles, "get_tiling_config", lambda: config)
+
+    tile = generator.render_tile(zoom=0, x=0, y=0, tile_size=8)
+    assert tile.mode == "P"
+    decoded = np.asarray(tile.convert("RGBA")).astype(int)
+    assert (rgba[..., 3] == 0).any()
+    np.testing.assert_array_equal(decoded[..., 3], rgba[..., 3])
+    opaque = rgba[..., 3] == 255
+    assert np.abs(decoded[opaque] - rgba[opaque].astype(int)).max() <= 2
+
+    tiles = generator.render_metatile(zoom=1, x=0, y=0, size=2, tile_size=8)
+    for (x, y), image in tiles.items():
+        assert image.mode == "P"
+        single = generator.render_tile(zoom=1, x=x, y=y, tile_size=8)
+        np.testing.assert_array_equal(np.asarray(image), np.asarray(single))
+
+    ds = _make_global_tmp_dataset(value=10.0, lat_descending=False)
+    result = cldas_tiles.CLDASTileGenerator(
+        ds, variable="TMP", layer="cldas/tmp"
+    ).generate(tmp_path, min_zoom=0, max_zoom=0, tile_size=8)
+    png = next((tmp_path / result.layer / result.time).rglob("*.png"))
+    with Image.open(png) as img:
+        assert img.mode == "P"
+        assert "transparency" in img.info
+
+
 def test_cldas_tile_generator_time_key_fallback(tmp_path: Path) -> None:
     from tiling.cldas_tiles import CLDASTileGenerator
 
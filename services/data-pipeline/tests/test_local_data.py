@@ -3,6 +3,7 @@ from __future__ import annotations
 from datetime import datetime, timezone
 from pathlib import Path
 import json
+import os
 import time
 
 import numpy as np
@@ -621,6 +622,91 @@ def test_indexer_model_validators_and_helpers(tmp_path: Path) -> None:
         LocalFileIndex(schema_version=2, generated_at="x", root_dir="x")  # type: ignore[call-arg]
 
 
+def test_index_lookup_resolves_items_and_sorted_times(tmp_path: Path) -> None:
+    from local.lookup import LocalFileIndexLookup
+
+    def _item(name: str, *, variable: str, timestamp: str) -> LocalFileIndexItem:
+        return LocalFileIndexItem(
+            kind="cldas",
+            path=str(tmp_path / name),
+            relative_path=name,
+            size=1,
+            mtime_ns=1,
+            variable=variable,
+            meta={"timestamp": timestamp},
+        )
+
+    first = _item("a.nc", variable="TMP", timestamp="2025010102")
+    index = LocalFileIndex(
+        schema_version=1,
+        generated_at="2025-01-01T00:00:00Z",
+        root_dir=str(tmp_path),
+        items=[
+            first,
+            _item("b.nc", variable="TMP", timestamp="2025010100"),
+            _item("dup.nc", variable="TMP", timestamp="2025010102"),
+            _item("c.nc", variable="RHU", timestamp="2025010101"),
+        ],
+    )
+    lookup = LocalFileIndexLookup(index)
+
+    assert lookup.get("b.nc") is index.items[1]
+    assert lookup.get("missing.nc") is None
+    assert lookup.find(kind="cldas", variable="TMP", timestamp="2025010102") is first
+    assert lookup.find(kind="cldas", variable="TMP", timestamp="2025010101") is None
+    assert lookup.times(kind="cldas", variable="TMP") == ["2025010100", "2025010102"]
+    assert lookup.times(kind="cldas") == ["2025010100", "2025010101", "2025010102"]
+    assert lookup.times(kind="cldas", start="2025010101", end="2025010101") == [
+        "2025010101"
+    ]
+
+    filtered = lookup.filtered({"cldas"})
+    assert len(filtered.items) == 4
+    assert lookup.filtered({"cldas"}) is filtered
+    assert lookup.filtered({"ecmwf"}).items == []
+
+
+def test_data_source_reuses_index_until_cache_file_changes(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    from types import SimpleNamespace
+
+    import local.cache as cache_module
+
+    cache_path = tmp_path / "idx.json"
+    generated_at = datetime.now(timezone.utc).isoformat()
+    loads: list[LocalFileIndex] = []
+
+    def _load(*_args, **_kwargs) -> LocalFileIndex:
+        # Same timestamp and item count every time; only the file stamp differs.
+        index = LocalFileIndex(
+            schema_version=1, generated_at=generated_at, root_dir="r", items=[]
+        )
+        cache_path.write_text("{}", encoding="utf-8")
+        os.utime(cache_path, ns=(len(loads) + 1, len(loads) + 1))
+        loads.append(index)
+        return index
+
+    monkeypatch.setattr(cache_module, "get_local_file_index", _load)
+
+    paths = SimpleNamespace(index_cache_ttl_seconds=3600)
+    src = LocalDataSource(paths=paths, cache_path=cache_path)  # type: ignore[arg-type]
+    first = src.index_lookup()
+    assert src.index_lookup() is first
+    assert src.list_files() is first.index
+    assert len(loads) == 1
+
+    os.utime(cache_path, ns=(99, 99))
+    second = src.index_lookup()
+    assert second is not first
+    assert len(loads) == 2
+    assert src.index_lookup() is second
+
+    paths.index_cache_ttl_seconds = 0
+    assert src.index_lookup() is not second
+    assert len(loads) == 3
+
+
 def test_build_local_file_index_from_config(tmp_path: Path) -> None:
     config_dir = tmp_path / "config"
     config_dir.mkdir(parents=True, exist_ok=True)
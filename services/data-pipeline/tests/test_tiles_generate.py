@@ -220,6 +220,110 @@ def test_generate_ecmwf_tiles_skips_missing_layers(
     assert not (tmp_path / "tiles" / "ecmwf" / "wind_speed").exists()
 
 
+def test_tiles_cli_writes_wind_vector_tiles(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    from datacube.core import DataCube
+    from tiles.generate import main as tiles_main
+    from tiling.config import get_tiling_config
+
+    config_dir = tmp_path / "config"
+    _write_test_config_dir(config_dir, tile_size=8)
+    monkeypatch.setenv("DIGITAL_EARTH_CONFIG_DIR", str(config_dir))
+    get_tiling_config.cache_clear()
+
+    ds = _make_dataset()
+    ds["u"] = ds["wind_speed"]
+    ds["v"] = -ds["wind_speed"]
+
+    def fake_open(cls, path, *, format=None, engine=None):  # noqa: ARG001
+        return DataCube.from_dataset(ds)
+
+    monkeypatch.setattr(DataCube, "open", classmethod(fake_open))
+
+    args = [
+        "--datacube",
+        "dummy.nc",
+        "--output-dir",
+        str(tmp_path / "out"),
+        "--no-temperature",
+        "--no-cloud",
+        "--no-precipitation",
+        "--wind-vectors",
+        "--min-zoom",
+        "0",
+        "--max-zoom",
+        "0",
+    ]
+    with pytest.raises(ValueError, match="run_time is required"):
+        tiles_main(args)
+
+    assert tiles_main([*args, "--run-time", "20260101T000000Z"]) == 0
+    tile_path = (
+        tmp_path
+        / "out"
+        / "ecmwf"
+        / "wind_vector"
+        / "20260101T000000Z"
+        / "20260101T000000Z"
+        / "sfc"
+        / "0"
+        / "0"
+        / "0.json"
+    )
+    assert tile_path.is_file()
+    assert tile_path.with_name("0.json.gz").is_file()
+
+
+def test_tiles_cli_writes_wind_texture(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    import json
+
+    from datacube.core import DataCube
+    from tiles.generate import main as tiles_main
+
+    ds = _make_dataset()
+    ds["u"] = ds["wind_speed"]
+    ds["v"] = -ds["wind_speed"]
+
+    def fake_open(cls, path, *, format=None, engine=None):  # noqa: ARG001
+        return DataCube.from_dataset(ds)
+
+    monkeypatch.setattr(DataCube, "open", classmethod(fake_open))
+
+    args = [
+        "--datacube",
+        "dummy.nc",
+        "--output-dir",
+        str(tmp_path / "out"),
+        "--no-temperature",
+        "--no-cloud",
+        "--no-precipitation",
+        "--wind-texture",
+        "--format",
+        "png",
+    ]
+    with pytest.raises(ValueError, match="run_time is required"):
+        tiles_main(args)
+
+    assert tiles_main([*args, "--run-time", "20260101T000000Z"]) == 0
+    texture_dir = (
+        tmp_path
+        / "out"
+        / "ecmwf"
+        / "wind_texture"
+        / "20260101T000000Z"
+        / "20260101T000000Z"
+        / "sfc"
+    )
+    assert (texture_dir / "wind.png").is_file()
+    assert not (texture_dir / "wind.webp").exists()
+    meta = json.loads((texture_dir / "wind.json").read_text("utf-8"))
+    assert (meta["uMin"], meta["uMax"]) == (10.0, 10.0)
+    assert (meta["vMin"], meta["vMax"]) == (-10.0, -10.0)
+
+
 def test_tiles_cli_wind_speed_toggle(
     tmp_path: Path, monkeypatch: pytest.MonkeyPatch
 ) -> None:
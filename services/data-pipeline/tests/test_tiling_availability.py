@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import numpy as np
+import pytest
+import xarray as xr
+
+
+def _touch(path: Path) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(b"tile")
+
+
+def test_write_availability_round_trips_sparse_tiles(tmp_path: Path) -> None:
+    from tiling.availability import (
+        AVAILABILITY_FILENAME,
+        TileAvailability,
+        write_availability,
+    )
+
+    _touch(tmp_path / "0" / "0" / "0.png")
+    _touch(tmp_path / "3" / "5" / "2.png")
+    _touch(tmp_path / "3" / "5" / "2.webp")
+    _touch(tmp_path / "3" / "7" / "4.png")
+    _touch(tmp_path / "3" / "7" / "4.json.gz")
+    _touch(tmp_path / "3" / "6" / "notes.txt")
+    (tmp_path / "legend").mkdir()
+
+    path = write_availability(tmp_path)
+    assert path == tmp_path / AVAILABILITY_FILENAME
+
+    payload = json.loads(path.read_text(encoding="utf-8"))
+    assert payload["zooms"]["3"] == {
+        "x": 5,
+        "y": 2,
+        "cols": 3,
+        "rows": 3,
+        "bitmap": payload["zooms"]["3"]["bitmap"],
+    }
+
+    availability = TileAvailability.from_payload(path.read_bytes())
+    assert availability.zooms == [0, 3]
+    assert availability.contains(0, 0, 0)
+    assert availability.contains(3, 5, 2)
+    assert availability.contains(3, 7, 4)
+    assert not availability.contains(3, 6, 3)
+    assert not availability.contains(3, 4, 2)
+    assert not availability.contains(1, 0, 0)
+
+
+def test_tile_availability_rejects_invalid_payloads() -> None:
+    from tiling.availability import TileAvailability
+
+    with pytest.raises(ValueError):
+        TileAvailability.from_payload(b"not json")
+    with pytest.raises(ValueError):
+        TileAvailability.from_payload({"schema_version": 99, "zooms": {}})
+    with pytest.raises(ValueError):
+        TileAvailability.from_payload(
+            {
+                "schema_version": 1,
+                "zooms": {
+                    "1": {"x": 0, "y": 0, "cols": 4, "rows": 4, "bitmap": "AA=="}
+                },
+            }
+        )
+
+
+def test_cldas_generator_emits_availability(tmp_path: Path) -> None:
+    from tiling.availability import AVAILABILITY_FILENAME, TileAvailability
+    from tiling.cldas_tiles import CLDASTileGenerator
+
+    lat = np.array([20.0, 30.0, 40.0], dtype=np.float64)
+    lon = np.array([100.0, 110.0, 120.0], dtype=np.float64)
+    tmp = np.zeros((1, lat.size, lon.size), dtype=np.float32)
+    ds = xr.Dataset(
+        {"TMP": xr.DataArray(tmp, dims=["time", "lat", "lon"])},
+        coords={
+            "time": np.array(["2026-01-01T00:00:00"], dtype="datetime64[s]"),
+            "lat": lat,
+            "lon": lon,
+        },
+    )
+    result = CLDASTileGenerator(ds, variable="TMP", layer="cldas/tmp").generate(
+        tmp_path, min_zoom=0, max_zoom=2, tile_size=4
+    )
+
+    tiles_root = tmp_path / "cldas" / "tmp" / result.time
+    availability = TileAvailability.from_payload(
+        (tiles_root / AVAILABILITY_FILENAME).read_bytes()
+    )
+    assert availability.zooms == [0, 1, 2]
+    for png in tiles_root.rglob("*.png"):
+        zoom, x = (int(part) for part in png.parts[-3:-1])
+        assert availability.contains(zoom, x, int(png.stem))
+    assert not availability.contains(2, 0, 3)
@@ -77,3 +77,23 @@ def test_rejects_non_mapping_yaml(tmp_path: Path) -> None:
 
     with pytest.raises(ValueError, match="tiling config must be a mapping"):
         load_tiling_config(path)
+
+
+def test_rejects_palette_layers_outside_cldas(tmp_path: Path) -> None:
+    from tiling.config import load_tiling_config
+
+    _write_yaml(
+        tmp_path / "cfg.yaml",
+        {
+            "tiling": {
+                "crs": "EPSG:4326",
+                "global": {"min_zoom": 0, "max_zoom": 6},
+                "event": {"min_zoom": 8, "max_zoom": 10},
+                "tile_size": 256,
+                "palette_layers": ["cldas/tmp", "ecmwf/temp"],
+            }
+        },
+    )
+
+    with pytest.raises(ValueError, match="palette_layers only supports CLDAS"):
+        load_tiling_config(tmp_path / "cfg.yaml")
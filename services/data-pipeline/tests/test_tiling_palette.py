@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+from io import BytesIO
+
+import numpy as np
+import pytest
+from PIL import Image
+
+
+def test_palette_lut_maps_values_to_indices_and_reserves_nodata() -> None:
+    from tiling.cldas_tiles import temperature_rgba
+    from tiling.palette import TRANSPARENT_INDEX, PaletteLUT
+
+    lut = PaletteLUT.from_colorizer(temperature_rgba, vmin=-20.0, vmax=40.0)
+    assert lut.levels == 255
+    assert lut.palette.shape == (256, 4)
+    assert lut.palette[TRANSPARENT_INDEX].tolist() == [0, 0, 0, 0]
+
+    indices = lut.indices(np.array([-100.0, -20.0, 40.0, 100.0, np.nan]))
+    assert indices.tolist() == [1, 1, 255, 255, TRANSPARENT_INDEX]
+
+    values = np.linspace(-20.0, 40.0, 97, dtype=np.float32)
+    quantized = lut.palette[lut.indices(values)]
+    exact = temperature_rgba(values)
+    assert np.abs(quantized.astype(int) - exact.astype(int)).max() <= 2
+
+    with pytest.raises(ValueError):
+        PaletteLUT.from_colorizer(temperature_rgba, vmin=1.0, vmax=1.0)
+    with pytest.raises(ValueError):
+        PaletteLUT.from_colorizer(temperature_rgba, vmin=0.0, vmax=1.0, levels=256)
+
+
+def test_palette_png_round_trips_with_trns() -> None:
+    from tiling.cldas_tiles import temperature_rgba
+    from tiling.palette import PaletteLUT, save_png
+
+    lut = PaletteLUT.from_colorizer(temperature_rgba, vmin=-20.0, vmax=40.0)
+    values = np.array([[np.nan, -20.0], [10.0, 40.0]], dtype=np.float32)
+
+    buf = BytesIO()
+    save_png(lut.image(lut.indices(values)), buf)
+    decoded = Image.open(BytesIO(buf.getvalue()))
+    assert decoded.mode == "P"
+    assert "transparency" in decoded.info
+
+    rgba = np.asarray(decoded.convert("RGBA"))
+    assert rgba[0, 0, 3] == 0
+    assert (rgba[0, 1:, 3] == 255).all()
+    assert (rgba[1, :, 3] == 255).all()
+
+
+def test_legend_value_range_reads_stop_values() -> None:
+    from tiling.palette import legend_value_range
+
+    legend = {
+        "stops": [{"value": 5, "color": "#000000"}, {"value": -1, "color": "#ffffff"}]
+    }
+    assert legend_value_range(legend) == (-1.0, 5.0)
+
+    with pytest.raises(ValueError):
+        legend_value_range({"stops": [{"value": 1}]})
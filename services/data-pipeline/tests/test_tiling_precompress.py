@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+import gzip
+import os
+import sys
+from pathlib import Path
+from types import ModuleType
+
+import pytest
+
+
+def test_precompress_directory_writes_sidecars_for_compressible_files(
+    tmp_path: Path,
+) -> None:
+    from tiling.precompress import precompress_directory
+
+    legend = tmp_path / "cldas" / "tmp" / "legend.json"
+    legend.parent.mkdir(parents=True)
+    body = ("[" + "1," * 2000 + "1]").encode("utf-8")
+    legend.write_bytes(body)
+    small = tmp_path / "small.json"
+    small.write_bytes(b"{}")
+    tile = tmp_path / "0.png"
+    tile.write_bytes(b"\x89PNG" + b"\x00" * 4096)
+
+    written = precompress_directory(tmp_path, encodings=["gzip", "zstd"])
+
+    assert written == 2
+    assert gzip.decompress(legend.with_name("legend.json.gz").read_bytes()) == body
+    assert legend.with_name("legend.json.zst").is_file()
+    assert not small.with_name("small.json.gz").exists()
+    assert not tile.with_name("0.png.gz").exists()
+
+
+def test_precompress_directory_skips_files_older_than_the_run(
+    tmp_path: Path,
+) -> None:
+    from tiling.precompress import precompress_directory
+
+    body = ("[" + "1," * 2000 + "1]").encode("utf-8")
+    old = tmp_path / "old" / "legend.json"
+    new = tmp_path / "new" / "legend.json"
+    for path in (old, new):
+        path.parent.mkdir(parents=True)
+        path.write_bytes(body)
+    os.utime(old, ns=(1_000_000_000, 1_000_000_000))
+    os.utime(new, ns=(3_000_000_000, 3_000_000_000))
+
+    written = precompress_directory(
+        tmp_path, encodings=["gzip"], modified_since_ns=2_000_000_000
+    )
+
+    assert written == 1
+    assert new.with_name("legend.json.gz").is_file()
+    assert not old.with_name("legend.json.gz").exists()
+
+
+def test_available_sidecar_encodings_ignores_stale_sidecars(tmp_path: Path) -> None:
+    from tiling.precompress import available_sidecar_encodings
+
+    source = tmp_path / "0.pbf"
+    source.write_bytes(b"pbf")
+    os.utime(source, ns=(2_000_000_000, 2_000_000_000))
+    for suffix, mtime_ns in ((".br", 3_000_000_000), (".gz", 1_000_000_000)):
+        sidecar = source.with_name(source.name + suffix)
+        sidecar.write_bytes(b"x")
+        os.utime(sidecar, ns=(mtime_ns, mtime_ns))
+
+    assert available_sidecar_encodings(source) == ["br"]
+    assert available_sidecar_encodings(tmp_path / "missing.pbf") == []
+
+
+def test_precompress_rejects_unknown_encoding_and_missing_dir(tmp_path: Path) -> None:
+    from tiling.precompress import PrecompressError, precompress_directory
+
+    with pytest.raises(PrecompressError, match="Unsupported sidecar encoding"):
+        precompress_directory(tmp_path, encodings=["lzma"])
+    with pytest.raises(PrecompressError, match="Tile directory not found"):
+        precompress_directory(tmp_path / "missing")
+
+
+def test_upload_directory_to_s3_sets_content_encoding_for_sidecars(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    from tiling.storage import S3UploadConfig, upload_directory_to_s3
+
+    (tmp_path / "legend.json").write_text("{}", encoding="utf-8")
+    (tmp_path / "legend.json.gz").write_bytes(gzip.compress(b"{}"))
+    (tmp_path / "0.pbf.br").write_bytes(b"br")
+
+    uploads: dict[str, dict] = {}
+
+    class FakeClient:
+        def upload_file(
+            self, filename: str, bucket: str, key: str, *, ExtraArgs: dict
+        ) -> None:
+            uploads[key] = dict(ExtraArgs)
+
+    fake_boto3 = ModuleType("boto3")
+    fake_boto3.client = lambda *args, **kwargs: FakeClient()  # type: ignore[attr-defined]
+    monkeypatch.setitem(sys.modules, "boto3", fake_boto3)
+
+    upload_directory_to_s3(tmp_path, config=S3UploadConfig(bucket="b", prefix="p"))
+
+    assert uploads["p/legend.json"] == {
+        "ContentType": "application/json",
+        "Metadata": {"sidecar-encodings": "gzip"},
+    }
+    assert uploads["p/legend.json.gz"] == {
+        "ContentType": "application/json",
+        "ContentEncoding": "gzip",
+    }
+    assert uploads["p/0.pbf.br"] == {
+        "ContentType": "application/x-protobuf",
+        "ContentEncoding": "br",
+    }
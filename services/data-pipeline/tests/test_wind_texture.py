@@ -0,0 +1,132 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import numpy as np
+import pytest
+import xarray as xr
+from PIL import Image
+
+
+def _make_wind_dataset() -> xr.Dataset:
+    lat = np.array([10.0, 20.0, 30.0], dtype=np.float32)
+    lon = np.array([100.0, 110.0, 120.0, 130.0], dtype=np.float32)
+    time = np.array(["2026-01-01T06:00:00"], dtype="datetime64[s]")
+    u = np.tile(np.array([-10.0, 0.0, 10.0, 20.0], dtype=np.float32), (1, 3, 1))
+    v = np.repeat(np.array([-5.0, 0.0, 5.0], dtype=np.float32), 4).reshape(1, 3, 4)
+    v[0, 2, 3] = np.nan
+    return xr.Dataset(
+        {
+            "u": xr.DataArray(u, dims=["time", "lat", "lon"], attrs={"units": "m/s"}),
+            "v": xr.DataArray(v, dims=["time", "lat", "lon"], attrs={"units": "m/s"}),
+        },
+        coords={"time": time, "lat": lat, "lon": lon},
+    )
+
+
+def _decode(channel: np.ndarray, *, offset: float, scale: float) -> np.ndarray:
+    return offset + channel.astype(np.float64) * scale
+
+
+def test_wind_texture_rgba_packs_channels_and_masks_missing() -> None:
+    from tiles.wind_texture import wind_texture_rgba
+
+    u = np.array([[-10.0, 10.0], [np.nan, 0.0]])
+    v = np.array([[0.0, 5.0], [1.0, -5.0]])
+    rgba, ranges = wind_texture_rgba(u, v)
+
+    assert ranges == {"uMin": -10.0, "uMax": 10.0, "vMin": -5.0, "vMax": 5.0}
+    assert rgba.dtype == np.uint8
+    assert rgba[..., 3].tolist() == [[255, 255], [0, 255]]
+    assert rgba[0, 0, 0] == 0 and rgba[0, 1, 0] == 255
+    assert rgba[1, 1, 1] == 0 and rgba[0, 1, 1] == 255
+    assert rgba[..., 2].max() == 0
+
+    with pytest.raises(ValueError, match="same shape"):
+        wind_texture_rgba(np.zeros((2, 2)), np.zeros((2, 3)))
+
+
+def test_wind_texture_writes_png_webp_and_metadata(tmp_path: Path) -> None:
+    from tiles.wind_texture import WindTextureGenerator
+
+    generator = WindTextureGenerator.from_dataset(_make_wind_dataset())
+    result = generator.generate(
+        tmp_path,
+        run_time="2026-01-01T00:00:00Z",
+        valid_time="2026-01-01T06:00:00Z",
+        level="sfc",
+    )
+    assert (result.layer, result.variable) == ("ecmwf/wind_texture", "u,v")
+    assert (result.run, result.time, result.level) == (
+        "20260101T000000Z",
+        "20260101T060000Z",
+        "sfc",
+    )
+    assert (result.width, result.height, result.formats) == (4, 3, ("png", "webp"))
+
+    texture_dir = tmp_path / "ecmwf" / "wind_texture" / result.run / result.time / "sfc"
+    meta = json.loads((texture_dir / "wind.json").read_text("utf-8"))
+    assert meta["bbox"] == [100.0, 10.0, 130.0, 30.0]
+    assert (meta["width"], meta["height"]) == (4, 3)
+    assert (meta["uMin"], meta["uMax"], meta["vMin"], meta["vMax"]) == (
+        -10.0,
+        20.0,
+        -5.0,
+        5.0,
+    )
+    assert meta["uOffset"] == meta["uMin"]
+    assert meta["uScale"] == pytest.approx(30.0 / 255.0)
+
+    png = np.asarray(Image.open(texture_dir / "wind.png").convert("RGBA"))
+    webp = np.asarray(Image.open(texture_dir / "wind.webp").convert("RGBA"))
+    np.testing.assert_array_equal(png, webp)
+    assert png.shape == (3, 4, 4)
+
+    u = _decode(png[..., 0], offset=meta["uOffset"], scale=meta["uScale"])
+    v = _decode(png[..., 1], offset=meta["vOffset"], scale=meta["vScale"])
+    # Row 0 is the northern edge (lat 30); lon runs west to east.
+    np.testing.assert_allclose(u[1], [-10.0, 0.0, 10.0, 20.0], atol=meta["uScale"])
+    np.testing.assert_allclose(v[:, 0], [5.0, 0.0, -5.0], atol=meta["vScale"])
+    assert png[0, 3, 3] == 0
+    assert png[2, 0, 3] == 255
+
+
+def test_wind_texture_resamples_and_validates(tmp_path: Path) -> None:
+    from tiles.wind_texture import WindTextureError, WindTextureGenerator
+
+    generator = WindTextureGenerator.from_dataset(
+        _make_wind_dataset(), width=7, height=5
+    )
+    result = generator.generate(
+        tmp_path,
+        run_time="20260101T000000Z",
+        valid_time="2026-01-01T06:00:00Z",
+        level="sfc",
+        formats=["png"],
+    )
+    texture_dir = tmp_path / "ecmwf" / "wind_texture" / result.run / result.time
+    assert Image.open(texture_dir / "sfc" / "wind.png").size == (7, 5)
+    assert not (texture_dir / "sfc" / "wind.webp").exists()
+
+    with pytest.raises(ValueError, match="width"):
+        WindTextureGenerator.from_dataset(_make_wind_dataset(), width=1)
+    with pytest.raises(ValueError, match="Unsupported wind texture format"):
+        generator.generate(
+            tmp_path,
+            run_time="20260101T000000Z",
+            valid_time="2026-01-01T06:00:00Z",
+            level="sfc",
+            formats=["jpg"],
+        )
+
+    no_wind = WindTextureGenerator.from_dataset(
+        _make_wind_dataset().rename({"u": "speed"})
+    )
+    with pytest.raises(WindTextureError, match="Wind components not found"):
+        no_wind.generate(
+            tmp_path,
+            run_time="20260101T000000Z",
+            valid_time="2026-01-01T06:00:00Z",
+            level="sfc",
+        )
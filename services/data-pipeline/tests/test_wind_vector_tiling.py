@@ -0,0 +1,156 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import numpy as np
+import pytest
+import xarray as xr
+
+
+def _write_test_config_dir(config_dir: Path) -> None:
+    config_dir.mkdir(parents=True, exist_ok=True)
+    (config_dir / "tiling.yaml").write_text(
+        "\n".join(
+            [
+                "tiling:",
+                "  crs: EPSG:4326",
+                "  global:",
+                "    min_zoom: 0",
+                "    max_zoom: 1",
+                "  event:",
+                "    min_zoom: 2",
+                "    max_zoom: 2",
+                "  tile_size: 8",
+                "",
+            ]
+        ),
+        encoding="utf-8",
+    )
+
+
+def _make_wind_dataset(
+    *, lon: np.ndarray | None = None, lat: np.ndarray | None = None
+) -> xr.Dataset:
+    lat = np.array([-90.0, 0.0, 90.0], dtype=np.float32) if lat is None else lat
+    lon = np.array([-180.0, 0.0, 180.0], dtype=np.float32) if lon is None else lon
+    time = np.array(["2026-01-01T06:00:00"], dtype="datetime64[s]")
+    u = np.full((1, lat.size, lon.size), 5.0, dtype=np.float32)
+    v = np.full((1, lat.size, lon.size), -3.0, dtype=np.float32)
+    return xr.Dataset(
+        {
+            "u": xr.DataArray(u, dims=["time", "lat", "lon"], attrs={"units": "m/s"}),
+            "v": xr.DataArray(v, dims=["time", "lat", "lon"], attrs={"units": "m/s"}),
+        },
+        coords={"time": time, "lat": lat, "lon": lon},
+    )
+
+
+@pytest.fixture
+def tiling_config(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    from tiling.config import get_tiling_config
+
+    _write_test_config_dir(tmp_path / "config")
+    monkeypatch.setenv("DIGITAL_EARTH_CONFIG_DIR", str(tmp_path / "config"))
+    get_tiling_config.cache_clear()
+
+
+def test_wind_vector_tiles_write_pyramid_and_availability(
+    tmp_path: Path, tiling_config: None
+) -> None:
+    from tiles.wind_vector_tiles import WindVectorTileGenerator
+    from tiling.availability import TileAvailability
+
+    generator = WindVectorTileGenerator.from_dataset(
+        _make_wind_dataset(), points_per_tile=4
+    )
+    result = generator.generate(
+        tmp_path / "tiles",
+        run_time="2026-01-01T00:00:00Z",
+        valid_time="2026-01-01T06:00:00Z",
+        level="sfc",
+    )
+    assert result.layer == "ecmwf/wind_vector"
+    assert result.variable == "u,v"
+    assert result.run == "20260101T000000Z"
+    assert result.time == "20260101T060000Z"
+    assert result.level == "sfc"
+    assert (result.min_zoom, result.max_zoom) == (0, 1)
+    assert result.tiles_written == 1 + 2 * 2
+
+    tiles_root = (
+        tmp_path
+        / "tiles"
+        / "ecmwf"
+        / "wind_vector"
+        / "20260101T000000Z"
+        / "20260101T060000Z"
+        / "sfc"
+    )
+    tile = json.loads((tiles_root / "0" / "0" / "0.json").read_text("utf-8"))
+    assert set(tile) == {"u", "v", "lat", "lon"}
+    assert len(tile["u"]) == 16
+    assert tile["u"] == pytest.approx([5.0] * 16)
+    assert tile["v"] == pytest.approx([-3.0] * 16)
+    assert tile["lon"][:4] == pytest.approx([-135.0, -45.0, 45.0, 135.0])
+    assert tile["lat"][0] == pytest.approx(67.5)
+
+    availability = TileAvailability.from_payload(
+        (tiles_root / "availability.json").read_bytes()
+    )
+    assert availability.zooms == [0, 1]
+    assert availability.contains(1, 1, 1)
+
+
+def test_wind_vector_tiles_skip_tiles_without_coverage(
+    tmp_path: Path, tiling_config: None
+) -> None:
+    from tiles.wind_vector_tiles import WindVectorTileGenerator
+
+    lat = np.array([10.0, 20.0, 30.0], dtype=np.float32)
+    lon = np.array([100.0, 110.0, 120.0], dtype=np.float32)
+    generator = WindVectorTileGenerator.from_dataset(
+        _make_wind_dataset(lat=lat, lon=lon), points_per_tile=8
+    )
+    result = generator.generate(
+        tmp_path,
+        run_time="20260101T000000Z",
+        valid_time="2026-01-01T06:00:00Z",
+        level="sfc",
+        min_zoom=1,
+        max_zoom=1,
+    )
+    assert result.tiles_written == 1
+
+    tile_path = (
+        tmp_path
+        / "ecmwf"
+        / "wind_vector"
+        / result.run
+        / result.time
+        / "sfc"
+        / "1"
+        / "1"
+        / "0.json"
+    )
+    tile = json.loads(tile_path.read_text("utf-8"))
+    assert tile["u"]
+    assert all(100.0 <= value <= 120.0 for value in tile["lon"])
+    assert all(10.0 <= value <= 30.0 for value in tile["lat"])
+
+
+def test_wind_vector_tiles_validate_inputs(tiling_config: None) -> None:
+    from tiles.wind_vector_tiles import WindVectorTileGenerator, WindVectorTilingError
+
+    with pytest.raises(ValueError, match="points_per_tile"):
+        WindVectorTileGenerator.from_dataset(_make_wind_dataset(), points_per_tile=0)
+
+    ds = _make_wind_dataset().rename({"u": "speed"})
+    generator = WindVectorTileGenerator.from_dataset(ds)
+    with pytest.raises(WindVectorTilingError, match="Wind components not found"):
+        generator.generate(
+            "out",
+            run_time="2026-01-01T00:00:00Z",
+            valid_time="2026-01-01T06:00:00Z",
+            level="sfc",
+        )